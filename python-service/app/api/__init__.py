@@ -95,6 +95,7 @@ optional_modules = [
     ("simple_excel", "/simple-excel", ["simple-excel"]),
     ("excel_conversion", "/excel", ["excel-conversion"]),
     ("excel_format_preservation", "/excel", ["excel-format-preservation"]),
+    ("excel_viewport", "/excel-viewport", ["excel-viewport"]),
 ]
 
 for module_name, prefix, tags in optional_modules:
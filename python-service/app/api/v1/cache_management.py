@@ -26,7 +26,7 @@ async def get_cache_stats() -> Dict[str, Any]:
             "status": "success",
             "stats": stats,
             "cache_config": {
-                "max_memory_items": integrated_cache.max_memory_items,
+                "max_memory_bytes": integrated_cache.memory.max_bytes,
                 "ttl_config": integrated_cache.ttl_config,
             },
         }
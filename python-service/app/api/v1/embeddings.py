@@ -185,3 +185,11 @@ async def delete_document_embedding(
     except Exception as e:
         logger.error(f"Document deletion error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/search-cache/stats")
+async def get_search_cache_stats() -> Dict[str, Any]:
+    """
+    Semantic search cache hit statistics
+    """
+    return {"status": "success", "stats": vector_search_service.get_cache_stats()}
@@ -15,6 +15,7 @@ from app.core.database import get_db
 from app.core.config import settings
 from app.core.i18n_dependencies import get_i18n_context, I18nContext
 from app.core.validators import FileValidator
+from app.core.content_hash import save_upload_to_temp
 from app.services.excel_analyzer import excel_analyzer
 from app.services.openai_service import openai_service
 from app.services.vector_search import vector_search_service
@@ -73,13 +74,10 @@ async def analyze_excel_file(
             detail="Invalid file format. Please upload a valid Excel file.",
         )
 
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(
-        delete=False, suffix=os.path.splitext(file.filename)[1]
-    ) as tmp_file:
-        content = await file.read()
-        tmp_file.write(content)
-        tmp_path = tmp_file.name
+    # Save uploaded file temporarily (content hash is the analysis cache key)
+    tmp_path, _ = await save_upload_to_temp(
+        file, suffix=os.path.splitext(file.filename)[1]
+    )
 
     try:
         # Generate unique file ID and save mapping
@@ -467,13 +465,10 @@ async def detect_errors(
             detail=f"Invalid file type. Allowed types: {settings.ALLOWED_EXTENSIONS}",
         )
 
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(
-        delete=False, suffix=os.path.splitext(file.filename)[1]
-    ) as tmp_file:
-        content = await file.read()
-        tmp_file.write(content)
-        tmp_path = tmp_file.name
+    # Save uploaded file temporarily (content hash is the analysis cache key)
+    tmp_path, _ = await save_upload_to_temp(
+        file, suffix=os.path.splitext(file.filename)[1]
+    )
 
     try:
         # Use IntegratedErrorDetector for comprehensive error detection
@@ -1005,13 +1000,10 @@ async def validate_and_report(
         )
         raise HTTPException(status_code=400, detail=error_message)
 
-    # 임시 파일 저장
-    with tempfile.NamedTemporaryFile(
-        delete=False, suffix=os.path.splitext(file.filename)[1]
-    ) as tmp_file:
-        content = await file.read()
-        tmp_file.write(content)
-        tmp_path = tmp_file.name
+    # 임시 파일 저장 (내용 해시를 함께 계산하여 분석 캐시 키로 사용)
+    tmp_path, _ = await save_upload_to_temp(
+        file, suffix=os.path.splitext(file.filename)[1]
+    )
 
     try:
         # IntegratedErrorDetector 사용하여 전체 검증
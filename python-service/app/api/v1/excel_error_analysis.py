@@ -29,6 +29,11 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/excel-error-analysis", tags=["Excel Error Analysis"])
 
+# 세션별 진행 중인 분석 (취소 요청용)
+# 워커 프로세스별 등록이므로 여러 uvicorn 워커로 실행하면 취소 요청이 분석을
+# 실행 중인 워커에 도달해야 함 (세션 고정 라우팅 필요, 다른 워커는 404)
+_running_detectors: Dict[str, IntegratedErrorDetector] = {}
+
 
 # Request/Response Models
 class AnalyzeRequest(BaseModel):
@@ -96,7 +101,7 @@ async def analyze_excel_file(
             raise HTTPException(status_code=400, detail="파일 경로가 필요합니다")
 
         # 오류 감지 실행
-        result = await detector.detect_all_errors(request.file_path)
+        result = await run_detection(detector, request.file_path, request.session_id)
 
         # 백그라운드에서 추가 분석 (필요시)
         if request.options.get("deep_analysis", False):
@@ -126,7 +131,7 @@ async def analyze_uploaded_file(
         detector = await get_error_detector(session_id)
 
         # 분석 실행
-        result = await detector.detect_all_errors(file_path)
+        result = await run_detection(detector, file_path, session_id)
 
         return ResponseBuilder.success(
             data=result, message="파일 분석이 완료되었습니다."
@@ -138,6 +143,26 @@ async def analyze_uploaded_file(
         raise HTTPException(status_code=500, detail=error_response)
 
 
+@router.post("/cancel/{session_id}")
+async def cancel_analysis(session_id: str):
+    """
+    진행 중인 오류 분석 취소
+
+    - 프로세스 풀에서 대기/실행 중인 시트 작업도 함께 취소
+    - 분석 요청은 status가 "cancelled"인 결과로 응답
+    - 분석을 실행 중인 워커 프로세스에서만 찾을 수 있음 (다른 워커는 404)
+    """
+    detector = _running_detectors.get(session_id)
+    if detector is None:
+        raise HTTPException(status_code=404, detail="진행 중인 분석이 없습니다")
+
+    cancelled_jobs = detector.cancel()
+    return ResponseBuilder.success(
+        data={"session_id": session_id, "cancelled_jobs": cancelled_jobs},
+        message="분석 취소를 요청했습니다.",
+    )
+
+
 @router.post("/check-cell")
 async def check_cell_error(
     request: CellErrorRequest,
@@ -318,6 +343,21 @@ async def stream_updates(session_id: str):
 
 
 # Helper Functions
+async def run_detection(
+    detector: IntegratedErrorDetector, file_path: str, session_id: Optional[str]
+):
+    """오류 감지 실행 - 실행 중에는 세션 ID로 취소할 수 있도록 등록"""
+    if not session_id:
+        return await detector.detect_all_errors(file_path)
+
+    _running_detectors[session_id] = detector
+    try:
+        return await detector.detect_all_errors(file_path)
+    finally:
+        if _running_detectors.get(session_id) is detector:
+            del _running_detectors[session_id]
+
+
 async def save_uploaded_file(file: UploadFile) -> str:
     """업로드된 파일 저장"""
     import os
@@ -14,6 +14,7 @@ import shutil
 
 from app.core.database import get_db
 from app.core.config import settings
+from app.core.content_hash import save_upload_to_temp
 from app.core.i18n_dependencies import get_i18n_context, I18nContext
 from app.services.detection.integrated_error_detector import IntegratedErrorDetector
 from app.services.fixing.integrated_error_fixer import IntegratedErrorFixer
@@ -148,13 +149,10 @@ async def apply_batch_fixes(
         )
         raise HTTPException(status_code=400, detail=error_message)
 
-    # 임시 파일 저장
-    with tempfile.NamedTemporaryFile(
-        delete=False, suffix=os.path.splitext(file.filename)[1]
-    ) as tmp_file:
-        content = await file.read()
-        tmp_file.write(content)
-        tmp_path = tmp_file.name
+    # 임시 파일 저장 (내용 해시를 함께 계산하여 분석 캐시 키로 사용)
+    tmp_path, _ = await save_upload_to_temp(
+        file, suffix=os.path.splitext(file.filename)[1]
+    )
 
     # 백업 생성
     backup_path = None
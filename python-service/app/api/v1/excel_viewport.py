@@ -0,0 +1,126 @@
+"""
+Excel Viewport API
+대용량 시트를 한 번에 보내지 않고 보이는 창(타일) 단위로 렌더링 - ETag/프리페치 지원
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, Optional
+import logging
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    UploadFile,
+)
+from fastapi.responses import JSONResponse, Response
+
+from app.core.config import settings
+from app.core.content_hash import save_upload_to_temp
+from app.services.excel_viewport_service import excel_viewport_service
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# 타일은 파일 내용 해시로 식별되므로 클라이언트가 재검증 없이 캐시해도 안전
+TILE_CACHE_CONTROL = "private, max-age=300"
+
+
+@router.post("/open")
+async def open_workbook(file: UploadFile = File(...)) -> Dict[str, Any]:
+    """
+    워크북을 파싱해 뷰포트 캐시에 등록하고 시트 목록을 반환합니다.
+
+    같은 내용의 파일은 다시 파싱하지 않고 같은 file_id를 돌려줍니다.
+    """
+    tmp_path, file_id = await save_upload_to_temp(
+        file, suffix=os.path.splitext(file.filename or "")[1]
+    )
+
+    try:
+        info = await asyncio.to_thread(
+            excel_viewport_service.open_workbook, tmp_path, file_id
+        )
+        return {"status": "success", **info}
+
+    except Exception as e:
+        logger.error(f"뷰포트 워크북 열기 실패: {str(e)}")
+        raise HTTPException(
+            status_code=400, detail=f"워크북을 열 수 없습니다: {str(e)}"
+        )
+
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+@router.get("/{file_id}/sheets/{sheet_name}/tile")
+async def get_tile(
+    file_id: str,
+    sheet_name: str,
+    background_tasks: BackgroundTasks,
+    row: int = Query(1, ge=1, description="시작 행 (1부터)"),
+    col: int = Query(1, ge=1, description="시작 열 (1부터)"),
+    rows: int = Query(settings.VIEWPORT_TILE_ROWS, ge=1, description="행 수"),
+    cols: int = Query(settings.VIEWPORT_TILE_COLS, ge=1, description="열 수"),
+    prefetch: bool = Query(True, description="인접 타일 미리 렌더링"),
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    요청한 행/열 창만 렌더링합니다.
+
+    ETag가 If-None-Match와 같으면 렌더링 없이 304를 반환하고,
+    응답 후 아래/오른쪽/위/왼쪽 인접 타일을 백그라운드에서 미리 렌더링합니다.
+    """
+    if not excel_viewport_service.has_workbook(file_id):
+        raise HTTPException(
+            status_code=404, detail="열려 있지 않은 파일입니다. 다시 열어주세요."
+        )
+
+    etag = excel_viewport_service.tile_etag(file_id, sheet_name, row, col, rows, cols)
+    headers = {"ETag": etag, "Cache-Control": TILE_CACHE_CONTROL}
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    try:
+        etag, tile = await asyncio.to_thread(
+            excel_viewport_service.get_tile, file_id, sheet_name, row, col, rows, cols
+        )
+    except KeyError:
+        raise HTTPException(
+            status_code=404, detail=f"시트를 찾을 수 없습니다: {sheet_name}"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if prefetch:
+        background_tasks.add_task(
+            asyncio.to_thread,
+            excel_viewport_service.prefetch_adjacent,
+            file_id,
+            sheet_name,
+            row,
+            col,
+            rows,
+            cols,
+        )
+
+    return JSONResponse(content=tile, headers=headers, background=background_tasks)
+
+
+@router.delete("/{file_id}")
+async def close_workbook(file_id: str) -> Dict[str, Any]:
+    """뷰포트 캐시에서 워크북과 타일 제거"""
+    removed = excel_viewport_service.close_workbook(file_id)
+    return {"status": "success", "removed": removed}
+
+
+@router.get("/stats")
+async def get_viewport_stats() -> Dict[str, Any]:
+    """타일 캐시 적중률 및 보관 중인 워크북/타일 수"""
+    return {"status": "success", "stats": excel_viewport_service.get_stats()}
@@ -10,6 +10,7 @@ import logging
 from datetime import datetime
 
 from app.services.analysis import FormulaAnalyzer
+from app.services.detection.dependency_graph import parse_key
 from app.services.detection.integrated_error_detector import IntegratedErrorDetector
 
 logger = logging.getLogger(__name__)
@@ -371,62 +372,52 @@ async def analyze_formula_dependencies(
         # 워크북 분석
         analysis_result = await formula_analyzer.analyze_workbook(tmp_path)
 
+        graph = analysis_result.dependency_graph
         dependency_info = {
-            "total_nodes": analysis_result.dependency_graph.number_of_nodes(),
-            "total_edges": analysis_result.dependency_graph.number_of_edges(),
-            "is_acyclic": nx.is_directed_acyclic_graph(
-                analysis_result.dependency_graph
-            ),
+            "total_nodes": graph.number_of_nodes(),
+            "total_edges": graph.number_of_edges(),
+            "is_acyclic": not graph.has_cycles(),
         }
 
         # 특정 셀의 의존성 분석
         if target_cell:
-            if target_cell in analysis_result.dependency_graph:
-                # 선행 셀 (이 셀이 의존하는 셀들)
-                predecessors = list(
-                    analysis_result.dependency_graph.predecessors(target_cell)
-                )
-
-                # 후행 셀 (이 셀에 의존하는 셀들)
-                successors = list(
-                    analysis_result.dependency_graph.successors(target_cell)
-                )
-
+            parsed = parse_key(target_cell)
+            if parsed and target_cell in graph:
                 dependency_info["target_cell"] = {
                     "cell": target_cell,
-                    "depends_on": predecessors[:20],
-                    "dependents": successors[:20],
+                    # 선행 셀/범위 (이 셀이 의존하는 참조들)
+                    "depends_on": graph.precedents(*parsed)[:20],
+                    # 후행 셀 (이 셀에 의존하는 수식들)
+                    "dependents": graph.dependents(*parsed)[:20],
                     "dependency_chain_length": len(
-                        nx.ancestors(analysis_result.dependency_graph, target_cell)
+                        graph.transitive_precedents(*parsed)
                     ),
                 }
 
         # 중요 노드 식별
-        if analysis_result.dependency_graph.number_of_nodes() > 0:
+        if graph.number_of_nodes() > 0:
             # 가장 많은 의존성을 가진 노드
-            node_degrees = dict(analysis_result.dependency_graph.degree())
-            top_nodes = sorted(node_degrees.items(), key=lambda x: x[1], reverse=True)[
-                :10
+            dependent_counts = graph.dependent_counts()
+            degrees = [
+                (node, len(graph.references[node]) + dependent_counts[node])
+                for node in range(graph.number_of_nodes())
             ]
+            top_nodes = sorted(degrees, key=lambda x: x[1], reverse=True)[:10]
 
             dependency_info["key_nodes"] = [
                 {
-                    "cell": node,
+                    "cell": graph.key(node),
                     "total_connections": degree,
-                    "in_degree": analysis_result.dependency_graph.in_degree(node),
-                    "out_degree": analysis_result.dependency_graph.out_degree(node),
+                    "in_degree": len(graph.references[node]),
+                    "out_degree": dependent_counts[node],
                 }
                 for node, degree in top_nodes
             ]
 
-        # 순환 참조 검출
-        try:
-            cycles = list(nx.simple_cycles(analysis_result.dependency_graph))
-            dependency_info["circular_references"] = [
-                {"cycle": cycle, "length": len(cycle)} for cycle in cycles[:5]
-            ]
-        except (KeyError, IndexError, AttributeError):
-            dependency_info["circular_references"] = []
+        # 순환 참조 검출 (Tarjan SCC)
+        dependency_info["circular_references"] = [
+            {"cycle": cycle, "length": len(cycle)} for cycle in graph.cycles()[:5]
+        ]
 
         return {
             "status": "success",
@@ -551,7 +542,3 @@ def _calculate_improvement_estimate(
         "optimization_count": len(optimization_plan),
         "implementation_effort": "medium" if len(optimization_plan) > 10 else "low",
     }
-
-
-# networkx import 추가
-import networkx as nx
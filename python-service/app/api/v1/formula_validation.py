@@ -28,10 +28,12 @@ class FormulaValidationRequest(BaseModel):
     cell_address: str = Field(..., description="셀 주소 (예: A1, B2)")
     sheet_name: str = Field(default="Sheet1", description="시트 이름")
     context: Optional[Dict[str, Any]] = Field(default=None, description="셀 컨텍스트 데이터")
+    session_id: str = Field(default="default", description="세션 ID (세션별 수식 모델 유지)")
 
 class BatchValidationRequest(BaseModel):
     changes: List[Dict[str, Any]] = Field(..., description="변경사항 목록")
     include_errors_simulation: bool = Field(default=True, description="오류 시뮬레이션 포함 여부")
+    session_id: str = Field(default="default", description="세션 ID (세션별 수식 모델 유지)")
 
 class FormulaValidationResponse(BaseModel):
     valid: bool
@@ -73,13 +75,14 @@ async def validate_formula(request: FormulaValidationRequest):
         
         # 컨텍스트가 제공된 경우 설정
         if request.context:
-            validator.set_context(request.sheet_name, request.context)
+            validator.set_context(request.sheet_name, request.context, request.session_id)
         
-        # 수식 검증 실행
+        # 수식 검증 실행 (세션 모델에서 변경 셀과 종속 셀만 계산)
         result = validator.validate_formula_realtime(
             request.formula,
             request.cell_address, 
-            request.sheet_name
+            request.sheet_name,
+            request.session_id
         )
         
         return FormulaValidationResponse(
@@ -116,7 +119,7 @@ async def validate_batch_changes(request: BatchValidationRequest):
         validator = get_validator()
         
         # 일괄 검증 실행
-        results = validator.batch_validate_changes(request.changes)
+        results = validator.batch_validate_changes(request.changes, request.session_id)
         
         # 응답 모델로 변환
         response_results = {}
@@ -157,7 +160,8 @@ async def validate_batch_changes(request: BatchValidationRequest):
 async def simulate_formula_errors(
     formula: str,
     sheet_name: str = "Sheet1",
-    context: Optional[Dict[str, Any]] = None
+    context: Optional[Dict[str, Any]] = None,
+    session_id: str = "default"
 ):
     """
     주어진 수식에서 발생할 수 있는 오류 조건들을 시뮬레이션합니다.
@@ -171,10 +175,10 @@ async def simulate_formula_errors(
         validator = get_validator()
         
         if context:
-            validator.set_context(sheet_name, context)
+            validator.set_context(sheet_name, context, session_id)
         
         # 오류 시뮬레이션 실행
-        potential_errors = validator.simulate_error_conditions(formula, sheet_name)
+        potential_errors = validator.simulate_error_conditions(formula, sheet_name, session_id)
         
         # 위험도 계산
         risk_level = calculate_risk_level(potential_errors)
@@ -196,7 +200,8 @@ async def simulate_formula_errors(
              summary="워크북으로부터 검증기 초기화")
 async def initialize_validator_from_workbook(
     background_tasks: BackgroundTasks,
-    file: UploadFile = File(...)
+    file: UploadFile = File(...),
+    session_id: str = "default"
 ):
     """
     업로드된 Excel 파일로부터 검증기를 초기화합니다.
@@ -213,18 +218,20 @@ async def initialize_validator_from_workbook(
         validator = get_validator()
         
         # 워크북으로부터 초기화
-        success = validator.initialize_from_openpyxl_workbook(tmp_file_path)
+        success = validator.initialize_from_openpyxl_workbook(tmp_file_path, session_id)
         
         # 백그라운드에서 임시 파일 삭제
         background_tasks.add_task(cleanup_temp_file, tmp_file_path)
         
         if success:
+            context = validator.get_model(session_id).inputs
             return JSONResponse(
                 content={
                     "success": True,
                     "message": "워크북이 성공적으로 초기화되었습니다",
-                    "sheets": list(validator.context.keys()),
-                    "total_cells": sum(len(sheet_data) for sheet_data in validator.context.values())
+                    "session_id": session_id,
+                    "sheets": list(context.keys()),
+                    "total_cells": sum(len(sheet_data) for sheet_data in context.values())
                 }
             )
         else:
@@ -242,18 +249,22 @@ async def initialize_validator_from_workbook(
 
 @router.get("/validator-status",
            summary="검증기 상태 확인")
-async def get_validator_status():
+async def get_validator_status(session_id: str = "default"):
     """
     현재 검증기의 상태와 로드된 데이터 정보를 반환합니다.
     """
     try:
         validator = get_validator()
+        initialized = session_id in validator.models
+        context = validator.get_model(session_id).inputs if initialized else {}
         
         status = {
-            "initialized": validator.xl_model is not None,
-            "sheets_count": len(validator.context),
-            "sheets": list(validator.context.keys()),
-            "total_cells": sum(len(sheet_data) for sheet_data in validator.context.values()),
+            "initialized": initialized,
+            "session_id": session_id,
+            "sheets_count": len(context),
+            "sheets": list(context.keys()),
+            "total_cells": sum(len(sheet_data) for sheet_data in context.values()),
+            "sessions": validator.get_session_stats(),
             "memory_usage": get_validator_memory_usage(validator)
         }
         
@@ -341,8 +352,15 @@ def get_validator_memory_usage(validator: RealtimeFormulaValidator) -> Dict[str,
     import sys
     
     try:
-        context_size = sys.getsizeof(validator.context)
-        model_size = sys.getsizeof(validator.xl_model) if validator.xl_model else 0
+        context_size = sum(
+            sys.getsizeof(sheet_data)
+            for model in validator.models.values()
+            for sheet_data in model.inputs.values()
+        )
+        model_size = sum(
+            sys.getsizeof(model._values) + sys.getsizeof(model._references)
+            for model in validator.models.values()
+        )
         
         return {
             "context_size_bytes": context_size,
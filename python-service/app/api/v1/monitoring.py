@@ -3,11 +3,18 @@ Monitoring API endpoints
 모니터링 API 엔드포인트
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from typing import Dict, Any, Optional
 import logging
 
-from app.core.monitoring import metrics_collector, system_monitor, alert_manager
+from app.core.metrics import CONTENT_TYPE_LATEST
+from app.core.monitoring import (
+    metrics_collector,
+    system_monitor,
+    alert_manager,
+    export_prometheus_metrics,
+)
+from app.core.parallel_processor import parallel_processor
 from app.core.responses import ResponseBuilder
 from app.services.rate_limiter import rate_limit, RateLimitTier
 
@@ -36,6 +43,12 @@ async def get_metrics(endpoint: Optional[str] = None) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/prometheus")
+async def get_prometheus_metrics() -> Response:
+    """Prometheus 텍스트 형식 메트릭 (스크레이프용, 속도 제한 없음)"""
+    return Response(content=export_prometheus_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
 @router.get("/system")
 @rate_limit(tier=RateLimitTier.BASIC, endpoint="/api/v1/monitoring/system")
 async def get_system_metrics() -> Dict[str, Any]:
@@ -51,6 +64,21 @@ async def get_system_metrics() -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/detection-queue")
+@rate_limit(tier=RateLimitTier.BASIC, endpoint="/api/v1/monitoring/detection-queue")
+async def get_detection_queue() -> Dict[str, Any]:
+    """오류 감지 프로세스 풀 대기열 조회"""
+    try:
+        stats = parallel_processor.get_queue_stats()
+
+        return ResponseBuilder.success(
+            data=stats, message="Detection queue stats retrieved successfully"
+        )
+    except Exception as e:
+        logger.error(f"Failed to get detection queue stats: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/alerts")
 @rate_limit(tier=RateLimitTier.BASIC, endpoint="/api/v1/monitoring/alerts")
 async def get_alerts() -> Dict[str, Any]:
@@ -95,6 +123,9 @@ async def detailed_health_check() -> Dict[str, Any]:
         # 활성 알림
         alerts = alert_manager.get_active_alerts()
 
+        # 감지 프로세스 풀 대기열
+        queue_stats = parallel_processor.get_queue_stats()
+
         # 헬스 상태 판단
         health_status = "healthy"
         issues = []
@@ -135,6 +166,11 @@ async def detailed_health_check() -> Dict[str, Any]:
                     "error_rate": api_stats.get("error_rate", 0),
                     "uptime_seconds": api_stats.get("uptime_seconds", 0),
                 },
+                "detection_queue": {
+                    "queue_depth": queue_stats["queue_depth"],
+                    "running": queue_stats["running"],
+                    "active_requests": queue_stats["active_requests"],
+                },
                 "alerts": {
                     "active_count": len(alerts),
                     "critical_count": sum(
@@ -0,0 +1,218 @@
+"""
+Cache Codec
+L2(Redis) 캐시용 압축 바이너리 직렬화 - msgpack + 크기 임계값 이상 zstd 압축
+ExcelError 목록은 필드명을 반복하지 않는 행(tuple) 형식으로 저장
+"""
+
+from dataclasses import asdict, fields, is_dataclass
+from datetime import date, datetime
+from enum import Enum
+import json
+import zlib
+from typing import Any, Optional
+import logging
+
+from app.core.config import settings
+from app.core.interfaces import ExcelError, FixResult
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 헤더 (2바이트): 형식 + 압축
+FORMAT_MSGPACK = b"m"
+FORMAT_JSON = b"j"
+COMPRESSION_NONE = b"n"
+COMPRESSION_ZSTD = b"z"
+COMPRESSION_ZLIB = b"d"
+
+# msgpack 확장 타입 코드
+EXT_EXCEL_ERRORS = 1  # ExcelError 목록 (행 형식)
+EXT_EXCEL_ERROR = 2
+EXT_FIX_RESULT = 3
+EXT_DATETIME = 4
+EXT_TUPLE = 5
+EXT_SET = 6
+
+# ExcelError/FixResult 필드 순서 (행 형식 직렬화 기준)
+EXCEL_ERROR_FIELDS = tuple(field.name for field in fields(ExcelError))
+FIX_RESULT_FIELDS = tuple(field.name for field in fields(FixResult))
+
+
+class CacheCodec:
+    """캐시 값 인코더/디코더
+
+    msgpack이 없으면 JSON으로, zstandard가 없으면 zlib으로 대체합니다.
+    알 수 없는 객체는 pickle 대신 dataclass는 dict로, 그 외는 문자열로 저장합니다.
+    """
+
+    def __init__(
+        self,
+        compression_threshold: Optional[int] = None,
+        compression_level: int = 3,
+    ):
+        self.compression_threshold = (
+            settings.CACHE_COMPRESSION_THRESHOLD
+            if compression_threshold is None
+            else compression_threshold
+        )
+        self.compression_level = compression_level
+        if ZSTD_AVAILABLE:
+            self._compressor = zstandard.ZstdCompressor(level=compression_level)
+            self._decompressor = zstandard.ZstdDecompressor()
+
+    # 인코딩
+    def encode(self, value: Any) -> bytes:
+        if MSGPACK_AVAILABLE:
+            payload = self._pack(value)
+            data_format = FORMAT_MSGPACK
+        else:
+            payload = json.dumps(self._to_json(value), ensure_ascii=False).encode()
+            data_format = FORMAT_JSON
+
+        compression = COMPRESSION_NONE
+        if len(payload) >= self.compression_threshold:
+            if ZSTD_AVAILABLE:
+                payload = self._compressor.compress(payload)
+                compression = COMPRESSION_ZSTD
+            else:
+                payload = zlib.compress(payload, self.compression_level)
+                compression = COMPRESSION_ZLIB
+
+        return data_format + compression + payload
+
+    def decode(self, data: bytes) -> Any:
+        data_format, compression, payload = data[:1], data[1:2], data[2:]
+
+        if compression == COMPRESSION_ZSTD:
+            payload = self._decompressor.decompress(payload)
+        elif compression == COMPRESSION_ZLIB:
+            payload = zlib.decompress(payload)
+
+        if data_format == FORMAT_MSGPACK:
+            return self._unpack(payload)
+        if data_format == FORMAT_JSON:
+            return self._from_json(json.loads(payload))
+        raise ValueError(f"알 수 없는 캐시 형식: {data_format!r}")
+
+    # msgpack
+    def _pack(self, value: Any) -> bytes:
+        return msgpack.packb(
+            self._prepare(value), default=self._default, use_bin_type=True
+        )
+
+    def _unpack(self, payload: bytes) -> Any:
+        return msgpack.unpackb(
+            payload, ext_hook=self._ext_hook, raw=False, strict_map_key=False
+        )
+
+    def _prepare(self, value: Any) -> Any:
+        """ExcelError 목록과 tuple을 확장 타입으로 바꾸며 컨테이너를 순회"""
+        if isinstance(value, dict):
+            return {key: self._prepare(item) for key, item in value.items()}
+        if isinstance(value, list):
+            if value and all(type(item) is ExcelError for item in value):
+                rows = [
+                    [getattr(error, name) for name in EXCEL_ERROR_FIELDS]
+                    for error in value
+                ]
+                return msgpack.ExtType(EXT_EXCEL_ERRORS, self._pack(rows))
+            return [self._prepare(item) for item in value]
+        if isinstance(value, tuple):
+            # msgpack은 tuple을 list로 저장하므로 확장 타입으로 구분
+            return msgpack.ExtType(EXT_TUPLE, self._pack(list(value)))
+        return value
+
+    def _default(self, value: Any) -> Any:
+        """msgpack 기본 타입이 아닌 값 변환"""
+        if isinstance(value, ExcelError):
+            row = [getattr(value, name) for name in EXCEL_ERROR_FIELDS]
+            return msgpack.ExtType(EXT_EXCEL_ERROR, self._pack(row))
+        if isinstance(value, FixResult):
+            row = [getattr(value, name) for name in FIX_RESULT_FIELDS]
+            return msgpack.ExtType(EXT_FIX_RESULT, self._pack(row))
+        if isinstance(value, datetime):
+            return msgpack.ExtType(EXT_DATETIME, value.isoformat().encode())
+        if isinstance(value, (set, frozenset)):
+            return msgpack.ExtType(EXT_SET, self._pack(list(value)))
+        return self._fallback(value)
+
+    def _ext_hook(self, code: int, data: bytes) -> Any:
+        if code == EXT_EXCEL_ERRORS:
+            return [
+                ExcelError(**dict(zip(EXCEL_ERROR_FIELDS, row)))
+                for row in self._unpack(data)
+            ]
+        if code == EXT_EXCEL_ERROR:
+            return ExcelError(**dict(zip(EXCEL_ERROR_FIELDS, self._unpack(data))))
+        if code == EXT_FIX_RESULT:
+            return FixResult(**dict(zip(FIX_RESULT_FIELDS, self._unpack(data))))
+        if code == EXT_DATETIME:
+            return datetime.fromisoformat(data.decode())
+        if code == EXT_TUPLE:
+            return tuple(self._unpack(data))
+        if code == EXT_SET:
+            return set(self._unpack(data))
+        return msgpack.ExtType(code, data)
+
+    # JSON (msgpack 미설치 시)
+    def _to_json(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {str(key): self._to_json(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple, set, frozenset)):
+            items = list(value)
+            if items and all(type(item) is ExcelError for item in items):
+                return {
+                    "__excel_errors__": [
+                        [self._to_json(getattr(e, n)) for n in EXCEL_ERROR_FIELDS]
+                        for e in items
+                    ]
+                }
+            return [self._to_json(item) for item in items]
+        if isinstance(value, (str, int, float, bool, type(None))):
+            return value
+        return self._to_json(self._fallback(value))
+
+    def _from_json(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            if "__excel_errors__" in value and len(value) == 1:
+                return [
+                    ExcelError(**dict(zip(EXCEL_ERROR_FIELDS, row)))
+                    for row in value["__excel_errors__"]
+                ]
+            return {key: self._from_json(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._from_json(item) for item in value]
+        return value
+
+    @staticmethod
+    def _fallback(value: Any) -> Any:
+        """직렬화할 수 없는 값의 대체 표현 (pickle은 사용하지 않음)"""
+        if isinstance(value, Enum):
+            return value.value
+        if isinstance(value, date):
+            return value.isoformat()
+        if is_dataclass(value) and not isinstance(value, type):
+            return asdict(value)
+        if hasattr(value, "item"):  # numpy 스칼라
+            return value.item()
+        if hasattr(value, "tolist"):  # numpy 배열
+            return value.tolist()
+        logger.debug(f"캐시 직렬화 대체(str): {type(value).__name__}")
+        return str(value)
+
+
+# 전역 인스턴스
+cache_codec = CacheCodec()
@@ -0,0 +1,273 @@
+"""
+In-Process Cache Engine
+IntegratedCache와 UnifiedExcelCache가 함께 쓰는 메모리 캐시 엔진
+- OrderedDict LRU (O(1) 조회/갱신/제거)
+- 타이머 휠 TTL 만료 (경과한 틱의 슬롯만 확인)
+- 항목 수가 아닌 바이트 기준 용량 제한
+- 읽기는 락 없이 수행, 쓰기만 짧은 락으로 직렬화
+"""
+
+from collections import OrderedDict
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+import logging
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 크기 추정 시 컨테이너를 따라 내려가는 최대 깊이
+SIZE_ESTIMATE_MAX_DEPTH = 8
+
+
+def estimate_size(value: Any, _depth: int = 0, _seen: Optional[Set[int]] = None) -> int:
+    """값의 대략적인 메모리 크기 (바이트) - 컨테이너와 객체 속성을 재귀적으로 합산"""
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if _depth >= SIZE_ESTIMATE_MAX_DEPTH or isinstance(
+        value, (str, bytes, bytearray, int, float, bool, type(None))
+    ):
+        return size
+
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += estimate_size(key, _depth + 1, _seen)
+            size += estimate_size(item, _depth + 1, _seen)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_size(item, _depth + 1, _seen)
+    elif hasattr(value, "__dict__"):
+        size += estimate_size(vars(value), _depth + 1, _seen)
+    elif hasattr(value, "__slots__"):
+        for name in value.__slots__:
+            if hasattr(value, name):
+                size += estimate_size(getattr(value, name), _depth + 1, _seen)
+    return size
+
+
+class TimerWheel:
+    """해시 타이머 휠 - 만료 시각을 틱 단위 슬롯에 넣고, 경과한 틱의 슬롯만 확인
+
+    슬롯 수보다 먼 만료 시각은 같은 슬롯에 들어가므로 꺼낸 키는 후보일 뿐이며,
+    실제 만료 여부는 호출한 쪽이 항목의 만료 시각으로 다시 확인합니다.
+    """
+
+    def __init__(self, tick: float, slots: int, now: float):
+        self.tick = tick
+        self.slots: List[Set[str]] = [set() for _ in range(slots)]
+        self._cursor = int(now / tick) - 1  # 마지막으로 처리한 틱
+
+    def schedule(self, key: str, expires_at: float) -> int:
+        slot = int(expires_at / self.tick) % len(self.slots)
+        self.slots[slot].add(key)
+        return slot
+
+    def cancel(self, key: str, slot: int):
+        self.slots[slot].discard(key)
+
+    def advance(self, now: float) -> Iterator[str]:
+        """now 이전에 끝난 틱들의 슬롯에 있는 키 (만료 후보)"""
+        last_elapsed = int(now / self.tick) - 1
+        steps = min(last_elapsed - self._cursor, len(self.slots))
+        start = self._cursor
+        self._cursor = max(self._cursor, last_elapsed)
+        for offset in range(1, steps + 1):
+            slot = self.slots[(start + offset) % len(self.slots)]
+            if slot:
+                yield from list(slot)
+
+
+class _Entry:
+    __slots__ = ("value", "size", "expires_at", "slot")
+
+    def __init__(self, value: Any, size: int, expires_at: Optional[float]):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.slot: Optional[int] = None
+
+
+class CacheEngine:
+    """바이트 용량 제한 LRU + 타이머 휠 TTL 메모리 캐시"""
+
+    def __init__(
+        self,
+        max_bytes: int,
+        tick_seconds: float = 1.0,
+        wheel_slots: int = 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._wheel = TimerWheel(tick_seconds, wheel_slots, clock())
+        self._lock = threading.Lock()
+        self._bytes = 0
+
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and not self._is_expired(entry, self._clock())
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    # 읽기 (락 없음)
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return default
+
+        if self._is_expired(entry, self._clock()):
+            self.stats["misses"] += 1
+            self._expire(key, entry)
+            return default
+
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            # 다른 스레드가 방금 제거함 - 읽은 값은 그대로 반환
+            pass
+        self.stats["hits"] += 1
+        return entry.value
+
+    def keys(self, prefix: str = "") -> List[str]:
+        """prefix로 시작하는 키 목록 (만료 여부는 확인하지 않음)"""
+        return [key for key in list(self._entries) if key.startswith(prefix)]
+
+    # 쓰기
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        size: Optional[int] = None,
+    ) -> bool:
+        """값 저장 - 용량을 넘으면 가장 오래 사용하지 않은 항목부터 제거
+
+        Returns:
+            저장 여부 (값 하나가 전체 용량보다 크면 저장하지 않음)
+        """
+        size = estimate_size(value) if size is None else size
+        if size > self.max_bytes:
+            logger.debug(
+                f"캐시 항목이 용량보다 커서 저장하지 않음: {key} ({size} bytes)"
+            )
+            self.delete(key)
+            return False
+
+        now = self._clock()
+        expires_at = now + ttl if ttl else None
+        entry = _Entry(value, size, expires_at)
+
+        with self._lock:
+            self._expire_due(now)
+
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._forget(key, previous)
+
+            if expires_at is not None:
+                entry.slot = self._wheel.schedule(key, expires_at)
+            self._entries[key] = entry
+            self._bytes += size
+
+            while self._bytes > self.max_bytes and self._entries:
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self._forget(evicted_key, evicted)
+                self.stats["evictions"] += 1
+
+        return True
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self._forget(key, entry)
+            return True
+
+    def delete_prefix(self, prefix: str) -> int:
+        """prefix로 시작하는 모든 키 삭제"""
+        return self.delete_where(lambda key: key.startswith(prefix))
+
+    def delete_where(self, predicate: Callable[[str], bool]) -> int:
+        with self._lock:
+            matched = [key for key in self._entries if predicate(key)]
+            for key in matched:
+                self._forget(key, self._entries.pop(key))
+        return len(matched)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            for slot in self._wheel.slots:
+                slot.clear()
+            self._bytes = 0
+
+    def expire(self) -> int:
+        """경과한 틱의 만료 항목 정리 (쓰기 때마다 자동으로도 수행)"""
+        with self._lock:
+            return self._expire_due(self._clock())
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "items": len(self._entries),
+            "size_bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0,
+        }
+
+    # 내부 유틸
+    @staticmethod
+    def _is_expired(entry: _Entry, now: float) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= now
+
+    def _expire(self, key: str, entry: _Entry):
+        with self._lock:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+                self._forget(key, entry)
+                self.stats["expirations"] += 1
+
+    def _expire_due(self, now: float) -> int:
+        """타이머 휠에서 경과한 슬롯의 만료 항목 제거 (self._lock 안에서 호출)"""
+        expired = 0
+        for key in self._wheel.advance(now):
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+            if self._is_expired(entry, now):
+                del self._entries[key]
+                self._forget(key, entry)
+                expired += 1
+        self.stats["expirations"] += expired
+        return expired
+
+    def _forget(self, key: str, entry: _Entry):
+        """제거된 항목의 크기/타이머 정리 (self._lock 안에서 호출)"""
+        self._bytes -= entry.size
+        if entry.slot is not None:
+            self._wheel.cancel(key, entry.slot)
+
+
+# 전역 인스턴스 - integrated_cache와 unified_cache가 공유
+memory_cache_engine = CacheEngine(
+    max_bytes=settings.CACHE_MEMORY_MAX_BYTES,
+    tick_seconds=settings.CACHE_TIMER_WHEEL_TICK,
+)
@@ -0,0 +1,141 @@
+"""
+Cache Keys
+@cache_result용 안정적인 캐시 키 생성
+- self/cls 제외, 인자 이름 기준으로 바인딩 (위치/키워드 호출이 같은 키)
+- 인자를 정규화한 뒤 해시 (dict 순서, set 순서와 무관)
+- 파일 경로 인자는 경로 대신 내용 해시(없으면 크기+수정 시각)로 구분
+- vary_on으로 키에 포함할 인자(또는 self 속성)를 함수별로 지정
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from dataclasses import asdict, is_dataclass
+from datetime import date
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+import logging
+
+from app.core.content_hash import content_hash_registry
+
+logger = logging.getLogger(__name__)
+
+# 바인딩 대상 객체를 가리키는 첫 번째 인자 이름
+BOUND_ARGUMENT_NAMES = ("self", "cls")
+
+# 키 해시 길이 (바이트)
+KEY_DIGEST_SIZE = 16
+
+
+def is_file_argument(name: str) -> bool:
+    """이름으로 파일 경로 인자 여부 판단 (file_path, excel_path, path 등)"""
+    return name == "path" or name.endswith("_path") or name == "file"
+
+
+def file_fingerprint(file_path: Any) -> Any:
+    """파일 경로를 내용 기준 식별자로 변환 (파일이 아니면 그대로)
+
+    업로드 시 등록된 내용 해시가 있으면 사용하고, 없으면 크기와 수정 시각을
+    사용합니다. 캐시 키 생성 중에 파일 전체를 읽지는 않습니다.
+    """
+    if not isinstance(file_path, (str, Path)):
+        return file_path
+    path = str(file_path)
+    digest = content_hash_registry.lookup(path)
+    if digest:
+        return {"content": digest}
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return path
+    return {"path": path, "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+
+def canonicalize(value: Any) -> Any:
+    """JSON으로 안정적으로 직렬화할 수 있는 형태로 변환"""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, Enum):
+        return canonicalize(value.value)
+    if isinstance(value, dict):
+        return {str(key): canonicalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [canonicalize(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(
+            (canonicalize(item) for item in value),
+            key=lambda item: json.dumps(item, sort_keys=True, default=str),
+        )
+    if isinstance(value, (bytes, bytearray)):
+        return {
+            "bytes": hashlib.blake2b(value, digest_size=KEY_DIGEST_SIZE).hexdigest()
+        }
+    if isinstance(value, (date, Path)):
+        return str(value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return canonicalize(asdict(value))
+    if hasattr(value, "model_dump"):  # pydantic 모델
+        return canonicalize(value.model_dump())
+    # 객체 주소가 들어간 기본 repr은 호출마다 달라지므로 타입 이름만 사용
+    if type(value).__repr__ is object.__repr__:
+        return {"type": f"{type(value).__module__}.{type(value).__qualname__}"}
+    return repr(value)
+
+
+class CacheKeyBuilder:
+    """함수 하나에 대한 캐시 키 생성기 (시그니처는 데코레이션 시 한 번만 분석)"""
+
+    def __init__(
+        self,
+        func: Callable,
+        prefix: Optional[str] = None,
+        vary_on: Optional[Sequence[str]] = None,
+        file_args: Optional[Iterable[str]] = None,
+    ):
+        self.prefix = prefix or f"{func.__module__}.{func.__qualname__}"
+        self.signature = inspect.signature(func)
+        params = list(self.signature.parameters)
+        self.bound_name = (
+            params[0] if params and params[0] in BOUND_ARGUMENT_NAMES else None
+        )
+        self.vary_on = tuple(vary_on) if vary_on is not None else None
+        self.file_args = (
+            set(file_args)
+            if file_args is not None
+            else {name for name in params if is_file_argument(name)}
+        )
+
+    def parts(self, args: Tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """키에 들어갈 정규화된 인자 값"""
+        bound = self.signature.bind_partial(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        owner = arguments.pop(self.bound_name, None) if self.bound_name else None
+
+        if self.vary_on is None:
+            selected = arguments
+        else:
+            selected = {}
+            for name in self.vary_on:
+                if name.startswith("self."):
+                    selected[name] = getattr(owner, name[5:], None)
+                else:
+                    selected[name] = arguments.get(name)
+
+        return {
+            name: canonicalize(
+                file_fingerprint(value) if name in self.file_args else value
+            )
+            for name, value in selected.items()
+        }
+
+    def build(self, args: Tuple, kwargs: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            self.parts(args, kwargs), sort_keys=True, ensure_ascii=False, default=str
+        )
+        digest = hashlib.blake2b(
+            payload.encode(), digest_size=KEY_DIGEST_SIZE
+        ).hexdigest()
+        return f"{self.prefix}:{digest}"
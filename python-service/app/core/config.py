@@ -50,7 +50,37 @@ class Settings(BaseSettings):
     VERTEX_AI_EMBEDDING_MODEL: str = Field(default="text-embedding-004")
 
     # Embedding Service Configuration
-    EMBEDDING_SERVICE: str = Field(default="vertex_ai")  # vertex_ai only
+    EMBEDDING_SERVICE: str = Field(default="vertex_ai")  # vertex_ai | local
+    EMBEDDING_BATCH_SIZE: int = Field(default=5)  # Vertex AI 요청당 최대 텍스트 수
+    EMBEDDING_MAX_CONCURRENCY: int = Field(default=4)  # 동시에 보낼 배치 요청 수
+    LOCAL_EMBEDDING_DIMENSION: int = Field(default=768)
+    LOCAL_EMBEDDING_LATENCY: float = Field(default=0.0)  # 호출당 모의 지연 (초)
+
+    # 임베딩 캐시 (텍스트 해시 키, 메모리 LRU + Redis L2, 동일 텍스트 동시 요청 병합)
+    EMBEDDING_CACHE_ENABLED: bool = Field(default=True)
+    EMBEDDING_CACHE_MAX_ENTRIES: int = Field(default=10000)
+    EMBEDDING_CACHE_TTL: int = Field(default=604800)  # 7일
+
+    # 벡터 검색 (pgvector ANN 인덱스, DB 없이 쓸 때는 프로세스 내 NumPy 인덱스)
+    VECTOR_SEARCH_BACKEND: str = Field(default="pgvector")  # pgvector | local
+    VECTOR_INDEX_TYPE: str = Field(default="hnsw")  # hnsw | ivfflat
+    VECTOR_HNSW_M: int = Field(default=16)
+    VECTOR_HNSW_EF_CONSTRUCTION: int = Field(default=64)
+    # 쿼리별 후보 수 (LIMIT 이상으로 보정)
+    VECTOR_HNSW_EF_SEARCH: int = Field(default=40)
+    VECTOR_IVFFLAT_LISTS: int = Field(default=100)
+    VECTOR_IVFFLAT_PROBES: int = Field(default=10)
+    # 유형 필터 시 후보를 더 가져올 배수
+    VECTOR_SEARCH_OVERFETCH: int = Field(default=4)
+
+    # 의미 기반 검색 결과 캐시 (질의 임베딩 코사인 거리 이내면 결과 재사용)
+    SEARCH_CACHE_ENABLED: bool = Field(default=True)
+    SEARCH_CACHE_MAX_DISTANCE: float = Field(default=0.05)  # 코사인 거리 (1 - 유사도)
+    SEARCH_CACHE_TTL: int = Field(default=3600)  # 초
+    SEARCH_CACHE_MAX_ENTRIES: int = Field(default=2048)  # 프로세스 내 항목 수
+    # search_cache 테이블 조회 후보 수
+    SEARCH_CACHE_DB_CANDIDATES: int = Field(default=5)
+    SEARCH_CACHE_EXPIRY_INTERVAL: float = Field(default=60.0)  # 만료 정리 주기 (초)
 
     # Security
     SECRET_KEY: str = Field(default="your-secret-key-here")
@@ -74,6 +104,22 @@ class Settings(BaseSettings):
     REDIS_PORT: int = Field(default=6379)
     REDIS_DB: int = Field(default=0)
 
+    # Redis L2 캐시 (redis.asyncio 커넥션 풀 + 파이프라인)
+    REDIS_L2_ENABLED: bool = Field(default=True)
+    REDIS_MAX_CONNECTIONS: int = Field(default=20)
+    REDIS_SOCKET_TIMEOUT: float = Field(default=0.5)  # 초
+    # 연결 실패 후 재시도 간격 (초)
+    REDIS_L2_RETRY_INTERVAL: float = Field(default=30.0)
+    # 이 크기 이상만 압축 (바이트)
+    CACHE_COMPRESSION_THRESHOLD: int = Field(default=4096)
+
+    # 동일 분석 요청 병합 (single-flight)
+    SINGLE_FLIGHT_LOCK_TTL: float = Field(default=300.0)  # 워커 간 락 유지 시간 (초)
+    SINGLE_FLIGHT_POLL_INTERVAL: float = Field(default=0.25)  # 락 해제 확인 간격 (초)
+
+    # 속도 제한 - Redis를 쓸 수 없을 때 프로세스 내 링 버퍼로 추적할 최대 식별자 수
+    RATE_LIMIT_LOCAL_MAX_IDENTIFIERS: int = Field(default=4096)
+
     # Logging
     LOG_LEVEL: str = Field(default="DEBUG")
     LOG_FORMAT: str = Field(default="json")
@@ -81,6 +127,8 @@ class Settings(BaseSettings):
     # File Upload
     MAX_UPLOAD_SIZE: int = Field(default=10485760)  # 10MB
     ALLOWED_EXTENSIONS: List[str] = Field(default=[".xlsx", ".xls", ".csv"])
+    # 파일 ID 매핑/업로드 파일 보관 시간
+    FILE_MAPPING_MAX_AGE_HOURS: int = Field(default=24)
 
     # AI Processing
     MAX_TOKENS: int = Field(default=4000)
@@ -96,16 +144,52 @@ class Settings(BaseSettings):
     EXCEL_MAX_ERRORS_PER_SHEET: int = Field(default=1000)
     EXCEL_ANALYSIS_TIMEOUT: int = Field(default=300)  # 5 minutes
 
+    # 프로세스 내 캐시 엔진 (integrated_cache/unified_cache 공유, 바이트 기준 LRU)
+    CACHE_MEMORY_MAX_BYTES: int = Field(default=268435456)  # 256MB
+    CACHE_TIMER_WHEEL_TICK: float = Field(default=1.0)  # TTL 만료 확인 간격 (초)
+
+    # 대용량 파일 스트리밍 감지 (둘 중 하나라도 넘으면 스트리밍 모드)
+    STREAMING_DETECTION_FILE_SIZE_THRESHOLD: int = Field(default=20971520)  # 20MB
+    STREAMING_DETECTION_CELL_THRESHOLD: int = Field(default=2000000)
+    STREAMING_DETECTION_CHUNK_ROWS: int = Field(default=1000)
+
     # WebSocket Settings
     WS_RECONNECT_ATTEMPTS: int = Field(default=5)
     WS_RECONNECT_DELAY: int = Field(default=3000)  # milliseconds
     WS_PING_INTERVAL: int = Field(default=30)  # seconds
     WS_MESSAGE_SIZE_LIMIT: int = Field(default=1048576)  # 1MB
+    WS_SEND_QUEUE_SIZE: int = Field(default=64)  # 연결별 전송 대기 프레임 수
+    WS_SEND_TIMEOUT: float = Field(default=10.0)  # 프레임 하나 전송 제한 시간 (초)
+
+    # 진행률 알림 집계 (작업별 토큰 버킷, 작은 변화는 최소 간격까지 보류 후 최신 값만 전송)
+    PROGRESS_EMIT_RATE: float = Field(default=4.0)  # 작업당 초당 전송 수
+    PROGRESS_EMIT_BURST: int = Field(default=5)
+    PROGRESS_MIN_DELTA: float = Field(default=1.0)  # 즉시 전송할 최소 변화량 (%p)
+    PROGRESS_MIN_INTERVAL: float = Field(default=0.5)  # 작은 변화 보류 최대 시간 (초)
+    PROGRESS_MAX_TASKS: int = Field(default=10000)
 
     # Performance Settings
     BATCH_PROCESSING_SIZE: int = Field(default=100)
     PARALLEL_WORKERS: int = Field(default=4)
 
+    # 메트릭 - 프로세스 리소스는 요청마다가 아니라 이 간격으로 샘플링 (초)
+    METRICS_PROCESS_SAMPLE_INTERVAL: float = Field(default=5.0)
+
+    # 감지기 프로세스 풀 (CPU 집약 감지를 이벤트 루프 밖에서 시트 단위로 실행)
+    DETECTION_PROCESS_POOL_ENABLED: bool = Field(default=True)
+    DETECTION_PROCESS_MIN_CELLS: int = Field(default=20000)  # 작은 파일은 직접 실행
+    DETECTION_PROCESS_MAX_PENDING: int = Field(default=16)
+
+    # 실시간 수식 검증 - 세션별 증분 계산 모델 (LRU로 메모리 제한)
+    FORMULA_SESSION_MODEL_LIMIT: int = Field(default=32)
+
+    # 뷰포트 타일 렌더링 (파싱된 워크북/렌더링된 타일은 LRU로 보관)
+    VIEWPORT_TILE_ROWS: int = Field(default=50)
+    VIEWPORT_TILE_COLS: int = Field(default=26)
+    VIEWPORT_MAX_TILE_CELLS: int = Field(default=10000)
+    VIEWPORT_WORKBOOK_CACHE_SIZE: int = Field(default=8)
+    VIEWPORT_TILE_CACHE_SIZE: int = Field(default=512)
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -0,0 +1,114 @@
+"""
+Content Hash
+파일 내용 기반 해시(BLAKE2) - 업로드를 디스크에 쓰는 동안 계산하여 분석 캐시 키로 사용
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 스트리밍 읽기/쓰기 단위
+CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# 해시 길이 (바이트) - 캐시 키로 충분한 160비트
+DIGEST_SIZE = 20
+
+
+def new_content_hasher() -> "hashlib.blake2b":
+    """내용 해시 객체 생성"""
+    return hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+
+def hash_file(file_path: str) -> str:
+    """파일 내용을 스트리밍으로 읽어 해시 계산"""
+    hasher = new_content_hasher()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class ContentHashRegistry:
+    """경로별 내용 해시 등록부
+
+    업로드 시 계산한 해시를 재사용하고, 파일 크기나 수정 시각이 바뀌면
+    (예: 수정 후 재검증) 다시 계산합니다.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        # {경로: (크기, 수정 시각 ns, 해시)}
+        self._entries: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+
+    def register(self, file_path: str, digest: str):
+        """이미 계산된 해시 등록"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return
+        self._entries[file_path] = (stat.st_size, stat.st_mtime_ns, digest)
+        self._entries.move_to_end(file_path)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def forget(self, file_path: str):
+        self._entries.pop(file_path, None)
+
+    def lookup(self, file_path: str) -> Optional[str]:
+        """등록된 해시가 현재 파일과 일치하면 반환 (계산하지 않음)"""
+        entry = self._entries.get(file_path)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            self.forget(file_path)
+            return None
+        size, mtime_ns, digest = entry
+        if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+            return None
+        return digest
+
+    async def resolve(self, file_path: str) -> Optional[str]:
+        """파일 내용 해시 조회 - 없거나 오래되면 스레드에서 계산 (읽을 수 없으면 None)"""
+        digest = self.lookup(file_path)
+        if digest:
+            return digest
+
+        try:
+            digest = await asyncio.to_thread(hash_file, file_path)
+        except OSError:
+            return None
+
+        self.register(file_path, digest)
+        return digest
+
+
+async def save_upload_to_temp(upload: Any, suffix: str = "") -> Tuple[str, str]:
+    """업로드 파일을 임시 파일로 저장하면서 내용 해시 계산
+
+    Returns:
+        (임시 파일 경로, 내용 해시)
+    """
+    hasher = new_content_hasher()
+    await upload.seek(0)
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
+        while chunk := await upload.read(CHUNK_SIZE):
+            hasher.update(chunk)
+            tmp_file.write(chunk)
+        tmp_path = tmp_file.name
+
+    digest = hasher.hexdigest()
+    content_hash_registry.register(tmp_path, digest)
+    return tmp_path, digest
+
+
+# 전역 인스턴스
+content_hash_registry = ContentHashRegistry()
@@ -1,21 +1,58 @@
 """
 File Path Resolver
 파일 ID와 실제 경로 매핑 관리
+
+매핑은 워커 간에 공유되도록 Redis에 저장합니다.
+- {prefix}          해시 (file_id -> 매핑 JSON), 조회 O(1)
+- {prefix}:created  정렬 집합 (file_id -> 생성 시각), 만료 대상만 범위 조회
+Redis를 쓸 수 없으면 생성 순서가 유지되는 프로세스 내 사전으로 동작합니다.
 """
 
+import json
 import os
-from typing import Dict, Optional
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
 from datetime import datetime
 import logging
 
+from app.core.redis_l2 import redis_l2_cache
+
 logger = logging.getLogger(__name__)
 
 
 class FilePathResolver:
     """파일 ID와 실제 경로 매핑"""
 
-    # 메모리 캐시 (실제로는 DB나 Redis 사용 권장)
-    _mappings: Dict[str, Dict[str, any]] = {}
+    # 공유 매핑 저장소 (Redis L2 커넥션 풀 재사용)
+    redis_cache = redis_l2_cache
+    key_prefix = "excel_unified:file_paths"
+
+    # 프로세스 내 매핑 (생성 순서 = 만료 순서, 앞에서부터 정리)
+    _mappings: "OrderedDict[str, Dict[str, any]]" = OrderedDict()
+
+    @classmethod
+    def _created_key(cls) -> str:
+        return f"{cls.key_prefix}:created"
+
+    @classmethod
+    def _remember(cls, file_id: str, mapping: Dict[str, any]):
+        cls._mappings.pop(file_id, None)
+        cls._mappings[file_id] = mapping
+
+    @classmethod
+    async def _forget(cls, file_id: str):
+        cls._mappings.pop(file_id, None)
+        client = cls.redis_cache.get_client()
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline(transaction=True)
+            pipe.hdel(cls.key_prefix, file_id)
+            pipe.zrem(cls._created_key(), file_id)
+            await pipe.execute()
+        except Exception as e:
+            cls.redis_cache.mark_unavailable(e)
 
     @classmethod
     async def save_file_mapping(
@@ -29,13 +66,56 @@ class FilePathResolver:
             file_path: 실제 파일 경로
             metadata: 추가 메타데이터
         """
-        cls._mappings[file_id] = {
+        mapping = {
             "file_path": file_path,
             "created_at": datetime.now().isoformat(),
             "metadata": metadata or {},
         }
+        cls._remember(file_id, mapping)
+
+        client = cls.redis_cache.get_client()
+        if client is not None:
+            try:
+                pipe = client.pipeline(transaction=True)
+                pipe.hset(
+                    cls.key_prefix, file_id, json.dumps(mapping, ensure_ascii=False)
+                )
+                pipe.zadd(cls._created_key(), {file_id: time.time()})
+                await pipe.execute()
+            except Exception as e:
+                cls.redis_cache.mark_unavailable(e)
+
         logger.info(f"파일 매핑 저장: {file_id} -> {file_path}")
 
+    @classmethod
+    async def get_file_mapping(cls, file_id: str) -> Optional[Dict[str, any]]:
+        """
+        파일 ID로 매핑 조회 (프로세스 내 사전 -> 공유 저장소 순)
+
+        Args:
+            file_id: 파일 고유 ID
+
+        Returns:
+            매핑 정보 또는 None
+        """
+        mapping = cls._mappings.get(file_id)
+        if mapping is not None:
+            return mapping
+
+        client = cls.redis_cache.get_client()
+        if client is None:
+            return None
+        try:
+            raw = await client.hget(cls.key_prefix, file_id)
+        except Exception as e:
+            cls.redis_cache.mark_unavailable(e)
+            return None
+        if raw is None:
+            return None
+
+        # 다른 워커가 저장한 매핑 (생성 순서를 지키기 위해 로컬에는 두지 않음)
+        return json.loads(raw)
+
     @classmethod
     async def get_file_path(cls, file_id: str) -> Optional[str]:
         """
@@ -47,7 +127,7 @@ class FilePathResolver:
         Returns:
             파일 경로 또는 None
         """
-        mapping = cls._mappings.get(file_id)
+        mapping = await cls.get_file_mapping(file_id)
         if mapping:
             file_path = mapping["file_path"]
             # 파일 존재 확인
@@ -56,7 +136,7 @@ class FilePathResolver:
             else:
                 logger.warning(f"매핑된 파일이 존재하지 않음: {file_path}")
                 # 매핑 제거
-                del cls._mappings[file_id]
+                await cls._forget(file_id)
 
         # 폴백: 규칙 기반 경로 생성
         default_path = f"/tmp/excel_files/{file_id}.xlsx"
@@ -99,32 +179,64 @@ class FilePathResolver:
         Returns:
             정리된 매핑 수
         """
-        from datetime import datetime, timedelta
-
-        current_time = datetime.now()
-        cutoff_time = current_time - timedelta(hours=max_age_hours)
-
-        to_remove = []
-        for file_id, mapping in cls._mappings.items():
-            created_at = datetime.fromisoformat(mapping["created_at"])
-            if created_at < cutoff_time:
-                # 파일도 함께 삭제
-                file_path = mapping["file_path"]
-                if os.path.exists(file_path):
-                    try:
-                        os.remove(file_path)
-                    except Exception as e:
-                        logger.error(f"파일 삭제 실패: {file_path}, {str(e)}")
-                to_remove.append(file_id)
-
-        # 매핑 제거
-        for file_id in to_remove:
-            del cls._mappings[file_id]
-
-        logger.info(f"오래된 매핑 {len(to_remove)}개 정리됨")
-        return len(to_remove)
+        cutoff = time.time() - max_age_hours * 3600
+        cutoff_time = datetime.fromtimestamp(cutoff)
+
+        # 프로세스 내 매핑: 생성 순서대로 앞에서부터 만료된 것만 확인
+        expired: Dict[str, str] = {}
+        while cls._mappings:
+            file_id, mapping = next(iter(cls._mappings.items()))
+            if datetime.fromisoformat(mapping["created_at"]) >= cutoff_time:
+                break
+            cls._mappings.popitem(last=False)
+            expired[file_id] = mapping["file_path"]
+
+        # 공유 매핑: 생성 시각 인덱스에서 만료 구간만 조회
+        expired.update(await cls._pop_expired_shared(cutoff))
+
+        # 파일도 함께 삭제
+        for file_path in expired.values():
+            if os.path.exists(file_path):
+                try:
+                    os.remove(file_path)
+                except Exception as e:
+                    logger.error(f"파일 삭제 실패: {file_path}, {str(e)}")
+
+        logger.info(f"오래된 매핑 {len(expired)}개 정리됨")
+        return len(expired)
+
+    @classmethod
+    async def _pop_expired_shared(cls, cutoff: float) -> Dict[str, str]:
+        """공유 저장소에서 만료된 매핑 제거 - 이 워커가 제거한 항목만 반환"""
+        client = cls.redis_cache.get_client()
+        if client is None:
+            return {}
+        try:
+            raw_ids = await client.zrangebyscore(cls._created_key(), "-inf", cutoff)
+            if not raw_ids:
+                return {}
+            file_ids: List[str] = [
+                raw.decode() if isinstance(raw, bytes) else raw for raw in raw_ids
+            ]
+            raw_mappings = await client.hmget(cls.key_prefix, file_ids)
+
+            pipe = client.pipeline(transaction=False)
+            for file_id in file_ids:
+                pipe.zrem(cls._created_key(), file_id)
+            pipe.hdel(cls.key_prefix, *file_ids)
+            removed = (await pipe.execute())[:-1]
+        except Exception as e:
+            cls.redis_cache.mark_unavailable(e)
+            return {}
+
+        # 여러 워커가 동시에 정리해도 ZREM에 성공한 워커만 파일을 삭제
+        return {
+            file_id: json.loads(raw)["file_path"]
+            for file_id, raw, was_removed in zip(file_ids, raw_mappings, removed)
+            if was_removed and raw is not None
+        }
 
     @classmethod
     def get_all_mappings(cls) -> Dict[str, Dict]:
-        """모든 매핑 조회 (디버깅용)"""
-        return cls._mappings.copy()
+        """이 워커의 프로세스 내 매핑 조회 (디버깅용)"""
+        return dict(cls._mappings)
@@ -4,31 +4,34 @@ Integrated Cache System
 """
 
 import asyncio
-from typing import Any, Dict, Optional, List
-from datetime import datetime, timedelta
+from collections import defaultdict
+from typing import Any, Dict, Optional, List, Sequence, Iterable
 import logging
 from functools import wraps
 
-from app.core.unified_cache import unified_cache
+from app.core.cache_engine import CacheEngine, estimate_size, memory_cache_engine
+from app.core.cache_keys import CacheKeyBuilder
+from app.core.redis_l2 import redis_l2_cache
 from app.core.cache import CACHE_TTL
 
 logger = logging.getLogger(__name__)
 
+# None도 캐시할 수 있도록 미스를 구분하는 표식
+_MISSING = object()
+
 
 class IntegratedCache:
     """통합 캐시 시스템 - L1(메모리) + L2(Redis)"""
 
-    def __init__(self):
-        # L1: 메모리 캐시 (빠른 접근)
-        self._memory_cache: Dict[str, Dict[str, Any]] = {}
-        self._memory_cache_metadata: Dict[str, datetime] = {}
+    def __init__(self, engine: Optional[CacheEngine] = None):
+        # L1: 메모리 캐시 (unified_cache와 같은 LRU/TTL 엔진 공유)
+        self.memory = engine or memory_cache_engine
 
-        # L2: Redis 캐시 (unified_cache 사용)
-        self.redis_cache = unified_cache
+        # L2: Redis 캐시 (비동기 커넥션 풀 + msgpack 코덱)
+        self.redis_cache = redis_l2_cache
 
         # 캐시 설정
         self.ttl_config = CACHE_TTL
-        self.max_memory_items = 1000  # 메모리 캐시 최대 항목 수
 
         # 통계
         self.stats = {
@@ -38,8 +41,15 @@ class IntegratedCache:
             "redis_misses": 0,
             "total_gets": 0,
             "total_sets": 0,
+            "analysis_hits": 0,
+            "analysis_misses": 0,
         }
 
+        # @cache_result 접두사별 통계
+        self.prefix_stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "bytes": 0}
+        )
+
     async def get(self, key: str, cache_level: str = "all") -> Optional[Any]:
         """
         캐시에서 값 조회
@@ -55,15 +65,12 @@ class IntegratedCache:
 
         # L1 메모리 캐시 확인
         if cache_level in ["all", "memory"]:
-            if key in self._memory_cache:
-                # TTL 확인
-                if self._is_memory_cache_valid(key):
-                    self.stats["memory_hits"] += 1
-                    logger.debug(f"Memory cache hit: {key}")
-                    return self._memory_cache[key]["value"]
-                else:
-                    # 만료된 항목 제거
-                    self._remove_from_memory(key)
+            # 만료 항목은 엔진이 미스로 처리하고 제거
+            value = self.memory.get(key, _MISSING)
+            if value is not _MISSING:
+                self.stats["memory_hits"] += 1
+                logger.debug(f"Memory cache hit: {key}")
+                return value
 
             self.stats["memory_misses"] += 1
 
@@ -124,6 +131,59 @@ class IntegratedCache:
 
         return success
 
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        여러 키 조회 - L1에서 먼저 찾고, 나머지는 Redis MGET 한 번으로 조회
+
+        Returns:
+            찾은 키와 값 (없는 키는 제외)
+        """
+        found = {}
+        misses = []
+        for key in keys:
+            self.stats["total_gets"] += 1
+            value = self.memory.get(key, _MISSING)
+            if value is not _MISSING:
+                self.stats["memory_hits"] += 1
+                found[key] = value
+            else:
+                self.stats["memory_misses"] += 1
+                misses.append(key)
+
+        if misses:
+            try:
+                redis_values = await self.redis_cache.get_many(misses)
+            except Exception as e:
+                logger.error(f"Redis cache get_many error: {str(e)}")
+                redis_values = {}
+
+            for key in misses:
+                if key in redis_values:
+                    self.stats["redis_hits"] += 1
+                    value = redis_values[key]
+                    self._set_memory_cache(key, value, ttl=300)  # 5분
+                    found[key] = value
+                else:
+                    self.stats["redis_misses"] += 1
+
+        return found
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """여러 키 저장 - L1에 저장하고 Redis에는 파이프라인 한 번으로 기록"""
+        self.stats["total_sets"] += len(items)
+
+        if ttl is None:
+            ttl = self.ttl_config.get("DEFAULT", 3600)
+
+        for key, value in items.items():
+            self._set_memory_cache(key, value, ttl)
+
+        try:
+            return await self.redis_cache.set_many(items, ttl)
+        except Exception as e:
+            logger.error(f"Redis cache set_many error: {str(e)}")
+            return False
+
     async def delete(self, key: str) -> bool:
         """캐시에서 값 삭제"""
         success = True
@@ -145,66 +205,53 @@ class IntegratedCache:
         count = 0
 
         # 메모리 캐시에서 삭제
-        keys_to_remove = [k for k in self._memory_cache if pattern in k]
-        for key in keys_to_remove:
-            self._remove_from_memory(key)
-            count += 1
+        count += self.memory.delete_where(lambda key: pattern in key)
 
-        # Redis는 unified_cache의 기능 사용
-        # Redis 패턴 삭제는 구현이 복잡하므로 생략
+        # Redis에서 삭제 (SCAN + UNLINK)
+        try:
+            count += await self.redis_cache.delete_pattern(pattern)
+        except Exception as e:
+            logger.error(f"Redis cache pattern delete error: {str(e)}")
 
         return count
 
     def _set_memory_cache(self, key: str, value: Any, ttl: int):
-        """메모리 캐시에 저장"""
-        # 캐시 크기 제한 확인
-        if len(self._memory_cache) >= self.max_memory_items:
-            self._evict_oldest()
-
-        self._memory_cache[key] = {"value": value, "ttl": ttl}
-        self._memory_cache_metadata[key] = datetime.now()
-
-    def _is_memory_cache_valid(self, key: str) -> bool:
-        """메모리 캐시 항목이 유효한지 확인"""
-        if key not in self._memory_cache_metadata:
-            return False
-
-        created_at = self._memory_cache_metadata[key]
-        ttl = self._memory_cache[key].get("ttl", 3600)
-
-        return datetime.now() < created_at + timedelta(seconds=ttl)
+        """메모리 캐시에 저장 (용량 초과 시 엔진이 LRU 순서로 제거)"""
+        self.memory.set(key, value, ttl=ttl)
 
     def _remove_from_memory(self, key: str):
         """메모리에서 제거"""
-        self._memory_cache.pop(key, None)
-        self._memory_cache_metadata.pop(key, None)
-
-    def _evict_oldest(self):
-        """가장 오래된 항목 제거 (LRU)"""
-        if not self._memory_cache_metadata:
-            return
-
-        oldest_key = min(self._memory_cache_metadata.items(), key=lambda x: x[1])[0]
-        self._remove_from_memory(oldest_key)
+        self.memory.delete(key)
 
     async def get_analysis(self, file_id: str) -> Optional[Dict[str, Any]]:
         """분석 결과 조회 (unified_cache 호환)"""
-        return await self.get(f"analysis:{file_id}")
+        analysis = await self.get(f"analysis:{file_id}")
+        if analysis is not None:
+            self.stats["analysis_hits"] += 1
+        else:
+            self.stats["analysis_misses"] += 1
+        return analysis
 
-    async def set_analysis(self, file_id: str, analysis: Dict[str, Any]):
+    async def set_analysis(
+        self, file_id: str, analysis: Dict[str, Any], ttl: Optional[int] = None
+    ):
         """분석 결과 저장 (unified_cache 호환)"""
         await self.set(
-            f"analysis:{file_id}", analysis, ttl=self.ttl_config.get("LONG", 7200)
+            f"analysis:{file_id}",
+            analysis,
+            ttl=ttl or self.ttl_config.get("LONG", 7200),
         )
 
     async def get_errors(self, file_id: str) -> Optional[List[Any]]:
         """오류 목록 조회 (unified_cache 호환)"""
         return await self.get(f"errors:{file_id}")
 
-    async def set_errors(self, file_id: str, errors: List[Any]):
+    async def set_errors(
+        self, file_id: str, errors: List[Any], ttl: Optional[int] = None
+    ):
         """오류 목록 저장 (unified_cache 호환)"""
         await self.set(
-            f"errors:{file_id}", errors, ttl=self.ttl_config.get("LONG", 7200)
+            f"errors:{file_id}", errors, ttl=ttl or self.ttl_config.get("LONG", 7200)
         )
 
     def get_stats(self) -> Dict[str, Any]:
@@ -217,19 +264,42 @@ class IntegratedCache:
             else 0
         )
 
+        analysis_lookups = self.stats["analysis_hits"] + self.stats["analysis_misses"]
+        analysis_hit_rate = (
+            self.stats["analysis_hits"] / analysis_lookups if analysis_lookups else 0
+        )
+
         return {
             **self.stats,
-            "memory_cache_size": len(self._memory_cache),
+            "memory_cache_size": len(self.memory),
+            "memory_cache_bytes": self.memory.size_bytes,
+            "memory_cache_max_bytes": self.memory.max_bytes,
             "hit_rate": round(hit_rate * 100, 2),
+            "analysis_hit_rate": round(analysis_hit_rate * 100, 2),
+            "redis": self.redis_cache.get_stats(),
+            "prefixes": self.get_prefix_stats(),
         }
 
-    async def warmup(self, keys: List[str]):
-        """캐시 워밍업 - 자주 사용되는 키들을 미리 로드"""
-        tasks = []
-        for key in keys:
-            tasks.append(self.get(key))
+    def record_prefix_access(self, prefix: str, hit: bool, size: int = 0):
+        """@cache_result 접두사별 적중/미스/저장 바이트 기록"""
+        stats = self.prefix_stats[prefix]
+        stats["hits" if hit else "misses"] += 1
+        stats["bytes"] += size
+
+    def get_prefix_stats(self) -> Dict[str, Dict[str, Any]]:
+        """접두사별 통계 (적중률 포함)"""
+        result = {}
+        for prefix, stats in self.prefix_stats.items():
+            lookups = stats["hits"] + stats["misses"]
+            result[prefix] = {
+                **stats,
+                "hit_rate": round(stats["hits"] / lookups * 100, 2) if lookups else 0,
+            }
+        return result
 
-        await asyncio.gather(*tasks, return_exceptions=True)
+    async def warmup(self, keys: List[str]):
+        """캐시 워밍업 - 자주 사용되는 키들을 미리 로드 (Redis 왕복 1회)"""
+        await self.get_many(keys)
 
 
 # 전역 인스턴스
@@ -237,33 +307,41 @@ integrated_cache = IntegratedCache()
 
 
 def cache_result(
-    prefix: str = "", ttl: Optional[int] = None, key_builder: Optional[callable] = None
+    prefix: str = "",
+    ttl: Optional[int] = None,
+    key_builder: Optional[callable] = None,
+    vary_on: Optional[Sequence[str]] = None,
+    file_args: Optional[Iterable[str]] = None,
 ):
     """
     함수 결과 캐싱 데코레이터 (기존 @cached 대체)
 
     Args:
-        prefix: 캐시 키 접두사
+        prefix: 캐시 키 접두사 (기본값: 모듈.함수 이름)
         ttl: 캐시 유효 시간
         key_builder: 커스텀 키 생성 함수
+        vary_on: 키에 포함할 인자 이름 ("self.속성" 가능, 기본값: self를 뺀 전체 인자)
+        file_args: 내용 기준으로 구분할 파일 경로 인자 (기본값: *_path, path, file)
     """
 
     def decorator(func):
+        default_builder = CacheKeyBuilder(
+            func, prefix=prefix or None, vary_on=vary_on, file_args=file_args
+        )
+        stats_prefix = prefix or default_builder.prefix
+
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            # 캐시 키 생성
+            # 캐시 키 생성 (self 제외, 인자 정규화 후 해시)
             if key_builder:
                 cache_key = key_builder(*args, **kwargs)
             else:
-                # 기본 키 생성
-                key_parts = [prefix or func.__name__]
-                key_parts.extend(str(arg) for arg in args)
-                key_parts.extend(f"{k}:{v}" for k, v in sorted(kwargs.items()))
-                cache_key = ":".join(key_parts)
+                cache_key = default_builder.build(args, kwargs)
 
             # 캐시 조회
             cached_value = await integrated_cache.get(cache_key)
             if cached_value is not None:
+                integrated_cache.record_prefix_access(stats_prefix, hit=True)
                 return cached_value
 
             # 함수 실행
@@ -271,6 +349,9 @@ def cache_result(
 
             # 결과 캐싱
             await integrated_cache.set(cache_key, result, ttl=ttl)
+            integrated_cache.record_prefix_access(
+                stats_prefix, hit=False, size=estimate_size(result)
+            )
 
             return result
 
@@ -3,8 +3,11 @@
 모든 서비스에서 일관된 로깅 형식과 레벨 제공
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from datetime import datetime
 from typing import Optional
@@ -137,9 +140,7 @@ def get_performance_logger(name: str) -> logging.Logger:
     perf_log_file = os.getenv("PERFORMANCE_LOG_FILE", "logs/performance.log")
 
     if perf_log_file and not any(
-        isinstance(h, logging.FileHandler)
-        and h.baseFilename.endswith("performance.log")
-        for h in logger.handlers
+        isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers
     ):
         # 성능 로그 디렉토리 생성
         log_dir = os.path.dirname(perf_log_file)
@@ -154,7 +155,13 @@ def get_performance_logger(name: str) -> logging.Logger:
         perf_formatter = logging.Formatter(perf_format)
         perf_handler.setFormatter(perf_formatter)
 
-        logger.addHandler(perf_handler)
+        # 요청 경로에서 파일 I/O를 하지 않도록 큐에 넣고 백그라운드 스레드가 기록
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, perf_handler)
+        listener.start()
+        atexit.register(listener.stop)
+
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
         logger.setLevel(logging.INFO)
 
         # 콘솔 출력 방지 (성능 로그는 파일에만 기록)
@@ -0,0 +1,254 @@
+"""
+Metrics Core
+저부하 메트릭 수집 기본 요소
+- LatencyHistogram: 로그 버킷(HDR 방식) 히스토그램, 기록 O(1), 전체 기간 백분위수
+- ProcessSampler: 프로세스 메모리/CPU를 요청마다가 아니라 백그라운드 타이머로 샘플링
+- Prometheus 텍스트 형식 내보내기 (prometheus-client 설치 시)
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+
+import psutil
+
+from app.core.config import settings
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        CollectorRegistry,
+        generate_latest,
+    )
+    from prometheus_client.core import (
+        CounterMetricFamily,
+        GaugeMetricFamily,
+        HistogramMetricFamily,
+    )
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+logger = logging.getLogger(__name__)
+
+# Prometheus 히스토그램 경계 (초)
+PROMETHEUS_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class LatencyHistogram:
+    """로그 버킷 지연 시간 히스토그램 (마이크로초 단위 정수로 기록)
+
+    2의 거듭제곱 구간마다 2^sub_bucket_bits개의 하위 버킷을 두므로
+    상대 오차가 약 1/2^sub_bucket_bits 이내입니다 (기본 5비트 = 약 3%).
+    """
+
+    __slots__ = (
+        "sub_bucket_bits",
+        "sub_buckets",
+        "counts",
+        "count",
+        "total",
+        "min",
+        "max",
+    )
+
+    def __init__(self, sub_bucket_bits: int = 5, max_value_bits: int = 36):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.sub_buckets = 1 << sub_bucket_bits
+        # 2^36us(약 19시간)를 넘는 값은 마지막 버킷에 기록
+        size = self.sub_buckets * (max_value_bits - sub_bucket_bits + 1)
+        self.counts: List[int] = [0] * size
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def _index(self, micros: int) -> int:
+        if micros < self.sub_buckets:
+            return max(micros, 0)
+        shift = micros.bit_length() - 1 - self.sub_bucket_bits
+        index = self.sub_buckets * (shift + 1) + (micros >> shift) - self.sub_buckets
+        return min(index, len(self.counts) - 1)
+
+    def _upper_bound(self, index: int) -> float:
+        """버킷 상한 (초)"""
+        if index < self.sub_buckets:
+            return (index + 1) / 1_000_000
+        shift = index // self.sub_buckets - 1
+        mantissa = index % self.sub_buckets + self.sub_buckets
+        return ((mantissa + 1) << shift) / 1_000_000
+
+    def record(self, seconds: float):
+        self.counts[self._index(int(seconds * 1_000_000))] += 1
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def percentiles(self, quantiles: Iterable[float]) -> List[float]:
+        """여러 백분위수를 버킷을 한 번만 훑어 계산 (quantiles는 오름차순)"""
+        quantiles = list(quantiles)
+        if not self.count:
+            return [0.0] * len(quantiles)
+
+        results = []
+        targets = iter(max(1, int(q * self.count + 0.5)) for q in quantiles)
+        target = next(targets)
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if not bucket_count:
+                continue
+            seen += bucket_count
+            while target is not None and seen >= target:
+                results.append(min(self._upper_bound(index), self.max))
+                target = next(targets, None)
+            if target is None:
+                break
+        return results
+
+    def percentile(self, quantile: float) -> float:
+        return self.percentiles([quantile])[0]
+
+    def cumulative_buckets(self, bounds: Iterable[float]) -> List[Tuple[float, int]]:
+        """Prometheus 형식 누적 버킷 [(경계, 경계 이하 개수)]"""
+        result = []
+        seen = 0
+        index = 0
+        for bound in bounds:
+            while index < len(self.counts) and self._upper_bound(index) <= bound:
+                seen += self.counts[index]
+                index += 1
+            result.append((bound, seen))
+        return result
+
+
+class ProcessSampler:
+    """프로세스 리소스 주기 샘플러 (요청 경로에서는 마지막 샘플만 읽음)"""
+
+    def __init__(self, interval: Optional[float] = None):
+        self.interval = interval or settings.METRICS_PROCESS_SAMPLE_INTERVAL
+        self.process = psutil.Process(os.getpid())
+        self.latest: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def memory_mb(self) -> float:
+        if not self.latest:
+            self.sample()
+        return self.latest.get("memory_mb", 0.0)
+
+    def sample(self) -> Dict[str, float]:
+        try:
+            with self.process.oneshot():
+                self.latest = {
+                    "timestamp": time.time(),
+                    "memory_mb": self.process.memory_info().rss / 1024 / 1024,
+                    "cpu_percent": self.process.cpu_percent(),
+                    "num_threads": self.process.num_threads(),
+                }
+        except Exception as e:
+            logger.debug(f"프로세스 샘플링 실패: {e}")
+        return self.latest
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            self.sample()
+            await asyncio.sleep(self.interval)
+
+
+class _ServiceMetricsCollector:
+    """스크레이프 시점에 MetricsCollector/ProcessSampler 값을 Prometheus 형식으로 변환"""
+
+    def __init__(self, metrics_collector: Any, sampler: ProcessSampler):
+        self.metrics_collector = metrics_collector
+        self.sampler = sampler
+
+    def collect(self):
+        requests = CounterMetricFamily(
+            "excel_service_requests", "Requests handled", labels=["endpoint"]
+        )
+        errors = CounterMetricFamily(
+            "excel_service_request_errors",
+            "Requests with status >= 400",
+            labels=["endpoint"],
+        )
+        latency = HistogramMetricFamily(
+            "excel_service_request_duration_seconds",
+            "Request latency",
+            labels=["endpoint"],
+        )
+
+        for endpoint, metric in list(self.metrics_collector.metrics.items()):
+            histogram: LatencyHistogram = metric["histogram"]
+            requests.add_metric([endpoint], metric["count"])
+            errors.add_metric([endpoint], metric["errors"])
+            buckets = [
+                (str(bound), count)
+                for bound, count in histogram.cumulative_buckets(PROMETHEUS_BUCKETS)
+            ]
+            buckets.append(("+Inf", histogram.count))
+            latency.add_metric([endpoint], buckets, histogram.total)
+
+        yield requests
+        yield errors
+        yield latency
+
+        for name, key, description in (
+            ("excel_service_process_memory_mb", "memory_mb", "Resident memory (MB)"),
+            ("excel_service_process_cpu_percent", "cpu_percent", "Process CPU (%)"),
+            ("excel_service_process_threads", "num_threads", "Process threads"),
+        ):
+            if key in self.sampler.latest:
+                yield GaugeMetricFamily(
+                    name, description, value=self.sampler.latest[key]
+                )
+
+
+def build_prometheus_registry(
+    metrics_collector: Any, sampler: ProcessSampler
+) -> Optional["CollectorRegistry"]:
+    """서비스 전용 레지스트리 (prometheus-client가 없으면 None)"""
+    if not PROMETHEUS_AVAILABLE:
+        return None
+    registry = CollectorRegistry()
+    registry.register(_ServiceMetricsCollector(metrics_collector, sampler))
+    return registry
+
+
+def render_prometheus(registry: Optional["CollectorRegistry"]) -> bytes:
+    if registry is None:
+        return b"# prometheus-client is not installed\n"
+    return generate_latest(registry)
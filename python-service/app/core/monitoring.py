@@ -14,9 +14,15 @@ from functools import wraps
 import traceback
 import psutil
 import os
-from collections import defaultdict, deque
+from collections import defaultdict
 
 from app.core.integrated_cache import integrated_cache
+from app.core.metrics import (
+    LatencyHistogram,
+    ProcessSampler,
+    build_prometheus_registry,
+    render_prometheus,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +37,8 @@ class MetricsCollector:
                 "total_time": 0,
                 "errors": 0,
                 "last_error": None,
-                "percentiles": deque(maxlen=1000),  # 최근 1000개 요청만 저장
+                # 전체 기간 지연 시간 분포 (기록 O(1), 메모리 고정)
+                "histogram": LatencyHistogram(),
             }
         )
         self.start_time = time.time()
@@ -47,7 +54,7 @@ class MetricsCollector:
         metric = self.metrics[endpoint]
         metric["count"] += 1
         metric["total_time"] += duration
-        metric["percentiles"].append(duration)
+        metric["histogram"].record(duration)
 
         if status_code >= 400:
             metric["errors"] += 1
@@ -85,16 +92,18 @@ class MetricsCollector:
         if count == 0:
             return {"count": 0, "errors": 0}
 
-        percentiles = sorted(metric["percentiles"])
+        histogram: LatencyHistogram = metric["histogram"]
+        p50, p90, p99 = histogram.percentiles((0.5, 0.9, 0.99))
 
         return {
             "count": count,
             "errors": metric["errors"],
             "error_rate": metric["errors"] / count,
             "avg_time": metric["total_time"] / count,
-            "p50": percentiles[len(percentiles) // 2] if percentiles else 0,
-            "p90": percentiles[int(len(percentiles) * 0.9)] if percentiles else 0,
-            "p99": percentiles[int(len(percentiles) * 0.99)] if percentiles else 0,
+            "p50": p50,
+            "p90": p90,
+            "p99": p99,
+            "max": histogram.max,
             "last_error": metric["last_error"],
         }
 
@@ -245,6 +254,13 @@ class RequestLogger:
 # 전역 인스턴스
 metrics_collector = MetricsCollector()
 system_monitor = SystemMonitor()
+process_sampler = ProcessSampler()
+prometheus_registry = build_prometheus_registry(metrics_collector, process_sampler)
+
+
+def export_prometheus_metrics() -> bytes:
+    """Prometheus 텍스트 형식 메트릭"""
+    return render_prometheus(prometheus_registry)
 
 
 # 데코레이터
@@ -4,14 +4,17 @@
 """
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
-from typing import List, Callable, Any, Dict, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Deque, List, Callable, Any, Dict, Optional, Set
 import multiprocessing
 import logging
 from dataclasses import dataclass
 from enum import Enum
 import time
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,10 +40,142 @@ class ProcessingResult:
 class ParallelProcessor:
     """병렬 처리 관리자"""
 
-    def __init__(self, max_workers: Optional[int] = None):
+    def __init__(
+        self, max_workers: Optional[int] = None, max_pending: Optional[int] = None
+    ):
         self.max_workers = max_workers or multiprocessing.cpu_count()
+        # 프로세스 풀에 동시에 제출할 수 있는 작업 수 (초과분은 대기열에서 기다림)
+        self.max_pending = max_pending or self.max_workers * 2
         self.thread_executor = ThreadPoolExecutor(max_workers=self.max_workers)
-        self.process_executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        self._process_executor: Optional[ProcessPoolExecutor] = None
+
+        # 프로세스 작업 대기열 상태
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._active_futures: Set[Future] = set()
+        self._request_futures: Dict[str, Set[asyncio.Future]] = {}
+        self.process_stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "cancelled": 0,
+        }
+
+    @property
+    def process_executor(self) -> ProcessPoolExecutor:
+        """프로세스 풀 (처음 사용할 때 생성)"""
+        if self._process_executor is None:
+            self._process_executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._process_executor
+
+    async def run_in_process(
+        self, func: Callable, *args: Any, request_id: Optional[str] = None
+    ) -> Any:
+        """CPU 집약 작업을 프로세스 풀에서 실행
+
+        제출 수는 ``max_pending`` 으로 제한되며, ``request_id`` 를 지정하면
+        ``cancel_request`` 로 해당 요청의 대기/실행 중 작업을 한 번에 취소할 수 있습니다.
+        func와 인자는 피클 가능해야 합니다.
+        """
+        await self._acquire_slot(request_id)
+        future: Optional[Future] = None
+        wrapped: Optional[asyncio.Future] = None
+        try:
+            future = self.process_executor.submit(func, *args)
+            self._active_futures.add(future)
+            self.process_stats["submitted"] += 1
+
+            wrapped = asyncio.wrap_future(future)
+            self._track(request_id, wrapped)
+            result = await wrapped
+            self.process_stats["completed"] += 1
+            return result
+        except asyncio.CancelledError:
+            # 대기 중이던 작업은 풀에서도 취소되고, 실행 중인 작업은 결과를 버림
+            self.process_stats["cancelled"] += 1
+            raise
+        except Exception:
+            self.process_stats["failed"] += 1
+            raise
+        finally:
+            if future is not None:
+                self._active_futures.discard(future)
+            if wrapped is not None:
+                self._untrack(request_id, wrapped)
+            self._release_slot()
+
+    def cancel_request(self, request_id: str) -> int:
+        """요청에 속한 프로세스 작업 취소 (대기열에 있는 작업 포함)"""
+        futures = self._request_futures.pop(request_id, set())
+        cancelled = 0
+        for future in futures:
+            if future.cancel():
+                cancelled += 1
+        if cancelled:
+            logger.info(f"프로세스 작업 취소: {request_id} ({cancelled}개)")
+        return cancelled
+
+    def get_queue_stats(self) -> Dict[str, Any]:
+        """프로세스 풀 대기열 통계"""
+        pending_in_pool = sum(
+            1 for f in self._active_futures if not f.running() and not f.done()
+        )
+        running = sum(1 for f in self._active_futures if f.running())
+        return {
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "queue_depth": len(self._waiters) + pending_in_pool,
+            "waiting_for_slot": len(self._waiters),
+            "running": running,
+            "active_requests": len(self._request_futures),
+            **self.process_stats,
+        }
+
+    async def _acquire_slot(self, request_id: Optional[str]):
+        """제출 슬롯 확보 - 가득 차면 FIFO 순서로 대기"""
+        if self._in_flight < self.max_pending and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._track(request_id, waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 받은 직후 취소된 경우 다음 대기자에게 넘김
+                self._release_slot()
+            self.process_stats["cancelled"] += 1
+            raise
+        finally:
+            self._untrack(request_id, waiter)
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+
+    def _release_slot(self):
+        """슬롯 반환 - 대기자가 있으면 바로 넘김"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._in_flight -= 1
+
+    def _track(self, request_id: Optional[str], future: asyncio.Future):
+        if request_id is not None:
+            self._request_futures.setdefault(request_id, set()).add(future)
+
+    def _untrack(self, request_id: Optional[str], future: asyncio.Future):
+        if request_id is None:
+            return
+        futures = self._request_futures.get(request_id)
+        if futures is not None:
+            futures.discard(future)
+            if not futures:
+                del self._request_futures[request_id]
 
     async def process_batch_async(
         self,
@@ -245,7 +380,9 @@ class ParallelProcessor:
     def shutdown(self):
         """실행자 종료"""
         self.thread_executor.shutdown(wait=True)
-        self.process_executor.shutdown(wait=True)
+        if self._process_executor is not None:
+            self._process_executor.shutdown(wait=True, cancel_futures=True)
+            self._process_executor = None
 
 
 class ExcelBatchProcessor:
@@ -431,3 +568,10 @@ class ExcelBatchProcessor:
                 for file_path, result in zip(file_paths, results)
             ],
         }
+
+
+# 전역 인스턴스 (감지 파이프라인 등 CPU 집약 작업 공용)
+parallel_processor = ParallelProcessor(
+    max_workers=settings.PARALLEL_WORKERS,
+    max_pending=settings.DETECTION_PROCESS_MAX_PENDING,
+)
@@ -0,0 +1,178 @@
+"""
+Progress Throttle
+작업별 진행률 알림 집계 - 토큰 버킷 + 최신 값 우선 병합 + 최소 변화량/간격
+- 변화량이 작은 틱은 최소 간격이 지날 때까지 보류하고 마지막 값만 보냄
+- 토큰이 없으면 보류했다가 토큰이 채워지는 시점에 최신 값 하나만 보냄
+- 완료(100%) 틱은 항상 즉시 전송, 시작/완료/오류 이벤트는 호출 측에서 직접 전송
+"""
+
+import asyncio
+from collections import OrderedDict
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+EmitCallback = Callable[[], Awaitable[Any]]
+
+
+class _TaskBucket:
+    """작업 하나의 토큰 버킷과 보류 중인 최신 진행률"""
+
+    __slots__ = (
+        "tokens",
+        "updated",
+        "last_value",
+        "last_emit",
+        "pending",
+        "pending_value",
+        "timer",
+    )
+
+    def __init__(self, tokens: float, now: float):
+        self.tokens = tokens
+        self.updated = now
+        self.last_value: Optional[float] = None
+        self.last_emit = 0.0
+        self.pending: Optional[EmitCallback] = None
+        self.pending_value = 0.0
+        self.timer: Optional[asyncio.Task] = None
+
+
+class ProgressThrottle:
+    """작업 키별 진행률 전송 속도 제한"""
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        min_delta: Optional[float] = None,
+        min_interval: Optional[float] = None,
+        max_tasks: Optional[int] = None,
+    ):
+        self.rate = rate or settings.PROGRESS_EMIT_RATE
+        self.burst = burst or settings.PROGRESS_EMIT_BURST
+        self.min_delta = settings.PROGRESS_MIN_DELTA if min_delta is None else min_delta
+        self.min_interval = (
+            settings.PROGRESS_MIN_INTERVAL if min_interval is None else min_interval
+        )
+        self.max_tasks = max_tasks or settings.PROGRESS_MAX_TASKS
+        self._buckets: "OrderedDict[str, _TaskBucket]" = OrderedDict()
+        self.stats = {"emitted": 0, "coalesced": 0, "trailing": 0}
+
+    def _bucket(self, key: str, now: float) -> _TaskBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _TaskBucket(float(self.burst), now)
+            while len(self._buckets) > self.max_tasks:
+                _, evicted = self._buckets.popitem(last=False)
+                self._cancel_timer(evicted)
+        else:
+            self._buckets.move_to_end(key)
+            bucket.tokens = min(
+                float(self.burst), bucket.tokens + (now - bucket.updated) * self.rate
+            )
+            bucket.updated = now
+        return bucket
+
+    async def submit(
+        self, key: str, value: float, emit: EmitCallback, final: bool = False
+    ) -> bool:
+        """진행률 틱 제출 - 지금 전송했으면 True, 보류(병합)했으면 False
+
+        emit은 실제로 전송할 때만 호출되는 인자 없는 코루틴 함수입니다.
+        """
+        now = time.monotonic()
+        bucket = self._bucket(key, now)
+
+        significant = (
+            bucket.last_value is None
+            or abs(value - bucket.last_value) >= self.min_delta
+        )
+        interval_wait = (
+            0.0 if significant else bucket.last_emit + self.min_interval - now
+        )
+
+        if final or (interval_wait <= 0 and bucket.tokens >= 1):
+            self._cancel_timer(bucket)
+            if bucket.pending is not None:
+                self.stats["coalesced"] += 1
+                bucket.pending = None
+            bucket.tokens = max(0.0, bucket.tokens - 1)
+            self._mark_emitted(bucket, value, now)
+            await emit()
+            return True
+
+        # 최신 값 우선: 이전에 보류된 틱은 버리고 이번 틱으로 교체
+        if bucket.pending is not None:
+            self.stats["coalesced"] += 1
+        bucket.pending = emit
+        bucket.pending_value = value
+        if bucket.timer is None:
+            token_wait = max(0.0, (1 - bucket.tokens) / self.rate)
+            bucket.timer = asyncio.create_task(
+                self._flush_later(key, bucket, max(interval_wait, token_wait))
+            )
+        return False
+
+    async def flush(self, key: str) -> bool:
+        """보류 중인 최신 진행률을 즉시 전송 (작업 완료 직전 등)"""
+        bucket = self._buckets.get(key)
+        if bucket is None or bucket.pending is None:
+            return False
+        self._cancel_timer(bucket)
+        emit, bucket.pending = bucket.pending, None
+        self._mark_emitted(bucket, bucket.pending_value, time.monotonic())
+        await emit()
+        return True
+
+    def discard(self, key: str):
+        """작업 상태 제거 (보류 중인 진행률은 버림)"""
+        bucket = self._buckets.pop(key, None)
+        if bucket is not None:
+            if bucket.pending is not None:
+                self.stats["coalesced"] += 1
+            self._cancel_timer(bucket)
+
+    async def _flush_later(self, key: str, bucket: _TaskBucket, delay: float):
+        """보류된 최신 진행률을 토큰/최소 간격이 허용하는 시점에 전송"""
+        await asyncio.sleep(delay)
+        bucket.timer = None
+        if self._buckets.get(key) is not bucket or bucket.pending is None:
+            return
+        now = time.monotonic()
+        refilled = bucket.tokens + (now - bucket.updated) * self.rate
+        bucket.tokens = max(0.0, min(float(self.burst), refilled) - 1)
+        bucket.updated = now
+        emit, bucket.pending = bucket.pending, None
+        self._mark_emitted(bucket, bucket.pending_value, now)
+        self.stats["trailing"] += 1
+        try:
+            await emit()
+        except Exception as e:
+            logger.warning(f"보류된 진행률 전송 실패 ({key}): {e}")
+
+    def _mark_emitted(self, bucket: _TaskBucket, value: float, now: float):
+        bucket.last_value = value
+        bucket.last_emit = now
+        self.stats["emitted"] += 1
+
+    @staticmethod
+    def _cancel_timer(bucket: _TaskBucket):
+        if bucket.timer is not None:
+            bucket.timer.cancel()
+            bucket.timer = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "tracked_tasks": len(self._buckets),
+            "pending": sum(1 for b in self._buckets.values() if b.pending is not None),
+        }
+
+
+# 전역 인스턴스
+progress_throttle = ProgressThrottle()
@@ -0,0 +1,167 @@
+"""
+Redis L2 Cache
+IntegratedCache의 L2 계층 - redis.asyncio 커넥션 풀 + 파이프라인 다중 조회/저장
+값은 cache_codec(msgpack + 압축)으로 직렬화
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+import logging
+
+from app.core.cache_codec import CacheCodec, cache_codec
+from app.core.config import settings
+
+try:
+    import redis.asyncio as redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class RedisL2Cache:
+    """비동기 Redis L2 캐시
+
+    Redis에 연결할 수 없으면 REDIS_L2_RETRY_INTERVAL 동안 호출을 건너뛰어
+    요청 경로가 연결 타임아웃을 반복해서 기다리지 않도록 합니다.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        codec: Optional[CacheCodec] = None,
+        key_prefix: str = "excel_unified:l2:",
+        enabled: Optional[bool] = None,
+    ):
+        self.redis_url = redis_url or settings.REDIS_URL
+        self.codec = codec or cache_codec
+        self.key_prefix = key_prefix
+        self.enabled = (
+            settings.REDIS_L2_ENABLED if enabled is None else enabled
+        ) and REDIS_AVAILABLE
+        self._client: Optional["redis.Redis"] = None
+        self._unavailable_until = 0.0
+
+        self.stats = {"errors": 0, "round_trips": 0, "bytes_written": 0}
+
+    def get_client(self) -> Optional["redis.Redis"]:
+        """커넥션 풀 기반 클라이언트 (지연 생성, 장애 시 None)"""
+        if not self.enabled or time.monotonic() < self._unavailable_until:
+            return None
+        if self._client is None:
+            pool = redis.ConnectionPool.from_url(
+                self.redis_url,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            )
+            self._client = redis.Redis(connection_pool=pool)
+        return self._client
+
+    def mark_unavailable(self, error: Exception):
+        self.stats["errors"] += 1
+        self._unavailable_until = time.monotonic() + settings.REDIS_L2_RETRY_INTERVAL
+        logger.warning(f"Redis L2 캐시 사용 불가, 잠시 건너뜀: {str(error)}")
+
+    def _key(self, key: str) -> str:
+        return f"{self.key_prefix}{key}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        return (await self.get_many([key])).get(key)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """MGET 한 번으로 여러 키 조회 - 찾은 키만 반환"""
+        client = self.get_client()
+        if client is None or not keys:
+            return {}
+
+        try:
+            raw_values = await client.mget([self._key(key) for key in keys])
+            self.stats["round_trips"] += 1
+        except Exception as e:
+            self.mark_unavailable(e)
+            return {}
+
+        found = {}
+        for key, raw in zip(keys, raw_values):
+            if raw is None:
+                continue
+            try:
+                found[key] = self.codec.decode(raw)
+            except Exception as e:
+                logger.warning(f"Redis L2 값 디코딩 실패: {key} - {str(e)}")
+        return found
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        return await self.set_many({key: value}, ttl)
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """파이프라인 한 번으로 여러 키 저장 (트랜잭션 없이 SET EX)"""
+        client = self.get_client()
+        if client is None or not items:
+            return False
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key, value in items.items():
+                data = self.codec.encode(value)
+                self.stats["bytes_written"] += len(data)
+                pipe.set(self._key(key), data, ex=ttl or None)
+            await pipe.execute()
+            self.stats["round_trips"] += 1
+            return True
+        except Exception as e:
+            self.mark_unavailable(e)
+            return False
+
+    async def delete(self, key: str) -> bool:
+        client = self.get_client()
+        if client is None:
+            return False
+
+        try:
+            await client.delete(self._key(key))
+            self.stats["round_trips"] += 1
+            return True
+        except Exception as e:
+            self.mark_unavailable(e)
+            return False
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """키에 pattern이 포함된 항목 삭제 (SCAN + UNLINK 파이프라인)"""
+        client = self.get_client()
+        if client is None:
+            return 0
+
+        try:
+            keys = [
+                key
+                async for key in client.scan_iter(
+                    match=f"{self.key_prefix}*{pattern}*", count=500
+                )
+            ]
+            if keys:
+                await client.unlink(*keys)
+            return len(keys)
+        except Exception as e:
+            self.mark_unavailable(e)
+            return 0
+
+    async def close(self):
+        """커넥션 풀 정리"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "enabled": self.enabled,
+            "available": self.enabled and time.monotonic() >= self._unavailable_until,
+        }
+
+
+# 전역 인스턴스
+redis_l2_cache = RedisL2Cache()
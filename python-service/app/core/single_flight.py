@@ -0,0 +1,157 @@
+"""
+Single Flight
+같은 키의 동시 요청을 하나의 실행으로 합치는 요청 병합 계층
+- 프로세스 내: 첫 호출(리더)만 실행하고 나머지는 같은 결과를 기다림
+- 워커 간: Redis 락(SET NX PX)을 잡은 워커만 실행하고, 다른 워커는 락이
+  풀릴 때까지 기다린 뒤 recheck(보통 캐시 조회)로 결과를 가져옴
+"""
+
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import logging
+
+from app.core.config import settings
+from app.core.redis_l2 import RedisL2Cache, redis_l2_cache
+
+logger = logging.getLogger(__name__)
+
+# 락 소유자만 해제하도록 토큰을 비교 후 삭제
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class SingleFlight:
+    """키별 요청 병합기"""
+
+    def __init__(
+        self,
+        redis_cache: Optional[RedisL2Cache] = None,
+        lock_prefix: str = "excel_unified:single_flight:",
+        lock_ttl: Optional[float] = None,
+        poll_interval: Optional[float] = None,
+    ):
+        self.redis_cache = redis_cache or redis_l2_cache
+        self.lock_prefix = lock_prefix
+        self.lock_ttl = lock_ttl or settings.SINGLE_FLIGHT_LOCK_TTL
+        self.poll_interval = poll_interval or settings.SINGLE_FLIGHT_POLL_INTERVAL
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.stats = {"leaders": 0, "followers": 0, "remote_followers": 0}
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._inflight
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        recheck: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        같은 키로 실행 중인 작업이 있으면 그 결과를 기다리고, 없으면 fn 실행
+
+        Args:
+            key: 병합 키 (보통 파일 내용 해시 기반)
+            fn: 실제 작업
+            recheck: 다른 워커가 만든 결과 조회 (지정 시 Redis 락으로 워커 간 병합)
+
+        Returns:
+            (결과, 다른 호출의 결과를 공유받았는지 여부)
+        """
+        while True:
+            future = self._inflight.get(key)
+            if future is None:
+                break
+
+            self.stats["followers"] += 1
+            try:
+                return await asyncio.shield(future), True
+            except asyncio.CancelledError:
+                # 리더만 취소된 경우 새 리더로 다시 시도, 호출자 취소는 전파
+                if not future.cancelled():
+                    raise
+                current = asyncio.current_task()
+                if current is not None and current.cancelling():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.stats["leaders"] += 1
+        try:
+            if recheck is not None:
+                result, shared = await self._run_with_lock(key, fn, recheck)
+            else:
+                result, shared = await fn(), False
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 기다리는 호출이 없어도 "exception was never retrieved" 경고가 없도록
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, shared
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def _run_with_lock(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        recheck: Callable[[], Awaitable[Any]],
+    ) -> Tuple[Any, bool]:
+        """Redis 락을 잡고 실행 - 다른 워커가 실행 중이면 끝날 때까지 기다린 뒤 재조회"""
+        client = self.redis_cache.get_client()
+        if client is None:
+            return await fn(), False
+
+        lock_key = f"{self.lock_prefix}{key}"
+        token = uuid.uuid4().hex
+        try:
+            acquired = await client.set(
+                lock_key, token, nx=True, px=int(self.lock_ttl * 1000)
+            )
+        except Exception as e:
+            self.redis_cache.mark_unavailable(e)
+            return await fn(), False
+
+        if acquired:
+            try:
+                return await fn(), False
+            finally:
+                try:
+                    await client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+                except Exception as e:
+                    logger.warning(f"single-flight 락 해제 실패: {lock_key} - {str(e)}")
+
+        # 다른 워커가 실행 중 - 락이 풀리거나 만료될 때까지 대기
+        self.stats["remote_followers"] += 1
+        deadline = time.monotonic() + self.lock_ttl
+        try:
+            while time.monotonic() < deadline and await client.exists(lock_key):
+                await asyncio.sleep(self.poll_interval)
+        except Exception as e:
+            self.redis_cache.mark_unavailable(e)
+
+        result = await recheck()
+        if result is not None:
+            return result, True
+
+        # 다른 워커가 실패했거나 결과를 남기지 않음 - 직접 실행
+        return await fn(), False
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "in_flight": len(self._inflight)}
+
+
+# 전역 인스턴스
+single_flight = SingleFlight()
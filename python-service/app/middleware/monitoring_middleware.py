@@ -9,11 +9,21 @@ from typing import Callable
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
+import re
 import psutil
 import os
 
+from app.core.monitoring import metrics_collector, process_sampler
+
 logger = logging.getLogger(__name__)
 
+# 경로 마스킹 패턴 (메트릭 엔드포인트 라벨 수를 제한)
+UUID_SEGMENT_PATTERN = re.compile(r"/[a-f0-9-]{36}")
+NUMERIC_SEGMENT_PATTERN = re.compile(r"/\d+")
+
+# 라우트에 매칭되지 않은 요청(404, 스캐너 등)은 하나의 라벨로 묶음
+UNMATCHED_ROUTE_LABEL = "{unmatched}"
+
 
 class MonitoringMiddleware(BaseHTTPMiddleware):
     """
@@ -23,7 +33,9 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
 
     def __init__(self, app: ASGIApp):
         super().__init__(app)
-        self.process = psutil.Process(os.getpid())
+        # 프로세스 리소스는 백그라운드 샘플러의 마지막 값을 사용 (요청마다 psutil 호출 안 함)
+        self.sampler = process_sampler
+        self.metrics = metrics_collector
 
         # 성능 통계 카운터
         self.request_count = 0
@@ -38,8 +50,7 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
         """요청 처리 및 모니터링"""
 
         # 요청 시작 정보 수집
-        start_time = time.time()
-        request_start_memory = self.process.memory_info().rss / 1024 / 1024  # MB
+        start_time = time.perf_counter()
 
         self.request_count += 1
 
@@ -86,16 +97,20 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
 
         finally:
             # 성능 메트릭 수집
-            end_time = time.time()
-            response_time = end_time - start_time
+            response_time = time.perf_counter() - start_time
             self.total_response_time += response_time
 
-            # 메모리 사용량 체크
-            current_memory = self.process.memory_info().rss / 1024 / 1024  # MB
-            memory_increase = current_memory - request_start_memory
+            # 메모리 사용량 체크 (마지막 샘플)
+            current_memory = self.sampler.memory_mb
 
             # 응답 기본 정보 로깅
             status_code = response.status_code if response else 500
+            safe_path = self._sanitize_path(str(request.url.path))
+            self.metrics.record_request(
+                endpoint=f"{request.method} {self._route_template(request)}",
+                duration=response_time,
+                status_code=status_code,
+            )
             logger.info(
                 f"[{self.request_count}] 응답: {status_code} ({response_time:.3f}초)"
             )
@@ -104,9 +119,6 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
             if response_time > 1.0:  # 1초 이상 소요된 요청
                 logger.warning(f"느린 응답 감지: {response_time:.3f}초")
 
-            if memory_increase > 10:  # 10MB 이상 메모리 증가
-                logger.warning(f"메모리 증가 감지: +{memory_increase:.2f} MB")
-
             # 메모리 임계값 체크
             if current_memory > self.memory_critical_threshold:
                 logger.critical(f"메모리 사용량 위험: {current_memory:.2f} MB")
@@ -117,13 +129,13 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
             if self.request_count % 100 == 0:
                 self._log_performance_stats()
 
-            # 상세 성능 메트릭을 별도 파일에 기록
+            # 상세 성능 메트릭을 별도 파일에 기록 (큐를 거쳐 백그라운드 스레드가 기록)
             self._log_detailed_metrics(
-                request=request,
+                method=request.method,
+                safe_path=safe_path,
                 response_time=response_time,
                 status_code=status_code,
                 memory_used=current_memory,
-                memory_increase=memory_increase,
                 error_occurred=error_occurred,
             )
 
@@ -138,24 +150,20 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
         logger.info(f"총 요청 수: {self.request_count}")
         logger.info(f"평균 응답 시간: {avg_response_time:.3f}초")
         logger.info(f"오류율: {error_rate:.1f}%")
-        logger.info(
-            f"현재 메모리: {self.process.memory_info().rss / 1024 / 1024:.2f} MB"
-        )
+        logger.info(f"현재 메모리: {self.sampler.memory_mb:.2f} MB")
 
         # CPU 사용률
-        try:
-            cpu_percent = self.process.cpu_percent()
+        cpu_percent = self.sampler.latest.get("cpu_percent")
+        if cpu_percent is not None:
             logger.info(f"CPU 사용률: {cpu_percent:.1f}%")
-        except (KeyError, IndexError, AttributeError):
-            pass
 
     def _log_detailed_metrics(
         self,
-        request: Request,
+        method: str,
+        safe_path: str,
         response_time: float,
         status_code: int,
         memory_used: float,
-        memory_increase: float,
         error_occurred: bool,
     ):
         """상세 성능 메트릭을 별도 로그에 기록"""
@@ -164,17 +172,13 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
         try:
             from app.core.logging_config import log_performance_metrics
 
-            # URL 경로에서 민감한 정보 제거
-            safe_path = self._sanitize_path(str(request.url.path))
-
             log_performance_metrics(
                 operation="http_request",
                 duration=response_time,
-                method=request.method,
+                method=method,
                 path=safe_path,
                 status_code=status_code,
                 memory_mb=round(memory_used, 2),
-                memory_increase_mb=round(memory_increase, 2),
                 error=error_occurred,
                 request_id=self.request_count,
             )
@@ -182,13 +186,18 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
         except Exception as e:
             logger.debug(f"성능 메트릭 로깅 실패: {e}")
 
+    @staticmethod
+    def _route_template(request: Request) -> str:
+        """메트릭 키로 쓸 라우트 경로 템플릿 (엔드포인트 수가 라우트 수로 제한됨)"""
+        route = request.scope.get("route")
+        path = getattr(route, "path", None)
+        return path if path else UNMATCHED_ROUTE_LABEL
+
     def _sanitize_path(self, path: str) -> str:
         """URL 경로에서 민감한 정보 제거"""
-        import re
-
         # 파일 ID나 사용자 ID 등을 마스킹
-        path = re.sub(r"/\d+", "/{id}", path)
-        path = re.sub(r"/[a-f0-9-]{36}", "/{uuid}", path)  # UUID 패턴
+        path = UUID_SEGMENT_PATTERN.sub("/{uuid}", path)  # UUID 패턴
+        path = NUMERIC_SEGMENT_PATTERN.sub("/{id}", path)
 
         return path
 
@@ -3,14 +3,17 @@ Excel 수식 분석기
 수식의 복잡도, 의존성, 성능 등을 분석
 """
 
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import re
 from dataclasses import dataclass
 from enum import Enum
-import networkx as nx
 from collections import defaultdict
 import logging
 import openpyxl
+from app.core.content_hash import content_hash_registry
+from app.core.excel_utils import ExcelUtils
+from app.core.single_flight import single_flight
+from app.services.detection.dependency_graph import DependencyGraph
 
 logger = logging.getLogger(__name__)
 
@@ -68,7 +71,7 @@ class WorkbookAnalysis:
     total_formulas: int
     complexity_distribution: Dict[FormulaComplexity, int]
     most_used_functions: List[Tuple[str, int]]
-    dependency_graph: nx.DiGraph
+    dependency_graph: DependencyGraph
     critical_paths: List[List[str]]
     volatile_formulas: List[str]
     array_formulas: List[str]
@@ -179,33 +182,35 @@ class FormulaAnalyzer:
         }
 
     async def analyze_workbook(self, file_path: str) -> WorkbookAnalysis:
-        """워크북 전체 수식 분석"""
+        """워크북 전체 수식 분석 (같은 내용의 동시 요청은 한 번만 분석)"""
+        content_hash = await content_hash_registry.resolve(file_path)
+        if not content_hash:
+            return await self._analyze_workbook(file_path)
+
+        analysis, _ = await single_flight.do(
+            f"formula_analysis:{content_hash}",
+            lambda: self._analyze_workbook(file_path),
+        )
+        return analysis
+
+    async def _analyze_workbook(self, file_path: str) -> WorkbookAnalysis:
+        """워크북 수식 분석 실행"""
 
         try:
             wb = openpyxl.load_workbook(file_path, data_only=False)
 
+            # 의존성 그래프를 먼저 한 번 구축하여 수식별 깊이/순환 조회에 사용
+            dependency_graph = DependencyGraph.for_workbook(wb)
             all_analyses = []
-            dependency_graph = nx.DiGraph()
 
             # 모든 시트의 수식 분석
             for sheet_name in wb.sheetnames:
                 sheet = wb[sheet_name]
-                sheet_analyses = await self._analyze_sheet(sheet, sheet_name)
+                sheet_analyses = await self._analyze_sheet(
+                    sheet, sheet_name, dependency_graph
+                )
                 all_analyses.extend(sheet_analyses)
 
-                # 의존성 그래프 구축
-                for analysis in sheet_analyses:
-                    cell_id = f"{sheet_name}!{analysis.cell}"
-                    dependency_graph.add_node(cell_id)
-
-                    for ref_cell in analysis.referenced_cells:
-                        ref_id = (
-                            f"{sheet_name}!{ref_cell}"
-                            if "!" not in ref_cell
-                            else ref_cell
-                        )
-                        dependency_graph.add_edge(ref_id, cell_id)
-
             # 분석 결과 집계
             return self._aggregate_analyses(all_analyses, dependency_graph)
 
@@ -214,7 +219,10 @@ class FormulaAnalyzer:
             raise
 
     async def _analyze_sheet(
-        self, sheet: Any, sheet_name: str
+        self,
+        sheet: Any,
+        sheet_name: str,
+        dependency_graph: Optional[DependencyGraph] = None,
     ) -> List[FormulaAnalysis]:
         """시트 내 모든 수식 분석"""
 
@@ -228,14 +236,19 @@ class FormulaAnalyzer:
                     and cell.value.startswith("=")
                 ):
                     analysis = await self._analyze_formula(
-                        cell.value, cell.coordinate, sheet_name, sheet
+                        cell.value, cell.coordinate, sheet_name, sheet, dependency_graph
                     )
                     analyses.append(analysis)
 
         return analyses
 
     async def _analyze_formula(
-        self, formula: str, cell: str, sheet: str, worksheet: Any
+        self,
+        formula: str,
+        cell: str,
+        sheet: str,
+        worksheet: Any,
+        dependency_graph: Optional[DependencyGraph] = None,
     ) -> FormulaAnalysis:
         """개별 수식 분석"""
 
@@ -260,8 +273,9 @@ class FormulaAnalyzer:
 
         # 의존성 깊이 계산
         dependency_depth = await self._calculate_dependency_depth(
-            cell, sheet, worksheet, referenced_cells
+            cell, sheet, worksheet, referenced_cells, dependency_graph
         )
+        has_circular = self._has_circular_reference(cell, sheet, dependency_graph)
 
         # 성능 영향 평가
         performance_impact = self._evaluate_performance_impact(
@@ -287,7 +301,7 @@ class FormulaAnalyzer:
             is_array_formula=is_array,
             is_volatile=is_volatile,
             has_external_reference=has_external,
-            has_circular_reference=False,  # 별도 검사 필요
+            has_circular_reference=has_circular,
             performance_impact=performance_impact,
             suggestions=suggestions,
         )
@@ -382,13 +396,22 @@ class FormulaAnalyzer:
         return list(categories)
 
     async def _calculate_dependency_depth(
-        self, cell: str, sheet: str, worksheet: Any, referenced_cells: List[str]
+        self,
+        cell: str,
+        sheet: str,
+        worksheet: Any,
+        referenced_cells: List[str],
+        dependency_graph: Optional[DependencyGraph] = None,
     ) -> int:
-        """의존성 깊이 계산"""
+        """의존성 깊이 계산 (그래프가 있으면 전체 선행 수식 체인 길이 사용)"""
 
         if not referenced_cells:
             return 0
 
+        if dependency_graph is not None:
+            row, column = ExcelUtils.cell_to_row_col(cell)
+            return dependency_graph.depth(sheet, row, column) + 1
+
         max_depth = 0
 
         for ref_cell in referenced_cells:
@@ -408,6 +431,15 @@ class FormulaAnalyzer:
 
         return max_depth + 1
 
+    def _has_circular_reference(
+        self, cell: str, sheet: str, dependency_graph: Optional[DependencyGraph]
+    ) -> bool:
+        """셀이 순환 참조(SCC)에 속하는지 확인"""
+        if dependency_graph is None:
+            return False
+        row, column = ExcelUtils.cell_to_row_col(cell)
+        return dependency_graph.is_in_cycle(sheet, row, column)
+
     def _evaluate_performance_impact(
         self, functions: List[str], ranges: List[str], is_volatile: bool, is_array: bool
     ) -> str:
@@ -482,7 +514,7 @@ class FormulaAnalyzer:
         return suggestions
 
     def _aggregate_analyses(
-        self, analyses: List[FormulaAnalysis], dependency_graph: nx.DiGraph
+        self, analyses: List[FormulaAnalysis], dependency_graph: DependencyGraph
     ) -> WorkbookAnalysis:
         """분석 결과 집계"""
 
@@ -526,16 +558,11 @@ class FormulaAnalyzer:
         # 최적화 기회
         opportunities = self._identify_optimization_opportunities(analyses)
 
-        # 크리티컬 패스 (간소화)
+        # 크리티컬 패스 - 순환은 SCC 단위로 축약하여 가장 긴 경로 계산
         critical_paths = []
-        if dependency_graph.number_of_nodes() > 0:
-            try:
-                # 가장 긴 경로 찾기
-                longest_path = nx.dag_longest_path(dependency_graph)
-                if longest_path:
-                    critical_paths.append(longest_path)
-            except Exception:
-                pass
+        longest_path = dependency_graph.longest_path()
+        if longest_path:
+            critical_paths.append(longest_path)
 
         return WorkbookAnalysis(
             total_formulas=len(analyses),
@@ -3,12 +3,9 @@ Advanced Circular Reference Detection Service
 복잡한 순환 참조 패턴을 감지하고 분석하는 고급 시스템
 """
 
-from openpyxl.utils import get_column_letter, column_index_from_string
-from openpyxl.utils.cell import coordinate_from_string
-import re
-from typing import List, Dict, Set
+from typing import List, Dict, Optional
 from dataclasses import dataclass
-import networkx as nx
+from app.services.detection.dependency_graph import DependencyGraph, parse_key
 import logging
 
 
@@ -28,15 +25,15 @@ class CircularReferenceDetector:
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.dependency_graph = nx.DiGraph()
-        self.cell_formulas = {}
-        self.sheet_references = {}
+        self.dependency_graph: Optional[DependencyGraph] = None
+        self._dependent_counts: Optional[List[int]] = None
 
     def analyze_workbook(self, workbook) -> List[CircularReferenceChain]:
         """워크북 전체의 순환 참조를 분석"""
 
-        # 1단계: 모든 셀의 의존성 그래프 구축
-        self._build_dependency_graph(workbook)
+        # 1단계: 워크북 공유 의존성 그래프 조회 (셀 인덱스면 재사용)
+        self.dependency_graph = DependencyGraph.for_workbook(workbook)
+        self._dependent_counts = None
 
         # 2단계: 순환 참조 감지
         circular_refs = self._detect_all_circular_references()
@@ -46,184 +43,9 @@ class CircularReferenceDetector:
 
         return circular_chains
 
-    def _build_dependency_graph(self, workbook):
-        """모든 셀의 의존성 그래프를 구축"""
-
-        for sheet_name in workbook.sheetnames:
-            sheet = workbook[sheet_name]
-
-            for row in sheet.iter_rows():
-                for cell in row:
-                    if cell.data_type == "f" and cell.value:
-                        cell_ref = f"{sheet_name}!{cell.coordinate}"
-                        self.cell_formulas[cell_ref] = cell.value
-
-                        # 수식에서 참조하는 셀들 추출
-                        referenced_cells = self._extract_cell_references(
-                            cell.value, sheet_name, workbook
-                        )
-
-                        # 의존성 그래프에 엣지 추가
-                        for ref_cell in referenced_cells:
-                            self.dependency_graph.add_edge(ref_cell, cell_ref)
-
-    def _extract_cell_references(
-        self, formula: str, current_sheet: str, workbook
-    ) -> Set[str]:
-        """수식에서 참조하는 모든 셀 추출 (다른 시트 포함)"""
-
-        references = set()
-
-        # 일반 셀 참조 패턴 (A1, $A$1, A:A, 1:1 등)
-        cell_pattern = r"(?:(?:\'[^\']+\'|[A-Za-z_]\w*)!)?(?:\$?[A-Z]+\$?\d+(?::\$?[A-Z]+\$?\d+)?|\$?[A-Z]+:\$?[A-Z]+|\d+:\d+)"
-
-        # 명명된 범위 패턴
-        named_range_pattern = r"[A-Za-z_]\w*(?![!:\(])"
-
-        # 함수 이름 제외
-        function_names = {
-            "SUM",
-            "AVERAGE",
-            "COUNT",
-            "MAX",
-            "MIN",
-            "IF",
-            "VLOOKUP",
-            "HLOOKUP",
-            "INDEX",
-            "MATCH",
-            "SUMIF",
-            "COUNTIF",
-            "AND",
-            "OR",
-            "NOT",
-            "IFERROR",
-            "CONCATENATE",
-            "LEFT",
-            "RIGHT",
-            "MID",
-            "LEN",
-            "TRIM",
-            "DATE",
-            "NOW",
-        }
-
-        # 셀 참조 추출
-        for match in re.finditer(cell_pattern, formula):
-            ref = match.group()
-
-            # 시트 이름이 포함된 경우
-            if "!" in ref:
-                sheet_ref, cell_ref = ref.split("!", 1)
-                sheet_ref = sheet_ref.strip("'")
-            else:
-                sheet_ref = current_sheet
-                cell_ref = ref
-
-            # 범위 참조인 경우 개별 셀로 확장
-            if ":" in cell_ref:
-                for cell in self._expand_range(cell_ref, sheet_ref):
-                    references.add(f"{sheet_ref}!{cell}")
-            else:
-                references.add(f"{sheet_ref}!{cell_ref}")
-
-        # 명명된 범위 처리
-        for match in re.finditer(named_range_pattern, formula):
-            name = match.group()
-            if name.upper() not in function_names:
-                # 실제 명명된 범위인지 확인하고 참조 추가
-                if (
-                    hasattr(workbook, "defined_names")
-                    and name in workbook.defined_names
-                ):
-                    named_range = workbook.defined_names[name]
-                    # 명명된 범위가 참조하는 셀들 추가
-                    for dest in named_range.destinations:
-                        sheet_name, cell_range = dest
-                        if ":" in cell_range:
-                            for cell in self._expand_range(cell_range, sheet_name):
-                                references.add(f"{sheet_name}!{cell}")
-                        else:
-                            references.add(f"{sheet_name}!{cell_range}")
-
-        return references
-
-    def _expand_range(self, range_ref: str, sheet_name: str) -> List[str]:
-        """범위 참조를 개별 셀로 확장 (메모리 효율성을 위해 제한적으로)"""
-
-        cells = []
-        try:
-            if ":" in range_ref:
-                start, end = range_ref.split(":")
-
-                # 전체 열/행 참조는 처리하지 않음
-                if start.isalpha() or end.isalpha() or start.isdigit() or end.isdigit():
-                    return []
-
-                start_col, start_row = coordinate_from_string(start)
-                end_col, end_row = coordinate_from_string(end)
-
-                # 너무 큰 범위는 제한
-                if (
-                    column_index_from_string(end_col)
-                    - column_index_from_string(start_col)
-                    > 100
-                    or end_row - start_row > 100
-                ):
-                    return []
-
-                for row in range(start_row, end_row + 1):
-                    for col_idx in range(
-                        column_index_from_string(start_col),
-                        column_index_from_string(end_col) + 1,
-                    ):
-                        cells.append(f"{get_column_letter(col_idx)}{row}")
-        except (KeyError, IndexError, AttributeError):
-            pass
-
-        return cells
-
     def _detect_all_circular_references(self) -> List[List[str]]:
-        """모든 순환 참조 감지"""
-
-        try:
-            # NetworkX의 순환 감지 알고리즘 사용
-            cycles = list(nx.simple_cycles(self.dependency_graph))
-            return cycles
-        except (KeyError, IndexError, AttributeError):
-            # 대안: 수동 DFS 기반 순환 감지
-            return self._manual_cycle_detection()
-
-    def _manual_cycle_detection(self) -> List[List[str]]:
-        """수동 DFS 기반 순환 참조 감지"""
-
-        cycles = []
-        visited = set()
-        rec_stack = set()
-
-        def dfs(node, path):
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in self.dependency_graph.neighbors(node):
-                if neighbor not in visited:
-                    if dfs(neighbor, path.copy()):
-                        return True
-                elif neighbor in rec_stack:
-                    # 순환 참조 발견
-                    cycle_start = path.index(neighbor)
-                    cycle = path[cycle_start:] + [neighbor]
-                    cycles.append(cycle)
-
-            rec_stack.remove(node)
-            return False
-
-        for node in self.dependency_graph.nodes():
-            if node not in visited:
-                dfs(node, [])
-
-        return cycles
+        """모든 순환 참조 감지 - Tarjan SCC로 선형 시간에 찾고 SCC마다 대표 순환 하나 반환"""
+        return self.dependency_graph.cycles()
 
     def _analyze_circular_chains(
         self, cycles: List[List[str]]
@@ -332,7 +154,11 @@ class CircularReferenceDetector:
         """참조를 끊었을 때의 영향도 평가"""
 
         # 해당 셀을 참조하는 다른 셀의 수 확인
-        dependents = len(list(self.dependency_graph.predecessors(source)))
+        if self._dependent_counts is None:
+            self._dependent_counts = self.dependency_graph.dependent_counts()
+        parsed = parse_key(source)
+        node = self.dependency_graph.node_id(*parsed) if parsed else None
+        dependents = 0 if node is None else self._dependent_counts[node]
 
         if dependents > 10:
             return "high"
@@ -1,12 +1,18 @@
 """
 Session Context Store
 세션별 컨텍스트 저장소 - Redis 기반 영구 저장
+
+세션 하나를 조각 단위 Redis 구조로 저장하고 변경된 조각만 씁니다.
+- {prefix}{session_id}:fields      해시 (workbook_context, selected_cells 등 필드별 JSON)
+- {prefix}{session_id}:chat        채팅 히스토리 리스트 (RPUSH + LTRIM으로 길이 제한)
+- {prefix}{session_id}:selections  선택 히스토리 리스트 (RPUSH + LTRIM)
 """
 
 import json
 import asyncio
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+import weakref
 import redis.asyncio as redis
 from app.services.context.workbook_context import WorkbookContext
 from app.core.config import settings
@@ -30,14 +36,23 @@ class SessionContextStore:
             settings, "REDIS_URL", "redis://localhost:6379"
         )
         self._redis: Optional[redis.Redis] = None
-        # 로컬 캐시를 integrated_cache로 대체
-        self._lock = asyncio.Lock()
+        # 세션별 잠금 (사용 중인 세션의 잠금만 유지)
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+            weakref.WeakValueDictionary()
+        )
 
         # 설정
         self.ttl = 3600 * 24  # 24시간
         self.max_history_per_session = 100
+        self.max_selection_history = 10
         self.key_prefix = "excel_unified:session:"
 
+        # 리스트로 저장하는 필드 -> (키 접미사, 최대 길이 설정 속성)
+        self.list_fields = {
+            "chat_history": ("chat", "max_history_per_session"),
+            "selection_history": ("selections", "max_selection_history"),
+        }
+
     async def _get_redis(self) -> redis.Redis:
         """Redis 연결 획득"""
         if self._redis is None:
@@ -46,6 +61,142 @@ class SessionContextStore:
             )
         return self._redis
 
+    def _session_lock(self, session_id: str) -> asyncio.Lock:
+        lock = self._locks.get(session_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[session_id] = lock
+        return lock
+
+    def _cache_key(self, session_id: str) -> str:
+        return f"{self.key_prefix}{session_id}"
+
+    def _fields_key(self, session_id: str) -> str:
+        return f"{self.key_prefix}{session_id}:fields"
+
+    def _list_key(self, session_id: str, field: str) -> str:
+        return f"{self.key_prefix}{session_id}:{self.list_fields[field][0]}"
+
+    @staticmethod
+    def _dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False)
+
+    def _split_context(self, context_data: Dict[str, Any]):
+        """세션 전체 컨텍스트 -> (해시 필드, 리스트 필드 항목)"""
+        fields = {
+            name: value
+            for name, value in context_data.items()
+            if name not in self.list_fields and name != "last_updated"
+        }
+        appends = {
+            name: list(context_data.get(name) or []) for name in self.list_fields
+        }
+        return fields, appends
+
+    def _queue_fragments(
+        self,
+        pipe,
+        session_id: str,
+        fields: Dict[str, Any],
+        appends: Dict[str, List[Any]],
+        replace: bool,
+    ):
+        """조각 기록 명령을 파이프라인에 추가 (EXPIRE 제외)"""
+        fields_key = self._fields_key(session_id)
+        if replace:
+            pipe.delete(
+                fields_key,
+                *(self._list_key(session_id, name) for name in self.list_fields),
+            )
+
+        if fields:
+            pipe.hset(
+                fields_key,
+                mapping={name: self._dumps(value) for name, value in fields.items()},
+            )
+
+        for name, items in appends.items():
+            if not items:
+                continue
+            list_key = self._list_key(session_id, name)
+            pipe.rpush(list_key, *(self._dumps(item) for item in items))
+            max_length = getattr(self, self.list_fields[name][1])
+            pipe.ltrim(list_key, -max_length, -1)
+
+    async def _load_legacy_context(
+        self, redis_client: redis.Redis, session_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """이전 형식(세션 전체를 JSON 문자열 하나로 저장) 컨텍스트 조회"""
+        legacy_key = self._cache_key(session_id)
+        if await redis_client.type(legacy_key) != "string":
+            return None
+
+        json_data = await redis_client.get(legacy_key)
+        return json.loads(json_data) if json_data else None
+
+    async def _write_fragments(
+        self,
+        session_id: str,
+        fields: Optional[Dict[str, Any]] = None,
+        appends: Optional[Dict[str, List[Any]]] = None,
+        replace: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        변경된 조각만 한 번의 MULTI 파이프라인으로 기록
+
+        이전 형식 컨텍스트가 남아 있으면 같은 파이프라인에서 먼저 조각으로 변환합니다.
+
+        Args:
+            session_id: 세션 ID
+            fields: 해시에 쓸 필드 (필드별 JSON)
+            appends: 리스트 필드에 덧붙일 항목 (RPUSH 후 LTRIM)
+            replace: 기존 세션 조각을 모두 지우고 새로 쓸지 여부
+
+        Returns:
+            변환한 이전 형식 컨텍스트 (없으면 None)
+        """
+        now = datetime.now()
+        fields = dict(fields or {})
+        fields["last_updated"] = now.isoformat()
+
+        async with self._session_lock(session_id):
+            redis_client = await self._get_redis()
+            # 배포 후 첫 요청이 쓰기여도 이전 히스토리를 잃지 않도록 변환
+            legacy = (
+                None
+                if replace
+                else await self._load_legacy_context(redis_client, session_id)
+            )
+            pipe = redis_client.pipeline(transaction=True)
+
+            if legacy is not None:
+                legacy_fields, legacy_appends = self._split_context(legacy)
+                self._queue_fragments(
+                    pipe, session_id, legacy_fields, legacy_appends, replace=True
+                )
+            self._queue_fragments(pipe, session_id, fields, appends or {}, replace)
+            # 새로 쓴 세션 위에 이전 형식이 나중에 다시 변환되지 않도록 삭제
+            if replace or legacy is not None:
+                pipe.delete(self._cache_key(session_id))
+
+            # 어떤 조각을 쓰든 세션 전체의 만료 시간을 함께 갱신
+            pipe.expire(self._fields_key(session_id), self.ttl)
+            for name in self.list_fields:
+                pipe.expire(self._list_key(session_id, name), self.ttl)
+
+            # 활성 세션 목록 갱신도 같은 왕복에서 처리
+            pipe.zadd(
+                f"{self.key_prefix}active_sessions", {session_id: now.timestamp()}
+            )
+            await pipe.execute()
+
+        if legacy is not None:
+            logger.info(f"세션 컨텍스트 형식 변환됨: {session_id}")
+
+        # 조합된 컨텍스트 캐시는 무효화 (다음 조회 시 재구성)
+        await integrated_cache.delete(self._cache_key(session_id))
+        return legacy
+
     async def save_session_context(
         self, session_id: str, context_data: Dict[str, Any]
     ) -> bool:
@@ -60,28 +211,11 @@ class SessionContextStore:
             성공 여부
         """
         try:
-            async with self._lock:
-                # 타임스탬프 추가
-                context_data["last_updated"] = datetime.now().isoformat()
+            fields, appends = self._split_context(context_data)
+            await self._write_fragments(session_id, fields, appends, replace=True)
 
-                # Redis에 저장
-                redis_client = await self._get_redis()
-                key = f"{self.key_prefix}{session_id}"
-
-                # JSON 직렬화
-                json_data = json.dumps(context_data, ensure_ascii=False)
-
-                # 저장 및 TTL 설정
-                await redis_client.setex(key, self.ttl, json_data)
-
-                # 통합 캐시에도 저장 (빠른 접근을 위해)
-                await integrated_cache.set(key, context_data, ttl=self.ttl)
-
-                # 세션 목록에 추가
-                await self._add_to_active_sessions(session_id)
-
-                logger.info(f"세션 컨텍스트 저장됨: {session_id}")
-                return True
+            logger.info(f"세션 컨텍스트 저장됨: {session_id}")
+            return True
 
         except Exception as e:
             logger.error(f"세션 컨텍스트 저장 실패: {str(e)}")
@@ -99,31 +233,47 @@ class SessionContextStore:
         """
         try:
             # 통합 캐시에서 먼저 확인
-            key = f"{self.key_prefix}{session_id}"
+            key = self._cache_key(session_id)
             cached_data = await integrated_cache.get(key)
             if cached_data:
                 return cached_data
 
-            # Redis에서 조회
+            # Redis에서 조각 조회 (한 번의 왕복)
             redis_client = await self._get_redis()
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.hgetall(self._fields_key(session_id))
+            for name in self.list_fields:
+                pipe.lrange(self._list_key(session_id, name), 0, -1)
+            fields, *lists = await pipe.execute()
 
-            json_data = await redis_client.get(key)
-            if json_data:
-                context_data = json.loads(json_data)
+            if not fields and not any(lists):
+                return await self._migrate_legacy_context(session_id)
 
-                # 통합 캐시에 저장
-                await integrated_cache.set(
-                    key, context_data, ttl=300
-                )  # 5분 메모리 캐시
+            context_data = {name: json.loads(value) for name, value in fields.items()}
+            for name, items in zip(self.list_fields, lists):
+                if items:
+                    context_data[name] = [json.loads(item) for item in items]
 
-                return context_data
+            # 통합 캐시에 저장
+            await integrated_cache.set(key, context_data, ttl=300)  # 5분 메모리 캐시
 
-            return None
+            return context_data
 
         except Exception as e:
             logger.error(f"세션 컨텍스트 조회 실패: {str(e)}")
             return None
 
+    async def _migrate_legacy_context(
+        self, session_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """이전 형식(세션 전체를 JSON 문자열 하나로 저장)을 조각 형식으로 변환"""
+        redis_client = await self._get_redis()
+        if await redis_client.type(self._cache_key(session_id)) != "string":
+            return None
+
+        # 변환은 세션 잠금 안에서 (동시 쓰기와 겹치지 않도록)
+        return await self._write_fragments(session_id)
+
     async def update_workbook_context(
         self, session_id: str, workbook_context: WorkbookContext
     ) -> bool:
@@ -138,19 +288,19 @@ class SessionContextStore:
             성공 여부
         """
         try:
-            # 현재 세션 컨텍스트 가져오기
-            context_data = await self.get_session_context(session_id) or {}
-
-            # 워크북 컨텍스트 업데이트
-            context_data["workbook_context"] = {
-                "file_id": workbook_context.file_id,
-                "file_name": workbook_context.file_name,
-                "summary": workbook_context.get_summary(),
-                "updated_at": workbook_context.updated_at.isoformat(),
-            }
-
-            # 저장
-            return await self.save_session_context(session_id, context_data)
+            # 워크북 컨텍스트 필드만 기록
+            await self._write_fragments(
+                session_id,
+                fields={
+                    "workbook_context": {
+                        "file_id": workbook_context.file_id,
+                        "file_name": workbook_context.file_name,
+                        "summary": workbook_context.get_summary(),
+                        "updated_at": workbook_context.updated_at.isoformat(),
+                    }
+                },
+            )
+            return True
 
         except Exception as e:
             logger.error(f"워크북 컨텍스트 업데이트 실패: {str(e)}")
@@ -176,14 +326,6 @@ class SessionContextStore:
             성공 여부
         """
         try:
-            # 현재 컨텍스트 가져오기
-            context_data = await self.get_session_context(session_id) or {}
-
-            # 채팅 히스토리 초기화
-            if "chat_history" not in context_data:
-                context_data["chat_history"] = []
-
-            # 메시지 추가
             message = {
                 "role": role,
                 "content": content,
@@ -191,16 +333,9 @@ class SessionContextStore:
                 "metadata": metadata or {},
             }
 
-            context_data["chat_history"].append(message)
-
-            # 최대 크기 유지
-            if len(context_data["chat_history"]) > self.max_history_per_session:
-                context_data["chat_history"] = context_data["chat_history"][
-                    -self.max_history_per_session :
-                ]
-
-            # 저장
-            return await self.save_session_context(session_id, context_data)
+            # 메시지 하나만 덧붙이고 최대 크기 유지 (RPUSH + LTRIM)
+            await self._write_fragments(session_id, appends={"chat_history": [message]})
+            return True
 
         except Exception as e:
             logger.error(f"채팅 메시지 추가 실패: {str(e)}")
@@ -220,29 +355,17 @@ class SessionContextStore:
             성공 여부
         """
         try:
-            # 현재 컨텍스트 가져오기
-            context_data = await self.get_session_context(session_id) or {}
-
-            # 선택된 셀 업데이트
-            context_data["selected_cells"] = cells
-            context_data["selection_timestamp"] = datetime.now().isoformat()
-
-            # 선택 히스토리 추가
-            if "selection_history" not in context_data:
-                context_data["selection_history"] = []
-
-            context_data["selection_history"].append(
-                {"cells": cells, "timestamp": datetime.now().isoformat()}
+            timestamp = datetime.now().isoformat()
+
+            # 선택된 셀 필드 갱신 + 선택 히스토리 추가 (최대 10개 유지)
+            await self._write_fragments(
+                session_id,
+                fields={"selected_cells": cells, "selection_timestamp": timestamp},
+                appends={
+                    "selection_history": [{"cells": cells, "timestamp": timestamp}]
+                },
             )
-
-            # 최대 10개 유지
-            if len(context_data["selection_history"]) > 10:
-                context_data["selection_history"] = context_data["selection_history"][
-                    -10:
-                ]
-
-            # 저장
-            return await self.save_session_context(session_id, context_data)
+            return True
 
         except Exception as e:
             logger.error(f"선택된 셀 업데이트 실패: {str(e)}")
@@ -278,33 +401,20 @@ class SessionContextStore:
             redis_client = await self._get_redis()
 
             for session_id in active_sessions:
-                key = f"{self.key_prefix}{session_id}"
-                exists = await redis_client.exists(key)
+                exists = await redis_client.exists(self._fields_key(session_id))
 
                 if not exists:
                     # 활성 세션 목록에서 제거
                     await self._remove_from_active_sessions(session_id)
 
-                    # 로컬 캐시에서 제거
-                    self._local_cache.pop(session_id, None)
+                    # 통합 캐시에서 제거
+                    await integrated_cache.delete(self._cache_key(session_id))
 
             logger.info("만료된 세션 정리 완료")
 
         except Exception as e:
             logger.error(f"세션 정리 실패: {str(e)}")
 
-    async def _add_to_active_sessions(self, session_id: str):
-        """활성 세션 목록에 추가"""
-        try:
-            redis_client = await self._get_redis()
-            key = f"{self.key_prefix}active_sessions"
-            score = datetime.now().timestamp()
-
-            await redis_client.zadd(key, {session_id: score})
-
-        except Exception as e:
-            logger.error(f"활성 세션 추가 실패: {str(e)}")
-
     async def _remove_from_active_sessions(self, session_id: str):
         """활성 세션 목록에서 제거"""
         try:
@@ -319,7 +429,7 @@ class SessionContextStore:
     async def close(self):
         """연결 종료"""
         if self._redis:
-            await self._redis.close()
+            await self._redis.aclose()
             self._redis = None
 
 
@@ -0,0 +1,407 @@
+"""
+Workbook Cell Index
+워크북을 한 번만 스캔하여 모든 감지기가 공유하는 열 지향(columnar) 셀 인덱스
+"""
+
+from array import array
+from collections import Counter, defaultdict
+import copy
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import numpy as np
+from app.core.excel_utils import ExcelUtils
+from app.services.detection.dependency_graph import DependencyGraph
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# 시트 요약에서 사용하는 데이터 타입 분류
+SUMMARY_TYPES = ("numbers", "text", "formulas", "dates")
+
+
+def classify_summary_type(value: Any, data_type: str, is_date: bool) -> Optional[str]:
+    """셀 값을 시트 요약용 데이터 타입으로 분류"""
+    if data_type == "f":
+        return "formulas"
+    if isinstance(value, (int, float)):
+        return "numbers"
+    if isinstance(value, str):
+        return "text"
+    if is_date:
+        return "dates"
+    return None
+
+
+def null_runs(
+    filled_rows: np.ndarray, first_row: int, last_row: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """빈 셀 마스크의 런 렝스 인코딩
+
+    값이 있는 행(오름차순) 사이의 간격으로 [first_row, last_row] 구간의
+    빈 셀 구간을 (시작 행, 길이) 배열로 반환합니다. 열 길이가 아니라
+    값이 있는 셀 수에 비례하며, 빈 셀마다 배열 칸을 만들지 않습니다.
+    """
+    filled = np.asarray(filled_rows, dtype=np.int64)
+    filled = filled[(filled >= first_row) & (filled <= last_row)]
+    bounds = np.concatenate(([first_row - 1], filled, [last_row + 1]))
+    lengths = np.diff(bounds) - 1
+    present = lengths > 0
+    return bounds[:-1][present] + 1, lengths[present]
+
+
+class IndexedCell:
+    """인덱스된 셀의 경량 뷰 - 감지기가 사용하는 openpyxl 셀 속성과 호환"""
+
+    __slots__ = (
+        "parent",
+        "row",
+        "column",
+        "value",
+        "data_type",
+        "number_format",
+        "is_date",
+    )
+
+    def __init__(
+        self,
+        parent: "SheetCellIndex",
+        row: int,
+        column: int,
+        value: Any = None,
+        data_type: str = "n",
+        number_format: str = "General",
+        is_date: bool = False,
+    ):
+        self.parent = parent
+        self.row = row
+        self.column = column
+        self.value = value
+        self.data_type = data_type
+        self.number_format = number_format
+        self.is_date = is_date
+
+    @property
+    def coordinate(self) -> str:
+        return f"{ExcelUtils.number_to_column(self.column)}{self.row}"
+
+    def __repr__(self) -> str:
+        return f"<IndexedCell {self.parent.title}!{self.coordinate}>"
+
+
+class SheetCellIndex:
+    """시트 단위 열 지향 셀 인덱스
+
+    값이 있는 셀만 보관하며, 행/열 번호는 압축 배열에 저장합니다.
+    """
+
+    def __init__(self, parent: "WorkbookCellIndex", title: str):
+        self.parent = parent
+        self.title = title
+        self.max_row = 0
+        self.max_column = 0
+
+        # 열 지향 저장소 (같은 위치 i가 하나의 셀)
+        self.rows = array("I")
+        self.cols = array("I")
+        self.values: List[Any] = []
+        self.data_types: List[str] = []
+        self.number_formats: List[str] = []
+        self.date_flags: List[bool] = []
+
+        # 조회용 보조 인덱스
+        self._positions: Dict[Tuple[int, int], int] = {}
+        self._column_members: Dict[int, List[int]] = defaultdict(list)
+        self._row_members: Dict[int, List[int]] = defaultdict(list)
+        self.formula_positions: List[int] = []
+
+        # 열별 타입 히스토그램 {col: Counter({"numbers": 10, ...})}
+        self.column_type_histograms: Dict[int, Counter] = defaultdict(Counter)
+
+        # 시트 구조 정보
+        self.merged_ranges: List[Tuple[int, int, int, int, str]] = []
+        self.hidden_rows: List[int] = []
+        self.hidden_columns: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add_cell(
+        self,
+        row: int,
+        column: int,
+        value: Any,
+        data_type: str,
+        number_format: str = "General",
+        is_date: bool = False,
+    ):
+        """셀 추가 (스캔 단계에서만 호출, 완료 후 finalize 필요)"""
+        position = len(self.values)
+        self.rows.append(row)
+        self.cols.append(column)
+        self.values.append(value)
+        self.data_types.append(data_type)
+        self.number_formats.append(number_format)
+        self.date_flags.append(is_date)
+
+        self._positions[(row, column)] = position
+        self._column_members[column].append(position)
+        self._row_members[row].append(position)
+        if data_type == "f":
+            self.formula_positions.append(position)
+
+        summary_type = classify_summary_type(value, data_type, is_date)
+        if summary_type:
+            self.column_type_histograms[column][summary_type] += 1
+
+    def finalize(self):
+        """스캔 완료 후 정렬 상태 보장"""
+        for members in self._column_members.values():
+            members.sort(key=self.rows.__getitem__)
+        for members in self._row_members.values():
+            members.sort(key=self.cols.__getitem__)
+
+    # 조회 API
+    def _view(self, position: int) -> IndexedCell:
+        return IndexedCell(
+            self,
+            self.rows[position],
+            self.cols[position],
+            self.values[position],
+            self.data_types[position],
+            self.number_formats[position],
+            self.date_flags[position],
+        )
+
+    def cell(self, row: int, column: int) -> IndexedCell:
+        """셀 조회 - 값이 없는 위치는 빈 셀 뷰를 반환 (새 셀을 만들지 않음)"""
+        position = self._positions.get((row, column))
+        if position is None:
+            return IndexedCell(self, row, column)
+        return self._view(position)
+
+    def value(self, row: int, column: int) -> Any:
+        """셀 값만 조회"""
+        position = self._positions.get((row, column))
+        return None if position is None else self.values[position]
+
+    def has_value(self, row: int, column: int) -> bool:
+        return (row, column) in self._positions
+
+    def __getitem__(self, coordinate: str) -> IndexedCell:
+        match = ExcelUtils.CELL_PATTERN.match(coordinate)
+        if not match:
+            raise ValueError(f"잘못된 셀 주소: {coordinate}")
+        column = ExcelUtils.column_to_number(match.group(1))
+        return self.cell(int(match.group(2)), column)
+
+    def iter_cells(self) -> Iterator[IndexedCell]:
+        """값이 있는 모든 셀을 행 우선 순서로 순회"""
+        for row in sorted(self._row_members):
+            for position in self._row_members[row]:
+                yield self._view(position)
+
+    def iter_column(self, column: int) -> Iterator[IndexedCell]:
+        """특정 열의 값이 있는 셀을 행 순서로 순회"""
+        for position in self._column_members.get(column, ()):
+            yield self._view(position)
+
+    def iter_formula_cells(self) -> Iterator[IndexedCell]:
+        """수식 셀만 순회"""
+        for position in self.formula_positions:
+            yield self._view(position)
+
+    def column_values(self, column: int) -> Dict[int, Any]:
+        """열의 {행: 값} 매핑"""
+        return {
+            self.rows[position]: self.values[position]
+            for position in self._column_members.get(column, ())
+        }
+
+    def column_null_runs(
+        self, column: int, first_row: int = 1, last_row: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """열의 빈 셀 구간 (시작 행, 길이) - 빈 문자열도 빈 셀로 취급"""
+        filled = [
+            self.rows[position]
+            for position in self._column_members.get(column, ())
+            if self.values[position] != ""
+        ]
+        return null_runs(
+            np.asarray(filled, dtype=np.int64),
+            first_row,
+            self.max_row if last_row is None else last_row,
+        )
+
+    def row_values(self, row: int) -> Dict[int, Any]:
+        """행의 {열: 값} 매핑"""
+        return {
+            self.cols[position]: self.values[position]
+            for position in self._row_members.get(row, ())
+        }
+
+    def first_row_in_column(self, column: int) -> Optional[int]:
+        """열에서 값이 있는 첫 번째 행 (없으면 None)"""
+        members = self._column_members.get(column)
+        return self.rows[members[0]] if members else None
+
+    @property
+    def populated_columns(self) -> List[int]:
+        return sorted(self._column_members)
+
+    @property
+    def populated_rows(self) -> List[int]:
+        return sorted(self._row_members)
+
+    def type_counts(self) -> Dict[str, int]:
+        """시트 전체 타입 카운트 (열별 히스토그램 합계)"""
+        totals: Counter = Counter()
+        for histogram in self.column_type_histograms.values():
+            totals.update(histogram)
+        return {name: totals.get(name, 0) for name in SUMMARY_TYPES}
+
+
+class WorkbookCellIndex:
+    """워크북 전체 셀 인덱스 - 한 번의 스캔으로 생성되어 모든 감지기가 공유"""
+
+    def __init__(self, workbook: Any = None):
+        # 원본 워크북 (VBA 등 셀 외 정보가 필요한 감지기용)
+        self.workbook = workbook
+        self.sheets: Dict[str, SheetCellIndex] = {}
+        self.sheetnames: List[str] = []
+        self._dependency_graph: Optional[DependencyGraph] = None
+
+    @property
+    def worksheets(self) -> List[SheetCellIndex]:
+        return [self.sheets[name] for name in self.sheetnames]
+
+    def __getitem__(self, sheet_name: str) -> SheetCellIndex:
+        return self.sheets[sheet_name]
+
+    def __contains__(self, sheet_name: str) -> bool:
+        return sheet_name in self.sheets
+
+    @property
+    def total_cells(self) -> int:
+        return sum(len(sheet) for sheet in self.sheets.values())
+
+    @property
+    def dependency_graph(self) -> DependencyGraph:
+        """워크북 수식 의존성 그래프 (처음 사용할 때 생성, 모든 감지기가 공유)"""
+        if self._dependency_graph is None:
+            self._dependency_graph = DependencyGraph.from_cell_index(self)
+        return self._dependency_graph
+
+    @dependency_graph.setter
+    def dependency_graph(self, graph: DependencyGraph):
+        self._dependency_graph = graph
+
+    @property
+    def has_dependency_graph(self) -> bool:
+        return self._dependency_graph is not None
+
+    @classmethod
+    def ensure(cls, workbook: Any) -> "WorkbookCellIndex":
+        """이미 인덱스면 그대로, 워크북이면 새로 스캔"""
+        if isinstance(workbook, cls):
+            return workbook
+        return cls.build(workbook)
+
+    @classmethod
+    def with_sheets(cls, sheetnames: List[str]) -> "WorkbookCellIndex":
+        """빈 시트들로 인덱스 생성 (스트리밍 청크를 채워 넣는 용도)"""
+        index = cls()
+        for sheet_name in sheetnames:
+            index.sheets[sheet_name] = SheetCellIndex(index, sheet_name)
+            index.sheetnames.append(sheet_name)
+        return index
+
+    def sheet_slice(
+        self, sheet_name: str, dependency_graph: Optional[DependencyGraph] = None
+    ) -> "WorkbookCellIndex":
+        """시트 하나만 담은 인덱스 (다른 시트는 이름만 유지) - 프로세스 간 전달용
+
+        의존성 그래프를 쓰는 감지기에는 시트 간 순환 참조를 놓치지 않도록 워크북 전체
+        그래프를 전달합니다. 전달하지 않으면 그래프 없이 피클되며, 조회하면 이 시트만으로
+        생성됩니다.
+        """
+        index = WorkbookCellIndex.with_sheets(self.sheetnames)
+        index._dependency_graph = dependency_graph
+        sheet = copy.copy(self.sheets[sheet_name])
+        sheet.parent = index
+        index.sheets[sheet_name] = sheet
+        return index
+
+    @classmethod
+    def build(cls, workbook: Any) -> "WorkbookCellIndex":
+        """워크북을 한 번 스캔하여 인덱스 생성"""
+        index = cls(workbook)
+        for sheet_name in workbook.sheetnames:
+            worksheet = workbook[sheet_name]
+            index.add_sheet(sheet_name, worksheet)
+
+        logger.debug(
+            f"셀 인덱스 생성: {len(index.sheetnames)}개 시트, {index.total_cells}개 셀"
+        )
+        return index
+
+    def add_sheet(self, sheet_name: str, worksheet: Any) -> SheetCellIndex:
+        """워크시트 하나를 스캔하여 인덱스에 추가"""
+        sheet_index = SheetCellIndex(self, sheet_name)
+        sheet_index.max_row = int(worksheet.max_row or 0)
+        sheet_index.max_column = int(worksheet.max_column or 0)
+
+        for cell in self._iter_existing_cells(worksheet):
+            value = cell.value
+            if value is None:
+                continue
+            sheet_index.add_cell(
+                cell.row,
+                cell.column,
+                value,
+                getattr(cell, "data_type", "n"),
+                getattr(cell, "number_format", "General"),
+                bool(getattr(cell, "is_date", False)),
+            )
+        sheet_index.finalize()
+
+        merged_cells = getattr(worksheet, "merged_cells", None)
+        if merged_cells is not None:
+            for merged_range in merged_cells.ranges:
+                sheet_index.merged_ranges.append(
+                    (
+                        merged_range.min_row,
+                        merged_range.min_col,
+                        merged_range.max_row,
+                        merged_range.max_col,
+                        str(merged_range),
+                    )
+                )
+
+        row_dimensions = getattr(worksheet, "row_dimensions", None)
+        if row_dimensions is not None:
+            sheet_index.hidden_rows = [
+                row_idx
+                for row_idx, row_dim in row_dimensions.items()
+                if getattr(row_dim, "hidden", False)
+            ]
+
+        column_dimensions = getattr(worksheet, "column_dimensions", None)
+        if column_dimensions is not None:
+            sheet_index.hidden_columns = [
+                col_letter
+                for col_letter, col_dim in column_dimensions.items()
+                if getattr(col_dim, "hidden", False)
+            ]
+
+        if sheet_name not in self.sheets:
+            self.sheetnames.append(sheet_name)
+        self.sheets[sheet_name] = sheet_index
+        return sheet_index
+
+    @staticmethod
+    def _iter_existing_cells(worksheet: Any) -> Iterator[Any]:
+        """파일에 실제로 존재하는 셀만 순회 (빈 셀 객체를 만들지 않음)"""
+        existing = getattr(worksheet, "_cells", None)
+        if isinstance(existing, dict):
+            return iter(list(existing.values()))
+        return (cell for row in worksheet.iter_rows() for cell in row)
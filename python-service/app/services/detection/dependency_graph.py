@@ -0,0 +1,665 @@
+"""
+Formula Dependency Graph
+워크북 전체 수식 의존성 그래프 - 정수 노드 ID, 범위 압축 엣지, Tarjan SCC 순환 감지
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from app.core.excel_utils import ExcelUtils
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 참조 사각형 (시트, 시작 행, 시작 열, 끝 행, 끝 열) - 단일 셀은 1x1 사각형
+Reference = Tuple[str, int, int, int, int]
+
+# Excel 최대 행/열 (1048576 / XFD) - 전체 행/열 참조의 범위
+MAX_ROW = 1048576
+MAX_COLUMN = 16384
+
+# 열 폭이 이 값 이하인 범위는 열별 구간 인덱스에, 더 넓은 범위는 시트별 열 구간 인덱스에 저장
+NARROW_RANGE_COLUMNS = 64
+
+# 수식 내 참조: [시트!]A1, [시트!]A1:B2, [시트!]A:C (전체 열), [시트!]1:3 (전체 행)
+# 따옴표 없는 시트 이름은 유니코드 문자로 시작할 수 있음 (예: 시트1!A1)
+REFERENCE_PATTERN = re.compile(
+    r"(?<![\w.$'!\]])"
+    r"(?:(?P<sheet>'(?:[^']|'')+'|[^\W\d][\w.]*)!)?"
+    r"(?:"
+    r"\$?(?P<col1>[A-Za-z]{1,3})\$?(?P<row1>\d+)"
+    r"(?::\$?(?P<col2>[A-Za-z]{1,3})\$?(?P<row2>\d+))?"
+    r"|\$?(?P<col_start>[A-Za-z]{1,3}):\$?(?P<col_end>[A-Za-z]{1,3})"
+    r"|\$?(?P<row_start>\d+):\$?(?P<row_end>\d+)"
+    r")"
+    r"(?![\w(!])"
+)
+
+# 이름 정의 후보 토큰 (함수 호출, 시트 접두사 제외)
+NAME_PATTERN = re.compile(r"(?<![\w.$'!\]])((?:[^\W\d]|\\)[\w.]*)(?![\w(!])")
+
+# 문자열 리터럴 ("..." 안의 참조 모양 텍스트 제외)
+STRING_LITERAL_PATTERN = re.compile(r'"(?:[^"]|"")*"')
+
+# 따옴표로 감싼 시트 접두사 (이름 정의 검색에서 제외)
+QUOTED_SHEET_PATTERN = re.compile(r"'(?:[^']|'')+'!")
+
+
+def parse_references(
+    formula: str,
+    current_sheet: str,
+    sheet_lookup: Optional[Dict[str, str]] = None,
+    defined_names: Optional[Dict[str, List[Reference]]] = None,
+) -> List[Reference]:
+    """수식에서 참조를 사각형 목록으로 추출 (외부 통합 문서 참조 제외)
+
+    전체 행/열 참조는 시트 끝까지의 사각형 하나로, 이름 정의는 그 대상 사각형들로
+    변환합니다. 범위 크기와 관계없이 셀 단위로 펼치지 않습니다.
+    """
+    references = []
+    formula = STRING_LITERAL_PATTERN.sub("", formula)
+    for match in REFERENCE_PATTERN.finditer(formula):
+        sheet = match.group("sheet")
+        if sheet:
+            if sheet.startswith("'"):
+                sheet = sheet[1:-1].replace("''", "'")
+            if sheet.startswith("["):
+                continue
+            if sheet_lookup:
+                sheet = sheet_lookup.get(sheet.lower(), sheet)
+        else:
+            sheet = current_sheet
+
+        if match.group("col1"):
+            col1 = ExcelUtils.column_to_number(match.group("col1").upper())
+            row1 = int(match.group("row1"))
+            if match.group("col2"):
+                col2 = ExcelUtils.column_to_number(match.group("col2").upper())
+                row2 = int(match.group("row2"))
+            else:
+                col2, row2 = col1, row1
+        elif match.group("col_start"):
+            col1 = ExcelUtils.column_to_number(match.group("col_start").upper())
+            col2 = ExcelUtils.column_to_number(match.group("col_end").upper())
+            row1, row2 = 1, MAX_ROW
+        else:
+            row1 = int(match.group("row_start"))
+            row2 = int(match.group("row_end"))
+            col1, col2 = 1, MAX_COLUMN
+
+        if max(col1, col2) > MAX_COLUMN or max(row1, row2) > MAX_ROW:
+            continue
+        if min(row1, row2) < 1:
+            continue
+        references.append(
+            (sheet, min(row1, row2), min(col1, col2), max(row1, row2), max(col1, col2))
+        )
+
+    if defined_names:
+        for match in NAME_PATTERN.finditer(QUOTED_SHEET_PATTERN.sub("", formula)):
+            references.extend(defined_names.get(match.group(1).lower(), ()))
+
+    return references
+
+
+def collect_defined_names(
+    workbook: Any,
+) -> Dict[Optional[str], Dict[str, List[Reference]]]:
+    """openpyxl 워크북의 이름 정의 수집 {범위(None=통합 문서, 시트명): {이름(소문자): 참조}}"""
+    scopes: Dict[Optional[str], Dict[str, List[Reference]]] = {}
+    sheet_lookup = {name.lower(): name for name in getattr(workbook, "sheetnames", ())}
+
+    def add(scope: Optional[str], name: str, defined_name: Any):
+        references = []
+        try:
+            for sheet, cell_range in defined_name.destinations:
+                references.extend(
+                    parse_references(cell_range, sheet_lookup.get(sheet.lower(), sheet))
+                )
+        except Exception as e:
+            logger.debug(f"이름 정의 해석 실패: {name} ({str(e)})")
+            return
+        if references:
+            scopes.setdefault(scope, {})[name.lower()] = references
+
+    defined_names = getattr(workbook, "defined_names", None)
+    if hasattr(defined_names, "items"):
+        for name, defined_name in defined_names.items():
+            add(None, name, defined_name)
+
+    for sheet in getattr(workbook, "worksheets", ()):
+        sheet_names = getattr(sheet, "defined_names", None)
+        if hasattr(sheet_names, "items"):
+            for name, defined_name in sheet_names.items():
+                add(sheet.title, name, defined_name)
+
+    return scopes
+
+
+def format_key(sheet: str, row: int, column: int) -> str:
+    """노드 키 문자열 ("Sheet1!A1")"""
+    return f"{sheet}!{ExcelUtils.number_to_column(column)}{row}"
+
+
+def format_reference(reference: Reference) -> str:
+    sheet, row1, col1, row2, col2 = reference
+    if (row1, col1) == (row2, col2):
+        return format_key(sheet, row1, col1)
+    if (row1, row2) == (1, MAX_ROW):
+        start = ExcelUtils.number_to_column(col1)
+        return f"{sheet}!{start}:{ExcelUtils.number_to_column(col2)}"
+    if (col1, col2) == (1, MAX_COLUMN):
+        return f"{sheet}!{row1}:{row2}"
+    end = f"{ExcelUtils.number_to_column(col2)}{row2}"
+    return f"{format_key(sheet, row1, col1)}:{end}"
+
+
+def parse_key(key: str) -> Optional[Tuple[str, int, int]]:
+    """ "Sheet1!A1" -> (시트, 행, 열) (형식이 다르면 None)"""
+    match = ExcelUtils.SHEET_CELL_PATTERN.match(key)
+    if not match:
+        return None
+    sheet = match.group(1).strip("'")
+    return sheet, int(match.group(3)), ExcelUtils.column_to_number(match.group(2))
+
+
+class IntervalIndex:
+    """정적 구간 트리 (centered interval tree)
+
+    구간을 모두 추가한 뒤 첫 조회 때 트리를 만들며, 점을 포함하는 구간 조회는
+    O(log n + k) 입니다.
+    """
+
+    def __init__(self):
+        self._intervals: List[Tuple[int, int, int]] = []
+        self._root: Optional[tuple] = None
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def add(self, start: int, end: int, value: int):
+        self._intervals.append((start, end, value))
+        self._root = None
+
+    def query(self, point: int) -> Iterator[int]:
+        """point를 포함하는 구간의 값"""
+        if self._root is None and self._intervals:
+            self._root = self._build(self._intervals)
+
+        node = self._root
+        while node is not None:
+            center, by_start, by_end, left, right = node
+            if point < center:
+                for start, _, value in by_start:
+                    if start > point:
+                        break
+                    yield value
+                node = left
+            elif point > center:
+                for _, end, value in by_end:
+                    if end < point:
+                        break
+                    yield value
+                node = right
+            else:
+                for _, _, value in by_start:
+                    yield value
+                return
+
+    @classmethod
+    def _build(cls, intervals: List[Tuple[int, int, int]]) -> Optional[tuple]:
+        if not intervals:
+            return None
+        endpoints = sorted(
+            point for start, end, _ in intervals for point in (start, end)
+        )
+        center = endpoints[len(endpoints) // 2]
+
+        left, middle, right = [], [], []
+        for interval in intervals:
+            if interval[1] < center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                middle.append(interval)
+
+        by_start = sorted(middle, key=lambda interval: interval[0])
+        by_end = sorted(middle, key=lambda interval: -interval[1])
+        return center, by_start, by_end, cls._build(left), cls._build(right)
+
+
+class DependencyGraph:
+    """워크북 수식 의존성 그래프
+
+    노드는 수식 셀만 가지며 정수 ID로 관리합니다. 엣지는 수식이 참조하는
+    사각형(셀 또는 범위)으로 압축 저장하고, 순회할 때 시트/열별 정렬된 수식 행에서
+    이진 탐색으로 범위 안의 수식 노드만 찾습니다. 값 셀은 순환에 참여할 수 없으므로
+    노드로 만들지 않습니다.
+
+    역방향 조회("셀 X를 참조하는 수식")는 참조 사각형을 구간 인덱스에 넣어
+    범위를 펼치지 않고 답합니다. 좁은 범위는 열별 행 구간 인덱스에, 전체 행처럼
+    넓은 범위는 시트별 열 구간 인덱스에 저장합니다.
+    """
+
+    def __init__(
+        self,
+        sheetnames: Optional[Iterable[str]] = None,
+        defined_names: Optional[Dict[Optional[str], Dict[str, List[Reference]]]] = None,
+    ):
+        self.node_keys: List[Tuple[str, int, int]] = []
+        self.formulas: List[str] = []
+        self.references: List[List[Reference]] = []
+        self._node_ids: Dict[Tuple[str, int, int], int] = {}
+        self._sheet_lookup = {name.lower(): name for name in sheetnames or ()}
+        self._defined_names = defined_names or {}
+        self._names_by_sheet: Dict[str, Dict[str, List[Reference]]] = {}
+
+        # 시트/열별 수식 행 (정렬) 및 같은 순서의 노드 ID
+        self._column_rows: Dict[Tuple[str, int], List[int]] = defaultdict(list)
+        self._column_nodes: Dict[Tuple[str, int], List[int]] = defaultdict(list)
+        self._sheet_columns: Dict[str, List[int]] = {}
+
+        # 역방향 조회용 구간 인덱스 (처음 조회할 때 생성)
+        self._narrow_index: Optional[Dict[Tuple[str, int], IntervalIndex]] = None
+        self._wide_index: Dict[str, IntervalIndex] = {}
+        self._wide_references: List[Tuple[int, int, int]] = []
+
+        # 지연 계산 결과
+        self._components: Optional[List[List[int]]] = None
+        self._component_of: Optional[List[int]] = None
+        self._cyclic_nodes: Optional[Set[int]] = None
+        self._depths: Optional[List[int]] = None
+
+    # 생성
+    def add_formula(self, sheet: str, row: int, column: int, formula: Any) -> int:
+        """수식 셀 추가 (생성 단계에서만 호출, 완료 후 finalize 필요)"""
+        node = len(self.node_keys)
+        self.node_keys.append((sheet, row, column))
+        self.formulas.append(str(formula))
+        self.references.append(
+            parse_references(
+                str(formula), sheet, self._sheet_lookup, self._names_for(sheet)
+            )
+        )
+        self._node_ids[(sheet, row, column)] = node
+        self._column_rows[(sheet, column)].append(row)
+        self._column_nodes[(sheet, column)].append(node)
+        return node
+
+    def _names_for(self, sheet: str) -> Dict[str, List[Reference]]:
+        """시트에서 보이는 이름 정의 (시트 범위 이름이 통합 문서 이름보다 우선)"""
+        names = self._names_by_sheet.get(sheet)
+        if names is None:
+            names = {
+                **self._defined_names.get(None, {}),
+                **self._defined_names.get(sheet, {}),
+            }
+            self._names_by_sheet[sheet] = names
+        return names
+
+    def finalize(self) -> "DependencyGraph":
+        """열별 수식 행 정렬 및 시트별 열 목록 생성"""
+        sheet_columns: Dict[str, List[int]] = defaultdict(list)
+        for (sheet, column), rows in self._column_rows.items():
+            nodes = self._column_nodes[(sheet, column)]
+            if any(rows[i] > rows[i + 1] for i in range(len(rows) - 1)):
+                ordered = sorted(zip(rows, nodes))
+                rows[:] = [row for row, _ in ordered]
+                nodes[:] = [node for _, node in ordered]
+            sheet_columns[sheet].append(column)
+        self._sheet_columns = {
+            sheet: sorted(columns) for sheet, columns in sheet_columns.items()
+        }
+        return self
+
+    @classmethod
+    def from_formulas(
+        cls,
+        entries: Iterable[Tuple[str, str, Any]],
+        sheetnames: Optional[Iterable[str]] = None,
+    ) -> "DependencyGraph":
+        """(시트, 주소, 수식) 목록으로 그래프 생성"""
+        graph = cls(sheetnames)
+        for sheet, coordinate, formula in entries:
+            row, column = ExcelUtils.cell_to_row_col(coordinate)
+            graph.add_formula(sheet, row, column, formula)
+        return graph.finalize()
+
+    @staticmethod
+    def cell_index_inputs(cell_index: Any) -> Tuple[
+        List[str],
+        Optional[Dict[Optional[str], Dict[str, List[Reference]]]],
+        List[Tuple[str, int, int, str]],
+    ]:
+        """셀 인덱스에서 그래프 생성 입력 (시트 이름, 이름 정의, 수식 셀) 추출
+
+        셀 인덱스 전체 대신 이 입력만 피클하여 워커 프로세스에서 그래프를 만들 수 있습니다.
+        """
+        workbook = getattr(cell_index, "workbook", None)
+        defined_names = (
+            collect_defined_names(workbook) if workbook is not None else None
+        )
+        formula_cells = [
+            (
+                sheet.title,
+                sheet.rows[position],
+                sheet.cols[position],
+                sheet.values[position],
+            )
+            for sheet in cell_index.worksheets
+            for position in sheet.formula_positions
+        ]
+        return list(cell_index.sheetnames), defined_names, formula_cells
+
+    @classmethod
+    def from_formula_cells(
+        cls,
+        sheetnames: Iterable[str],
+        defined_names: Optional[Dict[Optional[str], Dict[str, List[Reference]]]],
+        formula_cells: Iterable[Tuple[str, int, int, str]],
+    ) -> "DependencyGraph":
+        """(시트, 행, 열, 수식) 목록으로 그래프 생성"""
+        graph = cls(sheetnames, defined_names)
+        for sheet, row, column, formula in formula_cells:
+            graph.add_formula(sheet, row, column, formula)
+        graph.finalize()
+        logger.debug(
+            f"의존성 그래프 생성: {len(graph)}개 수식, {graph.number_of_edges()}개 참조"
+        )
+        return graph
+
+    @classmethod
+    def from_cell_index(cls, cell_index: Any) -> "DependencyGraph":
+        """WorkbookCellIndex의 수식 셀로 그래프 생성"""
+        return cls.from_formula_cells(*cls.cell_index_inputs(cell_index))
+
+    @classmethod
+    def for_workbook(cls, workbook: Any) -> "DependencyGraph":
+        """워크북의 공유 그래프 조회 (셀 인덱스면 캐시된 그래프, openpyxl이면 새로 생성)"""
+        if hasattr(workbook, "dependency_graph"):
+            return workbook.dependency_graph
+
+        graph = cls(workbook.sheetnames, collect_defined_names(workbook))
+        for sheet in workbook.worksheets:
+            for row in sheet.iter_rows():
+                for cell in row:
+                    if cell.data_type == "f" and cell.value:
+                        graph.add_formula(
+                            sheet.title, cell.row, cell.column, cell.value
+                        )
+        return graph.finalize()
+
+    # 기본 조회
+    def __len__(self) -> int:
+        return len(self.node_keys)
+
+    def __contains__(self, key: str) -> bool:
+        parsed = parse_key(key)
+        return parsed is not None and self.node_id(*parsed) is not None
+
+    def number_of_nodes(self) -> int:
+        return len(self.node_keys)
+
+    def number_of_edges(self) -> int:
+        """압축 엣지(참조 사각형) 수"""
+        return sum(len(references) for references in self.references)
+
+    def node_id(self, sheet: str, row: int, column: int) -> Optional[int]:
+        return self._node_ids.get((sheet, row, column))
+
+    def key(self, node: int) -> str:
+        return format_key(*self.node_keys[node])
+
+    def precedent_nodes(self, node: int) -> Iterator[int]:
+        """수식이 참조하는 수식 노드 (범위는 이진 탐색으로 해당 수식만 조회)"""
+        for sheet, row1, col1, row2, col2 in self.references[node]:
+            columns = self._sheet_columns.get(sheet)
+            if not columns:
+                continue
+            for column in columns[
+                bisect_left(columns, col1) : bisect_right(columns, col2)
+            ]:
+                rows = self._column_rows[(sheet, column)]
+                nodes = self._column_nodes[(sheet, column)]
+                for i in range(bisect_left(rows, row1), bisect_right(rows, row2)):
+                    yield nodes[i]
+
+    def precedents(self, sheet: str, row: int, column: int) -> List[str]:
+        """셀 수식이 직접 참조하는 셀/범위"""
+        node = self.node_id(sheet, row, column)
+        if node is None:
+            return []
+        return [format_reference(reference) for reference in self.references[node]]
+
+    def _build_dependents_index(self):
+        """참조 사각형을 구간 인덱스에 등록"""
+        narrow_index: Dict[Tuple[str, int], IntervalIndex] = defaultdict(IntervalIndex)
+        for node, references in enumerate(self.references):
+            for sheet, row1, col1, row2, col2 in references:
+                if col2 - col1 < NARROW_RANGE_COLUMNS:
+                    for column in range(col1, col2 + 1):
+                        narrow_index[(sheet, column)].add(row1, row2, node)
+                else:
+                    if sheet not in self._wide_index:
+                        self._wide_index[sheet] = IntervalIndex()
+                    self._wide_index[sheet].add(col1, col2, len(self._wide_references))
+                    self._wide_references.append((row1, row2, node))
+        self._narrow_index = dict(narrow_index)
+
+    def dependent_nodes(self, sheet: str, row: int, column: int) -> List[int]:
+        """셀을 직접 참조하는 수식 노드 (값 셀 포함 모든 셀에 대해 조회 가능)"""
+        if self._narrow_index is None:
+            self._build_dependents_index()
+
+        nodes = set()
+        column_index = self._narrow_index.get((sheet, column))
+        if column_index is not None:
+            nodes.update(column_index.query(row))
+
+        wide_index = self._wide_index.get(sheet)
+        if wide_index is not None:
+            for position in wide_index.query(column):
+                row1, row2, node = self._wide_references[position]
+                if row1 <= row <= row2:
+                    nodes.add(node)
+        return sorted(nodes)
+
+    def dependents(self, sheet: str, row: int, column: int) -> List[str]:
+        """셀을 직접 참조하는 수식 셀"""
+        return [self.key(node) for node in self.dependent_nodes(sheet, row, column)]
+
+    def dependent_counts(self) -> List[int]:
+        """노드별 직접 의존 수식 수"""
+        counts = [0] * len(self.node_keys)
+        for node in range(len(self.node_keys)):
+            for precedent in self.precedent_nodes(node):
+                counts[precedent] += 1
+        return counts
+
+    def transitive_dependents(self, sheet: str, row: int, column: int) -> Set[str]:
+        """셀 변경의 영향을 받는 모든 수식 셀"""
+        seen: Set[int] = set()
+        stack = self.dependent_nodes(sheet, row, column)
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            stack.extend(self.dependent_nodes(*self.node_keys[node]))
+        return {self.key(node) for node in seen}
+
+    def transitive_precedents(self, sheet: str, row: int, column: int) -> Set[str]:
+        """셀이 직간접적으로 의존하는 모든 수식 셀"""
+        start = self.node_id(sheet, row, column)
+        if start is None:
+            return set()
+        seen = {start}
+        stack = [start]
+        while stack:
+            for precedent in self.precedent_nodes(stack.pop()):
+                if precedent not in seen:
+                    seen.add(precedent)
+                    stack.append(precedent)
+        seen.discard(start)
+        return {self.key(node) for node in seen}
+
+    # 순환 감지
+    def strongly_connected_components(self) -> List[List[int]]:
+        """Tarjan SCC (반복 구현, O(V+E)) - 선행 컴포넌트가 먼저 나오는 순서"""
+        if self._components is not None:
+            return self._components
+
+        count = len(self.node_keys)
+        index_of = [-1] * count
+        low = [0] * count
+        on_stack = [False] * count
+        stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+
+        for root in range(count):
+            if index_of[root] != -1:
+                continue
+            index_of[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, self.precedent_nodes(root))]
+
+            while work:
+                node, neighbors = work[-1]
+                descended = False
+                for neighbor in neighbors:
+                    if index_of[neighbor] == -1:
+                        index_of[neighbor] = low[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack[neighbor] = True
+                        work.append((neighbor, self.precedent_nodes(neighbor)))
+                        descended = True
+                        break
+                    if on_stack[neighbor] and index_of[neighbor] < low[node]:
+                        low[node] = index_of[neighbor]
+                if descended:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+        component_of = [0] * count
+        for component_id, component in enumerate(components):
+            for node in component:
+                component_of[node] = component_id
+
+        self._components = components
+        self._component_of = component_of
+        return components
+
+    def cyclic_components(self) -> List[List[int]]:
+        """순환을 이루는 SCC (2개 이상 노드 또는 자기 참조)"""
+        return [
+            component
+            for component in self.strongly_connected_components()
+            if len(component) > 1 or component[0] in self.precedent_nodes(component[0])
+        ]
+
+    def is_in_cycle(self, sheet: str, row: int, column: int) -> bool:
+        node = self.node_id(sheet, row, column)
+        if node is None:
+            return False
+        if self._cyclic_nodes is None:
+            self._cyclic_nodes = {
+                member for component in self.cyclic_components() for member in component
+            }
+        return node in self._cyclic_nodes
+
+    def has_cycles(self) -> bool:
+        return bool(self.cyclic_components())
+
+    def cycles(self) -> List[List[str]]:
+        """순환 SCC마다 대표 순환 경로 (참조되는 셀 -> 참조하는 셀 순서)"""
+        return [
+            [self.key(node) for node in self._cycle_path(component)]
+            for component in self.cyclic_components()
+        ]
+
+    def _cycle_path(self, component: List[int]) -> List[int]:
+        """컴포넌트 첫 노드를 지나는 최단 순환 (BFS)"""
+        start = component[0]
+        members = set(component)
+        came_from: Dict[int, int] = {}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for precedent in self.precedent_nodes(node):
+                if precedent == start:
+                    # node -> ... -> start 역추적 결과가 곧 흐름 순서
+                    path = [node]
+                    while path[-1] != start:
+                        path.append(came_from[path[-1]])
+                    return path
+                if precedent in members and precedent not in came_from:
+                    came_from[precedent] = node
+                    queue.append(precedent)
+        return [start]
+
+    # 깊이 / 경로
+    def _compute_depths(self) -> List[int]:
+        """노드별 선행 수식 체인 길이 (SCC는 하나의 노드로 취급)"""
+        if self._depths is not None:
+            return self._depths
+
+        components = self.strongly_connected_components()
+        component_of = self._component_of
+        depths = [0] * len(self.node_keys)
+        for component_id, component in enumerate(components):
+            best = 0
+            for node in component:
+                for precedent in self.precedent_nodes(node):
+                    if component_of[precedent] != component_id:
+                        best = max(best, depths[precedent] + 1)
+            for node in component:
+                depths[node] = best
+        self._depths = depths
+        return depths
+
+    def depth(self, sheet: str, row: int, column: int) -> int:
+        """셀 수식의 의존성 깊이 (참조하는 수식이 없으면 0)"""
+        node = self.node_id(sheet, row, column)
+        if node is None:
+            return 0
+        return self._compute_depths()[node]
+
+    def longest_path(self) -> List[str]:
+        """가장 긴 의존성 체인 (참조되는 셀 -> 참조하는 셀 순서)"""
+        if not self.node_keys:
+            return []
+        depths = self._compute_depths()
+        components = self._components
+        component_of = self._component_of
+        node = max(range(len(depths)), key=depths.__getitem__)
+        path = [node]
+        while depths[node] > 0:
+            # 깊이를 결정한 선행 노드는 같은 SCC의 다른 멤버에 있을 수 있음
+            node = next(
+                precedent
+                for member in components[component_of[node]]
+                for precedent in self.precedent_nodes(member)
+                if depths[precedent] == depths[node] - 1
+            )
+            path.append(node)
+        return [self.key(node) for node in reversed(path)]
@@ -25,17 +25,44 @@ from app.services.detection.strategies.data_quality_detector import DataQualityD
 from app.services.detection.strategies.structure_detector import StructureDetector
 from app.services.detection.strategies.vba_error_detector import VBAErrorDetector
 from app.services.workbook_loader import OpenpyxlWorkbookLoader
+from app.services.detection.cell_index import WorkbookCellIndex
+from app.services.detection.dependency_graph import DependencyGraph
+from app.services.detection.streaming_detector import StreamingErrorDetector
 from app.services.detection.multi_cell_analyzer import MultiCellAnalyzer
 from app.core.excel_utils import ExcelUtils
-from app.core.integrated_cache import integrated_cache, cache_result
+from app.core.integrated_cache import integrated_cache
+from app.core.content_hash import content_hash_registry
+from app.core.config import settings
+from app.core.parallel_processor import parallel_processor
+from app.core.single_flight import single_flight
 import asyncio
+import hashlib
 import logging
 import re
+import uuid
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
+def _detect_sheet_in_process(
+    detectors: List[IErrorDetector], sheet_index: WorkbookCellIndex
+) -> List[List[ExcelError]]:
+    """프로세스 풀 작업 단위 - 시트 하나에 감지기들을 실행하고 감지기별 결과 반환"""
+
+    async def run() -> List[List[ExcelError]]:
+        results = []
+        for detector in detectors:
+            try:
+                results.append(await detector.detect(sheet_index))
+            except Exception as e:
+                logger.error(f"{detector.__class__.__name__} 오류: {str(e)}")
+                results.append([])
+        return results
+
+    return asyncio.run(run())
+
+
 class IntegratedErrorDetector:
     """통합 오류 감지 서비스"""
 
@@ -47,6 +74,9 @@ class IntegratedErrorDetector:
     MAX_CONCURRENT_DETECTORS = 4  # 동시 실행 감지기 수
     CACHE_TTL = 3600  # 캐시 TTL (1시간)
 
+    # 감지 로직이 바뀌면 올려서 이전 분석 캐시를 무효화
+    DETECTION_VERSION = 1
+
     def __init__(self, progress_reporter: Optional[IProgressReporter] = None):
         self.progress_reporter = progress_reporter
 
@@ -64,27 +94,115 @@ class IntegratedErrorDetector:
         # 멀티 셀 분석기
         self.multi_cell_analyzer = MultiCellAnalyzer()
 
+        # 진행 중인 감지 취소용 (프로세스 풀 요청 식별자, 실행 중인 태스크)
+        self._request_id: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._cancel_requested = False
+
     # @PerformanceMonitor.monitor_request  # TODO: Fix decorator
-    @cache_result(prefix="error_detection", ttl=3600)  # 1 hour cache
     async def detect_all_errors(self, file_path: str) -> FileAnalysisResult:
         """파일의 모든 오류 감지"""
-
-        # 통합 캐시에서 결과 확인
-        file_id = self._extract_file_id(file_path)
-        if file_id:
-            cached_result = await integrated_cache.get_analysis(file_id)
-            if cached_result:
-                logger.info(f"캐시에서 오류 감지 결과 반환: {file_path}")
-                # PerformanceMonitor.record_cache_access("error_detection", hit=True)  # TODO: Fix method
-                return cached_result
+        self._cancel_requested = False
+        # 다른 요청의 같은 분석을 기다리는 동안에도 cancel()로 취소할 수 있도록 등록
+        self._task = asyncio.current_task()
+        try:
+            return await self._detect_or_share(file_path)
+        except asyncio.CancelledError:
+            # 리더 실행은 _detect_uncached에서 처리, 여기서는 기다리던 요청의 취소
+            if not self._cancel_requested:
+                raise
+            return self._cancelled_result(file_path)
+
+    async def _detect_or_share(self, file_path: str) -> FileAnalysisResult:
+        """캐시된 결과, 진행 중인 동일 분석 결과 공유, 또는 직접 감지"""
+        # 통합 캐시에서 결과 확인 (파일 내용 해시 + 감지기 구성 버전 기준)
+        content_hash = await content_hash_registry.resolve(file_path)
+        if content_hash:
+            file_id = content_hash[:16]
+        else:
+            file_id = self._extract_file_id(file_path)
+        cache_key = self._build_cache_key(content_hash or file_id)
+        if not cache_key:
+            return await self._detect_uncached(file_path, file_id, cache_key)
+
+        cached_result = await integrated_cache.get_analysis(cache_key)
+        if cached_result:
+            logger.info(f"캐시에서 오류 감지 결과 반환: {file_path}")
+            # PerformanceMonitor.record_cache_access("error_detection", hit=True)  # TODO: Fix method
+            return await self._reuse_result(file_path, cached_result)
 
         # PerformanceMonitor.record_cache_access("error_detection", hit=False)  # TODO: Fix method
 
+        # 같은 내용을 동시에 분석하는 요청은 하나만 실행 (워커 간에는 Redis 락)
+        result, shared = await single_flight.do(
+            f"error_detection:{cache_key}",
+            lambda: self._detect_uncached(file_path, file_id, cache_key),
+            recheck=lambda: integrated_cache.get_analysis(cache_key),
+        )
+        if not shared:
+            return result
+        if result.get("status") != "success":
+            # 다른 요청의 취소/실패는 공유하지 않고 직접 실행
+            return await self._detect_uncached(file_path, file_id, cache_key)
+
+        logger.info(f"진행 중인 동일 분석 결과 공유: {file_path}")
+        return await self._reuse_result(file_path, result)
+
+    def _cancelled_result(self, file_path: str) -> FileAnalysisResult:
+        """cancel()로 요청된 취소를 결과로 변환"""
+        # 직접 요청한 취소는 결과로 변환했으므로 태스크의 취소 상태 해제
+        current = asyncio.current_task()
+        if current is not None and current.cancelling():
+            current.uncancel()
+        logger.info(f"오류 감지 취소됨: {file_path}")
+        return {
+            "status": "cancelled",
+            "message": "오류 감지가 취소되었습니다",
+            "file_path": file_path,
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    async def _reuse_result(
+        self, file_path: str, shared_result: FileAnalysisResult
+    ) -> FileAnalysisResult:
+        """캐시되었거나 다른 요청이 만든 결과를 현재 요청 기준으로 반환"""
+        # 같은 내용의 다른 업로드일 수 있으므로 경로 정보는 현재 요청 기준
+        result = {
+            **shared_result,
+            "file_path": file_path,
+            "filename": file_path.split("/")[-1],
+        }
+
+        # 진행 상황을 기다리는 클라이언트에게도 완료 알림
+        if self.progress_reporter:
+            await self.progress_reporter.start_task("오류 감지", 100)
+            await self.progress_reporter.report_progress(
+                100, 100, "캐시된 오류 감지 결과"
+            )
+            await self.progress_reporter.complete_task("오류 감지", result)
+
+        return result
+
+    async def _detect_uncached(
+        self, file_path: str, file_id: Optional[str], cache_key: Optional[str]
+    ) -> FileAnalysisResult:
+        """캐시 없이 오류 감지 실행 후 결과 캐싱"""
         # TODO: Fix PerformanceMonitor.monitor_operation
         # with PerformanceMonitor.monitor_operation("error_detection", file_path=file_path):
+        self._request_id = uuid.uuid4().hex
+        self._task = asyncio.current_task()
         try:
-            # 워크북 로드
-            workbook = await self._load_workbook(file_path)
+            if self._cancel_requested:
+                # 감지 시작 전에 취소 요청됨
+                raise asyncio.CancelledError()
+
+            # 대용량 파일은 워크북을 메모리에 올리지 않는 스트리밍 모드 사용
+            use_streaming = StreamingErrorDetector.should_stream(file_path)
+
+            if not use_streaming:
+                # 워크북 로드 후 한 번만 스캔하여 공유 셀 인덱스 생성
+                workbook = await self._load_workbook(file_path)
+                cell_index = self._build_cell_index(workbook)
 
             # 진행 상황 보고
             if self.progress_reporter:
@@ -93,8 +211,17 @@ class IntegratedErrorDetector:
 
             start_time = datetime.now()
 
-            # 병렬로 모든 감지기 실행 (최적화)
-            all_errors = await self._run_detectors_parallel_optimized(workbook)
+            if use_streaming:
+                logger.info(f"대용량 파일 스트리밍 감지 모드: {file_path}")
+                streaming_result = await self._create_streaming_detector().detect(
+                    file_path
+                )
+                all_errors = streaming_result["errors"]
+                sheet_summaries = streaming_result["sheets"]
+            else:
+                # 병렬로 모든 감지기 실행 (최적화)
+                all_errors = await self._run_detectors_parallel_optimized(cell_index)
+                sheet_summaries = await self._get_sheet_summaries(cell_index)
 
             # 중복 제거 및 정렬
             unique_errors = self._deduplicate_errors(all_errors)
@@ -112,23 +239,28 @@ class IntegratedErrorDetector:
                     self._convert_to_error_info(error) for error in sorted_errors
                 ],
                 "summary": self._create_summary(sorted_errors),
-                "sheets": await self._get_sheet_summaries(workbook),
+                "sheets": sheet_summaries,
                 "tier_used": ProcessingTier.CACHE.value,
             }
+            if use_streaming:
+                result["streaming"] = True
+                result["skipped_detectors"] = streaming_result["skipped_detectors"]
 
             # 통합 캐시에 저장 (계층적 캐싱)
-            if file_id:
+            if cache_key:
                 # 전체 분석 결과 캐싱
-                await integrated_cache.set_analysis(file_id, result, ttl=self.CACHE_TTL)
+                await integrated_cache.set_analysis(
+                    cache_key, result, ttl=self.CACHE_TTL
+                )
 
                 # 오류 목록 캐싱
                 await integrated_cache.set_errors(
-                    file_id, sorted_errors, ttl=self.CACHE_TTL
+                    cache_key, sorted_errors, ttl=self.CACHE_TTL
                 )
 
                 # 요약 정보는 더 오래 캐싱 (분석 결과보다 작고 자주 조회됨)
                 await integrated_cache.set(
-                    f"summary:{file_id}", result["summary"], ttl=self.CACHE_TTL * 2
+                    f"summary:{cache_key}", result["summary"], ttl=self.CACHE_TTL * 2
                 )
 
             # 진행 상황 완료
@@ -138,6 +270,11 @@ class IntegratedErrorDetector:
 
             return result
 
+        except asyncio.CancelledError:
+            # cancel()로 요청된 취소만 결과로 변환 (상위 태스크 취소는 그대로 전파)
+            if not self._cancel_requested:
+                raise
+            return self._cancelled_result(file_path)
         except FileNotFoundError:
             logger.error(f"파일을 찾을 수 없음: {file_path}")
             return {
@@ -165,6 +302,9 @@ class IntegratedErrorDetector:
                 "file_path": file_path,
                 "timestamp": datetime.now().isoformat(),
             }
+        finally:
+            # 감지가 끝난 뒤의 cancel()이 호출자 태스크를 취소하지 않도록
+            self._task = None
 
     async def detect_cell_error(
         self, file_path: str, sheet: str, cell: str
@@ -258,6 +398,14 @@ class IntegratedErrorDetector:
         """워크북 로드"""
         return await self.workbook_loader.load_workbook(file_path)
 
+    def _build_cell_index(self, workbook: Any) -> WorkbookCellIndex:
+        """모든 감지기가 공유할 셀 인덱스 생성 (워크북 전체 스캔은 여기서 한 번만)"""
+        return WorkbookCellIndex.ensure(workbook)
+
+    def _create_streaming_detector(self) -> StreamingErrorDetector:
+        """현재 감지기 목록으로 스트리밍 감지기 생성"""
+        return StreamingErrorDetector(self.detectors, self.progress_reporter)
+
     async def _run_detectors_parallel(self, workbook: Any) -> List[ExcelError]:
         """병렬로 감지기 실행 - 기본 방법"""
         tasks = []
@@ -292,12 +440,19 @@ class IntegratedErrorDetector:
     async def _run_detectors_parallel_optimized(
         self, workbook: Any
     ) -> List[ExcelError]:
-        """병렬로 감지기 실행 - 최적화 버전"""
+        """병렬로 감지기 실행 - 최적화 버전
+
+        대용량 워크북이면 CPU 집약 감지기는 프로세스 풀에서 시트 단위로 실행하고,
+        나머지 감지기만 이벤트 루프에서 실행합니다.
+        """
         # Semaphore로 동시 실행 제한
         semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_DETECTORS)
         all_errors = []
         error_lock = asyncio.Lock()
 
+        process_detectors = self._select_process_detectors(workbook)
+        loop_detectors = [d for d in self.detectors if d not in process_detectors]
+
         async def run_detector_with_limit(
             detector: IErrorDetector, index: int, total: int
         ):
@@ -325,14 +480,166 @@ class IntegratedErrorDetector:
 
         # 모든 감지기 비동기 실행
         tasks = [
-            run_detector_with_limit(detector, i, len(self.detectors))
-            for i, detector in enumerate(self.detectors)
+            run_detector_with_limit(detector, i, len(loop_detectors))
+            for i, detector in enumerate(loop_detectors)
         ]
 
-        await asyncio.gather(*tasks)
+        if process_detectors:
+            process_errors, _ = await asyncio.gather(
+                self._run_detectors_in_processes(workbook, process_detectors),
+                asyncio.gather(*tasks),
+            )
+            all_errors = process_errors + all_errors
+        else:
+            await asyncio.gather(*tasks)
 
         return all_errors
 
+    def _select_process_detectors(self, workbook: Any) -> List[IErrorDetector]:
+        """프로세스 풀에서 실행할 감지기 선택 (작은 워크북은 IPC 비용이 더 커서 제외)
+
+        감지기의 ``CPU_BOUND`` 속성이 참이면 선택합니다. I/O 없이 셀 인덱스만
+        계산하는(순수 CPU 작업) 감지기에 지정하며, 시트 단위로 나눈 셀 인덱스와 함께
+        피클되어 워커 프로세스에서 실행되므로 감지기와 결과도 피클 가능해야 합니다.
+        """
+        if not settings.DETECTION_PROCESS_POOL_ENABLED:
+            return []
+        if not isinstance(workbook, WorkbookCellIndex):
+            return []
+        if workbook.total_cells < settings.DETECTION_PROCESS_MIN_CELLS:
+            return []
+        return [d for d in self.detectors if getattr(d, "CPU_BOUND", False)]
+
+    async def _run_detectors_in_processes(
+        self, cell_index: WorkbookCellIndex, detectors: List[IErrorDetector]
+    ) -> List[ExcelError]:
+        """CPU 집약 감지기를 프로세스 풀에서 시트 단위로 실행
+
+        워크북 전체 의존성 그래프는 ``USES_DEPENDENCY_GRAPH`` 감지기가 있을 때만
+        워커에서 한 번 만들고, 그 감지기들의 시트 작업에만 함께 전달합니다.
+        """
+        sheetnames = list(cell_index.sheetnames)
+        graph_positions = [
+            position
+            for position, detector in enumerate(detectors)
+            if getattr(detector, "USES_DEPENDENCY_GRAPH", False)
+        ]
+        plain_positions = [
+            position
+            for position in range(len(detectors))
+            if position not in graph_positions
+        ]
+        groups = []
+        if plain_positions:
+            groups.append((plain_positions, None))
+        if graph_positions:
+            graph = await self._build_dependency_graph(cell_index)
+            groups.append((graph_positions, graph))
+        completed = 0
+
+        async def run_sheet(sheet_name: str) -> List[List[ExcelError]]:
+            nonlocal completed
+            group_results = await asyncio.gather(
+                *(
+                    self._detect_sheet_group(
+                        sheet_name,
+                        [detectors[position] for position in positions],
+                        cell_index.sheet_slice(sheet_name, graph),
+                    )
+                    for positions, graph in groups
+                )
+            )
+            results: List[List[ExcelError]] = [[] for _ in detectors]
+            for (positions, _), group_errors in zip(groups, group_results):
+                for position, errors in zip(positions, group_errors):
+                    results[position] = errors
+
+            completed += 1
+            if self.progress_reporter:
+                await self.progress_reporter.report_progress(
+                    int(completed / len(sheetnames) * 100),
+                    100,
+                    f"{sheet_name} 시트 감지 완료",
+                )
+            return results
+
+        sheet_results = await asyncio.gather(
+            *(run_sheet(name) for name in sheetnames), return_exceptions=True
+        )
+        if any(isinstance(r, asyncio.CancelledError) for r in sheet_results):
+            raise asyncio.CancelledError()
+
+        # 감지기 순서 -> 시트 순서로 결과 결합 (직접 실행과 같은 순서)
+        errors: List[ExcelError] = []
+        for detector_position in range(len(detectors)):
+            for results in sheet_results:
+                if isinstance(results, BaseException):
+                    logger.error(f"시트 감지 실패: {str(results)}")
+                    continue
+                errors.extend(results[detector_position])
+        return errors
+
+    async def _build_dependency_graph(
+        self, cell_index: WorkbookCellIndex
+    ) -> DependencyGraph:
+        """워크북 전체 의존성 그래프를 프로세스 풀에서 생성 (수식 셀만 전달)"""
+        if not cell_index.has_dependency_graph:
+            try:
+                cell_index.dependency_graph = await parallel_processor.run_in_process(
+                    DependencyGraph.from_formula_cells,
+                    *DependencyGraph.cell_index_inputs(cell_index),
+                    request_id=self._request_id,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 풀 장애 시 아래 조회에서 이벤트 루프에서 직접 생성
+                logger.warning(f"프로세스 풀 그래프 생성 실패, 직접 실행: {e}")
+        return cell_index.dependency_graph
+
+    async def _detect_sheet_group(
+        self,
+        sheet_name: str,
+        detectors: List[IErrorDetector],
+        sheet_slice: WorkbookCellIndex,
+    ) -> List[List[ExcelError]]:
+        """시트 하나에 감지기 묶음을 프로세스 풀에서 실행 (감지기별 결과)"""
+        try:
+            return await parallel_processor.run_in_process(
+                _detect_sheet_in_process,
+                detectors,
+                sheet_slice,
+                request_id=self._request_id,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 풀 장애(BrokenProcessPool, 피클 오류 등) 시 이벤트 루프에서 직접 실행
+            logger.warning(f"프로세스 풀 실행 실패, 직접 실행: {sheet_name} ({e})")
+            results = []
+            for detector in detectors:
+                try:
+                    results.append(await detector.detect(sheet_slice))
+                except Exception as detector_error:
+                    logger.error(
+                        f"{detector.__class__.__name__} 오류: {str(detector_error)}"
+                    )
+                    results.append([])
+            return results
+
+    def cancel(self) -> int:
+        """진행 중인 감지 요청 취소 (프로세스 풀의 대기/실행 작업 포함)
+
+        Returns:
+            취소된 프로세스 풀 작업 수
+        """
+        self._cancel_requested = True
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        if self._request_id is None:
+            return 0
+        return parallel_processor.cancel_request(self._request_id)
+
     def _deduplicate_errors(self, errors: List[ExcelError]) -> List[ExcelError]:
         """중복 오류 제거"""
         seen = set()
@@ -365,10 +672,21 @@ class IntegratedErrorDetector:
 
     def _generate_file_id(self, file_path: str) -> str:
         """파일 ID 생성"""
-        import hashlib
-
         return hashlib.md5(file_path.encode()).hexdigest()[:16]
 
+    def _detector_set_version(self) -> str:
+        """감지기 구성 버전 - 감지기 추가/제거나 로직 변경 시 캐시 키가 달라짐"""
+        detector_names = ",".join(sorted(type(d).__name__ for d in self.detectors))
+        return hashlib.blake2b(
+            f"{self.DETECTION_VERSION}:{detector_names}".encode(), digest_size=4
+        ).hexdigest()
+
+    def _build_cache_key(self, content_id: Optional[str]) -> Optional[str]:
+        """분석 캐시 키 생성 (내용 해시가 없으면 캐시하지 않음)"""
+        if not content_id:
+            return None
+        return f"error_detection:{content_id}:{self._detector_set_version()}"
+
     def _create_error_result(self, file_path: str, message: str) -> FileAnalysisResult:
         """에러 결과 생성"""
         return {
@@ -400,47 +718,26 @@ class IntegratedErrorDetector:
         }
 
     async def _get_sheet_summaries(self, workbook: Any) -> Dict[str, SheetSummary]:
-        """시트 요약 생성"""
+        """시트 요약 생성 - 셀 인덱스의 열별 타입 히스토그램 사용"""
+        cell_index = WorkbookCellIndex.ensure(workbook)
         summaries = {}
 
-        for sheet_name in workbook.sheetnames:
-            sheet = workbook[sheet_name]
+        for sheet_name in cell_index.sheetnames:
+            sheet = cell_index[sheet_name]
 
             # 데이터 타입 카운트
-            data_types: Dict[str, int] = {
-                "numbers": 0,
-                "text": 0,
-                "formulas": 0,
-                "dates": 0,
-                "empty": 0,
-            }
-
-            non_empty_cells = 0
-            formulas_count = 0
-
-            for row in sheet.iter_rows():
-                for cell in row:
-                    if cell.value is not None:
-                        non_empty_cells += 1
-
-                        if cell.data_type == "f":
-                            formulas_count += 1
-                            data_types["formulas"] += 1
-                        elif isinstance(cell.value, (int, float)):
-                            data_types["numbers"] += 1
-                        elif isinstance(cell.value, str):
-                            data_types["text"] += 1
-                        elif cell.is_date:
-                            data_types["dates"] += 1
-                    else:
-                        data_types["empty"] += 1
+            data_types: Dict[str, int] = dict(sheet.type_counts())
+            non_empty_cells = len(sheet)
+            data_types["empty"] = max(
+                sheet.max_row * sheet.max_column - non_empty_cells, 0
+            )
 
             summaries[sheet_name] = {
                 "name": sheet_name,
                 "rows": sheet.max_row,
                 "columns": sheet.max_column,
                 "non_empty_cells": non_empty_cells,
-                "formulas_count": formulas_count,
+                "formulas_count": data_types["formulas"],
                 "errors_count": 0,  # Will be updated later
                 "data_types": data_types,
             }
@@ -499,7 +796,7 @@ class IntegratedErrorDetector:
         }
 
     def _extract_file_id(self, file_path: str) -> Optional[str]:
-        """파일 경로에서 파일 ID 추출"""
+        """파일 경로에서 파일 ID 추출 (파일 내용을 읽을 수 없을 때의 대체 ID)"""
         # 예: /tmp/excel_file_123.xlsx -> 123
         import re
 
@@ -524,51 +821,31 @@ class IntegratedErrorDetector:
         logger.info(f"오류 감지 캐시 초기화: {count}개 항목 삭제")
 
     async def detect_errors_streaming(self, file_path: str, callback=None):
-        """대용량 파일을 위한 스트리밍 오류 감지"""
+        """대용량 파일을 위한 스트리밍 오류 감지
+
+        xlsx/xlsm은 워크북 전체를 로드하지 않고 시트 XML을 행 청크 단위로 읽으며,
+        청크(또는 시트)마다 감지된 오류를 callback으로 전달합니다.
+        """
         file_id = self._extract_file_id(file_path) or self._generate_file_id(file_path)
 
         try:
-            workbook = await self._load_workbook(file_path)
-            total_sheets = len(workbook.sheetnames)
-            errors_found = []
-
-            # 시트별로 스트리밍 처리
-            for sheet_index, sheet_name in enumerate(workbook.sheetnames):
-                sheet = workbook[sheet_name]
-                sheet_errors = []
-
-                # 진행률 계산
-                progress = int((sheet_index / total_sheets) * 100)
-
-                # 각 감지기 실행
-                for detector in self.detectors:
-                    try:
-                        # 시트 단위로 감지
-                        if hasattr(detector, "detect_sheet"):
-                            errors = await detector.detect_sheet(sheet, sheet_name)
-                            sheet_errors.extend(errors)
-                    except Exception as e:
-                        logger.warning(f"시트 {sheet_name} 감지 오류: {str(e)}")
-
-                # 콜백 호출 (중간 결과 전달)
-                if callback:
-                    await callback(
-                        {
-                            "sheet": sheet_name,
-                            "progress": progress,
-                            "errors": sheet_errors,
-                            "sheet_index": sheet_index,
-                            "total_sheets": total_sheets,
-                        }
-                    )
-
-                errors_found.extend(sheet_errors)
+            streaming_detector = self._create_streaming_detector()
+            if StreamingErrorDetector.can_stream(file_path):
+                streaming_result = await streaming_detector.detect(file_path, callback)
+            else:
+                # xls/csv 등은 로드한 뒤 시트 단위로 감지
+                workbook = await self._load_workbook(file_path)
+                streaming_result = await streaming_detector.detect_workbook(
+                    workbook, callback
+                )
 
             # 최종 결과 반환
             return {
                 "status": "success",
                 "file_id": file_id,
-                "errors": errors_found,
+                "errors": streaming_result["errors"],
+                "sheets": streaming_result["sheets"],
+                "skipped_detectors": streaming_result["skipped_detectors"],
                 "streaming": True,
             }
 
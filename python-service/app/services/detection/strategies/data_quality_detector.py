@@ -1,22 +1,43 @@
 """
 Data Quality Error Detector
 데이터 품질 오류 감지 전략
+
+시트를 한 번 (행, 열, 값, 타입) 열 지향 프레임으로 변환한 뒤
+중복/누락/타입 불일치/이상치를 NumPy/pandas 벡터 연산으로 감지합니다.
 """
 
 from typing import List, Any
 from app.core.interfaces import IErrorDetector, ExcelError, ExcelErrorType
-from collections import defaultdict
+from app.core.excel_utils import ExcelUtils
+from app.services.detection.cell_index import (
+    WorkbookCellIndex,
+    SheetCellIndex,
+    null_runs,
+)
 import re
 import logging
 from datetime import datetime
-import statistics
+import numpy as np
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# 중복으로 보지 않는 단순 값 (대소문자 무시)
+TRIVIAL_DUPLICATE_VALUES = {"yes", "no", "true", "false", "y", "n", "t", "f"}
+
+# 누락 데이터: 주변 ±MISSING_WINDOW행 안의 빈 셀이 이 수 이상이면 의도적 공백으로 봄
+MISSING_WINDOW = 2
+MISSING_RUN_THRESHOLD = 3
+
+# 문자열 타입 판별 순서 (앞의 패턴이 우선)
+STRING_TYPE_ORDER = ("email", "phone", "date", "number", "percentage", "currency")
+
 
 class DataQualityDetector(IErrorDetector):
     """데이터 품질 오류 감지기"""
 
+    CPU_BOUND = True
+
     def __init__(self):
         self.patterns = {
             "email": re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"),
@@ -30,9 +51,10 @@ class DataQualityDetector(IErrorDetector):
     async def detect(self, workbook: Any) -> List[ExcelError]:
         """워크북에서 데이터 품질 오류 감지"""
         errors = []
+        cell_index = WorkbookCellIndex.ensure(workbook)
 
-        for sheet in workbook.sheetnames:
-            worksheet = workbook[sheet]
+        for sheet in cell_index.sheetnames:
+            worksheet = cell_index[sheet]
             sheet_errors = await self._detect_sheet_errors(worksheet, sheet)
             errors.extend(sheet_errors)
 
@@ -47,290 +69,344 @@ class DataQualityDetector(IErrorDetector):
         ]
 
     async def _detect_sheet_errors(
-        self, worksheet: Any, sheet_name: str
+        self, worksheet: SheetCellIndex, sheet_name: str
     ) -> List[ExcelError]:
         """시트별 오류 감지"""
         errors = []
+        if not len(worksheet):
+            return errors
+
+        frame = self._build_frame(worksheet)
 
         # 중복 데이터 감지
-        duplicate_errors = self._detect_duplicates(worksheet, sheet_name)
+        duplicate_errors = self._detect_duplicates(frame, sheet_name)
         errors.extend(duplicate_errors)
 
         # 누락 데이터 감지
-        missing_errors = self._detect_missing_data(worksheet, sheet_name)
+        missing_errors = self._detect_missing_data(frame, worksheet.max_row, sheet_name)
         errors.extend(missing_errors)
 
         # 타입 불일치 감지
-        type_errors = self._detect_type_mismatches(worksheet, sheet_name)
+        type_errors = self._detect_type_mismatches(frame, sheet_name)
         errors.extend(type_errors)
 
         # 이상치 감지
-        outlier_errors = self._detect_outliers(worksheet, sheet_name)
+        outlier_errors = self._detect_outliers(frame, sheet_name)
         errors.extend(outlier_errors)
 
         return errors
 
-    def _detect_duplicates(self, worksheet: Any, sheet_name: str) -> List[ExcelError]:
-        """중복 데이터 감지"""
+    def _build_frame(self, worksheet: SheetCellIndex) -> pd.DataFrame:
+        """시트를 행 우선 순서의 열 지향 프레임으로 변환 (감지 메서드가 공유)"""
+        rows = np.asarray(worksheet.rows, dtype=np.int64)
+        cols = np.asarray(worksheet.cols, dtype=np.int64)
+        order = np.lexsort((cols, rows))
+
+        values = np.empty(len(worksheet.values), dtype=object)
+        values[:] = worksheet.values
+        values = values[order]
+
+        frame = pd.DataFrame({"row": rows[order], "col": cols[order], "value": values})
+        kinds = frame["value"].map(type)
+        frame["data_type"] = self._classify_types(frame["value"], kinds)
+        # 이상치는 실제 숫자 셀만 (숫자처럼 보이는 문자열 "12.5"는 제외, bool은 int)
+        numeric_kinds = {
+            kind: issubclass(kind, (int, float)) for kind in kinds.unique()
+        }
+        frame["is_numeric"] = kinds.map(numeric_kinds).to_numpy(dtype=bool)
+        return frame
+
+    def _classify_types(self, values: pd.Series, kinds: pd.Series) -> np.ndarray:
+        """셀 값 타입 분류 - 파이썬 타입별로 한 번, 문자열은 고유 값만 정규식으로"""
+        labels = {kind: self._detect_type_label(kind) for kind in kinds.unique()}
+        data_types = kinds.map(labels).to_numpy(dtype=object)
+
+        is_str = data_types == "str"
+        if is_str.any():
+            # 고유 문자열만 분류, 앞 패턴에 맞지 않은 문자열만 다음 패턴 검사
+            codes, uniques = pd.factorize(values[is_str])
+            remaining = pd.Series(uniques, dtype=object)
+            unique_types = np.full(len(uniques), "text", dtype=object)
+            for name in STRING_TYPE_ORDER:
+                if remaining.empty:
+                    break
+                matched = remaining.str.match(self.patterns[name]).to_numpy(dtype=bool)
+                unique_types[remaining.index[matched]] = name
+                remaining = remaining[~matched]
+            data_types[is_str] = unique_types[codes]
+        return data_types
+
+    @staticmethod
+    def _detect_type_label(kind: type) -> str:
+        """파이썬 타입 -> 데이터 타입 (문자열은 패턴 분류 전 "str")"""
+        if issubclass(kind, bool):
+            return "boolean"
+        if issubclass(kind, (int, float)):
+            return "number"
+        if issubclass(kind, datetime):
+            return "date"
+        if issubclass(kind, str):
+            return "str"
+        return "unknown"
+
+    @staticmethod
+    def _column_letters(cols: np.ndarray) -> dict:
+        """열 번호 -> 열 문자 (고유 열마다 한 번만 변환)"""
+        return {
+            int(col): ExcelUtils.number_to_column(int(col)) for col in np.unique(cols)
+        }
+
+    def _detect_duplicates(
+        self, frame: pd.DataFrame, sheet_name: str
+    ) -> List[ExcelError]:
+        """중복 데이터 감지 (값 해시로 그룹화, 같은 열에서의 중복만)"""
         errors = []
-        value_positions = defaultdict(list)
-
-        # 모든 셀 값과 위치 수집
-        for row in worksheet.iter_rows():
-            for cell in row:
-                if cell.value is not None and cell.value != "":
-                    # 헤더 행은 제외 (첫 번째 행)
-                    if cell.row > 1:
-                        value_positions[str(cell.value)].append(
-                            (cell.row, cell.column, cell.coordinate)
-                        )
-
-        # 중복 찾기 (더 정교한 규칙 적용)
-        for value, positions in value_positions.items():
-            if len(positions) > 1:
-                # 단순한 값(예: 'A', 'B', '1', '2' 등)은 중복으로 간주하지 않음
-                if len(str(value)) > 2 and str(value).lower() not in [
-                    "yes",
-                    "no",
-                    "true",
-                    "false",
-                    "y",
-                    "n",
-                    "t",
-                    "f",
-                ]:
-                    # 같은 열에서의 중복만 오류로 표시
-                    col_positions = defaultdict(list)
-                    for row, col, coord in positions:
-                        col_positions[col].append((row, coord))
-
-                    for col, col_items in col_positions.items():
-                        if len(col_items) > 1:
-                            # 첫 번째 위치를 제외한 나머지를 중복으로 표시
-                            for row, coord in col_items[1:]:
-                                error = ExcelError(
-                                    id=f"{sheet_name}_{coord}_duplicate",
-                                    type=ExcelErrorType.DUPLICATE.value,
-                                    category="potential_issue",  # 잠재적 문제
-                                    sheet=sheet_name,
-                                    cell=coord,
-                                    formula=None,
-                                    value=value,
-                                    message=f"같은 열에 중복된 값: '{value}'가 {col_items[0][1]}에도 있습니다",
-                                    severity="low",
-                                    is_auto_fixable=False,
-                                    suggested_fix="데이터 무결성을 위해 중복 여부를 확인하세요",
-                                    confidence=0.7,
-                                )
-                                errors.append(error)
+
+        # 헤더 행(첫 번째 행)과 빈 문자열 제외
+        data = frame[(frame["row"] > 1) & (frame["value"] != "")]
+        if data.empty:
+            return errors
+
+        # 값의 문자열 표현을 해시 기반으로 코드화 (코드 순서 = 처음 등장 순서)
+        codes, uniques = pd.factorize(data["value"].astype(str))
+
+        # 단순한 값(예: 'A', '1', 'yes' 등)은 중복으로 간주하지 않음
+        unique_strings = pd.Series(uniques, dtype=object)
+        eligible = (unique_strings.str.len() > 2) & ~unique_strings.str.lower().isin(
+            TRIVIAL_DUPLICATE_VALUES
+        )
+
+        keyed = pd.DataFrame(
+            {
+                "code": codes,
+                "col": data["col"].to_numpy(),
+                "row": data["row"].to_numpy(),
+                "position": np.arange(len(codes)),
+            }
+        )
+        keyed = keyed[eligible.to_numpy()[codes]]
+
+        groups = keyed.groupby(["code", "col"], sort=False)
+        keyed = keyed.assign(
+            first_row=groups["row"].transform("first"),
+            first_position=groups["position"].transform("first"),
+        )
+
+        # 첫 번째 위치를 제외한 나머지를 중복으로 표시 (값 -> 열 -> 행 순서)
+        duplicates = keyed[keyed.duplicated(["code", "col"], keep="first")]
+        duplicates = duplicates.sort_values(["code", "first_position", "row"])
+
+        letters = self._column_letters(duplicates["col"].to_numpy())
+        unique_values = uniques.tolist()
+        for code, col, row, first_row in zip(
+            duplicates["code"].tolist(),
+            duplicates["col"].tolist(),
+            duplicates["row"].tolist(),
+            duplicates["first_row"].tolist(),
+        ):
+            value = unique_values[code]
+            coord = f"{letters[col]}{row}"
+            first_coord = f"{letters[col]}{first_row}"
+            error = ExcelError(
+                id=f"{sheet_name}_{coord}_duplicate",
+                type=ExcelErrorType.DUPLICATE.value,
+                category="potential_issue",  # 잠재적 문제
+                sheet=sheet_name,
+                cell=coord,
+                formula=None,
+                value=value,
+                message=f"같은 열에 중복된 값: '{value}'가 {first_coord}에도 있습니다",
+                severity="low",
+                is_auto_fixable=False,
+                suggested_fix="데이터 무결성을 위해 중복 여부를 확인하세요",
+                confidence=0.7,
+            )
+            errors.append(error)
 
         return errors
 
-    def _detect_missing_data(self, worksheet: Any, sheet_name: str) -> List[ExcelError]:
-        """누락된 데이터 감지"""
+    def _detect_missing_data(
+        self, frame: pd.DataFrame, max_row: int, sheet_name: str
+    ) -> List[ExcelError]:
+        """누락된 데이터 감지 (열별 빈 셀 런 렝스 구간을 한 번 훑어 판별)"""
         errors = []
 
-        # 각 열의 데이터 패턴 분석
-        column_data = defaultdict(list)
-        max_row = worksheet.max_row
-        max_col = worksheet.max_column
-
-        for col in range(1, max_col + 1):
-            for row in range(1, max_row + 1):
-                cell = worksheet.cell(row=row, column=col)
-                column_data[col].append(
-                    {"row": row, "value": cell.value, "coord": cell.coordinate}
+        # 헤더를 제외한 데이터 행이 없으면 검사할 것이 없음
+        if max_row < 2:
+            return errors
+
+        data_row_count = max_row - 1
+
+        # 헤더가 있는 열만 검사 대상 (헤더가 비어 있는 열은 건너뜀)
+        for col, column in frame.groupby("col", sort=True):
+            rows = column["row"].to_numpy()
+            values = column["value"].to_numpy()
+            header = values[0] if rows[0] == 1 else None
+
+            # 값이 있는 셀의 비율 계산
+            data_mask = rows > 1
+            fill_rate = int(data_mask.sum()) / data_row_count
+
+            # 채워진 비율이 80% 이상인 열에서만 빈 셀을 오류로 표시
+            # 그리고 헤더가 실제로 의미있는 경우에만
+            if not (
+                fill_rate > 0.8
+                and header is not None
+                and str(header).strip() != ""
+                and header != "None"
+            ):
+                continue
+
+            # 2행부터 max_row까지의 빈 셀 구간 (빈 문자열도 빈 셀)
+            starts, lengths = null_runs(rows[values != ""], 2, max_row)
+            if not len(starts):
+                continue
+
+            # 주변 ±2행 안의 빈 셀이 3개 이상이면 스킵 (의도적으로 비운 것일 가능성)
+            flagged = self._isolated_null_rows(starts, lengths)
+
+            column_letter = ExcelUtils.number_to_column(int(col))
+            for row in flagged.tolist():
+                coord = f"{column_letter}{row}"
+                error = ExcelError(
+                    id=f"{sheet_name}_{coord}_missing",
+                    type=ExcelErrorType.MISSING_DATA.value,
+                    category="potential_issue",  # 잠재적 문제
+                    sheet=sheet_name,
+                    cell=coord,
+                    formula=None,
+                    value=None,
+                    message=f"'{header}' 열에 누락된 데이터",
+                    severity="low",
+                    is_auto_fixable=False,
+                    suggested_fix="필요한 경우 누락된 데이터를 입력하세요",
+                    confidence=0.6,
                 )
-
-        # 각 열에서 누락된 데이터 찾기
-        for col, data in column_data.items():
-            # 헤더를 제외한 데이터
-            if len(data) > 1:
-                header = data[0]["value"]
-                values = data[1:]
-
-                # 값이 있는 셀의 비율 계산
-                non_empty_count = sum(1 for item in values if item["value"] is not None)
-                fill_rate = non_empty_count / len(values) if values else 0
-
-                # 채워진 비율이 80% 이상인 열에서만 빈 셀을 오류로 표시
-                # 그리고 헤더가 실제로 의미있는 경우에만
-                if (
-                    fill_rate > 0.8
-                    and header is not None
-                    and str(header).strip() != ""
-                    and header != "None"
-                ):
-                    for item in values:
-                        if item["value"] is None or item["value"] == "":
-                            # 연속된 빈 셀이 3개 이상인 경우 스킵 (의도적으로 비운 것일 가능성)
-                            consecutive_empty = 0
-                            for i in range(
-                                max(0, values.index(item) - 2),
-                                min(len(values), values.index(item) + 3),
-                            ):
-                                if (
-                                    values[i]["value"] is None
-                                    or values[i]["value"] == ""
-                                ):
-                                    consecutive_empty += 1
-
-                            if consecutive_empty < 3:
-                                error = ExcelError(
-                                    id=f"{sheet_name}_{item['coord']}_missing",
-                                    type=ExcelErrorType.MISSING_DATA.value,
-                                    category="potential_issue",  # 잠재적 문제
-                                    sheet=sheet_name,
-                                    cell=item["coord"],
-                                    formula=None,
-                                    value=None,
-                                    message=f"'{header}' 열에 누락된 데이터",
-                                    severity="low",
-                                    is_auto_fixable=False,
-                                    suggested_fix="필요한 경우 누락된 데이터를 입력하세요",
-                                    confidence=0.6,
-                                )
-                                errors.append(error)
+                errors.append(error)
 
         return errors
 
+    @staticmethod
+    def _isolated_null_rows(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        """주변 빈 셀이 MISSING_RUN_THRESHOLD개 미만인 빈 행 (구간 수에 비례)
+
+        길이가 기준 이상인 구간의 행은 항상 제외되고, 짧은 구간의 행은 자기
+        구간과 바로 앞뒤 구간만 창(±MISSING_WINDOW) 안에 들어올 수 있습니다.
+        """
+        short = np.flatnonzero(lengths < MISSING_RUN_THRESHOLD)
+        if not len(short):
+            return short
+
+        # 짧은 구간의 각 행과 소속 구간 번호
+        run_ids = np.repeat(short, lengths[short])
+        offsets = np.arange(len(run_ids)) - np.repeat(
+            np.cumsum(lengths[short]) - lengths[short], lengths[short]
+        )
+        rows = starts[run_ids] + offsets
+
+        ends = starts + lengths - 1
+        low, high = rows - MISSING_WINDOW, rows + MISSING_WINDOW
+
+        def overlap(neighbour: np.ndarray, valid: np.ndarray) -> np.ndarray:
+            clipped = np.clip(neighbour, 0, len(starts) - 1)
+            count = np.minimum(ends[clipped], high) - np.maximum(starts[clipped], low)
+            return np.where(valid, np.maximum(count + 1, 0), 0)
+
+        nearby = (
+            overlap(run_ids, run_ids >= 0)
+            + overlap(run_ids - 1, run_ids > 0)
+            + overlap(run_ids + 1, run_ids < len(starts) - 1)
+        )
+        return rows[nearby < MISSING_RUN_THRESHOLD]
+
     def _detect_type_mismatches(
-        self, worksheet: Any, sheet_name: str
+        self, frame: pd.DataFrame, sheet_name: str
     ) -> List[ExcelError]:
-        """타입 불일치 감지"""
+        """타입 불일치 감지 (프레임 생성 시 분류한 타입 사용)"""
         errors = []
 
-        # 각 열의 데이터 타입 패턴 분석
-        column_types = defaultdict(lambda: defaultdict(int))
-
-        for col in worksheet.iter_cols():
-            col_idx = col[0].column
-
-            # 헤더를 제외한 데이터 분석
-            for cell in col[1:]:
-                if cell.value is not None and cell.value != "":
-                    data_type = self._detect_data_type(cell.value)
-                    column_types[col_idx][data_type] += 1
-
-        # 각 열의 주요 타입 결정
-        column_main_types = {}
-        for col_idx, types in column_types.items():
-            if types:
-                main_type = max(types.items(), key=lambda x: x[1])[0]
-                total_count = sum(types.values())
-                main_type_ratio = types[main_type] / total_count
-
-                # 주요 타입이 80% 이상인 경우
-                if main_type_ratio >= 0.8:
-                    column_main_types[col_idx] = main_type
-
-        # 타입 불일치 찾기
-        for col in worksheet.iter_cols():
-            col_idx = col[0].column
-            if col_idx in column_main_types:
-                expected_type = column_main_types[col_idx]
-
-                for cell in col[1:]:  # 헤더 제외
-                    if cell.value is not None and cell.value != "":
-                        actual_type = self._detect_data_type(cell.value)
-
-                        if actual_type != expected_type:
-                            error = ExcelError(
-                                id=f"{sheet_name}_{cell.coordinate}_type_mismatch",
-                                type=ExcelErrorType.TYPE_MISMATCH.value,
-                                category="critical_error",  # 명백한 오류
-                                sheet=sheet_name,
-                                cell=cell.coordinate,
-                                formula=None,
-                                value=cell.value,
-                                message=f"타입 불일치: {expected_type} 예상, {actual_type} 발견",
-                                severity="medium",
-                                is_auto_fixable=(
-                                    True
-                                    if actual_type == "text"
-                                    and expected_type == "number"
-                                    else False
-                                ),
-                                suggested_fix=f"값을 {expected_type} 타입으로 변환하세요",
-                                confidence=0.85,
-                            )
-                            errors.append(error)
+        # 헤더를 제외한 데이터
+        data = frame[(frame["row"] > 1) & (frame["value"] != "")]
+
+        for col, column in data.groupby("col", sort=True):
+            # 열의 주요 타입 결정 - 80% 이상인 경우만
+            counts = column["data_type"].value_counts(sort=True)
+            expected_type, main_count = counts.index[0], counts.iloc[0]
+            if main_count / len(column) < 0.8:
+                continue
+
+            # 타입 불일치 찾기
+            mismatched = column[column["data_type"] != expected_type]
+            letter = ExcelUtils.number_to_column(int(col))
+            for row, value, actual_type in zip(
+                mismatched["row"].tolist(),
+                mismatched["value"].tolist(),
+                mismatched["data_type"].tolist(),
+            ):
+                coord = f"{letter}{row}"
+                error = ExcelError(
+                    id=f"{sheet_name}_{coord}_type_mismatch",
+                    type=ExcelErrorType.TYPE_MISMATCH.value,
+                    category="critical_error",  # 명백한 오류
+                    sheet=sheet_name,
+                    cell=coord,
+                    formula=None,
+                    value=value,
+                    message=f"타입 불일치: {expected_type} 예상, {actual_type} 발견",
+                    severity="medium",
+                    is_auto_fixable=(
+                        True
+                        if actual_type == "text" and expected_type == "number"
+                        else False
+                    ),
+                    suggested_fix=f"값을 {expected_type} 타입으로 변환하세요",
+                    confidence=0.85,
+                )
+                errors.append(error)
 
         return errors
 
-    def _detect_outliers(self, worksheet: Any, sheet_name: str) -> List[ExcelError]:
-        """이상치 감지 (숫자 열에 대해)"""
+    def _detect_outliers(
+        self, frame: pd.DataFrame, sheet_name: str
+    ) -> List[ExcelError]:
+        """이상치 감지 (숫자 열에 대해, np.percentile IQR)"""
         errors = []
 
-        # 각 열의 숫자 데이터 수집
-        column_numbers = defaultdict(list)
-
-        for col in worksheet.iter_cols():
-            col_idx = col[0].column
-
-            for cell in col[1:]:  # 헤더 제외
-                if isinstance(cell.value, (int, float)):
-                    column_numbers[col_idx].append(
-                        {"value": cell.value, "coord": cell.coordinate, "row": cell.row}
-                    )
-
-        # 각 열에서 이상치 찾기 (IQR 방법)
-        for col_idx, data in column_numbers.items():
-            if len(data) >= 4:  # 최소 4개 이상의 데이터가 있어야 의미 있음
-                values = [item["value"] for item in data]
-
-                # IQR 계산
-                q1 = statistics.quantiles(values, n=4)[0]
-                q3 = statistics.quantiles(values, n=4)[2]
-                iqr = q3 - q1
-
-                # 이상치 경계
-                lower_bound = q1 - 1.5 * iqr
-                upper_bound = q3 + 1.5 * iqr
-
-                for item in data:
-                    if item["value"] < lower_bound or item["value"] > upper_bound:
-                        error = ExcelError(
-                            id=f"{sheet_name}_{item['coord']}_outlier",
-                            type="Outlier",
-                            category="potential_issue",  # 잠재적 문제
-                            sheet=sheet_name,
-                            cell=item["coord"],
-                            formula=None,
-                            value=item["value"],
-                            message=f"이상치 감지: 값 {item['value']}이 정상 범위({lower_bound:.2f} ~ {upper_bound:.2f})를 벗어남",
-                            severity="low",
-                            is_auto_fixable=False,
-                            suggested_fix="이상치가 올바른 값인지 확인하세요",
-                            confidence=0.7,
-                        )
-                        errors.append(error)
+        # 헤더를 제외한 숫자 데이터 (bool도 int이므로 포함)
+        numeric = frame[(frame["row"] > 1) & frame["is_numeric"]]
+
+        for col, column in numeric.groupby("col", sort=True):
+            # 최소 4개 이상의 데이터가 있어야 의미 있음
+            if len(column) < 4:
+                continue
+
+            # IQR 계산 (weibull = statistics.quantiles의 exclusive 방식)
+            numbers = column["value"].to_numpy(dtype=float)
+            q1, q3 = np.percentile(numbers, [25, 75], method="weibull")
+            iqr = q3 - q1
+
+            # 이상치 경계
+            lower_bound = q1 - 1.5 * iqr
+            upper_bound = q3 + 1.5 * iqr
+
+            outliers = column[(numbers < lower_bound) | (numbers > upper_bound)]
+            letter = ExcelUtils.number_to_column(int(col))
+            for row, value in zip(outliers["row"].tolist(), outliers["value"].tolist()):
+                coord = f"{letter}{row}"
+                error = ExcelError(
+                    id=f"{sheet_name}_{coord}_outlier",
+                    type="Outlier",
+                    category="potential_issue",  # 잠재적 문제
+                    sheet=sheet_name,
+                    cell=coord,
+                    formula=None,
+                    value=value,
+                    message=f"이상치 감지: 값 {value}이 정상 범위({lower_bound:.2f} ~ {upper_bound:.2f})를 벗어남",
+                    severity="low",
+                    is_auto_fixable=False,
+                    suggested_fix="이상치가 올바른 값인지 확인하세요",
+                    confidence=0.7,
+                )
+                errors.append(error)
 
         return errors
-
-    def _detect_data_type(self, value: Any) -> str:
-        """데이터 타입 감지"""
-        if isinstance(value, bool):
-            return "boolean"
-        elif isinstance(value, (int, float)):
-            return "number"
-        elif isinstance(value, datetime):
-            return "date"
-        elif isinstance(value, str):
-            # 문자열 패턴 분석
-            if self.patterns["email"].match(value):
-                return "email"
-            elif self.patterns["phone"].match(value):
-                return "phone"
-            elif self.patterns["date"].match(value):
-                return "date"
-            elif self.patterns["number"].match(value):
-                return "number"
-            elif self.patterns["percentage"].match(value):
-                return "percentage"
-            elif self.patterns["currency"].match(value):
-                return "currency"
-            else:
-                return "text"
-        else:
-            return "unknown"
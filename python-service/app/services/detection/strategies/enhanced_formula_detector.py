@@ -4,19 +4,30 @@ Detects potential formula errors before Excel evaluation
 """
 
 import re
-from typing import List, Set
+import weakref
+from typing import Any, List, Set
 from app.core.interfaces import ExcelError, ExcelErrorType
 from app.services.detection.strategies.formula_error_detector import (
     FormulaErrorDetector,
 )
+from app.services.detection.dependency_graph import DependencyGraph
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Dependency graph per workbook object, so per-cell checks on an openpyxl
+# workbook do not rescan every sheet (cell indexes cache their own graph)
+_workbook_graphs: "weakref.WeakKeyDictionary[Any, DependencyGraph]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class EnhancedFormulaDetector(FormulaErrorDetector):
     """Enhanced formula detector that can detect potential errors"""
 
+    # Circular reference checks need the workbook-wide dependency graph
+    USES_DEPENDENCY_GRAPH = True
+
     def __init__(self):
         super().__init__()
         # Additional patterns for detecting potential errors
@@ -28,9 +39,6 @@ class EnhancedFormulaDetector(FormulaErrorDetector):
             "vlookup": re.compile(
                 r"VLOOKUP\s*\(", re.IGNORECASE
             ),  # VLOOKUP that might fail
-            "circular_ref": re.compile(
-                r"([A-Z]+\d+)"
-            ),  # Cell references for circular check
         }
 
     async def check_cell_formula(self, cell, sheet_name: str) -> List[ExcelError]:
@@ -159,31 +167,25 @@ class EnhancedFormulaDetector(FormulaErrorDetector):
         return "VLOOKUP" in formula.upper()
 
     def _check_circular_reference(self, cell, sheet_name: str) -> bool:
-        """Check for circular references"""
-        visited = set()
-
-        def has_circular(current_cell, target_coord):
-            if current_cell.coordinate in visited:
-                return current_cell.coordinate == target_coord
-
-            visited.add(current_cell.coordinate)
-
-            if current_cell.data_type == "f" and current_cell.value:
-                # Extract cell references from formula
-                refs = re.findall(r"([A-Z]+\d+)", str(current_cell.value))
-
-                worksheet = current_cell.parent
-                for ref in refs:
-                    try:
-                        ref_cell = worksheet[ref]
-                        if ref == target_coord or has_circular(ref_cell, target_coord):
-                            return True
-                    except (KeyError, AttributeError, ValueError):
-                        pass
-
+        """Check whether the cell belongs to a cycle in the workbook dependency graph"""
+        try:
+            graph = self._workbook_graph(cell.parent.parent)
+        except AttributeError:
             return False
-
-        return has_circular(cell, cell.coordinate)
+        return graph.is_in_cycle(sheet_name, cell.row, cell.column)
+
+    @staticmethod
+    def _workbook_graph(workbook) -> DependencyGraph:
+        """Dependency graph of the workbook, built once per workbook object"""
+        try:
+            graph = _workbook_graphs.get(workbook)
+        except TypeError:
+            # Not weak-referenceable - build without caching
+            return DependencyGraph.for_workbook(workbook)
+        if graph is None:
+            graph = DependencyGraph.for_workbook(workbook)
+            _workbook_graphs[workbook] = graph
+        return graph
 
     def _check_potential_value_error(self, formula: str, worksheet) -> bool:
         """Check for potential #VALUE! errors"""
@@ -6,6 +6,7 @@ Formula Error Detection Strategy
 import re
 from typing import List, Optional, Any
 from app.core.interfaces import IErrorDetector, ExcelError, ExcelErrorType
+from app.services.detection.cell_index import WorkbookCellIndex
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,6 +15,11 @@ logger = logging.getLogger(__name__)
 class FormulaErrorDetector(IErrorDetector):
     """수식 오류 감지 전략"""
 
+    # 셀 단위 검사이므로 스트리밍 모드에서 행 청크마다 실행 가능
+    STREAMING_SCOPE = "chunk"
+
+    CPU_BOUND = True
+
     def __init__(self):
         self.error_patterns = {
             ExcelErrorType.DIV_ZERO: re.compile(r"#DIV/0!"),
@@ -37,44 +43,44 @@ class FormulaErrorDetector(IErrorDetector):
         """워크북에서 수식 오류 감지"""
         errors = []
         detected_cells = set()  # Track already detected errors
-
-        for sheet in workbook.worksheets:
-            for row in sheet.iter_rows():
-                for cell in row:
-                    cell_key = f"{sheet.title}_{cell.coordinate}"
-
-                    # 1. 먼저 실제 셀 값을 확인 (최우선 순위)
-                    if cell.value is not None:
-                        value_str = str(cell.value).strip()
-                        # Excel 오류 값 직접 체크
-                        error_mapping = {
-                            "#DIV/0!": ExcelErrorType.DIV_ZERO,
-                            "#N/A": ExcelErrorType.NA,
-                            "#NAME?": ExcelErrorType.NAME,
-                            "#NULL!": ExcelErrorType.NULL,
-                            "#NUM!": ExcelErrorType.NUM,
-                            "#REF!": ExcelErrorType.REF,
-                            "#VALUE!": ExcelErrorType.VALUE,
-                            "#SPILL!": ExcelErrorType.SPILL,
-                            "#CALC!": ExcelErrorType.CALC,
-                        }
-
-                        if value_str in error_mapping:
-                            error = self._create_error_from_value(cell, sheet.title)
-                            if error:
-                                errors.append(error)
-                                detected_cells.add(cell_key)
-                                # Skip formula check if value error is found
-                                continue
-
-                    # 2. 수식이 있고 아직 오류로 감지되지 않은 경우에만 추가 검사
-                    if (
-                        hasattr(cell, "data_type")
-                        and cell.data_type == "f"
-                        and cell_key not in detected_cells
-                    ):
-                        cell_errors = await self.check_cell_formula(cell, sheet.title)
-                        errors.extend(cell_errors)
+        cell_index = WorkbookCellIndex.ensure(workbook)
+
+        for sheet in cell_index.worksheets:
+            for cell in sheet.iter_cells():
+                cell_key = f"{sheet.title}_{cell.coordinate}"
+
+                # 1. 먼저 실제 셀 값을 확인 (최우선 순위)
+                if cell.value is not None:
+                    value_str = str(cell.value).strip()
+                    # Excel 오류 값 직접 체크
+                    error_mapping = {
+                        "#DIV/0!": ExcelErrorType.DIV_ZERO,
+                        "#N/A": ExcelErrorType.NA,
+                        "#NAME?": ExcelErrorType.NAME,
+                        "#NULL!": ExcelErrorType.NULL,
+                        "#NUM!": ExcelErrorType.NUM,
+                        "#REF!": ExcelErrorType.REF,
+                        "#VALUE!": ExcelErrorType.VALUE,
+                        "#SPILL!": ExcelErrorType.SPILL,
+                        "#CALC!": ExcelErrorType.CALC,
+                    }
+
+                    if value_str in error_mapping:
+                        error = self._create_error_from_value(cell, sheet.title)
+                        if error:
+                            errors.append(error)
+                            detected_cells.add(cell_key)
+                            # Skip formula check if value error is found
+                            continue
+
+                # 2. 수식이 있고 아직 오류로 감지되지 않은 경우에만 추가 검사
+                if (
+                    hasattr(cell, "data_type")
+                    and cell.data_type == "f"
+                    and cell_key not in detected_cells
+                ):
+                    cell_errors = await self.check_cell_formula(cell, sheet.title)
+                    errors.extend(cell_errors)
 
         return errors
 
@@ -5,8 +5,9 @@ Structure Error Detector
 
 from typing import List, Dict, Any, Set
 from app.core.interfaces import IErrorDetector, ExcelError, ExcelErrorType
+from app.services.detection.cell_index import WorkbookCellIndex, SheetCellIndex
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +15,8 @@ logger = logging.getLogger(__name__)
 class StructureDetector(IErrorDetector):
     """구조적 오류 감지기"""
 
+    CPU_BOUND = True
+
     def __init__(self):
         self.min_table_width = 2  # 테이블로 간주할 최소 열 수
         self.min_table_height = 3  # 테이블로 간주할 최소 행 수
@@ -22,9 +25,10 @@ class StructureDetector(IErrorDetector):
     async def detect(self, workbook: Any) -> List[ExcelError]:
         """워크북에서 구조적 오류 감지"""
         errors = []
+        cell_index = WorkbookCellIndex.ensure(workbook)
 
-        for sheet_name in workbook.sheetnames:
-            worksheet = workbook[sheet_name]
+        for sheet_name in cell_index.sheetnames:
+            worksheet = cell_index[sheet_name]
             sheet_errors = await self._detect_sheet_errors(worksheet, sheet_name)
             errors.extend(sheet_errors)
 
@@ -42,7 +46,7 @@ class StructureDetector(IErrorDetector):
         ]
 
     async def _detect_sheet_errors(
-        self, worksheet: Any, sheet_name: str
+        self, worksheet: SheetCellIndex, sheet_name: str
     ) -> List[ExcelError]:
         """시트별 구조적 오류 감지"""
         errors = []
@@ -69,126 +73,103 @@ class StructureDetector(IErrorDetector):
 
         return errors
 
-    def _detect_merged_cells(self, worksheet: Any, sheet_name: str) -> List[ExcelError]:
+    def _detect_merged_cells(
+        self, worksheet: SheetCellIndex, sheet_name: str
+    ) -> List[ExcelError]:
         """병합된 셀 감지"""
         errors = []
 
-        # openpyxl의 merged_cells 속성 사용
-        if hasattr(worksheet, "merged_cells"):
-            for merged_range in worksheet.merged_cells.ranges:
-                # 병합 범위의 첫 번째 셀
-                min_row, min_col = merged_range.min_row, merged_range.min_col
-                max_row, max_col = merged_range.max_row, merged_range.max_col
-
-                # 병합 범위가 데이터 테이블 내에 있는지 확인
-                if self._is_in_data_table(worksheet, min_row, min_col):
-                    top_left_cell = worksheet.cell(row=min_row, column=min_col)
+        for min_row, min_col, max_row, max_col, range_ref in worksheet.merged_ranges:
+            # 병합 범위가 데이터 테이블 내에 있는지 확인
+            if self._is_in_data_table(worksheet, min_row, min_col):
+                top_left_coord = f"{self._get_column_letter(min_col)}{min_row}"
 
-                    error = ExcelError(
-                        id=f"{sheet_name}_{top_left_cell.coordinate}_merged",
-                        type=ExcelErrorType.MERGED_CELLS.value,
-                        category="potential_issue",  # 잠재적 문제
-                        sheet=sheet_name,
-                        cell=str(merged_range),
-                        formula=None,
-                        value=top_left_cell.value,
-                        message=f"병합된 셀 감지: {merged_range}",
-                        severity=(
-                            "medium"
-                            if (max_row - min_row > 1 or max_col - min_col > 1)
-                            else "low"
-                        ),
-                        is_auto_fixable=True,
-                        suggested_fix="데이터 분석을 위해 병합된 셀을 분리하는 것을 권장합니다",
-                        confidence=1.0,
-                    )
-                    errors.append(error)
+                error = ExcelError(
+                    id=f"{sheet_name}_{top_left_coord}_merged",
+                    type=ExcelErrorType.MERGED_CELLS.value,
+                    category="potential_issue",  # 잠재적 문제
+                    sheet=sheet_name,
+                    cell=range_ref,
+                    formula=None,
+                    value=worksheet.value(min_row, min_col),
+                    message=f"병합된 셀 감지: {range_ref}",
+                    severity=(
+                        "medium"
+                        if (max_row - min_row > 1 or max_col - min_col > 1)
+                        else "low"
+                    ),
+                    is_auto_fixable=True,
+                    suggested_fix="데이터 분석을 위해 병합된 셀을 분리하는 것을 권장합니다",
+                    confidence=1.0,
+                )
+                errors.append(error)
 
         return errors
 
     def _detect_empty_rows_cols(
-        self, worksheet: Any, sheet_name: str
+        self, worksheet: SheetCellIndex, sheet_name: str
     ) -> List[ExcelError]:
         """빈 행과 열 감지"""
         errors = []
 
-        # 빈 행 감지
-        consecutive_empty = 0
-        last_data_row = 0
-
-        for row_idx in range(1, worksheet.max_row + 1):
-            row_empty = all(
-                cell.value is None or str(cell.value).strip() == ""
-                for cell in worksheet[row_idx]
+        # 빈 행 감지 - 데이터가 있는 행 사이의 간격만 확인
+        data_rows = [
+            row_idx
+            for row_idx in worksheet.populated_rows
+            if any(
+                str(value).strip() != ""
+                for value in worksheet.row_values(row_idx).values()
             )
+        ]
 
-            if row_empty:
-                consecutive_empty += 1
-            else:
-                if consecutive_empty > self.max_empty_rows and last_data_row > 0:
-                    # 데이터 사이의 빈 행들
-                    error = ExcelError(
-                        id=f"{sheet_name}_row{last_data_row+1}_empty_rows",
-                        type=ExcelErrorType.EMPTY_ROWS.value,
-                        category="potential_issue",  # 잠재적 문제
-                        sheet=sheet_name,
-                        cell=f"A{last_data_row+1}:A{row_idx-1}",
-                        formula=None,
-                        value=None,
-                        message=f"{consecutive_empty}개의 연속된 빈 행 발견",
-                        severity="low",
-                        is_auto_fixable=True,
-                        suggested_fix="불필요한 빈 행을 제거하여 데이터 연속성을 개선하세요",
-                        confidence=0.9,
-                    )
-                    errors.append(error)
-
-                consecutive_empty = 0
-                last_data_row = row_idx
+        for last_data_row, row_idx in zip(data_rows, data_rows[1:]):
+            consecutive_empty = row_idx - last_data_row - 1
+            if consecutive_empty > self.max_empty_rows:
+                # 데이터 사이의 빈 행들
+                error = ExcelError(
+                    id=f"{sheet_name}_row{last_data_row+1}_empty_rows",
+                    type=ExcelErrorType.EMPTY_ROWS.value,
+                    category="potential_issue",  # 잠재적 문제
+                    sheet=sheet_name,
+                    cell=f"A{last_data_row+1}:A{row_idx-1}",
+                    formula=None,
+                    value=None,
+                    message=f"{consecutive_empty}개의 연속된 빈 행 발견",
+                    severity="low",
+                    is_auto_fixable=True,
+                    suggested_fix="불필요한 빈 행을 제거하여 데이터 연속성을 개선하세요",
+                    confidence=0.9,
+                )
+                errors.append(error)
 
         # 빈 열 감지 (더 엄격한 기준 적용)
         # 실제로 데이터가 있는 영역 찾기
         data_start_col = 1
         data_end_col = worksheet.max_column
+        scan_last_row = min(worksheet.max_row, 99)  # 처음 99행만 확인
+        neighbour_last_row = min(worksheet.max_row, 19)
 
         # 실제 데이터가 있는 마지막 열 찾기
         for col_idx in range(worksheet.max_column, 0, -1):
-            has_data = any(
-                worksheet.cell(row=row, column=col_idx).value is not None
-                for row in range(1, min(worksheet.max_row + 1, 100))
-            )
-            if has_data:
+            if self._column_has_data(worksheet, col_idx, scan_last_row):
                 data_end_col = col_idx
                 break
 
         # 데이터 영역 내에서만 빈 열 검사
         for col_idx in range(data_start_col, data_end_col):
-            col_empty = all(
-                worksheet.cell(row=row, column=col_idx).value is None
-                for row in range(
-                    1, min(worksheet.max_row + 1, 100)
-                )  # 처음 100행만 확인
-            )
+            col_empty = not self._column_has_data(worksheet, col_idx, scan_last_row)
 
             # 데이터가 있는 열들 사이의 빈 열만 오류로 표시
             if col_empty:
                 # 앞뒤에 데이터가 있는지 확인
-                has_data_before = (
-                    any(
-                        worksheet.cell(row=row, column=col_idx - 1).value is not None
-                        for row in range(1, min(worksheet.max_row + 1, 20))
-                    )
-                    if col_idx > 1
-                    else False
+                has_data_before = col_idx > 1 and self._column_has_data(
+                    worksheet, col_idx - 1, neighbour_last_row
                 )
-
                 has_data_after = (
-                    any(
-                        worksheet.cell(row=row, column=col_idx + 1).value is not None
-                        for row in range(1, min(worksheet.max_row + 1, 20))
+                    col_idx < worksheet.max_column
+                    and self._column_has_data(
+                        worksheet, col_idx + 1, neighbour_last_row
                     )
-                    if col_idx < worksheet.max_column
-                    else False
                 )
 
                 # 양쪽에 데이터가 있는 경우에만 오류로 표시
@@ -213,7 +194,7 @@ class StructureDetector(IErrorDetector):
         return errors
 
     def _detect_table_structure_issues(
-        self, worksheet: Any, sheet_name: str
+        self, worksheet: SheetCellIndex, sheet_name: str
     ) -> List[ExcelError]:
         """테이블 구조 문제 감지"""
         errors = []
@@ -227,8 +208,7 @@ class StructureDetector(IErrorDetector):
             headers = []
 
             for col in range(table["start_col"], table["end_col"] + 1):
-                header_cell = worksheet.cell(row=header_row, column=col)
-                headers.append(header_cell.value)
+                headers.append(worksheet.value(header_row, col))
 
             # 빈 헤더 검사 (테이블 크기가 큰 경우에만)
             empty_headers = [
@@ -282,62 +262,54 @@ class StructureDetector(IErrorDetector):
 
         return errors
 
-    def _detect_hidden_data(self, worksheet: Any, sheet_name: str) -> List[ExcelError]:
+    def _detect_hidden_data(
+        self, worksheet: SheetCellIndex, sheet_name: str
+    ) -> List[ExcelError]:
         """숨겨진 행/열 감지"""
         errors = []
 
         # 숨겨진 행 검사
-        if hasattr(worksheet, "row_dimensions"):
-            hidden_rows = []
-            for row_idx, row_dim in worksheet.row_dimensions.items():
-                if hasattr(row_dim, "hidden") and row_dim.hidden:
-                    hidden_rows.append(row_idx)
-
-            if hidden_rows:
-                error = ExcelError(
-                    id=f"{sheet_name}_hidden_rows",
-                    type="Hidden Data",
-                    category="potential_issue",  # 잠재적 문제
-                    sheet=sheet_name,
-                    cell=f"A{hidden_rows[0]}",
-                    formula=None,
-                    value=None,
-                    message=f"{len(hidden_rows)}개의 숨겨진 행이 있습니다",
-                    severity="medium",
-                    is_auto_fixable=True,
-                    suggested_fix="숨겨진 행을 표시하거나 삭제하세요",
-                    confidence=1.0,
-                )
-                errors.append(error)
+        hidden_rows = worksheet.hidden_rows
+        if hidden_rows:
+            error = ExcelError(
+                id=f"{sheet_name}_hidden_rows",
+                type="Hidden Data",
+                category="potential_issue",  # 잠재적 문제
+                sheet=sheet_name,
+                cell=f"A{hidden_rows[0]}",
+                formula=None,
+                value=None,
+                message=f"{len(hidden_rows)}개의 숨겨진 행이 있습니다",
+                severity="medium",
+                is_auto_fixable=True,
+                suggested_fix="숨겨진 행을 표시하거나 삭제하세요",
+                confidence=1.0,
+            )
+            errors.append(error)
 
         # 숨겨진 열 검사
-        if hasattr(worksheet, "column_dimensions"):
-            hidden_cols = []
-            for col_letter, col_dim in worksheet.column_dimensions.items():
-                if hasattr(col_dim, "hidden") and col_dim.hidden:
-                    hidden_cols.append(col_letter)
-
-            if hidden_cols:
-                error = ExcelError(
-                    id=f"{sheet_name}_hidden_cols",
-                    type="Hidden Data",
-                    category="potential_issue",  # 잠재적 문제
-                    sheet=sheet_name,
-                    cell=f"{hidden_cols[0]}1",
-                    formula=None,
-                    value=None,
-                    message=f"{len(hidden_cols)}개의 숨겨진 열이 있습니다",
-                    severity="medium",
-                    is_auto_fixable=True,
-                    suggested_fix="숨겨진 열을 표시하거나 삭제하세요",
-                    confidence=1.0,
-                )
-                errors.append(error)
+        hidden_cols = worksheet.hidden_columns
+        if hidden_cols:
+            error = ExcelError(
+                id=f"{sheet_name}_hidden_cols",
+                type="Hidden Data",
+                category="potential_issue",  # 잠재적 문제
+                sheet=sheet_name,
+                cell=f"{hidden_cols[0]}1",
+                formula=None,
+                value=None,
+                message=f"{len(hidden_cols)}개의 숨겨진 열이 있습니다",
+                severity="medium",
+                is_auto_fixable=True,
+                suggested_fix="숨겨진 열을 표시하거나 삭제하세요",
+                confidence=1.0,
+            )
+            errors.append(error)
 
         return errors
 
     def _detect_inconsistent_formats(
-        self, worksheet: Any, sheet_name: str
+        self, worksheet: SheetCellIndex, sheet_name: str
     ) -> List[ExcelError]:
         """일관성 없는 형식 감지"""
         errors = []
@@ -345,19 +317,15 @@ class StructureDetector(IErrorDetector):
         # 각 열의 형식 패턴 분석
         column_formats = defaultdict(lambda: defaultdict(int))
 
-        for col_idx in range(1, min(worksheet.max_column + 1, 50)):  # 최대 50열까지
-            for row_idx in range(
-                2, min(worksheet.max_row + 1, 100)
-            ):  # 헤더 제외, 최대 100행
-                cell = worksheet.cell(row=row_idx, column=col_idx)
-                if cell.value is not None:
+        for col_idx in worksheet.populated_columns:
+            if col_idx >= 50:  # 최대 49열까지
+                break
+            for cell in worksheet.iter_column(col_idx):
+                if cell.row >= 100:  # 헤더 제외, 최대 99행
+                    break
+                if cell.row >= 2:
                     # 숫자 형식 추출
-                    format_code = (
-                        cell.number_format
-                        if hasattr(cell, "number_format")
-                        else "General"
-                    )
-                    column_formats[col_idx][format_code] += 1
+                    column_formats[col_idx][cell.number_format] += 1
 
         # 일관성 없는 형식 찾기
         for col_idx, formats in column_formats.items():
@@ -388,7 +356,14 @@ class StructureDetector(IErrorDetector):
         return errors
 
     # Helper methods
-    def _is_in_data_table(self, worksheet: Any, row: int, col: int) -> bool:
+    def _column_has_data(
+        self, worksheet: SheetCellIndex, col_idx: int, last_row: int
+    ) -> bool:
+        """열의 1 ~ last_row 행에 값이 있는지 확인"""
+        first_row = worksheet.first_row_in_column(col_idx)
+        return first_row is not None and first_row <= last_row
+
+    def _is_in_data_table(self, worksheet: SheetCellIndex, row: int, col: int) -> bool:
         """주어진 위치가 데이터 테이블 내에 있는지 확인"""
         # 간단한 휴리스틱: 주변에 데이터가 있는지 확인
         nearby_data = 0
@@ -396,77 +371,69 @@ class StructureDetector(IErrorDetector):
             for dc in [-1, 0, 1]:
                 if dr == 0 and dc == 0:
                     continue
-                try:
-                    cell = worksheet.cell(row=row + dr, column=col + dc)
-                    if cell.value is not None:
-                        nearby_data += 1
-                except Exception:
-                    pass
+                if worksheet.has_value(row + dr, col + dc):
+                    nearby_data += 1
 
         return nearby_data >= 3
 
-    def _find_tables(self, worksheet: Any) -> List[Dict[str, Any]]:
+    def _find_tables(self, worksheet: SheetCellIndex) -> List[Dict[str, Any]]:
         """워크시트에서 테이블 영역 찾기"""
         tables = []
         visited = set()
         table_id = 0
 
-        for row in range(1, min(worksheet.max_row + 1, 1000)):
-            for col in range(1, min(worksheet.max_column + 1, 100)):
-                if (row, col) not in visited:
-                    # 데이터가 있는 셀에서 시작
-                    cell = worksheet.cell(row=row, column=col)
-                    if cell.value is not None:
-                        # 연결된 데이터 영역 찾기
-                        table = self._find_connected_region(
-                            worksheet, row, col, visited
-                        )
-
-                        # 최소 크기 이상인 경우만 테이블로 간주
-                        if (
-                            table["end_row"] - table["start_row"]
-                            >= self.min_table_height - 1
-                            and table["end_col"] - table["start_col"]
-                            >= self.min_table_width - 1
-                        ):
-                            table["id"] = table_id
-                            tables.append(table)
-                            table_id += 1
+        # 데이터가 있는 셀에서만 시작 (행 우선 순서)
+        for cell in worksheet.iter_cells():
+            row, col = cell.row, cell.column
+            if row >= 1000 or col >= 100 or (row, col) in visited:
+                continue
+
+            # 연결된 데이터 영역 찾기
+            table = self._find_connected_region(worksheet, row, col, visited)
+
+            # 최소 크기 이상인 경우만 테이블로 간주
+            if (
+                table["end_row"] - table["start_row"] >= self.min_table_height - 1
+                and table["end_col"] - table["start_col"] >= self.min_table_width - 1
+            ):
+                table["id"] = table_id
+                tables.append(table)
+                table_id += 1
 
         return tables
 
     def _find_connected_region(
-        self, worksheet: Any, start_row: int, start_col: int, visited: Set[tuple]
+        self,
+        worksheet: SheetCellIndex,
+        start_row: int,
+        start_col: int,
+        visited: Set[tuple],
     ) -> Dict[str, Any]:
         """연결된 데이터 영역 찾기"""
         min_row, max_row = start_row, start_row
         min_col, max_col = start_col, start_col
 
         # BFS로 연결된 영역 탐색
-        queue = [(start_row, start_col)]
+        queue = deque([(start_row, start_col)])
         visited.add((start_row, start_col))
 
         while queue:
-            row, col = queue.pop(0)
+            row, col = queue.popleft()
 
             # 인접한 셀 확인
             for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
                 new_row, new_col = row + dr, col + dc
 
-                if (new_row, new_col) not in visited:
-                    if (
-                        1 <= new_row <= worksheet.max_row
-                        and 1 <= new_col <= worksheet.max_column
-                    ):
-                        cell = worksheet.cell(row=new_row, column=new_col)
-                        if cell.value is not None:
-                            visited.add((new_row, new_col))
-                            queue.append((new_row, new_col))
-
-                            min_row = min(min_row, new_row)
-                            max_row = max(max_row, new_row)
-                            min_col = min(min_col, new_col)
-                            max_col = max(max_col, new_col)
+                if (new_row, new_col) not in visited and worksheet.has_value(
+                    new_row, new_col
+                ):
+                    visited.add((new_row, new_col))
+                    queue.append((new_row, new_col))
+
+                    min_row = min(min_row, new_row)
+                    max_row = max(max_row, new_row)
+                    min_col = min(min_col, new_col)
+                    max_col = max(max_col, new_col)
 
         return {
             "start_row": min_row,
@@ -7,6 +7,7 @@ from typing import List, Dict, Any
 from app.core.interfaces import ExcelError
 from app.core.base_detector import BaseErrorDetector
 from app.core.cacheable_mixin import CacheableMixin
+from app.services.detection.cell_index import WorkbookCellIndex
 from app.services.advanced_vba_analyzer import AdvancedVBAAnalyzer
 import re
 import logging
@@ -24,6 +25,9 @@ except ImportError:
 class VBAErrorDetector(BaseErrorDetector, CacheableMixin):
     """VBA 코드 오류 감지기 - AdvancedVBAAnalyzer 기능 통합"""
 
+    # 셀과 무관하게 파일 경로로 한 번만 실행 (스트리밍 모드)
+    STREAMING_SCOPE = "file"
+
     def __init__(self):
         super().__init__()
 
@@ -93,6 +97,10 @@ class VBAErrorDetector(BaseErrorDetector, CacheableMixin):
         """워크북에서 VBA 오류 감지 - AdvancedVBAAnalyzer 통합"""
         errors = []
 
+        # 공유 셀 인덱스가 전달된 경우 원본 워크북 사용 (VBA는 셀 스캔 불필요)
+        if isinstance(workbook, WorkbookCellIndex):
+            workbook = workbook.workbook
+
         # workbook이 파일 경로인 경우와 객체인 경우 처리
         file_path = None
         if isinstance(workbook, str):
@@ -0,0 +1,384 @@
+"""
+Streaming Error Detector
+대용량 워크북을 메모리에 올리지 않고 행 청크 단위로 오류를 감지하는 스트리밍 엔진
+"""
+
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from app.core.config import settings
+from app.core.interfaces import IErrorDetector, IProgressReporter, ExcelError
+from app.core.types import SheetSummary
+from app.services.detection.cell_index import (
+    SUMMARY_TYPES,
+    SheetCellIndex,
+    WorkbookCellIndex,
+)
+from app.services.xlsx_stream_reader import SheetStream, StreamingXlsxReader
+from openpyxl.utils.cell import range_boundaries
+from datetime import datetime
+import asyncio
+import os
+import zipfile
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 워크시트 XML을 직접 파싱할 수 있는 형식
+STREAMABLE_EXTENSIONS = (".xlsx", ".xlsm")
+
+
+class StreamingErrorDetector:
+    """스트리밍 오류 감지기
+
+    워크시트 XML을 한 번 스트리밍 파싱하면서 ``chunk_rows`` 행마다 작은 셀 인덱스를
+    만들어 감지기를 실행합니다. 메모리는 공유 문자열 테이블과 현재 청크 크기로 제한되며,
+    청크마다 감지된 오류를 콜백과 진행 상황 보고기로 즉시 전달합니다.
+
+    감지기의 ``STREAMING_SCOPE`` 속성으로 실행 방식을 결정합니다.
+    - ``"chunk"``: 행 청크마다 실행 (셀 단위 검사)
+    - ``"file"``: 파일 경로로 한 번만 실행 (VBA 등)
+    - 그 외: 시트 전체가 필요하므로 스트리밍 모드에서는 건너뜀
+    """
+
+    def __init__(
+        self,
+        detectors: List[IErrorDetector],
+        progress_reporter: Optional[IProgressReporter] = None,
+        chunk_rows: Optional[int] = None,
+    ):
+        self.detectors = detectors
+        self.progress_reporter = progress_reporter
+        self.chunk_rows = max(1, chunk_rows or settings.STREAMING_DETECTION_CHUNK_ROWS)
+        self.max_errors_per_sheet = settings.EXCEL_MAX_ERRORS_PER_SHEET
+
+    @staticmethod
+    def can_stream(file_path: str) -> bool:
+        """워크시트 XML을 직접 스트리밍할 수 있는 파일인지 확인"""
+        if os.path.splitext(str(file_path))[1].lower() not in STREAMABLE_EXTENSIONS:
+            return False
+        return os.path.isfile(file_path) and zipfile.is_zipfile(file_path)
+
+    @classmethod
+    def should_stream(cls, file_path: str) -> bool:
+        """파일 크기 또는 추정 셀 수가 임계값을 넘으면 스트리밍 모드 사용"""
+        if not cls.can_stream(file_path):
+            return False
+
+        try:
+            file_size = os.path.getsize(file_path)
+        except OSError:
+            return False
+
+        if file_size >= settings.STREAMING_DETECTION_FILE_SIZE_THRESHOLD:
+            return True
+
+        try:
+            with StreamingXlsxReader(file_path) as reader:
+                estimated_cells = reader.estimate_cell_count()
+        except Exception as e:
+            logger.debug(f"셀 수 추정 실패, 일반 모드 사용: {str(e)}")
+            return False
+
+        return estimated_cells >= settings.STREAMING_DETECTION_CELL_THRESHOLD
+
+    async def detect(
+        self,
+        file_path: str,
+        callback: Optional[Callable[[Dict[str, Any]], Awaitable[Any]]] = None,
+    ) -> Dict[str, Any]:
+        """파일을 스트리밍하며 오류 감지
+
+        Returns:
+            errors, sheets(시트 요약), skipped_detectors, total_cells 를 담은 딕셔너리
+        """
+        chunk_detectors = self._detectors_with_scope("chunk")
+        file_detectors = self._detectors_with_scope("file")
+        skipped_detectors = [
+            type(d).__name__
+            for d in self.detectors
+            if d not in chunk_detectors and d not in file_detectors
+        ]
+        if skipped_detectors:
+            logger.info(
+                f"스트리밍 모드에서 시트 전체가 필요한 감지기 제외: {skipped_detectors}"
+            )
+
+        errors: List[ExcelError] = []
+        sheet_summaries: Dict[str, SheetSummary] = {}
+
+        # VBA 등 파일 단위 감지기는 셀 스캔 없이 한 번만 실행
+        for detector in file_detectors:
+            try:
+                errors.extend(await detector.detect(str(file_path)))
+            except Exception as e:
+                logger.error(f"감지기 {type(detector).__name__} 실행 실패: {str(e)}")
+
+        with StreamingXlsxReader(file_path) as reader:
+            total_sheets = len(reader.sheetnames)
+
+            for sheet_index, sheet_name in enumerate(reader.sheetnames):
+                stream = reader.open_sheet(sheet_name)
+                sheet_errors, summary = await self._detect_sheet(
+                    reader.sheetnames,
+                    stream,
+                    chunk_detectors,
+                    sheet_index,
+                    total_sheets,
+                    callback,
+                )
+                errors.extend(sheet_errors)
+                sheet_summaries[sheet_name] = summary
+
+        return {
+            "errors": errors,
+            "sheets": sheet_summaries,
+            "skipped_detectors": skipped_detectors,
+            "total_cells": sum(s["non_empty_cells"] for s in sheet_summaries.values()),
+        }
+
+    async def detect_workbook(
+        self,
+        workbook: Any,
+        callback: Optional[Callable[[Dict[str, Any]], Awaitable[Any]]] = None,
+    ) -> Dict[str, Any]:
+        """이미 로드된 워크북을 시트 단위로 감지 (xls/csv 등 XML 스트리밍 불가 형식)
+
+        시트 하나의 인덱스만 유지하므로 시트 전체가 필요한 감지기도 모두 실행합니다.
+        """
+        errors: List[ExcelError] = []
+        sheet_summaries: Dict[str, SheetSummary] = {}
+        file_detectors = self._detectors_with_scope("file")
+        sheet_detectors = [d for d in self.detectors if d not in file_detectors]
+
+        for detector in file_detectors:
+            try:
+                errors.extend(await detector.detect(workbook))
+            except Exception as e:
+                logger.error(f"감지기 {type(detector).__name__} 실행 실패: {str(e)}")
+
+        sheetnames = list(workbook.sheetnames)
+        total_sheets = len(sheetnames)
+
+        for sheet_index, sheet_name in enumerate(sheetnames):
+            cell_index = WorkbookCellIndex.with_sheets(sheetnames)
+            sheet = cell_index.add_sheet(sheet_name, workbook[sheet_name])
+
+            sheet_errors: List[ExcelError] = []
+            for detector in sheet_detectors:
+                try:
+                    sheet_errors.extend(await detector.detect(cell_index))
+                except Exception as e:
+                    logger.warning(f"시트 {sheet_name} 감지 오류: {str(e)}")
+            sheet_errors = sheet_errors[: self.max_errors_per_sheet]
+
+            data_types: Dict[str, int] = dict(sheet.type_counts())
+            data_types["empty"] = max(sheet.max_row * sheet.max_column - len(sheet), 0)
+            sheet_summaries[sheet_name] = {
+                "name": sheet_name,
+                "rows": sheet.max_row,
+                "columns": sheet.max_column,
+                "non_empty_cells": len(sheet),
+                "formulas_count": data_types["formulas"],
+                "errors_count": len(sheet_errors),
+                "data_types": data_types,
+            }
+            errors.extend(sheet_errors)
+
+            await self._emit(
+                callback,
+                sheet_name,
+                int(((sheet_index + 1) / total_sheets) * 100),
+                sheet_errors,
+                sheet_index,
+                total_sheets,
+                sheet.max_row,
+            )
+
+        return {
+            "errors": errors,
+            "sheets": sheet_summaries,
+            "skipped_detectors": [],
+            "total_cells": sum(s["non_empty_cells"] for s in sheet_summaries.values()),
+        }
+
+    def _detectors_with_scope(self, scope: str) -> List[IErrorDetector]:
+        return [
+            d for d in self.detectors if getattr(d, "STREAMING_SCOPE", None) == scope
+        ]
+
+    async def _detect_sheet(
+        self,
+        sheetnames: List[str],
+        stream: SheetStream,
+        detectors: List[IErrorDetector],
+        sheet_index: int,
+        total_sheets: int,
+        callback: Optional[Callable[[Dict[str, Any]], Awaitable[Any]]],
+    ) -> tuple:
+        """시트 하나를 행 청크 단위로 감지"""
+        sheet_name = stream.name
+        sheet_errors: List[ExcelError] = []
+        type_totals: Counter = Counter()
+        non_empty_cells = 0
+        rows_processed = 0
+
+        chunk: Optional[SheetCellIndex] = None
+        chunk_row_count = 0
+
+        for row in stream.iter_rows():
+            if chunk is None:
+                chunk = WorkbookCellIndex.with_sheets(sheetnames)[sheet_name]
+
+            for cell in row:
+                chunk.add_cell(
+                    cell.row,
+                    cell.column,
+                    cell.formula_value,
+                    cell.data_type,
+                    is_date=isinstance(cell.value, datetime),
+                )
+            chunk_row_count += 1
+
+            if chunk_row_count >= self.chunk_rows:
+                rows_processed = row[0].row
+                non_empty_cells += len(chunk)
+                type_totals.update(chunk.type_counts())
+                await self._flush_chunk(
+                    chunk,
+                    detectors,
+                    sheet_errors,
+                    stream,
+                    sheet_index,
+                    total_sheets,
+                    rows_processed,
+                    callback,
+                )
+                chunk = None
+                chunk_row_count = 0
+
+        # 마지막 청크 - 시트마다 최소 한 번은 결과를 전달하도록 빈 시트도 처리
+        if chunk is not None or rows_processed == 0:
+            if chunk is None:
+                chunk = WorkbookCellIndex.with_sheets(sheetnames)[sheet_name]
+            non_empty_cells += len(chunk)
+            type_totals.update(chunk.type_counts())
+            rows_processed = stream.max_row
+            await self._flush_chunk(
+                chunk,
+                detectors,
+                sheet_errors,
+                stream,
+                sheet_index,
+                total_sheets,
+                rows_processed,
+                callback,
+            )
+
+        data_types: Dict[str, int] = {
+            name: type_totals.get(name, 0) for name in SUMMARY_TYPES
+        }
+        data_types["empty"] = max(
+            stream.max_row * stream.max_column - non_empty_cells, 0
+        )
+
+        summary: SheetSummary = {
+            "name": sheet_name,
+            "rows": stream.max_row,
+            "columns": stream.max_column,
+            "non_empty_cells": non_empty_cells,
+            "formulas_count": data_types["formulas"],
+            "errors_count": len(sheet_errors),
+            "data_types": data_types,
+        }
+        return sheet_errors, summary
+
+    async def _flush_chunk(
+        self,
+        chunk: SheetCellIndex,
+        detectors: List[IErrorDetector],
+        sheet_errors: List[ExcelError],
+        stream: SheetStream,
+        sheet_index: int,
+        total_sheets: int,
+        rows_processed: int,
+        callback: Optional[Callable[[Dict[str, Any]], Awaitable[Any]]],
+    ):
+        """청크에 감지기를 실행하고 중간 결과 전달"""
+        chunk.finalize()
+        sheet_name = stream.name
+        chunk_errors: List[ExcelError] = []
+
+        remaining = self.max_errors_per_sheet - len(sheet_errors)
+        if remaining > 0:
+            for detector in detectors:
+                try:
+                    chunk_errors.extend(await detector.detect(chunk.parent))
+                except Exception as e:
+                    logger.error(
+                        f"감지기 {type(detector).__name__} 실행 실패 "
+                        f"({sheet_name}): {str(e)}"
+                    )
+            chunk_errors = chunk_errors[:remaining]
+            sheet_errors.extend(chunk_errors)
+
+        progress = self._calculate_progress(
+            stream, sheet_index, total_sheets, rows_processed
+        )
+        await self._emit(
+            callback,
+            sheet_name,
+            progress,
+            chunk_errors,
+            sheet_index,
+            total_sheets,
+            rows_processed,
+        )
+
+    async def _emit(
+        self,
+        callback: Optional[Callable[[Dict[str, Any]], Awaitable[Any]]],
+        sheet_name: str,
+        progress: int,
+        errors: List[ExcelError],
+        sheet_index: int,
+        total_sheets: int,
+        rows_processed: int,
+    ):
+        """중간 결과를 콜백과 진행 상황 보고기로 전달"""
+        if callback:
+            await callback(
+                {
+                    "sheet": sheet_name,
+                    "progress": progress,
+                    "errors": errors,
+                    "sheet_index": sheet_index,
+                    "total_sheets": total_sheets,
+                    "rows_processed": rows_processed,
+                }
+            )
+
+        if self.progress_reporter:
+            await self.progress_reporter.report_progress(
+                progress, 100, f"{sheet_name}: {rows_processed}행 처리"
+            )
+            if errors and hasattr(self.progress_reporter, "report_partial_errors"):
+                await self.progress_reporter.report_partial_errors(sheet_name, errors)
+
+        # 다른 요청이 굶지 않도록 청크 사이에 이벤트 루프 양보
+        await asyncio.sleep(0)
+
+    @staticmethod
+    def _calculate_progress(
+        stream: SheetStream, sheet_index: int, total_sheets: int, rows_processed: int
+    ) -> int:
+        """시트 순서와 dimension 기준 행 진행률로 전체 진행률 계산"""
+        sheet_fraction = 1.0
+        if not stream.exhausted and stream.dimension:
+            try:
+                _, _, _, max_row = range_boundaries(stream.dimension)
+                if max_row:
+                    sheet_fraction = min(rows_processed / max_row, 1.0)
+            except (TypeError, ValueError):
+                pass
+
+        return int(((sheet_index + sheet_fraction) / max(total_sheets, 1)) * 100)
@@ -3,7 +3,18 @@ Embedding Services Package
 임베딩 서비스 패키지
 """
 
+from app.services.embedding.embedding_cache import (
+    CachedEmbeddingService,
+    EmbeddingCache,
+)
 from app.services.embedding.embedding_factory import EmbeddingServiceFactory
+from app.services.embedding.local_embedding import LocalEmbeddingService
 from app.services.embedding.vertex_ai_embedding import VertexAIEmbeddingService
 
-__all__ = ["EmbeddingServiceFactory", "VertexAIEmbeddingService"]
+__all__ = [
+    "CachedEmbeddingService",
+    "EmbeddingCache",
+    "EmbeddingServiceFactory",
+    "LocalEmbeddingService",
+    "VertexAIEmbeddingService",
+]
@@ -0,0 +1,218 @@
+"""
+Embedding Cache
+텍스트 내용 해시 기반 임베딩 캐시 (메모리 LRU + Redis L2)와
+캐시/동시 요청 병합을 덧씌우는 임베딩 서비스 데코레이터
+"""
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.embedding_interfaces.embedding_interface import (
+    IEmbeddingCache,
+    IEmbeddingService,
+)
+from app.core.redis_l2 import RedisL2Cache, redis_l2_cache
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache(IEmbeddingCache):
+    """
+    임베딩 캐시
+
+    키는 모델 이름 + 텍스트 SHA-256이므로 모델이 바뀌면 자연히 분리됨.
+    Redis에는 float64 바이트로 저장해 워커 간에 공유
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_entries: Optional[int] = None,
+        ttl: Optional[int] = None,
+        redis_cache: Optional[RedisL2Cache] = None,
+    ):
+        self.namespace = namespace
+        self.max_entries = max_entries or settings.EMBEDDING_CACHE_MAX_ENTRIES
+        self.ttl = ttl or settings.EMBEDDING_CACHE_TTL
+        self.redis_cache = redis_cache if redis_cache is not None else redis_l2_cache
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self.stats = {"memory_hits": 0, "redis_hits": 0, "misses": 0}
+
+    def key(self, text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"embedding:{self.namespace}:{digest}"
+
+    async def get_many(self, texts: List[str]) -> Dict[str, List[float]]:
+        """찾은 텍스트만 반환 (메모리 → Redis 순)"""
+        found = {}
+        remote = {}
+        for text in texts:
+            key = self.key(text)
+            embedding = self._memory.get(key)
+            if embedding is not None:
+                self._memory.move_to_end(key)
+                found[text] = list(embedding)
+                self.stats["memory_hits"] += 1
+            else:
+                remote[key] = text
+
+        if remote:
+            stored = await self.redis_cache.get_many(list(remote))
+            for key, data in stored.items():
+                embedding = np.frombuffer(data, dtype=np.float64).tolist()
+                self._remember(key, embedding)
+                found[remote[key]] = list(embedding)
+            self.stats["redis_hits"] += len(stored)
+            self.stats["misses"] += len(remote) - len(stored)
+        return found
+
+    async def set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        """메모리에 먼저 기록한 뒤 Redis에 파이프라인으로 저장"""
+        items = {}
+        for text, embedding in embeddings.items():
+            key = self.key(text)
+            self._remember(key, list(embedding))
+            items[key] = np.asarray(embedding, dtype=np.float64).tobytes()
+        if items:
+            await self.redis_cache.set_many(items, ttl=self.ttl)
+
+    async def get_cached_embedding(self, text: str) -> Optional[List[float]]:
+        return (await self.get_many([text])).get(text)
+
+    async def cache_embedding(self, text: str, embedding: List[float]) -> None:
+        await self.set_many({text: embedding})
+
+    async def clear_cache(self) -> None:
+        self._memory.clear()
+        await self.redis_cache.delete_pattern(f"embedding:{self.namespace}:")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "memory_entries": len(self._memory)}
+
+    def _remember(self, key: str, embedding: List[float]) -> None:
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+class CachedEmbeddingService(IEmbeddingService):
+    """
+    캐시 + 동시 요청 병합 임베딩 서비스 (데코레이터)
+
+    캐시에 없는 텍스트만 내부 서비스로 보내고, 같은 텍스트를 다른 요청이
+    이미 임베딩 중이면 그 결과를 기다림. 빈 텍스트는 서비스마다 처리가
+    달라 캐시하지 않음
+    """
+
+    def __init__(
+        self, service: IEmbeddingService, cache: Optional[EmbeddingCache] = None
+    ):
+        self.service = service
+        namespace = getattr(service, "model_name", type(service).__name__)
+        self.cache = cache or EmbeddingCache(namespace)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {"requested": 0, "computed": 0, "inflight_joins": 0}
+
+    def __getattr__(self, name: str) -> Any:
+        # get_usage_stats 등 내부 서비스 고유 기능은 그대로 노출
+        if name == "service":
+            raise AttributeError(name)
+        return getattr(self.service, name)
+
+    async def create_embedding(self, text: str) -> List[float]:
+        """단일 텍스트를 임베딩 벡터로 변환"""
+        if not text.strip():
+            return await self.service.create_embedding(text)
+        self.stats["requested"] += 1
+        embeddings = await self._resolve([text], self._compute_single)
+        return embeddings[0]
+
+    async def create_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """여러 텍스트를 배치로 임베딩 (중복 텍스트는 한 번만 계산)"""
+        if not texts:
+            return []
+        self.stats["requested"] += len(texts)
+        return await self._resolve(texts, self.service.create_embeddings)
+
+    def get_embedding_dimension(self) -> int:
+        return self.service.get_embedding_dimension()
+
+    def get_max_text_length(self) -> int:
+        return self.service.get_max_text_length()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        return {**self.stats, **self.cache.get_stats()}
+
+    async def _compute_single(self, texts: List[str]) -> List[List[float]]:
+        return [await self.service.create_embedding(texts[0])]
+
+    async def _resolve(
+        self,
+        texts: List[str],
+        compute: Callable[[List[str]], Awaitable[List[List[float]]]],
+    ) -> List[List[float]]:
+        cacheable = [text for text in dict.fromkeys(texts) if text.strip()]
+        found = await self.cache.get_many(cacheable)
+
+        owned, waiting = [], {}
+        loop = asyncio.get_running_loop()
+        for text in cacheable:
+            if text in found:
+                continue
+            key = self.cache.key(text)
+            future = self._inflight.get(key)
+            if future is not None:
+                waiting[text] = future
+                self.stats["inflight_joins"] += 1
+            else:
+                self._inflight[key] = loop.create_future()
+                owned.append(text)
+
+        blank = list(dict.fromkeys(text for text in texts if not text.strip()))
+        if owned or blank:
+            try:
+                computed = dict(zip(owned + blank, await compute(owned + blank)))
+            except BaseException as e:
+                self._fail_inflight(owned, e)
+                raise
+            self.stats["computed"] += len(owned) + len(blank)
+            for text in owned:
+                self._inflight.pop(self.cache.key(text)).set_result(computed[text])
+            found.update(computed)
+            await self.cache.set_many({text: computed[text] for text in owned})
+
+        retry = []
+        for text, future in waiting.items():
+            # 기다리던 요청이 취소돼도 공유 결과는 취소되지 않도록 shield
+            try:
+                found[text] = list(await asyncio.shield(future))
+            except asyncio.CancelledError:
+                # 계산을 맡은 요청만 취소된 경우 다시 시도, 호출자 취소는 전파
+                if not future.cancelled():
+                    raise
+                current = asyncio.current_task()
+                if current is not None and current.cancelling():
+                    raise
+                retry.append(text)
+        if retry:
+            found.update(zip(retry, await self._resolve(retry, compute)))
+        return [found[text] for text in texts]
+
+    def _fail_inflight(self, texts: List[str], error: BaseException) -> None:
+        for text in texts:
+            future = self._inflight.pop(self.cache.key(text), None)
+            if future is None or future.done():
+                continue
+            if isinstance(error, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(error)
+                # 기다리는 요청이 없어도 "never retrieved" 경고가 남지 않도록
+                future.exception()
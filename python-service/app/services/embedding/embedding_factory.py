@@ -7,6 +7,8 @@ import asyncio
 import logging
 from typing import Optional
 from app.core.embedding_interfaces.embedding_interface import IEmbeddingService
+from app.services.embedding.embedding_cache import CachedEmbeddingService
+from app.services.embedding.local_embedding import LocalEmbeddingService
 from app.services.embedding.vertex_ai_embedding import VertexAIEmbeddingService
 from app.core.config import settings
 
@@ -51,7 +53,20 @@ class EmbeddingServiceFactory:
     @classmethod
     def _create_service(cls) -> IEmbeddingService:
         """
-        설정에 따라 적절한 임베딩 서비스 생성
+        설정에 따라 임베딩 서비스를 만들고 캐시를 덧씌움
+
+        Returns:
+            IEmbeddingService: 생성된 임베딩 서비스
+        """
+        service = cls._create_model_service()
+        if settings.EMBEDDING_CACHE_ENABLED:
+            return CachedEmbeddingService(service)
+        return service
+
+    @classmethod
+    def _create_model_service(cls) -> IEmbeddingService:
+        """
+        설정에 따라 적절한 임베딩 모델 서비스 생성
 
         Returns:
             IEmbeddingService: 생성된 임베딩 서비스
@@ -66,6 +81,12 @@ class EmbeddingServiceFactory:
                     settings, "VERTEX_AI_EMBEDDING_MODEL", "text-embedding-004"
                 )
                 return VertexAIEmbeddingService(model_name=model_name)
+            elif service_type == "local":
+                logger.info("로컬 결정적 임베딩 모델을 사용합니다 (오프라인)")
+                return LocalEmbeddingService(
+                    dimension=settings.LOCAL_EMBEDDING_DIMENSION,
+                    latency=settings.LOCAL_EMBEDDING_LATENCY,
+                )
             else:
                 raise ValueError(f"지원하지 않는 임베딩 서비스 타입: {service_type}")
 
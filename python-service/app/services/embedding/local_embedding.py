@@ -0,0 +1,101 @@
+"""
+Local Embedding Service
+외부 API 없이 쓰는 결정적 임베딩 (단어/문자 3-gram 특성 해싱)
+
+의미 품질은 실제 모델보다 낮지만 같은 텍스트는 항상 같은 벡터가 나오고
+단어가 겹칠수록 코사인 유사도가 높아, 오프라인 개발/테스트와
+임베딩 파이프라인 벤치마크에 사용
+"""
+
+import asyncio
+import hashlib
+import re
+from typing import Any, Dict, List
+
+import numpy as np
+
+from app.core.embedding_interfaces.embedding_interface import (
+    IEmbeddingService,
+    IEmbeddingUsageTracker,
+)
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class LocalEmbeddingService(IEmbeddingService, IEmbeddingUsageTracker):
+    """로컬 결정적 임베딩 서비스"""
+
+    def __init__(self, dimension: int = 768, latency: float = 0.0):
+        """
+        Args:
+            dimension: 임베딩 차원
+            latency: 호출마다 더할 모의 지연 (초) - 원격 모델 호출 비용 재현용
+        """
+        self.model_name = f"local-hash-{dimension}"
+        self._embedding_dimension = dimension
+        self._max_text_length = 10000
+        self.latency = latency
+        self._calls = 0
+        self._chars = 0
+
+    async def create_embedding(self, text: str) -> List[float]:
+        """단일 텍스트를 임베딩 벡터로 변환"""
+        return (await self.create_embeddings([text]))[0]
+
+    async def create_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """여러 텍스트를 배치로 임베딩"""
+        if not texts:
+            return []
+        self._calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        embeddings = []
+        for text in texts:
+            self.track_usage(text)
+            embeddings.append(self._embed(text[: self._max_text_length]))
+        return embeddings
+
+    def get_embedding_dimension(self) -> int:
+        return self._embedding_dimension
+
+    def get_max_text_length(self) -> int:
+        return self._max_text_length
+
+    def track_usage(self, text: str) -> None:
+        self._chars += len(text)
+
+    def get_usage_stats(self) -> Dict[str, Any]:
+        return {
+            "service": "Local",
+            "model": self.model_name,
+            "calls": self._calls,
+            "characters": self._chars,
+        }
+
+    def _embed(self, text: str) -> List[float]:
+        """부호 있는 특성 해싱 후 L2 정규화"""
+        vector = np.zeros(self._embedding_dimension, dtype=np.float64)
+        features = []
+        for word in TOKEN_PATTERN.findall(text.lower()):
+            features.append(word)
+            padded = f"<{word}>"
+            features.extend(padded[i : i + 3] for i in range(len(padded) - 2))
+        if not features:
+            return vector.tolist()
+
+        hashes = np.array(
+            [
+                int.from_bytes(
+                    hashlib.blake2b(f.encode("utf-8"), digest_size=8).digest(), "little"
+                )
+                for f in features
+            ],
+            dtype=np.uint64,
+        )
+        indices = (hashes % np.uint64(self._embedding_dimension)).astype(np.int64)
+        signs = np.where((hashes >> np.uint64(63)) == 0, 1.0, -1.0)
+        np.add.at(vector, indices, signs)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector.tolist()
@@ -6,9 +6,11 @@ SOLID 원칙을 준수하는 Vertex AI 임베딩 서비스 구현
 import os
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 from google.cloud import aiplatform
 from google.oauth2 import service_account
+from app.core.config import settings
 from app.core.embedding_interfaces.embedding_interface import (
     IEmbeddingService,
     IEmbeddingUsageTracker,
@@ -38,6 +40,13 @@ class VertexAIEmbeddingService(IEmbeddingService, IEmbeddingUsageTracker):
         self._monthly_chars = 0
         self._free_tier_limit = 5_000_000  # 5M characters
 
+        # Vertex AI SDK는 동기 API - 서비스 수명 동안 쓰는 제한된 스레드 풀로 호출
+        self._batch_size = settings.EMBEDDING_BATCH_SIZE
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.EMBEDDING_MAX_CONCURRENCY,
+            thread_name_prefix="vertex-embedding",
+        )
+
         # 초기화
         self._initialize_client()
 
@@ -99,16 +108,7 @@ class VertexAIEmbeddingService(IEmbeddingService, IEmbeddingUsageTracker):
             # 사용량 추적
             self.track_usage(text)
 
-            # Vertex AI는 동기 API이므로 executor 사용
-            loop = asyncio.get_event_loop()
-
-            # ThreadPoolExecutor를 사용하여 비동기 처리
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                embeddings = await loop.run_in_executor(
-                    executor, lambda: self.model.get_embeddings([text])
-                )
+            embeddings = await self._get_embeddings([text])
 
             # 임베딩 벡터 반환
             return embeddings[0].values
@@ -140,22 +140,15 @@ class VertexAIEmbeddingService(IEmbeddingService, IEmbeddingUsageTracker):
             for text in processed_texts:
                 self.track_usage(text)
 
-            # Vertex AI 배치 크기 제한 (최대 5개)
-            batch_size = 5
-            all_embeddings = []
-
-            loop = asyncio.get_event_loop()
-
-            # 동시 실행을 위한 executor
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                for i in range(0, len(processed_texts), batch_size):
-                    batch = processed_texts[i : i + batch_size]
-                    embeddings = await loop.run_in_executor(
-                        executor, lambda b=batch: self.model.get_embeddings(b)
-                    )
-                    all_embeddings.extend([e.values for e in embeddings])
+            # Vertex AI 배치 크기 제한 - 배치들은 스레드 풀 크기만큼 동시에 요청
+            batches = [
+                processed_texts[i : i + self._batch_size]
+                for i in range(0, len(processed_texts), self._batch_size)
+            ]
+            results = await asyncio.gather(
+                *(self._get_embeddings(batch) for batch in batches)
+            )
+            all_embeddings = [e.values for batch in results for e in batch]
 
             return all_embeddings
 
@@ -163,6 +156,17 @@ class VertexAIEmbeddingService(IEmbeddingService, IEmbeddingUsageTracker):
             logger.error(f"Vertex AI 배치 임베딩 오류: {str(e)}")
             raise
 
+    async def _get_embeddings(self, texts: List[str]) -> List[Any]:
+        """공유 스레드 풀에서 Vertex AI 동기 호출 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self.model.get_embeddings, texts
+        )
+
+    def close(self) -> None:
+        """스레드 풀 정리"""
+        self._executor.shutdown(wait=False)
+
     def get_embedding_dimension(self) -> int:
         """임베딩 벡터의 차원 반환"""
         return self._embedding_dimension
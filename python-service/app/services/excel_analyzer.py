@@ -6,12 +6,19 @@ Excel 파일 분석 및 포괄적인 오류 감지 서비스
 import openpyxl
 from openpyxl.utils import get_column_letter
 from openpyxl.utils.exceptions import InvalidFileException
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterable
 import re
 from pathlib import Path
 import logging
 from datetime import datetime
 from dataclasses import dataclass
+from app.services.xlsx_stream_reader import (
+    StreamingXlsxReader,
+    SheetStream,
+    StreamedCell,
+)
+from app.core.content_hash import content_hash_registry
+from app.core.single_flight import single_flight
 
 logger = logging.getLogger(__name__)
 
@@ -78,48 +85,56 @@ class ExcelAnalyzer:
         }
 
     async def analyze_file(self, file_path: str) -> Dict[str, Any]:
-        """Analyze an Excel file and extract metadata with error detection"""
+        """Analyze an Excel file and extract metadata with error detection
+
+        Concurrent calls for the same file content share one analysis run.
+        """
+        content_hash = await content_hash_registry.resolve(str(file_path))
+        if not content_hash:
+            return await self._analyze_file(file_path)
+
+        result, shared = await single_flight.do(
+            f"excel_analysis:{content_hash}", lambda: self._analyze_file(file_path)
+        )
+        if shared:
+            # Same content, but file info belongs to this caller's upload
+            result = {**result, "file_info": self._file_info(Path(file_path))}
+        return result
+
+    @staticmethod
+    def _file_info(file_path: Path) -> Dict[str, Any]:
+        stat = file_path.stat()
+        return {
+            "filename": file_path.name,
+            "size": stat.st_size,
+            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+        }
+
+    async def _analyze_file(self, file_path: str) -> Dict[str, Any]:
+        """Run the analysis for one file (no request coalescing)"""
         try:
             file_path = Path(file_path)
 
             # Basic file info
-            file_info = {
-                "filename": file_path.name,
-                "size": file_path.stat().st_size,
-                "modified": datetime.fromtimestamp(
-                    file_path.stat().st_mtime
-                ).isoformat(),
-            }
-
-            # 두 가지 모드로 워크북 열기
-            # 1. 수식 포함 (data_only=False)
-            workbook_formulas = openpyxl.load_workbook(
-                file_path, read_only=False, data_only=False, keep_vba=False
-            )
-            # 2. 계산된 값 (data_only=True)
-            workbook_values = openpyxl.load_workbook(
-                file_path, read_only=False, data_only=True, keep_vba=False
-            )
+            file_info = self._file_info(file_path)
 
             sheets_info = {}
             total_formulas = 0
             total_errors = 0
             all_errors = []
 
-            # 모든 시트 분석
-            for sheet_name in workbook_formulas.sheetnames:
-                sheet_formulas = workbook_formulas[sheet_name]
-                sheet_values = workbook_values[sheet_name]
-
-                sheet_analysis = await self._analyze_sheet(
-                    sheet_formulas, sheet_values, sheet_name
-                )
-                sheets_info[sheet_name] = sheet_analysis
-                total_formulas += sheet_analysis.get("formula_count", 0)
+            # 워크시트 XML을 한 번만 스트리밍 파싱 (수식과 캐시된 값을 함께 읽음)
+            with StreamingXlsxReader(file_path) as reader:
+                for sheet_name in reader.sheetnames:
+                    sheet_analysis = await self._analyze_sheet(
+                        reader.open_sheet(sheet_name), sheet_name
+                    )
+                    sheets_info[sheet_name] = sheet_analysis
+                    total_formulas += sheet_analysis.get("formula_count", 0)
 
-                # 오류 수집
-                sheet_errors = sheet_analysis.get("errors", [])
-                all_errors.extend(sheet_errors)
+                    # 오류 수집
+                    sheet_errors = sheet_analysis.get("errors", [])
+                    all_errors.extend(sheet_errors)
 
             # 중복 제거
             unique_errors = []
@@ -135,9 +150,6 @@ class ExcelAnalyzer:
             all_errors = unique_errors
             total_errors = len(all_errors)
 
-            workbook_formulas.close()
-            workbook_values.close()
-
             # Transform errors to expected format
             formatted_errors = []
             for error in all_errors:
@@ -181,112 +193,102 @@ class ExcelAnalyzer:
             raise
 
     async def _analyze_sheet(
-        self, sheet_formulas, sheet_values, sheet_name: str
+        self, sheet_stream: SheetStream, sheet_name: str
     ) -> Dict[str, Any]:
-        """Analyze a single sheet with both formula and value views"""
+        """Analyze a single sheet from one streaming pass (formula + cached value)"""
         analysis = {
             "name": sheet_name,
-            "rows": sheet_formulas.max_row,
-            "columns": sheet_formulas.max_column,
-            "used_range": f"A1:{get_column_letter(sheet_formulas.max_column)}{sheet_formulas.max_row}",
+            "rows": 0,
+            "columns": [],
+            "used_range": "",
             "formulas": [],
             "errors": [],
             "formula_count": 0,
             "merged_cells": [],
         }
 
-        # Get column headers
-        if sheet_formulas.max_row > 0:
-            headers = []
-            for col in range(1, sheet_formulas.max_column + 1):
-                cell = sheet_formulas.cell(row=1, column=col)
-                headers.append(cell.value if cell.value else f"Column{col}")
-            analysis["columns"] = headers
-
         errors_found = []
-
-        # Analyze all cells
-        for row in range(1, sheet_formulas.max_row + 1):
-            for col in range(1, sheet_formulas.max_column + 1):
-                cell_formulas = sheet_formulas.cell(row=row, column=col)
-                cell_values = sheet_values.cell(row=row, column=col)
-
-                # 1. 수식이 있는 셀 검사
-                if cell_formulas.data_type == "f" and cell_formulas.value:
-                    formula = str(cell_formulas.value)
-
-                    # 수식 정보 수집
-                    if len(analysis["formulas"]) < 10:  # Limit stored formulas
-                        analysis["formulas"].append(
-                            {
-                                "cell": cell_formulas.coordinate,
-                                "formula": formula,
-                                "value": cell_values.value,
-                            }
-                        )
-                    analysis["formula_count"] += 1
-
-                    # 수식 자체의 위험 패턴 검사
-                    for pattern, description in self.risky_patterns.items():
-                        if re.search(pattern, formula, re.IGNORECASE):
-                            # 실제로 오류가 발생했는지 확인
-                            calculated_value = cell_values.value
-                            error_type = self._check_value_for_error(calculated_value)
-
-                            if error_type:
-                                error = self._create_error(
-                                    cell_formulas,
-                                    sheet_name,
-                                    error_type,
-                                    formula=formula,
-                                    value=calculated_value,
-                                )
-                                errors_found.append(error)
-
-                # 2. 값 자체가 오류인 경우 검사 (수식이 없어도)
-                if cell_values.value is not None:
-                    # ArrayFormula 처리
-                    actual_value = cell_values.value
-                    if (
-                        hasattr(actual_value, "__class__")
-                        and actual_value.__class__.__name__ == "ArrayFormula"
-                    ):
-                        # ArrayFormula의 경우 string representation을 체크
-                        actual_value = str(actual_value)
-
-                    error_type = self._check_value_for_error(actual_value)
-                    if error_type:
-                        # 이미 추가된 오류인지 확인
-                        already_added = any(
-                            e.cell == cell_values.coordinate
-                            and e.sheet == sheet_name
-                            and e.error_type == error_type
-                            for e in errors_found
-                        )
-
-                        if not already_added:
+        error_keys = set()
+        header_values: Dict[int, Any] = {}
+        data_type_samples: List[StreamedCell] = []
+
+        # Analyze populated cells only
+        for cell in sheet_stream:
+            # 헤더 행과 데이터 타입 샘플 수집
+            if cell.row == 1:
+                header_values[cell.column] = cell.formula_value
+            elif cell.row < 100 and cell.column < 20:
+                data_type_samples.append(cell)
+
+            # 1. 수식이 있는 셀 검사
+            if cell.formula:
+                formula = cell.formula
+
+                # 수식 정보 수집
+                if len(analysis["formulas"]) < 10:  # Limit stored formulas
+                    analysis["formulas"].append(
+                        {
+                            "cell": cell.coordinate,
+                            "formula": formula,
+                            "value": cell.value,
+                        }
+                    )
+                analysis["formula_count"] += 1
+
+                # 수식 자체의 위험 패턴 검사
+                for pattern, description in self.risky_patterns.items():
+                    if re.search(pattern, formula, re.IGNORECASE):
+                        # 실제로 오류가 발생했는지 확인
+                        calculated_value = cell.value
+                        error_type = self._check_value_for_error(calculated_value)
+
+                        if error_type:
                             error = self._create_error(
-                                cell_values,
+                                cell,
                                 sheet_name,
                                 error_type,
-                                formula=(
-                                    str(cell_formulas.value)
-                                    if cell_formulas.data_type == "f"
-                                    else None
-                                ),
-                                value=actual_value,
+                                formula=formula,
+                                value=calculated_value,
                             )
                             errors_found.append(error)
+                            error_keys.add((cell.coordinate, error_type))
+
+            # 2. 값 자체가 오류인 경우 검사 (수식이 없어도)
+            if cell.value is not None:
+                error_type = self._check_value_for_error(cell.value)
+                # 이미 추가된 오류인지 확인
+                if error_type and (cell.coordinate, error_type) not in error_keys:
+                    error = self._create_error(
+                        cell,
+                        sheet_name,
+                        error_type,
+                        formula=cell.formula,
+                        value=cell.value,
+                    )
+                    errors_found.append(error)
+                    error_keys.add((cell.coordinate, error_type))
+
+        # 시트 크기는 스트림을 끝까지 읽은 뒤 확정됨
+        max_row = sheet_stream.max_row
+        max_column = sheet_stream.max_column
+        analysis["rows"] = max_row
+        analysis["used_range"] = f"A1:{get_column_letter(max_column)}{max_row}"
+
+        # Get column headers
+        analysis["columns"] = [
+            header_values.get(col) or f"Column{col}" for col in range(1, max_column + 1)
+        ]
 
         # Add errors to analysis
         analysis["errors"] = errors_found
 
         # Merged cells info
-        for merged_range in sheet_formulas.merged_cells.ranges:
-            analysis["merged_cells"].append(str(merged_range))
+        analysis["merged_cells"] = list(sheet_stream.merged_cells)
 
         # Data type analysis
-        analysis["data_types"] = self._analyze_data_types(sheet_values)
+        analysis["data_types"] = self._analyze_data_types(
+            data_type_samples, max_row, max_column
+        )
 
         return analysis
 
@@ -385,34 +387,49 @@ class ExcelAnalyzer:
             summary[error_type] = summary.get(error_type, 0) + 1
         return summary
 
-    def _analyze_data_types(self, sheet) -> Dict[str, Dict[str, Any]]:
-        """Analyze data types in columns"""
+    def _analyze_data_types(
+        self, cells: Iterable[StreamedCell], max_row: int, max_column: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """Analyze data types in columns from populated cells only"""
         column_types = {}
-
-        for col in range(1, min(sheet.max_column + 1, 20)):  # Limit to first 20 columns
-            col_letter = get_column_letter(col)
-            types = {"text": 0, "number": 0, "date": 0, "formula": 0, "empty": 0}
-
-            for row in range(2, min(sheet.max_row + 1, 100)):  # Sample first 100 rows
-                cell = sheet.cell(row=row, column=col)
-
-                if cell.value is None:
-                    types["empty"] += 1
-                elif isinstance(cell.value, (int, float)):
-                    types["number"] += 1
-                elif isinstance(cell.value, datetime):
-                    types["date"] += 1
-                elif isinstance(cell.value, str):
-                    if cell.value.startswith("="):
-                        types["formula"] += 1
-                    else:
-                        types["text"] += 1
+        last_col = min(max_column, 19)  # Limit to first 19 columns
+        last_row = min(max_row, 99)  # Sample first 99 rows
+        sampled_rows = max(last_row - 1, 0)
+
+        column_counts: Dict[int, Dict[str, int]] = {}
+        populated_counts: Dict[int, int] = {}
+        for cell in cells:
+            value = cell.value
+            if value is None or not (
+                2 <= cell.row <= last_row and cell.column <= last_col
+            ):
+                continue
+
+            types = column_counts.setdefault(
+                cell.column,
+                {"text": 0, "number": 0, "date": 0, "formula": 0, "empty": 0},
+            )
+            populated_counts[cell.column] = populated_counts.get(cell.column, 0) + 1
+            if isinstance(value, (int, float)):
+                types["number"] += 1
+            elif isinstance(value, datetime):
+                types["date"] += 1
+            elif isinstance(value, str):
+                if value.startswith("="):
+                    types["formula"] += 1
+                else:
+                    types["text"] += 1
+
+        for col in sorted(column_counts):
+            types = column_counts[col]
+            # 샘플 범위 중 값이 없는 셀은 빈 셀로 집계
+            types["empty"] = sampled_rows - populated_counts[col]
 
             # Determine primary type
             non_empty_types = {k: v for k, v in types.items() if k != "empty" and v > 0}
             if non_empty_types:
                 primary_type = max(non_empty_types, key=non_empty_types.get)
-                column_types[col_letter] = {
+                column_types[get_column_letter(col)] = {
                     "primary": primary_type,
                     "distribution": types,
                     "mixed": len(non_empty_types) > 1,
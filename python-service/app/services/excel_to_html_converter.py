@@ -4,7 +4,7 @@ Excel to HTML converter with proper merged cell support
 
 import openpyxl
 from openpyxl.utils import get_column_letter
-from typing import Dict, Any
+from typing import Dict, Any, List, Set, Tuple
 
 
 class ExcelToHtmlConverter:
@@ -27,6 +27,83 @@ class ExcelToHtmlConverter:
 
     def convert_sheet_to_html(self, worksheet) -> Dict[str, Any]:
         """Convert worksheet to HTML structure"""
+        layout = self.build_layout(worksheet)
+        max_row = layout["max_row"]
+        max_col = layout["max_col"]
+
+        return {
+            "html_rows": self.render_rows(worksheet, layout, 1, max_row, 1, max_col),
+            "col_widths": layout["col_widths"],
+            "row_heights": layout["row_heights"],
+            "merged_cells": layout["merged_cells"],
+            "max_row": max_row,
+            "max_col": max_col,
+        }
+
+    def convert_viewport(
+        self,
+        worksheet,
+        row: int,
+        col: int,
+        rows: int,
+        cols: int,
+        layout: Dict[str, Any] = None,
+    ) -> Dict[str, Any]:
+        """Convert only a window of the worksheet (1-based row/col)
+
+        Pass a layout from build_layout() to reuse sizes and merge maps across
+        windows of the same sheet. top/left are pixel offsets of the window so a
+        virtualized grid can position it without the other rows and columns.
+        """
+        if layout is None:
+            layout = self.build_layout(worksheet)
+        max_row = layout["max_row"]
+        max_col = layout["max_col"]
+
+        row_start = max(1, row)
+        col_start = max(1, col)
+        row_end = min(max_row, row_start + max(rows, 0) - 1)
+        col_end = min(max_col, col_start + max(cols, 0) - 1)
+
+        html_rows = self.render_rows(
+            worksheet, layout, row_start, row_end, col_start, col_end
+        )
+
+        # Merges intersecting the window (masters may lie outside of it)
+        merged_cells = [
+            merge
+            for merge in layout["merged_cells"]
+            if merge["start"]["row"] < row_end
+            and merge["end"]["row"] >= row_start - 1
+            and merge["start"]["col"] < col_end
+            and merge["end"]["col"] >= col_start - 1
+        ]
+
+        row_offsets = layout["row_offsets"]
+        col_offsets = layout["col_offsets"]
+        return {
+            "html_rows": html_rows,
+            "row_start": row_start,
+            "row_end": row_end,
+            "col_start": col_start,
+            "col_end": col_end,
+            "col_widths": {
+                c: layout["col_widths"][c] for c in range(col_start, col_end + 1)
+            },
+            "row_heights": {
+                r: layout["row_heights"][r] for r in range(row_start, row_end + 1)
+            },
+            "merged_cells": merged_cells,
+            "top": row_offsets[min(row_start, max_row + 1) - 1],
+            "left": col_offsets[min(col_start, max_col + 1) - 1],
+            "total_height": row_offsets[max_row],
+            "total_width": col_offsets[max_col],
+            "max_row": max_row,
+            "max_col": max_col,
+        }
+
+    def build_layout(self, worksheet) -> Dict[str, Any]:
+        """Precompute sizes, prefix sums and merge lookup maps for a worksheet"""
         # Get dimensions
         max_row = worksheet.max_row or 100
         max_col = worksheet.max_column or 26
@@ -54,7 +131,10 @@ class ExcelToHtmlConverter:
 
         # Process merged cells
         merged_cells = []
-        merged_map = {}  # Map of cells that are part of merges
+        merge_masters: Dict[Tuple[int, int], Tuple[int, int]] = (
+            {}
+        )  # (row, col) -> spans
+        merged_hidden: Set[Tuple[int, int]] = set()  # merged cells except masters
 
         for merge_range in worksheet.merged_cells.ranges:
             start_row = merge_range.min_row
@@ -71,21 +151,60 @@ class ExcelToHtmlConverter:
                 }
             )
 
+            merge_masters[(start_row, start_col)] = (
+                end_row - start_row + 1,
+                end_col - start_col + 1,
+            )
+
             # Mark all cells in merge (except master) as hidden
             for r in range(start_row, end_row + 1):
                 for c in range(start_col, end_col + 1):
                     if r != start_row or c != start_col:
-                        merged_map[f"{r},{c}"] = True
+                        merged_hidden.add((r, c))
+
+        return {
+            "max_row": max_row,
+            "max_col": max_col,
+            "col_widths": col_widths,
+            "row_heights": row_heights,
+            # Prefix sums so merged sizes are O(1): offsets[i] = sum of sizes 1..i
+            "col_offsets": self._prefix_sums(col_widths, max_col),
+            "row_offsets": self._prefix_sums(row_heights, max_row),
+            "merged_cells": merged_cells,
+            "merge_masters": merge_masters,
+            "merged_hidden": merged_hidden,
+            "style_cache": {},  # openpyxl style id -> CSS without size
+        }
+
+    def render_rows(
+        self,
+        worksheet,
+        layout: Dict[str, Any],
+        row_start: int,
+        row_end: int,
+        col_start: int,
+        col_end: int,
+    ) -> List[List[Dict[str, Any]]]:
+        """Render the cells of a row/column window using a precomputed layout"""
+        max_row = layout["max_row"]
+        max_col = layout["max_col"]
+        col_widths = layout["col_widths"]
+        row_heights = layout["row_heights"]
+        col_offsets = layout["col_offsets"]
+        row_offsets = layout["row_offsets"]
+        merge_masters = layout["merge_masters"]
+        merged_hidden = layout["merged_hidden"]
+        style_cache = layout["style_cache"]
 
         # Build HTML table
         html_rows = []
 
-        for row in range(1, max_row + 1):
+        for row in range(row_start, row_end + 1):
             html_cols = []
 
-            for col in range(1, max_col + 1):
+            for col in range(col_start, col_end + 1):
                 # Skip cells that are part of a merge (but not the master)
-                if f"{row},{col}" in merged_map:
+                if (row, col) in merged_hidden:
                     continue
 
                 cell = worksheet.cell(row=row, column=col)
@@ -94,32 +213,27 @@ class ExcelToHtmlConverter:
                 cell_attrs = {
                     "class": "excel-cell",
                     "style": self._get_cell_style(
-                        cell, col_widths[col], row_heights[row]
+                        cell, col_widths[col], row_heights[row], style_cache
                     ),
                 }
 
                 # Check if this is a merged cell master
-                for merge in merged_cells:
-                    if (
-                        merge["start"]["row"] == row - 1
-                        and merge["start"]["col"] == col - 1
-                    ):
-                        cell_attrs["colspan"] = merge["colspan"]
-                        cell_attrs["rowspan"] = merge["rowspan"]
-                        cell_attrs["class"] += " merged-cell"
-
-                        # Calculate total width for merged cell
-                        total_width = sum(
-                            col_widths[c] for c in range(col, col + merge["colspan"])
-                        )
-                        total_height = sum(
-                            row_heights[r] for r in range(row, row + merge["rowspan"])
-                        )
-
-                        cell_attrs[
-                            "style"
-                        ] += f" width: {total_width}px; height: {total_height}px;"
-                        break
+                spans = merge_masters.get((row, col))
+                if spans:
+                    rowspan, colspan = spans
+                    cell_attrs["colspan"] = colspan
+                    cell_attrs["rowspan"] = rowspan
+                    cell_attrs["class"] += " merged-cell"
+
+                    # Calculate total size for merged cell (clipped to the sheet)
+                    last_col = min(col + colspan - 1, max_col)
+                    last_row = min(row + rowspan - 1, max_row)
+                    total_width = col_offsets[last_col] - col_offsets[col - 1]
+                    total_height = row_offsets[last_row] - row_offsets[row - 1]
+
+                    cell_attrs[
+                        "style"
+                    ] += f" width: {total_width}px; height: {total_height}px;"
 
                 # Cell value
                 value = cell.value if cell.value is not None else ""
@@ -128,23 +242,41 @@ class ExcelToHtmlConverter:
 
             html_rows.append(html_cols)
 
-        return {
-            "html_rows": html_rows,
-            "col_widths": col_widths,
-            "row_heights": row_heights,
-            "merged_cells": merged_cells,
-            "max_row": max_row,
-            "max_col": max_col,
-        }
+        return html_rows
 
-    def _get_cell_style(self, cell, width: int, height: int) -> str:
-        """Get CSS style for cell"""
-        styles = []
+    @staticmethod
+    def _prefix_sums(sizes: Dict[int, int], count: int) -> List[int]:
+        """Cumulative sizes where offsets[i] is the total of indices 1..i"""
+        offsets = [0] * (count + 1)
+        for index in range(1, count + 1):
+            offsets[index] = offsets[index - 1] + sizes[index]
+        return offsets
+
+    def _get_cell_style(
+        self, cell, width: int, height: int, style_cache: Dict[Any, str] = None
+    ) -> str:
+        """Get CSS style for cell
 
-        # Size
-        styles.append(f"width: {width}px")
-        styles.append(f"min-width: {width}px")
-        styles.append(f"height: {height}px")
+        The formatting part depends only on the cell's openpyxl style, so it is
+        memoised per style id when a cache is given.
+        """
+        size = f"width: {width}px; min-width: {width}px; height: {height}px"
+
+        if style_cache is None:
+            formatting = self._get_format_style(cell)
+        else:
+            style_id = getattr(cell, "style_id", None)
+            formatting = style_cache.get(style_id)
+            if formatting is None:
+                formatting = self._get_format_style(cell)
+                if style_id is not None:
+                    style_cache[style_id] = formatting
+
+        return f"{size}; {formatting}" if formatting else size
+
+    def _get_format_style(self, cell) -> str:
+        """Get CSS for alignment, font, fill and border of a cell"""
+        styles = []
 
         # Alignment
         if cell.alignment:
@@ -164,11 +296,11 @@ class ExcelToHtmlConverter:
                 styles.append("font-weight: bold")
             if cell.font.size:
                 styles.append(f"font-size: {cell.font.size}pt")
-            if cell.font.color and cell.font.color.rgb:
+            if cell.font.color and isinstance(cell.font.color.rgb, str):
                 styles.append(f"color: #{cell.font.color.rgb[2:]}")
 
         # Background
-        if cell.fill and cell.fill.fgColor and cell.fill.fgColor.rgb:
+        if cell.fill and cell.fill.fgColor and isinstance(cell.fill.fgColor.rgb, str):
             styles.append(f"background-color: #{cell.fill.fgColor.rgb[2:]}")
 
         # Border
@@ -0,0 +1,252 @@
+"""
+Excel Viewport Service
+파싱된 워크북을 캐시해 두고 화면에 보이는 행/열 창(타일)만 HTML 구조로 렌더링
+"""
+
+from collections import OrderedDict
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import openpyxl
+
+from app.core.config import settings
+from app.core.content_hash import new_content_hasher
+from app.services.excel_to_html_converter import ExcelToHtmlConverter
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 렌더링 결과 형식이 바뀌면 올려서 이전 ETag를 무효화
+RENDER_VERSION = 1
+
+
+class ViewportWorkbook:
+    """뷰포트용으로 열어 둔 워크북 - 시트별 레이아웃(크기, 병합 맵, 스타일 캐시) 보관"""
+
+    def __init__(self, file_id: str, workbook: Any):
+        self.file_id = file_id
+        self.workbook = workbook
+        self.layouts: Dict[str, Dict[str, Any]] = {}
+        # openpyxl은 빈 셀 조회 시 셀을 만들기 때문에 렌더링은 워크북 단위로 직렬화
+        self.lock = threading.Lock()
+
+    def layout(
+        self, converter: ExcelToHtmlConverter, sheet_name: str
+    ) -> Dict[str, Any]:
+        layout = self.layouts.get(sheet_name)
+        if layout is None:
+            layout = converter.build_layout(self.workbook[sheet_name])
+            self.layouts[sheet_name] = layout
+        return layout
+
+
+class ExcelViewportService:
+    """뷰포트 타일 렌더링 서비스
+
+    워크북은 내용 해시(file_id)별로 한 번만 파싱하고, 요청된 창만 렌더링합니다.
+    타일 ETag는 내용 해시와 창 좌표로 만들기 때문에 렌더링 없이 304 여부를
+    판단할 수 있고, 렌더링된 타일과 인접 타일(프리페치)은 LRU에 보관합니다.
+    """
+
+    def __init__(
+        self,
+        max_workbooks: Optional[int] = None,
+        max_tiles: Optional[int] = None,
+    ):
+        self.max_workbooks = max_workbooks or settings.VIEWPORT_WORKBOOK_CACHE_SIZE
+        self.max_tiles = max_tiles or settings.VIEWPORT_TILE_CACHE_SIZE
+        self.converter = ExcelToHtmlConverter()
+
+        self._workbooks: "OrderedDict[str, ViewportWorkbook]" = OrderedDict()
+        self._tiles: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        self.stats = {"tile_hits": 0, "tile_misses": 0, "prefetched": 0}
+
+    # 워크북
+    def open_workbook(self, file_path: str, file_id: str) -> Dict[str, Any]:
+        """워크북을 파싱해 캐시에 등록 (같은 내용이면 다시 파싱하지 않음)"""
+        with self._lock:
+            cached = self._workbooks.get(file_id)
+            if cached is not None:
+                self._workbooks.move_to_end(file_id)
+                return self.describe(file_id)
+
+        workbook = openpyxl.load_workbook(file_path, data_only=True)
+
+        with self._lock:
+            self._workbooks[file_id] = ViewportWorkbook(file_id, workbook)
+            self._workbooks.move_to_end(file_id)
+            while len(self._workbooks) > self.max_workbooks:
+                evicted, _ = self._workbooks.popitem(last=False)
+                self._drop_tiles(evicted)
+                logger.debug(f"뷰포트 워크북 캐시에서 제거: {evicted}")
+
+        return self.describe(file_id)
+
+    def describe(self, file_id: str) -> Dict[str, Any]:
+        """워크북 시트 목록과 기본 타일 크기"""
+        entry = self._get_workbook(file_id)
+        return {
+            "file_id": file_id,
+            "sheets": [
+                {
+                    "name": sheet.title,
+                    "max_row": sheet.max_row,
+                    "max_col": sheet.max_column,
+                }
+                for sheet in entry.workbook.worksheets
+            ],
+            "tile_rows": settings.VIEWPORT_TILE_ROWS,
+            "tile_cols": settings.VIEWPORT_TILE_COLS,
+        }
+
+    def close_workbook(self, file_id: str) -> bool:
+        with self._lock:
+            removed = self._workbooks.pop(file_id, None) is not None
+            self._drop_tiles(file_id)
+        return removed
+
+    def has_workbook(self, file_id: str) -> bool:
+        return file_id in self._workbooks
+
+    # 타일
+    def tile_etag(
+        self, file_id: str, sheet_name: str, row: int, col: int, rows: int, cols: int
+    ) -> str:
+        """타일 ETag - 내용 해시와 창 좌표로 결정되므로 렌더링 없이 계산"""
+        hasher = new_content_hasher()
+        hasher.update(
+            f"{RENDER_VERSION}:{file_id}:{sheet_name}:{row}:{col}:{rows}:{cols}".encode()
+        )
+        return f'"{hasher.hexdigest()}"'
+
+    def get_tile(
+        self, file_id: str, sheet_name: str, row: int, col: int, rows: int, cols: int
+    ) -> Tuple[str, Dict[str, Any]]:
+        """타일 렌더링 (캐시 우선)
+
+        Raises:
+            KeyError: 열려 있지 않은 파일이거나 없는 시트
+            ValueError: 잘못된 창 크기
+        """
+        self._validate_window(row, col, rows, cols)
+        etag = self.tile_etag(file_id, sheet_name, row, col, rows, cols)
+
+        with self._lock:
+            tile = self._tiles.get(etag)
+            if tile is not None:
+                self._tiles.move_to_end(etag)
+                self.stats["tile_hits"] += 1
+                return etag, tile
+
+        tile = self._render(file_id, sheet_name, row, col, rows, cols)
+        self.stats["tile_misses"] += 1
+        self._store_tile(etag, tile)
+        return etag, tile
+
+    def prefetch_adjacent(
+        self, file_id: str, sheet_name: str, row: int, col: int, rows: int, cols: int
+    ) -> int:
+        """인접 타일(아래, 오른쪽, 위, 왼쪽)을 미리 렌더링해 캐시 - 렌더링한 타일 수 반환"""
+        try:
+            entry = self._get_workbook(file_id)
+            sheet = entry.workbook[sheet_name]
+        except KeyError:
+            return 0
+
+        rendered = 0
+        for next_row, next_col in self.adjacent_windows(
+            row, col, rows, cols, sheet.max_row, sheet.max_column
+        ):
+            etag = self.tile_etag(file_id, sheet_name, next_row, next_col, rows, cols)
+            if etag in self._tiles:
+                continue
+            try:
+                tile = self._render(file_id, sheet_name, next_row, next_col, rows, cols)
+            except KeyError:
+                # 프리페치 도중 워크북이 캐시에서 빠짐
+                break
+            self._store_tile(etag, tile)
+            rendered += 1
+
+        self.stats["prefetched"] += rendered
+        return rendered
+
+    @staticmethod
+    def adjacent_windows(
+        row: int, col: int, rows: int, cols: int, max_row: int, max_col: int
+    ) -> List[Tuple[int, int]]:
+        """시트 범위 안의 인접 창 시작 좌표 (스크롤 방향 우선순위 순)"""
+        candidates = [
+            (row + rows, col),
+            (row, col + cols),
+            (row - rows, col),
+            (row, col - cols),
+        ]
+        return [
+            (r, c)
+            for r, c in candidates
+            if 1 <= r <= max(max_row, 1) and 1 <= c <= max(max_col, 1)
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        requests = self.stats["tile_hits"] + self.stats["tile_misses"]
+        return {
+            **self.stats,
+            "hit_rate": self.stats["tile_hits"] / requests if requests else 0.0,
+            "workbooks": len(self._workbooks),
+            "tiles": len(self._tiles),
+            "max_workbooks": self.max_workbooks,
+            "max_tiles": self.max_tiles,
+        }
+
+    # 내부 유틸
+    def _render(
+        self, file_id: str, sheet_name: str, row: int, col: int, rows: int, cols: int
+    ) -> Dict[str, Any]:
+        entry = self._get_workbook(file_id)
+        worksheet = entry.workbook[sheet_name]
+        with entry.lock:
+            layout = entry.layout(self.converter, sheet_name)
+            tile = self.converter.convert_viewport(
+                worksheet, row, col, rows, cols, layout=layout
+            )
+        tile["file_id"] = file_id
+        tile["sheet"] = sheet_name
+        return tile
+
+    def _get_workbook(self, file_id: str) -> ViewportWorkbook:
+        with self._lock:
+            entry = self._workbooks.get(file_id)
+            if entry is None:
+                raise KeyError(file_id)
+            self._workbooks.move_to_end(file_id)
+            return entry
+
+    def _store_tile(self, etag: str, tile: Dict[str, Any]):
+        with self._lock:
+            self._tiles[etag] = tile
+            self._tiles.move_to_end(etag)
+            while len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
+
+    def _drop_tiles(self, file_id: str):
+        """워크북의 타일 제거 (self._lock 안에서 호출)"""
+        stale = [
+            etag for etag, tile in self._tiles.items() if tile.get("file_id") == file_id
+        ]
+        for etag in stale:
+            del self._tiles[etag]
+
+    def _validate_window(self, row: int, col: int, rows: int, cols: int):
+        if row < 1 or col < 1 or rows < 1 or cols < 1:
+            raise ValueError("row, col, rows, cols는 1 이상이어야 합니다")
+        if rows * cols > settings.VIEWPORT_MAX_TILE_CELLS:
+            raise ValueError(
+                f"타일 크기가 최대 셀 수({settings.VIEWPORT_MAX_TILE_CELLS})를 넘습니다"
+            )
+
+
+# 전역 인스턴스
+excel_viewport_service = ExcelViewportService()
@@ -0,0 +1,464 @@
+"""
+Incremental Formula Model
+세션별로 유지되는 컴파일된 수식 모델 - 변경된 셀과 그 전이 종속 셀만 다시 계산
+"""
+
+from collections import OrderedDict, defaultdict, deque
+from functools import lru_cache
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.excel_utils import ExcelUtils
+from app.services.detection.dependency_graph import (
+    MAX_COLUMN,
+    MAX_ROW,
+    NARROW_RANGE_COLUMNS,
+    Reference,
+    format_key,
+    parse_references,
+)
+
+try:
+    import numpy as np
+    import schedula
+    from formulas import Parser
+    from formulas.functions import Error, XlError
+
+    FORMULAS_AVAILABLE = True
+except ImportError:
+    FORMULAS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 셀 키 (시트, 행, 열)
+CellKey = Tuple[str, int, int]
+
+# 단일 셀 주소 (A1, $B$2) - 범위나 시트 접두사는 허용하지 않음
+CELL_ADDRESS_PATTERN = re.compile(r"^\$?([A-Za-z]{1,3})\$?(\d+)$")
+
+
+@lru_cache(maxsize=4096)
+def compile_formula(formula: str) -> Tuple[Any, Tuple[str, ...]]:
+    """수식을 한 번만 파싱/컴파일 (같은 수식 문자열은 모든 세션이 공유)
+
+    Returns:
+        (컴파일된 함수, 입력 참조 문자열 목록) - 함수 인자는 입력 순서를 따름
+    """
+    function = Parser().ast(formula)[1].compile()
+    return function, tuple(function.inputs)
+
+
+def _to_internal(result: Any) -> Any:
+    """formulas 계산 결과를 단일 셀 값으로 변환 (오류 값은 XlError 그대로 유지)"""
+    value = np.asarray(result, dtype=object).ravel()
+    value = value[0] if value.size else 0
+    if value is schedula.EMPTY:
+        return 0
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def to_python_value(value: Any) -> Any:
+    """내부 값을 API 응답용 값으로 변환 (오류는 "#DIV/0!" 같은 문자열)"""
+    if isinstance(value, XlError):
+        return str(value)
+    if value is schedula.EMPTY:
+        return None
+    return value
+
+
+class IncrementalFormulaModel:
+    """증분 재계산 수식 모델
+
+    셀 원본 값과 수식별 참조 사각형을 보관하고, 계산된 값은 캐시합니다.
+    셀이 바뀌면 역방향 참조 인덱스로 전이 종속 셀만 더티로 표시해 캐시에서 빼고,
+    값은 필요할 때 선행 셀부터 반복 스택으로 당겨 계산합니다(pull 방식).
+    범위 참조는 셀로 펼치지 않고 열별 행 구간으로 역방향 인덱스에 저장합니다.
+    """
+
+    def __init__(
+        self,
+        sheetnames: Optional[Iterable[str]] = None,
+        defined_names: Optional[Dict[Optional[str], Dict[str, List[Reference]]]] = None,
+    ):
+        if not FORMULAS_AVAILABLE:
+            raise ImportError(
+                "formulas library is required. Install with: pip install formulas"
+            )
+
+        self.inputs: Dict[str, Dict[str, Any]] = {}
+        self.errors: Dict[CellKey, str] = {}
+        self.circular: Set[CellKey] = set()
+        self.evaluations = 0
+
+        self._cells: Dict[CellKey, Any] = {}
+        self._references: Dict[CellKey, List[Reference]] = {}
+        self._values: Dict[CellKey, Any] = {}
+        self._extents: Dict[str, List[int]] = {}
+        self._sheet_lookup: Dict[str, str] = {}
+        self._defined_names = defined_names or {}
+        self._names_by_sheet: Dict[str, Dict[str, List[Reference]]] = {}
+
+        # 역방향 참조 인덱스: 좁은 범위는 (시트, 열)별, 넓은 범위는 시트별
+        self._watchers: Dict[Tuple[str, int], Dict[CellKey, List[Tuple[int, int]]]] = (
+            defaultdict(dict)
+        )
+        self._wide_watchers: Dict[str, Dict[CellKey, List[Reference]]] = defaultdict(
+            dict
+        )
+
+        for sheet in sheetnames or ():
+            self._add_sheet(sheet)
+
+    @classmethod
+    def from_context(
+        cls,
+        context: Dict[str, Dict[str, Any]],
+        defined_names: Optional[Dict[Optional[str], Dict[str, List[Reference]]]] = None,
+    ) -> "IncrementalFormulaModel":
+        """{시트: {주소: 값 또는 "=수식"}} 컨텍스트로 모델 생성"""
+        model = cls(context.keys(), defined_names)
+        for sheet, cells in context.items():
+            for address, value in cells.items():
+                model._store(sheet, address, value)
+        return model
+
+    # 조회
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def value(self, sheet: str, address: str) -> Any:
+        """셀의 현재 값 (필요하면 선행 셀부터 계산)"""
+        return to_python_value(self._value(self._key(sheet, address)))
+
+    def error(self, sheet: str, address: str) -> Optional[str]:
+        """수식 파싱/계산 오류 메시지 (없으면 None)"""
+        return self.errors.get(self._key(sheet, address))
+
+    def is_formula(self, sheet: str, address: str) -> bool:
+        return self._key(sheet, address) in self._references
+
+    def is_circular(self, sheet: str, address: str) -> bool:
+        """셀이 순환 참조에 포함되는지 (종속 셀을 따라가 자기 자신에 도달하는지)"""
+        key = self._key(sheet, address)
+        if key not in self._references:
+            return False
+        return key in self._transitive_dependents([key], include_seeds=False)
+
+    def dependents(self, sheet: str, address: str) -> List[str]:
+        """셀이 바뀌면 다시 계산되는 전이 종속 셀 목록"""
+        key = self._key(sheet, address)
+        dirty = self._transitive_dependents([key], include_seeds=False)
+        return sorted(format_key(*cell) for cell in dirty)
+
+    # 변경
+    def set_cell(self, sheet: str, address: str, value: Any) -> Set[CellKey]:
+        """셀 하나 변경 후 영향받는 셀만 재계산"""
+        return self.set_cells([(sheet, address, value)])
+
+    def set_cells(self, changes: Iterable[Tuple[str, str, Any]]) -> Set[CellKey]:
+        """여러 셀 변경 후 변경 셀과 전이 종속 셀만 재계산
+
+        Returns:
+            다시 계산 대상이 된 셀 키 집합
+        """
+        dirty = self.apply_changes(changes)
+        for key in dirty:
+            if key in self._references:
+                self._value(key)
+        return dirty
+
+    def preview(self, sheet: str, address: str, value: Any) -> Dict[str, Any]:
+        """변경을 커밋하지 않고 셀 값을 미리 계산
+
+        종속 셀 캐시만 무효화했다가 원래 값으로 되돌리므로, 되돌린 뒤의 종속 셀도
+        다음 조회 때 필요한 만큼만 다시 계산됩니다.
+        """
+        key = self._key(sheet, address)
+        previous = self._cells.get(key)
+        self.apply_changes([(sheet, address, value)])
+        try:
+            return {
+                "value": self.value(sheet, address),
+                "error": self.errors.get(key),
+                "circular": self.is_circular(sheet, address),
+            }
+        finally:
+            self.apply_changes([(sheet, address, previous)])
+
+    def apply_changes(self, changes: Iterable[Tuple[str, str, Any]]) -> Set[CellKey]:
+        """원본 값 갱신 및 더티 셀 무효화 (재계산은 하지 않음)"""
+        changes = list(changes)
+        # 잘못된 주소가 있으면 아무것도 바꾸기 전에 거부
+        for _, address, _ in changes:
+            self.parse_address(address)
+        seeds = [
+            self._store(sheet, address, value) for sheet, address, value in changes
+        ]
+        dirty = self._transitive_dependents(seeds, include_seeds=True)
+        for key in dirty:
+            self._values.pop(key, None)
+            self.circular.discard(key)
+        return dirty
+
+    def _store(self, sheet: str, address: str, value: Any) -> CellKey:
+        """셀 원본 값 저장 및 역방향 참조 인덱스 갱신"""
+        key = self._key(sheet, address)
+        sheet = key[0]
+        if key in self._references:
+            self._unwatch(key)
+        self.errors.pop(key, None)
+
+        cells = self.inputs.setdefault(sheet, {})
+        if value is None or value == "":
+            self._cells.pop(key, None)
+            cells.pop(address.upper(), None)
+            return key
+
+        self._cells[key] = value
+        cells[address.upper()] = value
+        extent = self._extents[sheet]
+        extent[0] = max(extent[0], key[1])
+        extent[1] = max(extent[1], key[2])
+
+        if isinstance(value, str) and value.startswith("="):
+            references = parse_references(
+                value, sheet, self._sheet_lookup, self._names_for(sheet)
+            )
+            self._watch(key, references)
+        return key
+
+    # 역방향 참조 인덱스
+    def _watch(self, key: CellKey, references: List[Reference]):
+        self._references[key] = references
+        for reference in references:
+            sheet, row1, col1, row2, col2 = reference
+            if col2 - col1 < NARROW_RANGE_COLUMNS:
+                for column in range(col1, col2 + 1):
+                    self._watchers[(sheet, column)].setdefault(key, []).append(
+                        (row1, row2)
+                    )
+            else:
+                self._wide_watchers[sheet].setdefault(key, []).append(reference)
+
+    def _unwatch(self, key: CellKey):
+        for reference in self._references.pop(key):
+            sheet, _, col1, _, col2 = reference
+            if col2 - col1 < NARROW_RANGE_COLUMNS:
+                for column in range(col1, col2 + 1):
+                    self._watchers[(sheet, column)].pop(key, None)
+            else:
+                self._wide_watchers[sheet].pop(key, None)
+
+    def direct_dependents(self, key: CellKey) -> Iterable[CellKey]:
+        """셀을 직접 참조하는 수식 셀"""
+        sheet, row, column = key
+        for dependent, spans in self._watchers.get((sheet, column), {}).items():
+            if any(row1 <= row <= row2 for row1, row2 in spans):
+                yield dependent
+        for dependent, references in self._wide_watchers.get(sheet, {}).items():
+            if any(
+                r1 <= row <= r2 and c1 <= column <= c2
+                for _, r1, c1, r2, c2 in references
+            ):
+                yield dependent
+
+    def _transitive_dependents(
+        self, seeds: Iterable[CellKey], include_seeds: bool
+    ) -> Set[CellKey]:
+        """BFS로 전이 종속 셀 수집"""
+        seeds = list(seeds)
+        visited: Set[CellKey] = set(seeds) if include_seeds else set()
+        queue = deque(seeds)
+        while queue:
+            for dependent in self.direct_dependents(queue.popleft()):
+                if dependent not in visited:
+                    visited.add(dependent)
+                    queue.append(dependent)
+        return visited
+
+    # 계산
+    def _value(self, key: CellKey) -> Any:
+        """셀 값 계산 - 재귀 없이 선행 수식 셀부터 반복 스택으로 평가"""
+        if key in self._values:
+            return self._values[key]
+        if key not in self._references:
+            return self._cells.get(key, schedula.EMPTY)
+
+        stack = [key]
+        expanding: Set[CellKey] = set()
+        while stack:
+            current = stack[-1]
+            if current in self._values:
+                stack.pop()
+                continue
+            if current in expanding:
+                self._values[current] = self._compute(current)
+                expanding.discard(current)
+                stack.pop()
+                continue
+
+            expanding.add(current)
+            for precedent in self._formula_precedents(current):
+                if precedent in self._values:
+                    continue
+                if precedent in expanding:
+                    # 스택에서 펼치는 중인 셀 = 현재 경로 → 순환
+                    path = [cell for cell in stack if cell in expanding]
+                    self.circular.update(path[path.index(precedent) :])
+                    continue
+                stack.append(precedent)
+
+        return self._values[key]
+
+    def _formula_precedents(self, key: CellKey) -> Iterable[CellKey]:
+        """참조 범위 안의 수식 셀 (사용 영역으로 잘라서 순회)"""
+        for sheet, row1, col1, row2, col2 in self._references.get(key, ()):
+            extent = self._extents.get(sheet)
+            if not extent:
+                continue
+            for row in range(row1, min(row2, extent[0]) + 1):
+                for column in range(col1, min(col2, extent[1]) + 1):
+                    precedent = (sheet, row, column)
+                    if precedent in self._references:
+                        yield precedent
+
+    def _compute(self, key: CellKey) -> Any:
+        """수식 셀 하나 계산 (선행 셀 값은 이미 캐시되어 있음)"""
+        self.evaluations += 1
+        if key in self.circular:
+            return 0
+
+        sheet = key[0]
+        try:
+            function, inputs = compile_formula(self._cells[key])
+            arguments = [self._input_array(sheet, reference) for reference in inputs]
+            return _to_internal(function(*arguments))
+        except Exception as e:
+            self.errors[key] = str(e)
+            return Error.errors["#VALUE!"]
+
+    def _input_array(self, sheet: str, reference: str) -> Any:
+        """formulas 입력 참조 문자열을 2차원 값 배열로 변환"""
+        references = parse_references(
+            reference, sheet, self._sheet_lookup, self._names_for(sheet)
+        )
+        if len(references) != 1:
+            return np.array([[Error.errors["#NAME?"]]], dtype=object)
+
+        target, row1, col1, row2, col2 = references[0]
+        extent = self._extents.get(target)
+        if not extent:
+            return np.array([[Error.errors["#REF!"]]], dtype=object)
+        row2 = max(row1, min(row2, extent[0]))
+        col2 = max(col1, min(col2, extent[1]))
+
+        array = np.empty((row2 - row1 + 1, col2 - col1 + 1), dtype=object)
+        for row in range(row1, row2 + 1):
+            for column in range(col1, col2 + 1):
+                array[row - row1, column - col1] = self._cell_value(
+                    (target, row, column)
+                )
+        return array
+
+    def _cell_value(self, key: CellKey) -> Any:
+        if key in self._references:
+            return self._values.get(key, 0)
+        value = self._cells.get(key)
+        return schedula.EMPTY if value is None else value
+
+    # 내부 유틸
+    @staticmethod
+    def parse_address(address: str) -> Tuple[int, int]:
+        """셀 주소 -> (행, 열)
+
+        Raises:
+            ValueError: 단일 셀 주소가 아니거나 시트 범위를 벗어난 경우
+        """
+        match = CELL_ADDRESS_PATTERN.match(str(address).strip())
+        if match:
+            row = int(match.group(2))
+            column = ExcelUtils.column_to_number(match.group(1).upper())
+            if 1 <= row <= MAX_ROW and column <= MAX_COLUMN:
+                return row, column
+        raise ValueError(f"Invalid cell address: {address}")
+
+    def _key(self, sheet: str, address: str) -> CellKey:
+        row, column = self.parse_address(address)
+        if sheet.lower() not in self._sheet_lookup:
+            self._add_sheet(sheet)
+        return (self._sheet_lookup[sheet.lower()], row, column)
+
+    def _add_sheet(self, sheet: str):
+        self._sheet_lookup[sheet.lower()] = sheet
+        self._extents.setdefault(sheet, [0, 0])
+        self.inputs.setdefault(sheet, {})
+
+    def _names_for(self, sheet: str) -> Dict[str, List[Reference]]:
+        """시트에서 보이는 이름 정의 (시트 범위 이름이 통합 문서 이름보다 우선)"""
+        names = self._names_by_sheet.get(sheet)
+        if names is None:
+            names = {
+                **self._defined_names.get(None, {}),
+                **self._defined_names.get(sheet, {}),
+            }
+            self._names_by_sheet[sheet] = names
+        return names
+
+
+class SessionModelCache:
+    """세션별 수식 모델 LRU - 최대 개수를 넘으면 가장 오래 사용하지 않은 모델 제거"""
+
+    def __init__(self, max_sessions: int = 32):
+        self.max_sessions = max(1, max_sessions)
+        self._models: "OrderedDict[str, IncrementalFormulaModel]" = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._models
+
+    def get(self, session_id: str) -> Optional[IncrementalFormulaModel]:
+        model = self._models.get(session_id)
+        if model is not None:
+            self._models.move_to_end(session_id)
+        return model
+
+    def put(
+        self, session_id: str, model: IncrementalFormulaModel
+    ) -> IncrementalFormulaModel:
+        self._models[session_id] = model
+        self._models.move_to_end(session_id)
+        while len(self._models) > self.max_sessions:
+            evicted, _ = self._models.popitem(last=False)
+            self.evictions += 1
+            logger.debug(f"수식 세션 모델 제거 (LRU): {evicted}")
+        return model
+
+    def get_or_create(self, session_id: str) -> IncrementalFormulaModel:
+        model = self.get(session_id)
+        if model is None:
+            model = self.put(session_id, IncrementalFormulaModel())
+        return model
+
+    def values(self) -> List[IncrementalFormulaModel]:
+        return list(self._models.values())
+
+    def discard(self, session_id: str):
+        self._models.pop(session_id, None)
+
+    def clear(self):
+        self._models.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "sessions": len(self._models),
+            "max_sessions": self.max_sessions,
+            "evictions": self.evictions,
+            "cells": sum(len(model) for model in self.values()),
+            "compiled_formulas": compile_formula.cache_info().currsize,
+        }
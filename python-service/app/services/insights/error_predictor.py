@@ -8,8 +8,10 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 from app.core.interfaces import IErrorPredictor, RiskLevel
+from app.core.excel_utils import ExcelUtils
 from app.services.context import WorkbookContext, CellInfo
 from app.services.detection.integrated_error_detector import IntegratedErrorDetector
+from app.services.detection.dependency_graph import DependencyGraph
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,8 @@ class ErrorPredictor(IErrorPredictor):
         self.error_detector = IntegratedErrorDetector()
         self.prediction_cache: Dict[str, List[ErrorPrediction]] = {}
         self.error_patterns = self._init_error_patterns()
+        # 예측 호출 동안 컨텍스트별 의존성 그래프 재사용 {id(context): graph}
+        self._dependency_graphs: Dict[int, DependencyGraph] = {}
 
     def _init_error_patterns(self) -> Dict[str, Dict[str, Any]]:
         """오류 패턴 초기화"""
@@ -114,6 +118,24 @@ class ErrorPredictor(IErrorPredictor):
         except Exception as e:
             logger.error(f"오류 예측 실패: {str(e)}")
             return []
+        finally:
+            self._dependency_graphs.pop(id(context), None)
+
+    def _get_dependency_graph(self, context: WorkbookContext) -> DependencyGraph:
+        """컨텍스트 수식으로 의존성 그래프 생성 (예측 호출 동안 한 번만)"""
+        graph = self._dependency_graphs.get(id(context))
+        if graph is None:
+            graph = DependencyGraph.from_formulas(
+                (
+                    (sheet_name, cell.address, cell.formula)
+                    for sheet_name, sheet in context.sheets.items()
+                    for cell in sheet.cells.values()
+                    if cell.formula
+                ),
+                context.sheets.keys(),
+            )
+            self._dependency_graphs[id(context)] = graph
+        return graph
 
     async def _find_affected_cells(
         self, context: WorkbookContext, changed_cells: List[str]
@@ -129,8 +151,12 @@ class ErrorPredictor(IErrorPredictor):
                 sheet_name = "Sheet1"
                 cell_address = cell_ref
 
-            # 직접 의존 셀들
+            # 직접/간접 의존 셀들 (컨텍스트 정보 + 수식 의존성 그래프의 범위 참조)
             dependents = context.get_dependent_cells(sheet_name, cell_address)
+            row, column = ExcelUtils.cell_to_row_col(cell_address)
+            dependents |= self._get_dependency_graph(context).transitive_dependents(
+                sheet_name, row, column
+            )
             for dep in dependents:
                 if "!" in dep:
                     dep_sheet, dep_addr = dep.split("!", 1)
@@ -144,46 +170,19 @@ class ErrorPredictor(IErrorPredictor):
         self, cell: CellInfo, context: WorkbookContext
     ) -> float:
         """순환 참조 위험도 확인"""
-        if not cell.formula or not cell.dependencies:
+        if not cell.formula:
             return 0.0
 
-        # 재귀적으로 의존성 체크
-        visited = set()
-        risk = 0.0
-
-        def check_circular(current_ref: str, path: List[str], depth: int = 0) -> float:
-            if depth > 10:  # 깊이 제한
-                return 0.1
+        graph = self._get_dependency_graph(context)
+        row, column = ExcelUtils.cell_to_row_col(cell.address)
+        if graph.is_in_cycle(cell.sheet, row, column):
+            return 0.9
 
-            if current_ref in visited:
-                return 0.0
-            visited.add(current_ref)
-
-            if current_ref == f"{cell.sheet}!{cell.address}" and len(path) > 0:
-                # 순환 참조 발견
-                return 0.9
-
-            # 현재 셀의 의존성 확인
-            if "!" in current_ref:
-                sheet, addr = current_ref.split("!", 1)
-                dep_cell = context.get_cell(sheet, addr)
-            else:
-                dep_cell = context.get_cell(cell.sheet, current_ref)
-
-            if dep_cell and dep_cell.dependencies:
-                max_risk = 0.0
-                for dep in dep_cell.dependencies:
-                    sub_risk = check_circular(dep, path + [current_ref], depth + 1)
-                    max_risk = max(max_risk, sub_risk)
-                return max_risk * 0.8  # 거리에 따라 감소
-
-            return 0.0
-
-        # 각 의존성에 대해 체크
-        for dep in cell.dependencies:
-            risk = max(risk, check_circular(dep, [f"{cell.sheet}!{cell.address}"]))
+        # 순환은 아니지만 의존성 체인이 매우 깊으면 낮은 위험도
+        if graph.depth(cell.sheet, row, column) > 10:
+            return 0.1
 
-        return min(risk, 0.9)
+        return 0.0
 
     async def _check_div_zero_risk(
         self, cell: CellInfo, context: WorkbookContext
@@ -9,6 +9,9 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 from enum import Enum
 
+from app.core.progress_throttle import progress_throttle
+from app.services.websocket_manager import websocket_manager
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +38,8 @@ class ProgressTracker:
         self.active_tasks: Dict[str, Dict[str, Any]] = {}
         self.completed_tasks: Dict[str, Dict[str, Any]] = {}
         self.websocket_connections: Dict[str, Any] = {}
+        # 알림 태스크 참조 유지 (가비지 컬렉션 방지)
+        self._notify_tasks: set = set()
 
     def create_task(
         self, task_id: str, filename: str, user_id: Optional[str] = None
@@ -118,7 +123,15 @@ class ProgressTracker:
         if progress_detail:
             task["current_detail"] = progress_detail
 
-        logger.info(f"진행률 업데이트: {task_id} - {stage.value} ({stage_progress}%)")
+        logger.debug(f"진행률 업데이트: {task_id} - {stage.value} ({stage_progress}%)")
+        snapshot = dict(task)
+        self._schedule_notify(
+            progress_throttle.submit(
+                f"task:{task_id}",
+                stage_progress,
+                lambda: websocket_manager.send_progress_update(task_id, snapshot),
+            )
+        )
 
         return task
 
@@ -148,6 +161,7 @@ class ProgressTracker:
         del self.active_tasks[task_id]
 
         logger.info(f"작업 완료: {task_id}")
+        self._schedule_notify(self._notify_finished(task_id, task, failed=False))
 
         return task
 
@@ -177,9 +191,36 @@ class ProgressTracker:
         del self.active_tasks[task_id]
 
         logger.error(f"작업 실패: {task_id} - {error_message}")
+        self._schedule_notify(self._notify_finished(task_id, task, failed=True))
 
         return task
 
+    def _schedule_notify(self, coro):
+        """WebSocket 알림 예약 (이벤트 루프 밖에서 호출되면 알림 생략)"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            coro.close()
+            return
+        task = loop.create_task(self._run_notify(coro))
+        self._notify_tasks.add(task)
+        task.add_done_callback(self._notify_tasks.discard)
+
+    @staticmethod
+    async def _run_notify(coro):
+        try:
+            await coro
+        except Exception as e:
+            logger.warning(f"진행률 알림 실패: {e}")
+
+    async def _notify_finished(self, task_id: str, task: Dict[str, Any], failed: bool):
+        """완료/실패 알림은 속도 제한 없이 항상 전송"""
+        progress_throttle.discard(f"task:{task_id}")
+        if failed:
+            await websocket_manager.send_task_error(task_id, dict(task))
+        else:
+            await websocket_manager.send_task_completion(task_id, dict(task))
+
     def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
         """작업 상태 조회"""
 
@@ -3,14 +3,153 @@ Rate Limiter Service
 속도 제한 서비스 - Redis 기반 분산 환경 지원
 """
 
+from array import array
+from collections import OrderedDict
+import math
 import time
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 from enum import Enum
+from app.core.config import settings
 from app.core.integrated_cache import integrated_cache
+from app.core.redis_l2 import redis_l2_cache
 
 logger = logging.getLogger(__name__)
 
+# 슬라이딩 윈도우 전략이 확인하는 창: (제한 이름, 기간(초), 기본 제한)
+SLIDING_WINDOWS = (
+    ("requests_per_minute", 60, 60),
+    ("requests_per_hour", 3600, 1000),
+)
+
+GCRA_KEY_PREFIX = "excel_unified:rate_limit:gcra:"
+
+# GCRA(Generic Cell Rate Algorithm) - 창마다 이론적 도착 시각(TAT) 하나만 저장
+# KEYS: 창별 키, ARGV: 가중치, (기간 ms, 제한) 쌍
+# 모든 창이 허용할 때만 TAT를 갱신 (한 창이라도 거부하면 아무것도 소비하지 않음)
+# 반환: {허용 여부, 결정한 창 인덱스(0부터), 남은 요청 수, 재시도 대기 ms}
+GCRA_LUA_SCRIPT = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local weight = tonumber(ARGV[1])
+local new_tats = {}
+local min_remaining = nil
+local min_index = 0
+
+for i, key in ipairs(KEYS) do
+    local period = tonumber(ARGV[i * 2])
+    local limit = tonumber(ARGV[i * 2 + 1])
+    local interval = period / limit
+    local tat = tonumber(redis.call("GET", key) or now)
+    if tat < now then
+        tat = now
+    end
+    local new_tat = tat + interval * weight
+    local allow_at = new_tat - period
+    if allow_at > now then
+        return {0, i - 1, 0, math.ceil(allow_at - now)}
+    end
+    new_tats[i] = new_tat
+    local remaining = math.floor((now - allow_at) / interval)
+    if min_remaining == nil or remaining < min_remaining then
+        min_remaining = remaining
+        min_index = i - 1
+    end
+end
+
+for i, key in ipairs(KEYS) do
+    local period = tonumber(ARGV[i * 2])
+    redis.call("SET", key, new_tats[i], "PX", math.ceil(new_tats[i] - now) + 1000)
+end
+return {1, min_index, min_remaining, 0}
+"""
+
+
+class SlidingWindowRing:
+    """고정 크기 링 버퍼 슬라이딩 윈도우 (최근 limit개 요청 시각만 보관)
+
+    가장 오래된 칸이 기간 안에 있으면 창이 가득 찬 것이므로 확인이 O(가중치)입니다.
+    """
+
+    __slots__ = ("period", "slots", "head")
+
+    def __init__(self, period: float, limit: int):
+        self.period = period
+        self.slots = array("d", [float("-inf")]) * max(1, int(limit))
+        self.head = 0  # 가장 오래된 요청 칸
+
+    def retry_after(self, now: float, weight: int) -> float:
+        """weight만큼 요청하려면 기다려야 하는 시간 (0이면 허용)"""
+        if weight > len(self.slots):
+            return self.period
+        # weight번째로 오래된 요청이 창을 벗어나야 함
+        oldest = self.slots[(self.head + weight - 1) % len(self.slots)]
+        return max(0.0, oldest + self.period - now)
+
+    def remaining(self, now: float) -> int:
+        """창 안에서 더 받을 수 있는 요청 수 (head부터 시각순이므로 이진 탐색)"""
+        size = len(self.slots)
+        window_start = now - self.period
+        low, high = 0, size
+        while low < high:
+            mid = (low + high) // 2
+            if self.slots[(self.head + mid) % size] <= window_start:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def record(self, now: float, weight: int):
+        size = len(self.slots)
+        for _ in range(weight):
+            self.slots[self.head] = now
+            self.head = (self.head + 1) % size
+
+
+class LocalSlidingWindows:
+    """Redis를 쓸 수 없을 때의 프로세스 내 슬라이딩 윈도우 (식별자 수는 LRU로 제한)"""
+
+    def __init__(self, max_identifiers: int):
+        self.max_identifiers = max_identifiers
+        self._rings: "OrderedDict[str, Dict[Tuple[int, int], SlidingWindowRing]]" = (
+            OrderedDict()
+        )
+
+    def check(
+        self,
+        identifier: str,
+        windows: List[Tuple[int, int]],
+        weight: int,
+        now: float,
+    ) -> Tuple[bool, int, int, float]:
+        rings = self._rings.get(identifier)
+        if rings is None:
+            rings = self._rings[identifier] = {}
+            while len(self._rings) > self.max_identifiers:
+                self._rings.popitem(last=False)
+        else:
+            self._rings.move_to_end(identifier)
+
+        window_rings = []
+        for index, (period, limit) in enumerate(windows):
+            ring = rings.get((period, limit))
+            if ring is None:
+                ring = rings[(period, limit)] = SlidingWindowRing(period, limit)
+            wait = ring.retry_after(now, weight)
+            if wait > 0:
+                return False, index, 0, wait
+            window_rings.append(ring)
+
+        remaining = []
+        for ring in window_rings:
+            ring.record(now, weight)
+            remaining.append(ring.remaining(now))
+        index = min(range(len(remaining)), key=remaining.__getitem__)
+        return True, index, remaining[index], 0.0
+
+    def reset(self, identifier: str):
+        self._rings.pop(identifier, None)
+
 
 class RateLimitStrategy(Enum):
     """Rate Limiting 전략"""
@@ -88,6 +227,11 @@ class RateLimiter:
     def __init__(self, strategy: RateLimitStrategy = RateLimitStrategy.SLIDING_WINDOW):
         self.strategy = strategy
         self.cache = integrated_cache
+        self.redis_cache = redis_l2_cache
+        self.local_windows = LocalSlidingWindows(
+            settings.RATE_LIMIT_LOCAL_MAX_IDENTIFIERS
+        )
+        self._gcra_script = None
 
     async def check_rate_limit(
         self,
@@ -139,59 +283,67 @@ class RateLimiter:
     async def _sliding_window_check(
         self, identifier: str, limits: Dict[str, int], weight: int
     ) -> Tuple[bool, Optional[Dict[str, Any]]]:
-        """슬라이딩 윈도우 방식 구현"""
-        current_time = time.time()
+        """슬라이딩 윈도우 방식 구현 (분/시간 창을 함께 확인)
 
-        # 분당 제한 확인
-        minute_key = f"rate_limit:sliding:{identifier}:minute"
-        minute_limit = limits.get("requests_per_minute", 60)
-
-        # 최근 1분간 요청 기록 가져오기
-        minute_data = await self.cache.get(minute_key) or []
-
-        # 1분 이전 기록 제거
-        minute_data = [t for t in minute_data if current_time - t < 60]
+        Redis가 있으면 GCRA Lua 스크립트로 왕복 1회에 원자적으로 확인하고,
+        없으면 프로세스 내 링 버퍼로 확인합니다.
+        """
+        windows = [
+            (period, limits.get(name, default))
+            for name, period, default in SLIDING_WINDOWS
+        ]
+        # 무제한(ADMIN) 창은 확인하지 않음
+        windows = [
+            (period, limit) for period, limit in windows if limit != float("inf")
+        ]
+        if not windows:
+            return True, None
 
-        # 가중치 적용한 요청 수 계산
-        weighted_count = sum(1 for _ in minute_data) * weight
+        result = await self._redis_gcra_check(identifier, windows, weight)
+        if result is None:
+            result = self.local_windows.check(identifier, windows, weight, time.time())
+        allowed, window_index, remaining, retry_after = result
 
-        if weighted_count >= minute_limit:
-            # 제한 초과
-            reset_time = min(minute_data) + 60 if minute_data else current_time + 60
+        current_time = time.time()
+        period, limit = windows[window_index]
+        if not allowed:
             return False, {
-                "limit": minute_limit,
+                "limit": limit,
                 "remaining": 0,
-                "reset_time": int(reset_time),
-                "retry_after": int(reset_time - current_time),
+                "reset_time": int(current_time + retry_after),
+                "retry_after": max(1, math.ceil(retry_after)),
             }
 
-        # 요청 기록 추가
-        minute_data.append(current_time)
-        await self.cache.set(minute_key, minute_data, ttl=70)  # 70초 보관
+        return True, {
+            "limit": limit,
+            "remaining": remaining,
+            "reset_time": int(current_time + period),
+        }
 
-        # 시간당 제한도 확인
-        hour_key = f"rate_limit:sliding:{identifier}:hour"
-        hour_limit = limits.get("requests_per_hour", 1000)
-        hour_data = await self.cache.get(hour_key) or []
-        hour_data = [t for t in hour_data if current_time - t < 3600]
+    async def _redis_gcra_check(
+        self, identifier: str, windows: List[Tuple[int, int]], weight: int
+    ) -> Optional[Tuple[bool, int, int, float]]:
+        """Redis GCRA 확인 (Redis를 쓸 수 없으면 None)"""
+        client = self.redis_cache.get_client()
+        if client is None:
+            return None
 
-        if len(hour_data) * weight >= hour_limit:
-            reset_time = min(hour_data) + 3600 if hour_data else current_time + 3600
-            return False, {
-                "limit": hour_limit,
-                "remaining": 0,
-                "reset_time": int(reset_time),
-                "retry_after": int(reset_time - current_time),
-            }
+        keys = [f"{GCRA_KEY_PREFIX}{identifier}:{period}" for period, _ in windows]
+        args = [weight]
+        for period, limit in windows:
+            args.extend([period * 1000, int(limit)])
 
-        hour_data.append(current_time)
-        await self.cache.set(hour_key, hour_data, ttl=3700)
+        try:
+            if self._gcra_script is None:
+                self._gcra_script = client.register_script(GCRA_LUA_SCRIPT)
+            allowed, window_index, remaining, retry_after_ms = await self._gcra_script(
+                keys=keys, args=args, client=client
+            )
+        except Exception as e:
+            self.redis_cache.mark_unavailable(e)
+            return None
 
-        return True, {
-            "limit": minute_limit,
-            "remaining": minute_limit - weighted_count,
-            "reset_time": int(current_time + 60),
-        }
+        return bool(allowed), int(window_index), int(remaining), retry_after_ms / 1000
 
     async def _fixed_window_check(
         self, identifier: str, limits: Dict[str, int], weight: int
@@ -335,12 +487,21 @@ class RateLimiter:
 
     async def reset_rate_limit(self, identifier: str):
         """특정 사용자의 rate limit 초기화"""
-        patterns = [f"rate_limit:*:{identifier}:*", f"rate_limit:*:{identifier}"]
+        self.local_windows.reset(identifier)
+
+        client = self.redis_cache.get_client()
+        if client is not None:
+            keys = [
+                f"{GCRA_KEY_PREFIX}{identifier}:{period}"
+                for _, period, _ in SLIDING_WINDOWS
+            ]
+            try:
+                await client.delete(*keys)
+            except Exception as e:
+                self.redis_cache.mark_unavailable(e)
 
-        for pattern in patterns:
-            # Redis에서 패턴 매칭으로 키 삭제
-            # 실제 구현 시 Redis SCAN 명령어 사용
-            pass
+        for strategy in ("fixed", "token", "leaky"):
+            await self.cache.clear_pattern(f"rate_limit:{strategy}:{identifier}")
 
         logger.info(f"Rate limit reset for: {identifier}")
 
@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 try:
-    import formulas
+    import formulas  # noqa: F401
 
     FORMULAS_AVAILABLE = True
 except ImportError:
@@ -21,6 +21,13 @@ except ImportError:
 import openpyxl
 from openpyxl.utils import get_column_letter
 
+from app.core.config import settings
+from app.services.detection.dependency_graph import collect_defined_names
+from app.services.incremental_formula_model import (
+    IncrementalFormulaModel,
+    SessionModelCache,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,28 +47,45 @@ class ValidationResult:
 
 
 class RealtimeFormulaValidator:
-    """실시간 Excel 수식 검증기"""
+    """실시간 Excel 수식 검증기
 
-    def __init__(self):
-        self.xl_model = None
-        self.context = {}
-        self.sheet_structures = {}
-        self.dependency_graph = {}
+    세션마다 컴파일된 수식 모델을 유지하고, 셀이 바뀌면 그 셀과 전이 종속 셀만
+    다시 계산합니다. 세션 모델 수는 LRU로 제한합니다.
+    """
 
+    DEFAULT_SESSION = "default"
+
+    def __init__(self):
         if not FORMULAS_AVAILABLE:
             raise ImportError(
                 "formulas library is required. Install with: pip install formulas"
             )
 
-    def initialize_from_openpyxl_workbook(self, workbook_path: str) -> bool:
-        """openpyxl 워크북으로부터 초기화"""
+        self.models = SessionModelCache(settings.FORMULA_SESSION_MODEL_LIMIT)
+        self.sheet_structures = {}
+
+    @property
+    def context(self) -> Dict[str, Dict[str, Any]]:
+        """기본 세션의 셀 원본 값 {시트: {주소: 값 또는 "=수식"}}"""
+        model = self.models.get(self.DEFAULT_SESSION)
+        return model.inputs if model is not None else {}
+
+    def get_model(self, session_id: str = DEFAULT_SESSION) -> IncrementalFormulaModel:
+        """세션 모델 조회 (없으면 빈 모델 생성)"""
+        return self.models.get_or_create(session_id)
+
+    def initialize_from_openpyxl_workbook(
+        self, workbook_path: str, session_id: str = DEFAULT_SESSION
+    ) -> bool:
+        """openpyxl 워크북으로부터 세션 모델 초기화"""
         try:
             wb = openpyxl.load_workbook(workbook_path, data_only=False)
+            context = {}
 
             # 모든 시트의 데이터 추출
             for sheet_name in wb.sheetnames:
                 ws = wb[sheet_name]
-                self.context[sheet_name] = {}
+                context[sheet_name] = {}
 
                 # 셀 데이터 추출
                 for row in ws.iter_rows():
@@ -70,9 +94,12 @@ class RealtimeFormulaValidator:
                             cell_addr = f"{get_column_letter(cell.column)}{cell.row}"
 
                             if cell.data_type == "f":  # 수식
-                                self.context[sheet_name][cell_addr] = f"={cell.value}"
+                                value = str(cell.value)
+                                context[sheet_name][cell_addr] = (
+                                    value if value.startswith("=") else f"={value}"
+                                )
                             else:  # 값
-                                self.context[sheet_name][cell_addr] = cell.value
+                                context[sheet_name][cell_addr] = cell.value
 
                 # 시트 구조 정보 저장
                 self.sheet_structures[sheet_name] = {
@@ -81,32 +108,46 @@ class RealtimeFormulaValidator:
                     "merged_cells": [str(range_) for range_ in ws.merged_cells.ranges],
                 }
 
-            # formulas 모델 초기화
-            self.xl_model = formulas.ExcelModel()
-            self.xl_model.loads(self.context)
+            # 세션 모델 생성 (수식은 처음 조회할 때 컴파일/계산)
+            self.models.put(
+                session_id,
+                IncrementalFormulaModel.from_context(
+                    context, collect_defined_names(wb)
+                ),
+            )
 
-            logger.info(f"Initialized validator with {len(self.context)} sheets")
+            logger.info(f"Initialized validator with {len(context)} sheets")
             return True
 
         except Exception as e:
             logger.error(f"Failed to initialize from workbook: {e}")
             return False
 
-    def set_context(self, sheet_name: str, cell_data: Dict[str, Any]):
-        """컨텍스트 수동 설정"""
-        if sheet_name not in self.context:
-            self.context[sheet_name] = {}
-
-        self.context[sheet_name].update(cell_data)
-
-        # formulas 모델 재생성
-        self.xl_model = formulas.ExcelModel()
-        self.xl_model.loads({sheet_name: self.context[sheet_name]})
+    def set_context(
+        self,
+        sheet_name: str,
+        cell_data: Dict[str, Any],
+        session_id: str = DEFAULT_SESSION,
+    ):
+        """컨텍스트 수동 설정 - 바뀐 셀과 종속 셀만 다시 계산"""
+        model = self.get_model(session_id)
+        current = model.inputs.get(sheet_name, {})
+        changes = [
+            (sheet_name, address, value)
+            for address, value in cell_data.items()
+            if current.get(address.upper()) != value
+        ]
+        if changes:
+            model.set_cells(changes)
 
     def validate_formula_realtime(
-        self, formula: str, cell_address: str, sheet_name: str = "Sheet1"
+        self,
+        formula: str,
+        cell_address: str,
+        sheet_name: str = "Sheet1",
+        session_id: str = DEFAULT_SESSION,
     ) -> ValidationResult:
-        """실시간 수식 검증"""
+        """실시간 수식 검증 - 세션 모델에 커밋하지 않고 미리 계산"""
         start_time = datetime.now()
 
         try:
@@ -114,17 +155,16 @@ class RealtimeFormulaValidator:
             if not formula.startswith("="):
                 formula = f"={formula}"
 
-            # 임시 컨텍스트 생성
-            temp_context = self.context.get(sheet_name, {}).copy()
-            temp_context[cell_address] = formula
-
-            # 새 모델로 계산
-            test_model = formulas.ExcelModel()
-            test_model.loads({sheet_name: temp_context})
-            test_model.calculate()
+            preview = self.get_model(session_id).preview(
+                sheet_name, cell_address, formula
+            )
+            if preview["error"]:
+                raise ValueError(preview["error"])
+            if preview["circular"]:
+                raise ValueError(f"Circular reference detected at {cell_address}")
 
             # 결과 추출
-            calculated_value = test_model[sheet_name].cells[cell_address].value
+            calculated_value = preview["value"]
 
             # 의존성 분석
             dependencies = self._extract_dependencies(formula)
@@ -158,38 +198,39 @@ class RealtimeFormulaValidator:
             )
 
     def batch_validate_changes(
-        self, changes: List[Dict]
+        self, changes: List[Dict], session_id: str = DEFAULT_SESSION
     ) -> Dict[str, ValidationResult]:
-        """변경사항 일괄 검증"""
+        """변경사항 일괄 검증 - 세션 모델에 적용해 계산한 뒤 원래 값으로 되돌림"""
         results = {}
+        model = self.get_model(session_id)
 
-        # 임시 컨텍스트 구성
-        temp_context = {}
-        for sheet_name in self.context:
-            temp_context[sheet_name] = self.context[sheet_name].copy()
-
-        # 모든 변경사항 적용
+        # 변경사항 구성 (되돌리기용 원래 값 보관)
+        edits = []
         for change in changes:
             sheet = change.get("sheet", "Sheet1")
             cell = change.get("cell")
             formula = change.get("formula") or change.get("newFormula")
             value = change.get("value") or change.get("newValue")
 
-            if sheet not in temp_context:
-                temp_context[sheet] = {}
-
             if formula:
-                temp_context[sheet][cell] = (
-                    f"={formula}" if not formula.startswith("=") else formula
-                )
-            elif value is not None:
-                temp_context[sheet][cell] = value
-
-        # 일괄 계산
+                value = f"={formula}" if not formula.startswith("=") else formula
+            elif value is None:
+                continue
+            try:
+                model.parse_address(cell)
+            except ValueError:
+                # 결과 생성 단계에서 해당 변경만 오류로 보고
+                continue
+            edits.append((sheet, cell, value))
+
+        originals = [
+            (sheet, cell, model.inputs.get(sheet, {}).get(cell.upper()))
+            for sheet, cell, _ in edits
+        ]
+
+        # 일괄 계산 (변경 셀과 종속 셀만 무효화)
         try:
-            batch_model = formulas.ExcelModel()
-            batch_model.loads(temp_context)
-            batch_model.calculate()
+            model.apply_changes(edits)
 
             # 각 변경사항에 대한 결과 생성
             for change in changes:
@@ -198,8 +239,11 @@ class RealtimeFormulaValidator:
                 change_id = f"{sheet}!{cell}"
 
                 try:
-                    calculated_value = batch_model[sheet].cells[cell].value
-                    formula = temp_context[sheet][cell]
+                    calculated_value = model.value(sheet, cell)
+                    error = model.error(sheet, cell)
+                    if error:
+                        raise ValueError(error)
+                    formula = model.inputs.get(sheet, {}).get(cell.upper())
 
                     results[change_id] = ValidationResult(
                         valid=True,
@@ -218,6 +262,8 @@ class RealtimeFormulaValidator:
         except Exception as e:
             # 전체 실패 시 개별 검증으로 폴백
             logger.warning(f"Batch validation failed, falling back to individual: {e}")
+            model.apply_changes(originals)
+            originals = []
             for change in changes:
                 sheet = change.get("sheet", "Sheet1")
                 cell = change.get("cell")
@@ -226,16 +272,24 @@ class RealtimeFormulaValidator:
 
                 if formula:
                     results[change_id] = self.validate_formula_realtime(
-                        formula, cell, sheet
+                        formula, cell, sheet, session_id
                     )
 
+        finally:
+            if originals:
+                model.apply_changes(originals)
+
         return results
 
     def simulate_error_conditions(
-        self, formula: str, sheet_name: str = "Sheet1"
+        self,
+        formula: str,
+        sheet_name: str = "Sheet1",
+        session_id: str = DEFAULT_SESSION,
     ) -> List[Dict]:
         """오류 조건 시뮬레이션"""
         errors = []
+        context = self.get_model(session_id).inputs
 
         try:
             # 다양한 오류 시나리오 테스트
@@ -245,7 +299,7 @@ class RealtimeFormulaValidator:
                     "type": "division_by_zero",
                     "test": lambda f: "/0" in f
                     or "B2" in f
-                    and self.context.get(sheet_name, {}).get("B2") == 0,
+                    and context.get(sheet_name, {}).get("B2") == 0,
                 },
                 # Circular reference
                 {
@@ -287,6 +341,14 @@ class RealtimeFormulaValidator:
 
         return errors
 
+    def reset_session(self, session_id: str = DEFAULT_SESSION):
+        """세션 모델 제거"""
+        self.models.discard(session_id)
+
+    def get_session_stats(self) -> Dict[str, Any]:
+        """세션 모델 캐시 통계"""
+        return self.models.stats()
+
     def _extract_dependencies(self, formula: str) -> List[str]:
         """수식의 의존성 추출"""
         dependencies = []
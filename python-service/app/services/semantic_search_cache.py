@@ -0,0 +1,168 @@
+"""
+Semantic Search Cache
+질의 임베딩 유사도 기반 검색 결과 캐시 (프로세스 내)
+
+같은 질의(공백/대소문자 정규화)는 임베딩 없이 바로, 표현만 다른 질의는
+임베딩이 SEARCH_CACHE_MAX_DISTANCE 이내인 캐시 항목의 결과를 재사용.
+검색 조건(문서 유형, limit, threshold)이 같은 항목끼리만 비교함
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.services.vector_index import InMemoryVectorIndex
+
+logger = logging.getLogger(__name__)
+
+SearchScope = Tuple[str, int, float]
+
+
+class _CacheEntry:
+    __slots__ = ("key", "scope", "results", "expires_at")
+
+    def __init__(self, key: str, scope: SearchScope, results, expires_at: float):
+        self.key = key
+        self.scope = scope
+        self.results = results
+        self.expires_at = expires_at
+
+
+class SemanticSearchCache:
+    """질의 임베딩 최근접 이웃으로 찾는 검색 결과 캐시 (LRU + TTL)"""
+
+    def __init__(
+        self,
+        max_distance: Optional[float] = None,
+        ttl: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.max_distance = (
+            settings.SEARCH_CACHE_MAX_DISTANCE if max_distance is None else max_distance
+        )
+        self.ttl = ttl or settings.SEARCH_CACHE_TTL
+        self.max_entries = max_entries or settings.SEARCH_CACHE_MAX_ENTRIES
+        self._entries: "OrderedDict[Tuple[SearchScope, str], _CacheEntry]" = (
+            OrderedDict()
+        )
+        # 검색 조건별 질의 임베딩 인덱스
+        self._indexes: Dict[SearchScope, InMemoryVectorIndex] = {}
+        self.stats = {
+            "lookups": 0,
+            "exact_hits": 0,
+            "semantic_hits": 0,
+            "shared_hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "evicted": 0,
+        }
+
+    @staticmethod
+    def scope(
+        document_type: Optional[str], limit: int, threshold: float
+    ) -> SearchScope:
+        return (document_type or "", int(limit), float(threshold))
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        return " ".join(query.lower().split())
+
+    def get_exact(self, query: str, scope: SearchScope) -> Optional[List[Any]]:
+        """정규화한 질의가 같은 항목 (임베딩 전에 확인)"""
+        self.stats["lookups"] += 1
+        entry = self._live_entry((scope, self.normalize(query)))
+        if entry is None:
+            return None
+        self.stats["exact_hits"] += 1
+        return entry.results
+
+    def get_similar(
+        self, embedding: Sequence[float], scope: SearchScope
+    ) -> Optional[List[Any]]:
+        """질의 임베딩이 max_distance 이내인 가장 가까운 항목"""
+        index = self._indexes.get(scope)
+        hits = index.search(embedding, limit=1) if index is not None else []
+        if hits:
+            record, similarity = hits[0]
+            if 1 - similarity <= self.max_distance:
+                entry = self._live_entry((scope, record["document_id"]))
+                if entry is not None:
+                    self.stats["semantic_hits"] += 1
+                    return entry.results
+        self.stats["misses"] += 1
+        return None
+
+    def record_shared_hit(self) -> None:
+        """프로세스 캐시는 놓쳤지만 공유 저장소(search_cache 테이블)에서 찾음"""
+        self.stats["misses"] -= 1
+        self.stats["shared_hits"] += 1
+
+    def put(
+        self,
+        query: str,
+        embedding: Sequence[float],
+        scope: SearchScope,
+        results: List[Any],
+        ttl: Optional[int] = None,
+    ) -> None:
+        normalized = self.normalize(query)
+        key = (scope, normalized)
+        if key in self._entries:
+            self._remove(key)
+
+        index = self._indexes.get(scope)
+        if index is None:
+            index = self._indexes[scope] = InMemoryVectorIndex(initial_capacity=64)
+        index.add(normalized, "query", "", embedding)
+        expires_at = time.monotonic() + (ttl or self.ttl)
+        self._entries[key] = _CacheEntry(normalized, scope, results, expires_at)
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.stats["evicted"] += 1
+
+    def purge_expired(self) -> int:
+        """만료 항목 정리 (백그라운드 주기 작업에서 호출)"""
+        now = time.monotonic()
+        expired = [key for key, e in self._entries.items() if e.expires_at <= now]
+        for key in expired:
+            self._remove(key)
+        self.stats["expired"] += len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        """색인 문서가 바뀌면 결과가 달라지므로 전체 무효화"""
+        self._entries.clear()
+        self._indexes.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        hits = (
+            self.stats["exact_hits"]
+            + self.stats["semantic_hits"]
+            + self.stats["shared_hits"]
+        )
+        lookups = self.stats["lookups"]
+        return {
+            **self.stats,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "max_distance": self.max_distance,
+        }
+
+    def _live_entry(self, key: Tuple[SearchScope, str]) -> Optional[_CacheEntry]:
+        """만료된 항목은 읽기 경로에서 지우지 않고 없는 것으로만 취급"""
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _remove(self, key: Tuple[SearchScope, str]) -> None:
+        entry = self._entries.pop(key)
+        index = self._indexes.get(entry.scope)
+        if index is not None:
+            index.remove(entry.key)
+            if not len(index):
+                del self._indexes[entry.scope]
@@ -0,0 +1,290 @@
+"""
+Vector Index
+pgvector ANN 인덱스(HNSW/IVFFlat) 관리와 DB 없이 쓰는 프로세스 내 NumPy 인덱스
+
+임계값을 WHERE 절에 두면 인덱스를 쓸 수 없어 전체 테이블을 스캔하므로,
+검색은 항상 거리 순 정렬 + LIMIT으로 후보를 가져온 뒤 임계값으로 걸러냄
+"""
+
+import logging
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import text
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# pgvector hnsw.ef_search 허용 범위
+MAX_EF_SEARCH = 1000
+
+
+def to_vector_literal(embedding: Sequence[float]) -> str:
+    """pgvector 텍스트 표현 ("[0.1,0.2,...]")"""
+    return "[" + ",".join(repr(float(value)) for value in embedding) + "]"
+
+
+class PgVectorIndex:
+    """document_embeddings 테이블의 pgvector ANN 인덱스 관리"""
+
+    table = "document_embeddings"
+
+    def __init__(
+        self,
+        kind: str = "hnsw",
+        m: int = 16,
+        ef_construction: int = 64,
+        ef_search: int = 40,
+        lists: int = 100,
+        probes: int = 10,
+        overfetch: int = 4,
+    ):
+        if kind not in ("hnsw", "ivfflat"):
+            raise ValueError(f"지원하지 않는 벡터 인덱스 유형: {kind}")
+        self.kind = kind
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.lists = lists
+        self.probes = probes
+        self.overfetch = max(1, overfetch)
+
+    @classmethod
+    def from_settings(cls) -> "PgVectorIndex":
+        return cls(
+            kind=settings.VECTOR_INDEX_TYPE,
+            m=settings.VECTOR_HNSW_M,
+            ef_construction=settings.VECTOR_HNSW_EF_CONSTRUCTION,
+            ef_search=settings.VECTOR_HNSW_EF_SEARCH,
+            lists=settings.VECTOR_IVFFLAT_LISTS,
+            probes=settings.VECTOR_IVFFLAT_PROBES,
+            overfetch=settings.VECTOR_SEARCH_OVERFETCH,
+        )
+
+    @property
+    def index_name(self) -> str:
+        return f"{self.table}_embedding_{self.kind}_idx"
+
+    def create_index_sql(self) -> str:
+        """코사인 거리 연산자(<=>)용 인덱스 생성 DDL"""
+        if self.kind == "hnsw":
+            options = (
+                f"m = {int(self.m)}, ef_construction = {int(self.ef_construction)}"
+            )
+        else:
+            options = f"lists = {int(self.lists)}"
+        return (
+            f"CREATE INDEX IF NOT EXISTS {self.index_name} ON {self.table} "
+            f"USING {self.kind} (embedding vector_cosine_ops) WITH ({options})"
+        )
+
+    async def ensure_index(self, conn) -> None:
+        """
+        인덱스가 없으면 생성 (시작 시 한 번)
+
+        IVFFlat은 생성 시점의 데이터로 리스트 중심을 잡으므로
+        데이터가 어느 정도 쌓인 뒤 재생성하는 것이 좋음
+        """
+        await conn.execute(text(self.create_index_sql()))
+        await conn.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS {self.table}_document_type_idx "
+                f"ON {self.table} (document_type)"
+            )
+        )
+        logger.info(f"벡터 인덱스 확인 완료: {self.index_name}")
+
+    def fetch_limit(self, limit: int, filtered: bool) -> int:
+        """유형 필터는 인덱스 스캔 뒤에 적용되므로 그만큼 후보를 더 가져옴"""
+        return limit * self.overfetch if filtered else limit
+
+    async def configure_search(self, db, fetch_limit: int) -> None:
+        """현재 트랜잭션에만 적용되는 검색 파라미터 설정"""
+        if self.kind == "hnsw":
+            # ef_search보다 많은 후보는 반환되지 않으므로 LIMIT 이상으로 맞춤
+            ef_search = min(max(self.ef_search, fetch_limit), MAX_EF_SEARCH)
+            name, value = "hnsw.ef_search", ef_search
+        else:
+            name, value = "ivfflat.probes", self.probes
+        await db.execute(
+            text("SELECT set_config(:name, :value, true)"),
+            {"name": name, "value": str(value)},
+        )
+
+    def search_sql(self, filtered: bool) -> str:
+        """거리 순 정렬 + LIMIT (인덱스 스캔 가능한 형태)"""
+        where = "WHERE document_type = :document_type" if filtered else ""
+        return f"""
+        SELECT
+            id,
+            document_id,
+            document_type,
+            content,
+            document_metadata,
+            embedding <=> CAST(:embedding AS vector) AS distance
+        FROM {self.table}
+        {where}
+        ORDER BY embedding <=> CAST(:embedding AS vector)
+        LIMIT :limit
+        """
+
+
+class InMemoryVectorIndex:
+    """
+    프로세스 내 벡터 인덱스
+
+    행마다 L2 정규화한 float32 행렬을 두고 내적 한 번 + argpartition으로
+    top-k를 구함. 삭제는 마지막 행을 빈자리로 옮겨 행렬을 연속으로 유지
+    """
+
+    def __init__(self, initial_capacity: int = 1024):
+        initial_capacity = max(1, initial_capacity)
+        self._initial_capacity = initial_capacity
+        self._vectors: Optional[np.ndarray] = None
+        self._type_codes = np.zeros(initial_capacity, dtype=np.int32)
+        self._records: List[Dict[str, Any]] = []
+        self._type_ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, document_id: str) -> bool:
+        return any(record["document_id"] == document_id for record in self._records)
+
+    def add(
+        self,
+        document_id: str,
+        document_type: str,
+        content: str,
+        embedding: Sequence[float],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """문서 추가 후 레코드 ID 반환"""
+        vector = self._normalize(embedding)
+        row = len(self._records)
+        self._reserve(row + 1, vector.shape[0])
+        self._vectors[row] = vector
+        self._type_codes[row] = self._type_ids.setdefault(
+            document_type, len(self._type_ids)
+        )
+        record_id = str(uuid.uuid4())
+        self._records.append(
+            {
+                "id": record_id,
+                "document_id": document_id,
+                "document_type": document_type,
+                "content": content,
+                "metadata": metadata or {},
+            }
+        )
+        return record_id
+
+    def update(
+        self,
+        document_id: str,
+        content: str,
+        embedding: Sequence[float],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """같은 document_id의 모든 레코드 내용/벡터 교체"""
+        vector = self._normalize(embedding)
+        updated = False
+        for row, record in enumerate(self._records):
+            if record["document_id"] == document_id:
+                self._vectors[row] = vector
+                record["content"] = content
+                record["metadata"] = metadata or {}
+                updated = True
+        return updated
+
+    def remove(self, document_id: str) -> int:
+        """같은 document_id의 레코드를 모두 삭제하고 삭제 수 반환"""
+        removed = 0
+        row = 0
+        while row < len(self._records):
+            if self._records[row]["document_id"] != document_id:
+                row += 1
+                continue
+            last = len(self._records) - 1
+            if row != last:
+                self._vectors[row] = self._vectors[last]
+                self._type_codes[row] = self._type_codes[last]
+                self._records[row] = self._records[last]
+            self._records.pop()
+            removed += 1
+        return removed
+
+    def search(
+        self,
+        embedding: Sequence[float],
+        limit: int = 10,
+        threshold: Optional[float] = None,
+        document_type: Optional[str] = None,
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """코사인 유사도 상위 limit개 중 threshold를 넘는 (레코드, 유사도)"""
+        size = len(self._records)
+        if size == 0 or limit <= 0:
+            return []
+
+        rows = None
+        if document_type is not None:
+            code = self._type_ids.get(document_type)
+            if code is None:
+                return []
+            rows = np.flatnonzero(self._type_codes[:size] == code)
+            if rows.size == 0:
+                return []
+
+        matrix = self._vectors[:size] if rows is None else self._vectors[rows]
+        scores = matrix @ self._normalize(embedding)
+
+        if limit < scores.shape[0]:
+            top = np.argpartition(-scores, limit - 1)[:limit]
+        else:
+            top = np.arange(scores.shape[0])
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        hits = []
+        for position in top.tolist():
+            similarity = float(scores[position])
+            if threshold is not None and similarity <= threshold:
+                break
+            row = position if rows is None else int(rows[position])
+            hits.append((self._records[row], similarity))
+        return hits
+
+    def clear(self) -> None:
+        self._vectors = None
+        self._type_codes = np.zeros(self._initial_capacity, dtype=np.int32)
+        self._records.clear()
+        self._type_ids.clear()
+
+    def _reserve(self, size: int, dimension: int) -> None:
+        """행렬 용량을 두 배씩 늘림"""
+        if self._vectors is None:
+            self._vectors = np.zeros(
+                (self._type_codes.shape[0], dimension), dtype=np.float32
+            )
+        elif self._vectors.shape[1] != dimension:
+            raise ValueError(
+                f"임베딩 차원 불일치: {self._vectors.shape[1]} != {dimension}"
+            )
+        if size <= self._vectors.shape[0]:
+            return
+
+        count = len(self._records)
+        capacity = max(size, self._vectors.shape[0] * 2)
+        vectors = np.zeros((capacity, dimension), dtype=np.float32)
+        vectors[:count] = self._vectors[:count]
+        type_codes = np.zeros(capacity, dtype=np.int32)
+        type_codes[:count] = self._type_codes[:count]
+        self._vectors = vectors
+        self._type_codes = type_codes
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
@@ -5,13 +5,21 @@ Vector search service for semantic similarity
 from typing import List, Dict, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
+import asyncio
 import json
 import logging
-from datetime import datetime
 
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
 from app.services.embedding.embedding_factory import EmbeddingServiceFactory
 from app.models.embeddings import DocumentEmbedding
 from app.core.embedding_interfaces.embedding_interface import IEmbeddingService
+from app.services.semantic_search_cache import SearchScope, SemanticSearchCache
+from app.services.vector_index import (
+    InMemoryVectorIndex,
+    PgVectorIndex,
+    to_vector_literal,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +30,17 @@ class VectorSearchService:
     def __init__(self):
         """서비스 초기화"""
         self._embedding_service: Optional[IEmbeddingService] = None
+        self.pg_index = PgVectorIndex.from_settings()
+        # DB 없이 실행하거나 VECTOR_SEARCH_BACKEND=local일 때 사용
+        self.local_index = InMemoryVectorIndex()
+        # 질의 임베딩 유사도로 찾는 결과 캐시 (+ search_cache 테이블 공유 계층)
+        self._cache_enabled = settings.SEARCH_CACHE_ENABLED
+        self.search_cache = SemanticSearchCache()
+        self._expiry_task: Optional[asyncio.Task] = None
+
+    def _use_local_index(self, db: Optional[AsyncSession]) -> bool:
+        """프로세스 내 인덱스 사용 여부"""
+        return db is None or settings.VECTOR_SEARCH_BACKEND == "local"
 
     async def search_similar_documents(
         self,
@@ -33,10 +52,13 @@ class VectorSearchService:
     ) -> List[Dict[str, Any]]:
         """Search for similar documents using vector similarity"""
 
-        # Check cache first
-        cached_results = await self._get_cached_results(query, db)
-        if cached_results:
-            return cached_results
+        scope = self.search_cache.scope(document_type, limit, threshold)
+
+        # 같은 질의는 임베딩 호출 없이 바로 반환
+        if self._cache_enabled:
+            cached_results = self.search_cache.get_exact(query, scope)
+            if cached_results is not None:
+                return cached_results
 
         # Get embedding service
         if not self._embedding_service:
@@ -47,35 +69,50 @@ class VectorSearchService:
         # Generate query embedding
         query_embedding = await self._embedding_service.create_embedding(query)
 
-        # Build the similarity search query
-        sql_query = """
-        SELECT
-            id,
-            document_id,
-            document_type,
-            content,
-            document_metadata,
-            1 - (embedding <=> :embedding::vector) as similarity
-        FROM document_embeddings
-        WHERE 1 - (embedding <=> :embedding::vector) > :threshold
-        """
-
-        params = {"embedding": query_embedding, "threshold": threshold}
-
-        if document_type:
-            sql_query += " AND document_type = :document_type"
+        # 표현만 다른 질의는 임베딩 거리로 찾아 벡터 검색을 건너뜀
+        if self._cache_enabled:
+            cached_results = self.search_cache.get_similar(query_embedding, scope)
+            if cached_results is None and not self._use_local_index(db):
+                cached_results = await self._get_cached_results(
+                    query_embedding, scope, db
+                )
+                if cached_results is not None:
+                    self.search_cache.record_shared_hit()
+                    self.search_cache.put(query, query_embedding, scope, cached_results)
+            if cached_results is not None:
+                return cached_results
+
+        if self._use_local_index(db):
+            hits = self.local_index.search(
+                query_embedding, limit, threshold, document_type or None
+            )
+            results = [
+                {**record, "similarity": similarity} for record, similarity in hits
+            ]
+            if self._cache_enabled:
+                self.search_cache.put(query, query_embedding, scope, results)
+            return results
+
+        # 거리 순 LIMIT으로 인덱스 스캔 후 임계값은 가져온 후보에만 적용
+        filtered = bool(document_type)
+        fetch_limit = self.pg_index.fetch_limit(limit, filtered)
+        params = {
+            "embedding": to_vector_literal(query_embedding),
+            "limit": fetch_limit,
+        }
+        if filtered:
             params["document_type"] = document_type
 
-        sql_query += " ORDER BY similarity DESC LIMIT :limit"
-        params["limit"] = limit
-
-        # Execute search
-        result = await db.execute(text(sql_query), params)
+        await self.pg_index.configure_search(db, fetch_limit)
+        result = await db.execute(text(self.pg_index.search_sql(filtered)), params)
         rows = result.fetchall()
 
         # Format results
         results = []
         for row in rows:
+            similarity = 1 - float(row.distance)
+            if similarity <= threshold:
+                break
             results.append(
                 {
                     "id": str(row.id),
@@ -87,12 +124,16 @@ class VectorSearchService:
                         if row.document_metadata
                         else {}
                     ),
-                    "similarity": float(row.similarity),
+                    "similarity": similarity,
                 }
             )
+            if len(results) == limit:
+                break
 
         # Cache results
-        await self._cache_results(query, query_embedding, results, db)
+        if self._cache_enabled:
+            self.search_cache.put(query, query_embedding, scope, results)
+            await self._cache_results(query, query_embedding, scope, results, db)
 
         return results
 
@@ -115,6 +156,13 @@ class VectorSearchService:
         # Generate embedding
         embedding = await self._embedding_service.create_embedding(content)
 
+        if self._use_local_index(db):
+            record_id = self.local_index.add(
+                document_id, document_type, content, embedding, metadata
+            )
+            await self._invalidate_search_cache(db)
+            return record_id
+
         # Create embedding record
         doc_embedding = DocumentEmbedding(
             document_id=document_id,
@@ -126,6 +174,7 @@ class VectorSearchService:
 
         db.add(doc_embedding)
         await db.commit()
+        await self._invalidate_search_cache(db)
 
         logger.info(f"Indexed document {document_id} of type {document_type}")
         return str(doc_embedding.id)
@@ -147,6 +196,20 @@ class VectorSearchService:
         # Generate embeddings in batch
         embeddings = await self._embedding_service.create_embeddings(contents)
 
+        if self._use_local_index(db):
+            record_ids = [
+                self.local_index.add(
+                    doc["document_id"],
+                    doc["document_type"],
+                    doc["content"],
+                    embedding,
+                    doc.get("metadata"),
+                )
+                for doc, embedding in zip(documents, embeddings)
+            ]
+            await self._invalidate_search_cache(db)
+            return record_ids
+
         # Create embedding records
         doc_ids = []
         for doc, embedding in zip(documents, embeddings):
@@ -163,6 +226,7 @@ class VectorSearchService:
             doc_ids.append(str(doc_embedding.id))
 
         await db.commit()
+        await self._invalidate_search_cache(db)
 
         logger.info(f"Indexed {len(documents)} documents in batch")
         return doc_ids
@@ -176,6 +240,19 @@ class VectorSearchService:
     ) -> bool:
         """Update an existing document's embedding"""
 
+        if self._use_local_index(db):
+            if document_id not in self.local_index:
+                logger.warning(f"Document {document_id} not found for update")
+                return False
+            if not self._embedding_service:
+                self._embedding_service = (
+                    await EmbeddingServiceFactory.get_embedding_service()
+                )
+            embedding = await self._embedding_service.create_embedding(content)
+            updated = self.local_index.update(document_id, content, embedding, metadata)
+            await self._invalidate_search_cache(db)
+            return updated
+
         # Find existing document
         result = await db.execute(
             text("SELECT id FROM document_embeddings WHERE document_id = :doc_id"),
@@ -217,6 +294,7 @@ class VectorSearchService:
         )
 
         await db.commit()
+        await self._invalidate_search_cache(db)
         logger.info(f"Updated embedding for document {document_id}")
         return True
 
@@ -225,6 +303,12 @@ class VectorSearchService:
     ) -> bool:
         """Delete a document's embedding"""
 
+        if self._use_local_index(db):
+            deleted = self.local_index.remove(document_id) > 0
+            if deleted:
+                await self._invalidate_search_cache(db)
+            return deleted
+
         result = await db.execute(
             text("DELETE FROM document_embeddings WHERE document_id = :doc_id"),
             {"doc_id": document_id},
@@ -234,48 +318,108 @@ class VectorSearchService:
         deleted = result.rowcount > 0
 
         if deleted:
+            await self._invalidate_search_cache(db)
             logger.info(f"Deleted embedding for document {document_id}")
 
         return deleted
 
-    async def _get_cached_results(
-        self, query: str, db: AsyncSession
-    ) -> Optional[List[Dict[str, Any]]]:
-        """Get cached search results"""
+    async def _invalidate_search_cache(self, db: Optional[AsyncSession]):
+        """문서 변경 후 프로세스 캐시와 search_cache 테이블을 함께 비움
+
+        테이블 행을 남겨 두면 다음 질의가 이전 결과를 읽어 프로세스 캐시에 다시 올림
+        """
+        self.search_cache.clear()
+        if self._use_local_index(db):
+            return
 
-        # Check if caching is enabled
-        if not hasattr(self, "_cache_enabled"):
-            self._cache_enabled = True
+        try:
+            await db.execute(text("DELETE FROM search_cache"))
+            await db.commit()
+        except Exception as e:
+            logger.error(f"Failed to invalidate search cache: {str(e)}")
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """검색 결과 캐시 적중 통계"""
+        return {**self.search_cache.get_stats(), "enabled": self._cache_enabled}
+
+    def start_cache_expiry(self):
+        """만료 캐시 정리 백그라운드 작업 시작"""
+        if self._expiry_task is None or self._expiry_task.done():
+            self._expiry_task = asyncio.create_task(self._run_cache_expiry())
+
+    async def stop_cache_expiry(self):
+        if self._expiry_task is not None:
+            self._expiry_task.cancel()
+            try:
+                await self._expiry_task
+            except asyncio.CancelledError:
+                pass
+            self._expiry_task = None
+
+    async def _run_cache_expiry(self):
+        while True:
+            await asyncio.sleep(settings.SEARCH_CACHE_EXPIRY_INTERVAL)
+            try:
+                await self.expire_cache()
+            except Exception as e:
+                logger.debug(f"Search cache expiry failed: {str(e)}")
+
+    async def expire_cache(self, db: Optional[AsyncSession] = None) -> int:
+        """프로세스 캐시와 search_cache 테이블의 만료 항목 삭제"""
+        expired = self.search_cache.purge_expired()
+        if settings.VECTOR_SEARCH_BACKEND != "pgvector":
+            return expired
+
+        if db is None:
+            async with AsyncSessionLocal() as session:
+                return expired + await self._delete_expired_rows(session)
+        return expired + await self._delete_expired_rows(db)
+
+    async def _delete_expired_rows(self, db: AsyncSession) -> int:
+        result = await db.execute(
+            text(
+                """
+                DELETE FROM search_cache
+                WHERE created_at <= now() - make_interval(secs => ttl)
+            """
+            )
+        )
+        await db.commit()
+        return result.rowcount or 0
 
-        if not self._cache_enabled:
-            return None
+    async def _get_cached_results(
+        self, query_embedding: List[float], scope: SearchScope, db: AsyncSession
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Get cached search results for the nearest cached query embedding"""
 
-        # Look for cached results
+        # 만료 행은 읽기 경로에서 지우지 않고 건너뜀 (정리는 expire_cache)
         result = await db.execute(
             text(
                 """
-                SELECT results, created_at, ttl
+                SELECT
+                    query,
+                    results,
+                    query_embedding <=> CAST(:embedding AS vector) AS distance
                 FROM search_cache
-                WHERE query = :query
+                WHERE created_at > now() - make_interval(secs => ttl)
+                ORDER BY query_embedding <=> CAST(:embedding AS vector)
+                LIMIT :candidates
             """
             ),
-            {"query": query},
+            {
+                "embedding": to_vector_literal(query_embedding),
+                "candidates": settings.SEARCH_CACHE_DB_CANDIDATES,
+            },
         )
 
-        row = result.first()
-        if row:
-            # Check if cache is still valid
-            cache_age = datetime.utcnow() - row.created_at
-            if cache_age.total_seconds() < row.ttl:
-                logger.info(f"Using cached results for query: {query}")
-                return json.loads(row.results)
-            else:
-                # Delete expired cache
-                await db.execute(
-                    text("DELETE FROM search_cache WHERE query = :query"),
-                    {"query": query},
-                )
-                await db.commit()
+        for row in result.fetchall():
+            if float(row.distance) > self.search_cache.max_distance:
+                break
+            payload = json.loads(row.results)
+            # 검색 조건이 다른 결과나 이전 형식(목록) 행은 재사용하지 않음
+            if isinstance(payload, dict) and payload.get("scope") == list(scope):
+                logger.info(f"Using cached results of similar query: {row.query}")
+                return payload["results"]
 
         return None
 
@@ -283,26 +427,21 @@ class VectorSearchService:
         self,
         query: str,
         query_embedding: List[float],
+        scope: SearchScope,
         results: List[Dict[str, Any]],
         db: AsyncSession,
-        ttl: int = 3600,
+        ttl: Optional[int] = None,
     ):
         """Cache search results"""
 
-        if not hasattr(self, "_cache_enabled"):
-            self._cache_enabled = True
-
-        if not self._cache_enabled:
-            return
-
         try:
             await db.execute(
                 text(
                     """
                     INSERT INTO search_cache (query, query_embedding, results, ttl)
-                    VALUES (:query, :embedding::vector, :results, :ttl)
+                    VALUES (:query, CAST(:embedding AS vector), :results, :ttl)
                     ON CONFLICT (query) DO UPDATE
-                    SET query_embedding = :embedding::vector,
+                    SET query_embedding = CAST(:embedding AS vector),
                         results = :results,
                         ttl = :ttl,
                         created_at = CURRENT_TIMESTAMP
@@ -310,9 +449,9 @@ class VectorSearchService:
                 ),
                 {
                     "query": query,
-                    "embedding": query_embedding,
-                    "results": json.dumps(results),
-                    "ttl": ttl,
+                    "embedding": to_vector_literal(query_embedding),
+                    "results": json.dumps({"scope": list(scope), "results": results}),
+                    "ttl": ttl or self.search_cache.ttl,
                 },
             )
             await db.commit()
@@ -4,21 +4,136 @@ WebSocket Manager for Real-time Progress Updates
 """
 
 import asyncio
+from collections import deque
 import json
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Optional
 from fastapi import WebSocket, WebSocketDisconnect
 import uuid
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+# 최신 프레임만 의미가 있어 느린 연결에서 합치거나 버려도 되는 메시지 타입
+COALESCABLE_MESSAGE_TYPES = {"progress_update"}
+
+# 서버가 정리한 연결을 닫을 때 쓰는 종료 코드 (1013 Try Again Later)
+EVICTED_CLOSE_CODE = 1013
+
+
+class ConnectionSender:
+    """연결별 전송 큐와 전송 태스크
+
+    프레임은 순서대로 보내되, 아직 보내지 못한 같은 작업의 진행률 프레임은
+    최신 값으로 교체합니다. 큐가 가득 차면 진행률 프레임부터 버리고,
+    버릴 수 있는 프레임이 없으면 연결을 끊습니다 (느린 소비자).
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_queue: int,
+        send_timeout: float,
+        on_failure: Any,
+    ):
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self._on_failure = on_failure
+        # [coalesce_key, text] - 교체할 수 있도록 리스트로 보관
+        self._queue: "deque[List[Optional[str]]]" = deque()
+        self._pending: Dict[str, List[Optional[str]]] = {}
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        self.closed = False
+
+        self.stats = {"sent": 0, "coalesced": 0, "dropped": 0, "max_depth": 0}
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def enqueue(self, text: str, coalesce_key: Optional[str] = None) -> bool:
+        """프레임 추가 (대기하지 않음) - 연결이 끊겨야 하면 False"""
+        if self.closed:
+            return False
+
+        if coalesce_key is not None:
+            pending = self._pending.get(coalesce_key)
+            if pending is not None:
+                pending[1] = text
+                self.stats["coalesced"] += 1
+                return True
+
+        if len(self._queue) >= self.max_queue:
+            if coalesce_key is not None:
+                self.stats["dropped"] += 1
+                return True
+            if not self._drop_oldest_coalescable():
+                return False
+
+        item = [coalesce_key, text]
+        self._queue.append(item)
+        if coalesce_key is not None:
+            self._pending[coalesce_key] = item
+        self.stats["max_depth"] = max(self.stats["max_depth"], len(self._queue))
+        self._wakeup.set()
+        return True
+
+    def _drop_oldest_coalescable(self) -> bool:
+        for item in self._queue:
+            if item[0] is not None:
+                self._queue.remove(item)
+                del self._pending[item[0]]
+                self.stats["dropped"] += 1
+                return True
+        return False
+
+    async def _run(self):
+        while True:
+            if not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            coalesce_key, text = self._queue.popleft()
+            if coalesce_key is not None:
+                self._pending.pop(coalesce_key, None)
+            try:
+                await asyncio.wait_for(
+                    self.websocket.send_text(text), timeout=self.send_timeout
+                )
+                self.stats["sent"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._on_failure(e)
+                return
+
+    def close(self):
+        self.closed = True
+        self._queue.clear()
+        self._pending.clear()
+        if self._task is not asyncio.current_task():
+            self._task.cancel()
+
 
 class WebSocketManager:
-    """WebSocket 연결 관리자"""
+    """WebSocket 연결 관리자
+
+    메시지는 한 번만 직렬화하여 수신자별 전송 큐에 넣으므로, 느린 클라이언트가
+    다른 연결로의 전송을 막지 않습니다.
+    """
 
     def __init__(self):
         # 활성 WebSocket 연결들
         self.active_connections: Dict[str, WebSocket] = {}
+        # 연결별 전송 큐
+        self.senders: Dict[str, ConnectionSender] = {}
+        self.slow_disconnects = 0
+        # 정리한 연결의 소켓 종료 태스크 (완료 전 GC 방지)
+        self._closing: "set[asyncio.Task]" = set()
         # 사용자별 연결 매핑
         self.user_connections: Dict[str, List[str]] = {}
         # 작업별 연결 매핑
@@ -41,6 +156,12 @@ class WebSocketManager:
 
         # 연결 저장
         self.active_connections[connection_id] = websocket
+        self.senders[connection_id] = ConnectionSender(
+            websocket,
+            max_queue=settings.WS_SEND_QUEUE_SIZE,
+            send_timeout=settings.WS_SEND_TIMEOUT,
+            on_failure=lambda error: self._on_send_failure(connection_id, error),
+        )
 
         # 사용자별 연결 매핑
         if user_id:
@@ -76,6 +197,9 @@ class WebSocketManager:
         if connection_id in self.active_connections:
             # 연결 제거
             del self.active_connections[connection_id]
+            sender = self.senders.pop(connection_id, None)
+            if sender is not None:
+                sender.close()
 
             # 사용자별 매핑에서 제거
             for user_id, connections in self.user_connections.items():
@@ -85,78 +209,83 @@ class WebSocketManager:
                         del self.user_connections[user_id]
                     break
 
-            # 작업별 매핑에서 제거
-            for task_id, connections in self.task_connections.items():
+            # 작업별 매핑에서 제거 (subscribe_task로 여러 작업을 구독할 수 있음)
+            for task_id, connections in list(self.task_connections.items()):
                 if connection_id in connections:
                     connections.remove(connection_id)
                     if not connections:  # 빈 리스트면 삭제
                         del self.task_connections[task_id]
-                    break
 
             logger.info(f"WebSocket 연결 해제: {connection_id}")
 
-    async def send_to_connection(
-        self, connection_id: str, message: Dict[str, Any]
-    ) -> bool:
-        """특정 연결에 메시지 전송"""
+    def is_connected(self, connection_id: str) -> bool:
+        return connection_id in self.active_connections
 
-        if connection_id not in self.active_connections:
-            return False
+    def _evict(self, connection_id: str):
+        """연결을 해제하고 소켓도 닫음 (수신 루프가 종료되도록)"""
+        websocket = self.active_connections.get(connection_id)
+        self.disconnect(connection_id)
+        if websocket is None:
+            return
+
+        task = asyncio.create_task(self._close_socket(connection_id, websocket))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
 
+    @staticmethod
+    async def _close_socket(connection_id: str, websocket: WebSocket):
         try:
-            websocket = self.active_connections[connection_id]
-            await websocket.send_text(json.dumps(message, ensure_ascii=False))
-            return True
+            await websocket.close(code=EVICTED_CLOSE_CODE)
         except Exception as e:
-            logger.error(f"메시지 전송 실패 (연결 {connection_id}): {str(e)}")
-            # 연결이 끊어진 경우 정리
-            self.disconnect(connection_id)
-            return False
+            logger.debug(f"WebSocket 종료 실패 (연결 {connection_id}): {str(e)}")
+
+    def _on_send_failure(self, connection_id: str, error: Exception):
+        logger.error(f"메시지 전송 실패 (연결 {connection_id}): {str(error)}")
+        # 연결이 끊어진 경우 정리
+        self._evict(connection_id)
+
+    def _fan_out(self, connection_ids: Iterable[str], message: Dict[str, Any]) -> int:
+        """메시지를 한 번 직렬화하여 각 연결의 전송 큐에 추가 (대기하지 않음)"""
+        text = json.dumps(message, ensure_ascii=False)
+        coalesce_key = None
+        if message.get("type") in COALESCABLE_MESSAGE_TYPES:
+            coalesce_key = f"{message['type']}:{message.get('task_id')}"
+
+        queued = 0
+        for connection_id in list(connection_ids):
+            sender = self.senders.get(connection_id)
+            if sender is None:
+                continue
+            if sender.enqueue(text, coalesce_key):
+                queued += 1
+            else:
+                logger.warning(f"전송 큐 초과로 느린 연결 해제: {connection_id}")
+                self.slow_disconnects += 1
+                self._evict(connection_id)
+        return queued
+
+    async def send_to_connection(
+        self, connection_id: str, message: Dict[str, Any]
+    ) -> bool:
+        """특정 연결에 메시지 전송"""
+        return self._fan_out([connection_id], message) == 1
 
     async def send_to_user(self, user_id: str, message: Dict[str, Any]) -> int:
         """특정 사용자의 모든 연결에 메시지 전송"""
-
-        if user_id not in self.user_connections:
-            return 0
-
-        connections = self.user_connections[user_id].copy()  # 복사본 사용
-        sent_count = 0
-
-        for connection_id in connections:
-            if await self.send_to_connection(connection_id, message):
-                sent_count += 1
-
-        return sent_count
+        return self._fan_out(self.user_connections.get(user_id, []), message)
 
     async def send_to_task(self, task_id: str, message: Dict[str, Any]) -> int:
         """특정 작업을 추적하는 모든 연결에 메시지 전송"""
-
-        if task_id not in self.task_connections:
-            return 0
-
-        connections = self.task_connections[task_id].copy()  # 복사본 사용
-        sent_count = 0
-
-        for connection_id in connections:
-            if await self.send_to_connection(connection_id, message):
-                sent_count += 1
-
-        return sent_count
+        return self._fan_out(self.task_connections.get(task_id, []), message)
 
     async def broadcast(
         self, message: Dict[str, Any], exclude_connections: List[str] = None
     ) -> int:
         """모든 연결에 메시지 브로드캐스트"""
-
-        exclude_connections = exclude_connections or []
-        sent_count = 0
-
-        for connection_id in list(self.active_connections.keys()):
-            if connection_id not in exclude_connections:
-                if await self.send_to_connection(connection_id, message):
-                    sent_count += 1
-
-        return sent_count
+        excluded = set(exclude_connections or [])
+        return self._fan_out(
+            (cid for cid in self.active_connections if cid not in excluded), message
+        )
 
     async def send_progress_update(self, task_id: str, progress_data: Dict[str, Any]):
         """진행률 업데이트 전송"""
@@ -212,12 +341,26 @@ class WebSocketManager:
     def get_connection_stats(self) -> Dict[str, Any]:
         """연결 통계 정보"""
 
+        senders = list(self.senders.values())
         return {
             "total_connections": len(self.active_connections),
             "users_connected": len(self.user_connections),
             "tasks_being_tracked": len(self.task_connections),
+            "send_queues": {
+                "total_depth": sum(sender.depth for sender in senders),
+                "max_depth": max((sender.depth for sender in senders), default=0),
+                "capacity": settings.WS_SEND_QUEUE_SIZE,
+                "sent": sum(sender.stats["sent"] for sender in senders),
+                "coalesced": sum(sender.stats["coalesced"] for sender in senders),
+                "dropped": sum(sender.stats["dropped"] for sender in senders),
+                "slow_disconnects": self.slow_disconnects,
+            },
             "connection_details": {
                 "active_connections": list(self.active_connections.keys()),
+                "queue_depths": {
+                    connection_id: sender.depth
+                    for connection_id, sender in self.senders.items()
+                },
                 "user_connections": {
                     user_id: len(connections)
                     for user_id, connections in self.user_connections.items()
@@ -270,6 +413,9 @@ class ProgressWebSocketHandler:
             while self.is_active:
                 # 클라이언트로부터 메시지 수신
                 data = await self.websocket.receive_text()
+                # 관리자가 정리한 연결 (느린 소비자 등)은 더 처리하지 않음
+                if not websocket_manager.is_connected(self.connection_id):
+                    break
                 message = json.loads(data)
 
                 await self.handle_message(message)
@@ -0,0 +1,418 @@
+"""
+Streaming XLSX Reader
+xlsx 패키지의 XML을 한 번만 스트리밍 파싱하여 셀의 수식과 캐시된 값을 함께 제공
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+import logging
+
+from openpyxl.formula.translate import Translator
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format
+from openpyxl.utils import get_column_letter, column_index_from_string
+from openpyxl.utils.cell import range_boundaries
+from openpyxl.utils.datetime import (
+    CALENDAR_MAC_1904,
+    CALENDAR_WINDOWS_1900,
+    from_excel,
+    from_ISO8601,
+)
+from openpyxl.utils.exceptions import InvalidFileException
+
+logger = logging.getLogger(__name__)
+
+_COORD_PATTERN = re.compile(r"^\$?([A-Z]+)\$?(\d+)$")
+_REL_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+
+
+@lru_cache(maxsize=256)
+def _local(tag: str) -> str:
+    """네임스페이스를 제거한 태그 이름"""
+    return tag.rsplit("}", 1)[-1]
+
+
+@dataclass
+class StreamedCell:
+    """스트리밍으로 읽은 셀 - 수식과 캐시된 값을 함께 보관"""
+
+    __slots__ = ("row", "column", "formula", "value", "data_type", "style_id")
+
+    row: int
+    column: int
+    formula: Optional[str]  # "=..." 형태, 수식이 없으면 None
+    value: Any  # 캐시된 계산 값 (data_only=True 와 동일)
+    data_type: str  # openpyxl 규칙: 'f', 'n', 's', 'b', 'e', 'd'
+    style_id: int
+
+    @property
+    def coordinate(self) -> str:
+        return f"{get_column_letter(self.column)}{self.row}"
+
+    @property
+    def formula_value(self) -> Any:
+        """data_only=False 로 열었을 때의 값 (수식 또는 값)"""
+        return self.formula if self.formula is not None else self.value
+
+
+class SheetStream:
+    """단일 시트 스트림
+
+    셀을 순회하는 동안 최대 행/열을 계산하고, 순회가 끝나면
+    ``merged_cells`` 가 채워집니다.
+    """
+
+    def __init__(self, reader: "StreamingXlsxReader", name: str, part: str):
+        self.reader = reader
+        self.name = name
+        self.part = part
+        self.max_row = 0
+        self.max_column = 0
+        self.dimension: Optional[str] = None
+        self.merged_cells: List[str] = []
+        self.exhausted = False
+
+    def __iter__(self) -> Iterator[StreamedCell]:
+        return self.iter_cells(skip_empty=True)
+
+    def iter_rows(self, skip_empty: bool = True) -> Iterator[List[StreamedCell]]:
+        """행 단위 순회 - 한 번에 한 행만 메모리에 유지"""
+        current_row: List[StreamedCell] = []
+        current_index = None
+        for cell in self.iter_cells(skip_empty=skip_empty):
+            if current_index is not None and cell.row != current_index:
+                yield current_row
+                current_row = []
+            current_index = cell.row
+            current_row.append(cell)
+        if current_row:
+            yield current_row
+
+    def iter_cells(self, skip_empty: bool = True) -> Iterator[StreamedCell]:
+        """셀 순회. skip_empty=False 이면 값 없이 서식만 있는 셀도 반환"""
+        reader = self.reader
+        shared_formulas: Dict[str, Tuple[str, str]] = {}
+        self.max_row = 0
+        self.max_column = 0
+        self.merged_cells = []
+
+        with reader.archive.open(self.part) as stream:
+            row_index = 0
+            column_index = 0
+            sheet_data = None
+            for event, element in ET.iterparse(stream, events=("start", "end")):
+                tag = _local(element.tag)
+
+                if event == "start":
+                    if tag == "row":
+                        row_ref = element.get("r")
+                        row_index = int(row_ref) if row_ref else row_index + 1
+                        # r 속성 없는 셀을 위해 열 카운터 초기화
+                        column_index = 0
+                    elif tag == "sheetData":
+                        sheet_data = element
+                    continue
+
+                if tag == "c":
+                    ref = element.get("r")
+                    match = _COORD_PATTERN.match(ref.upper()) if ref else None
+                    if match:
+                        column_index = column_index_from_string(match.group(1))
+                        row_index = int(match.group(2))
+                    else:
+                        # r 속성이 없거나 해석할 수 없으면 행 안의 위치로 판단
+                        if ref:
+                            logger.debug(f"셀 참조 해석 실패, 위치로 대체: {ref}")
+                        column_index += 1
+
+                    cell = reader._parse_cell(
+                        element, row_index, column_index, shared_formulas
+                    )
+                    element.clear()
+
+                    self.max_row = max(self.max_row, row_index)
+                    self.max_column = max(self.max_column, column_index)
+
+                    if skip_empty and cell.value is None and cell.formula is None:
+                        continue
+                    yield cell
+
+                elif tag == "row":
+                    # 처리한 행을 트리에서 분리하여 메모리를 현재 행 크기로 유지
+                    element.clear()
+                    if sheet_data is not None:
+                        del sheet_data[:]
+
+                elif tag == "dimension":
+                    self.dimension = element.get("ref")
+
+                elif tag == "mergeCell":
+                    merged_ref = element.get("ref")
+                    if merged_ref:
+                        self.merged_cells.append(merged_ref)
+
+        # openpyxl과 동일하게 병합 범위도 시트 크기에 포함
+        for merged_ref in self.merged_cells:
+            _, _, max_col, max_row = range_boundaries(merged_ref)
+            self.max_row = max(self.max_row, max_row)
+            self.max_column = max(self.max_column, max_col)
+
+        # openpyxl과 동일하게 빈 시트도 1x1로 간주
+        self.max_row = self.max_row or 1
+        self.max_column = self.max_column or 1
+        self.exhausted = True
+
+
+class StreamingXlsxReader:
+    """xlsx 스트리밍 리더
+
+    openpyxl을 ``data_only=False`` / ``data_only=True`` 로 두 번 여는 대신
+    워크시트 XML을 한 번만 파싱하여 각 셀의 수식과 캐시 값을 함께 제공합니다.
+    셀 객체를 만들지 않으므로 메모리 사용량은 공유 문자열 테이블과 현재 행에 비례합니다.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = str(file_path)
+        try:
+            self.archive = zipfile.ZipFile(self.file_path)
+        except (zipfile.BadZipFile, OSError) as e:
+            if isinstance(e, FileNotFoundError):
+                raise
+            raise InvalidFileException(f"xlsx 파일을 열 수 없습니다: {str(e)}")
+
+        self._sheet_parts: Dict[str, str] = {}
+        self.sheetnames: List[str] = []
+        self.shared_strings: List[str] = []
+        self._shared_strings_loaded = False
+        self._date_styles: List[bool] = []
+        self.epoch = CALENDAR_WINDOWS_1900
+
+        try:
+            self._read_workbook()
+            self._read_styles()
+        except KeyError as e:
+            self.archive.close()
+            raise InvalidFileException(f"xlsx 구성 요소가 없습니다: {str(e)}")
+
+    def __enter__(self) -> "StreamingXlsxReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.archive.close()
+
+    def open_sheet(self, sheet_name: str) -> SheetStream:
+        """시트 스트림 열기"""
+        if sheet_name not in self._sheet_parts:
+            raise KeyError(f"시트를 찾을 수 없습니다: {sheet_name}")
+        if not self._shared_strings_loaded:
+            self._read_shared_strings()
+            self._shared_strings_loaded = True
+        return SheetStream(self, sheet_name, self._sheet_parts[sheet_name])
+
+    def sheet_part_size(self, sheet_name: str) -> int:
+        """시트 XML의 압축 해제 크기 (바이트)"""
+        return self.archive.getinfo(self._sheet_parts[sheet_name]).file_size
+
+    def sheet_dimension(self, sheet_name: str) -> Optional[str]:
+        """시트의 <dimension ref> 값 - sheetData 이전에 있으므로 본문을 읽지 않음"""
+        with self.archive.open(self._sheet_parts[sheet_name]) as stream:
+            for _, element in ET.iterparse(stream, events=("start",)):
+                tag = _local(element.tag)
+                if tag == "dimension":
+                    return element.get("ref")
+                if tag == "sheetData":
+                    return None
+        return None
+
+    def estimate_cell_count(self) -> int:
+        """dimension 정보로 추정한 전체 셀 수 (전체 파싱 없이 크기 판단용)"""
+        total = 0
+        for sheet_name in self.sheetnames:
+            dimension = self.sheet_dimension(sheet_name)
+            if not dimension:
+                continue
+            try:
+                min_col, min_row, max_col, max_row = range_boundaries(dimension)
+            except (TypeError, ValueError):
+                continue
+            if None in (min_col, min_row, max_col, max_row):
+                continue
+            total += (max_row - min_row + 1) * (max_col - min_col + 1)
+        return total
+
+    # 패키지 메타데이터 파싱
+    def _read_workbook(self):
+        rels = {}
+        rels_root = ET.fromstring(self.archive.read("xl/_rels/workbook.xml.rels"))
+        for rel in rels_root:
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                part = target.lstrip("/")
+            else:
+                part = posixpath.normpath(posixpath.join("xl", target))
+            rels[rel.get("Id")] = part
+
+        workbook_root = ET.fromstring(self.archive.read("xl/workbook.xml"))
+        for element in workbook_root.iter():
+            tag = _local(element.tag)
+            if tag == "workbookPr" and element.get("date1904") in ("1", "true"):
+                self.epoch = CALENDAR_MAC_1904
+            elif tag == "sheet":
+                part = rels.get(element.get(_REL_ID))
+                # 차트시트 등 워크시트가 아닌 파트는 제외
+                if part and "worksheets/" in part:
+                    name = element.get("name")
+                    self._sheet_parts[name] = part
+                    self.sheetnames.append(name)
+
+    def _read_shared_strings(self):
+        if "xl/sharedStrings.xml" not in self.archive.namelist():
+            return
+        with self.archive.open("xl/sharedStrings.xml") as stream:
+            for _, element in ET.iterparse(stream, events=("end",)):
+                if _local(element.tag) != "si":
+                    continue
+                self.shared_strings.append(self._read_text(element))
+                element.clear()
+
+    def _read_styles(self):
+        if "xl/styles.xml" not in self.archive.namelist():
+            return
+        root = ET.fromstring(self.archive.read("xl/styles.xml"))
+        custom_formats = {}
+        cell_xfs = None
+        for element in root:
+            tag = _local(element.tag)
+            if tag == "numFmts":
+                for num_fmt in element:
+                    custom_formats[int(num_fmt.get("numFmtId"))] = num_fmt.get(
+                        "formatCode", ""
+                    )
+            elif tag == "cellXfs":
+                cell_xfs = element
+
+        if cell_xfs is None:
+            return
+        for xf in cell_xfs:
+            fmt_id = int(xf.get("numFmtId", 0))
+            fmt_code = custom_formats.get(fmt_id, BUILTIN_FORMATS.get(fmt_id, ""))
+            self._date_styles.append(bool(fmt_code) and is_date_format(fmt_code))
+
+    @staticmethod
+    def _read_text(element: ET.Element) -> str:
+        """<si>/<is> 요소의 텍스트 (서식 run 포함, 윗주 제외)"""
+        parts = []
+        for child in element:
+            tag = _local(child.tag)
+            if tag == "t":
+                parts.append(child.text or "")
+            elif tag == "r":
+                for run_child in child:
+                    if _local(run_child.tag) == "t":
+                        parts.append(run_child.text or "")
+        return "".join(parts)
+
+    # 셀 파싱
+    def _parse_cell(
+        self,
+        element: ET.Element,
+        row: int,
+        column: int,
+        shared_formulas: Dict[str, Tuple[str, str]],
+    ) -> StreamedCell:
+        cell_type = element.get("t", "n")
+        style_id = int(element.get("s", 0))
+        raw_value = None
+        formula = None
+        inline_text = None
+
+        for child in element:
+            tag = _local(child.tag)
+            if tag == "v":
+                raw_value = child.text
+            elif tag == "f":
+                formula = self._read_formula(child, row, column, shared_formulas)
+            elif tag == "is":
+                inline_text = self._read_text(child)
+
+        value = self._convert_value(cell_type, raw_value, inline_text, style_id)
+
+        if formula is not None:
+            data_type = "f"
+        elif cell_type in ("s", "str", "inlineStr"):
+            data_type = "s"
+        elif cell_type in ("b", "e", "d"):
+            data_type = cell_type
+        else:
+            data_type = "n"
+            if value is not None and not isinstance(value, (int, float)):
+                data_type = "d"
+
+        return StreamedCell(row, column, formula, value, data_type, style_id)
+
+    def _read_formula(
+        self,
+        element: ET.Element,
+        row: int,
+        column: int,
+        shared_formulas: Dict[str, Tuple[str, str]],
+    ) -> Optional[str]:
+        text = element.text
+        coordinate = f"{get_column_letter(column)}{row}"
+
+        if element.get("t") == "shared":
+            shared_id = element.get("si")
+            if text:
+                # 공유 수식의 기준 셀
+                shared_formulas[shared_id] = (f"={text}", coordinate)
+            elif shared_id in shared_formulas:
+                master_formula, master_coord = shared_formulas[shared_id]
+                return Translator(
+                    master_formula, origin=master_coord
+                ).translate_formula(coordinate)
+            else:
+                return None
+
+        if text is None:
+            return None
+        return f"={text}"
+
+    def _convert_value(
+        self,
+        cell_type: str,
+        raw_value: Optional[str],
+        inline_text: Optional[str],
+        style_id: int,
+    ) -> Any:
+        if cell_type == "inlineStr":
+            return inline_text
+        if raw_value is None:
+            return None
+
+        if cell_type == "s":
+            return self.shared_strings[int(raw_value)]
+        if cell_type in ("str", "e"):
+            return raw_value
+        if cell_type == "b":
+            return raw_value in ("1", "true")
+        if cell_type == "d":
+            return from_ISO8601(raw_value)
+
+        if "." in raw_value or "E" in raw_value or "e" in raw_value:
+            number = float(raw_value)
+        else:
+            number = int(raw_value)
+
+        if style_id < len(self._date_styles) and self._date_styles[style_id]:
+            try:
+                return from_excel(number, self.epoch)
+            except (ValueError, OverflowError):
+                return number
+        return number
@@ -3,8 +3,9 @@ WebSocket Progress Reporter
 실시간 진행 상황 보고를 위한 WebSocket 구현
 """
 
-from typing import Dict, Any, Optional, Set
+from typing import Dict, Any, List, Optional, Set
 from app.core.interfaces import IProgressReporter
+from app.core.progress_throttle import progress_throttle
 import asyncio
 import logging
 from datetime import datetime
@@ -72,11 +73,24 @@ class WebSocketProgressReporter(IProgressReporter):
         self.current_task = None
         self.start_time = None
 
+    @property
+    def _throttle_key(self) -> str:
+        return f"ws:{self.session_id}:{self.current_task}"
+
     async def report_progress(self, current: int, total: int, message: str = ""):
-        """진행 상황 보고"""
+        """진행 상황 보고 (작업별 속도 제한, 보류된 틱은 최신 값만 전송)"""
         if self.start_time is None:
             self.start_time = datetime.now()
 
+        percentage = round((current / total * 100) if total > 0 else 0, 2)
+        await progress_throttle.submit(
+            self._throttle_key,
+            percentage,
+            lambda: self._send_progress(current, total, message),
+            final=total > 0 and current >= total,
+        )
+
+    async def _send_progress(self, current: int, total: int, message: str):
         progress_data = {
             "type": "progress",
             "session_id": self.session_id,
@@ -95,7 +109,8 @@ class WebSocketProgressReporter(IProgressReporter):
         logger.debug(f"진행 상황 보고: {current}/{total} - {message}")
 
     async def report_error(self, error: Exception):
-        """오류 보고"""
+        """오류 보고 (보류된 진행률은 버리고 항상 전송)"""
+        progress_throttle.discard(self._throttle_key)
         error_data = {
             "type": "error",
             "session_id": self.session_id,
@@ -110,8 +125,36 @@ class WebSocketProgressReporter(IProgressReporter):
         await self.manager.send_message(self.session_id, error_data)
         logger.error(f"오류 보고: {str(error)}")
 
+    async def report_partial_errors(self, sheet_name: str, errors: List[Any]):
+        """스트리밍 감지 중간 결과 보고 (청크 단위로 감지된 오류)"""
+        partial_data = {
+            "type": "partial_errors",
+            "session_id": self.session_id,
+            "data": {
+                "sheet": sheet_name,
+                "task": self.current_task,
+                "count": len(errors),
+                "errors": [
+                    {
+                        "id": error.id,
+                        "type": error.type,
+                        "severity": error.severity,
+                        "sheet": error.sheet,
+                        "cell": error.cell,
+                        "message": error.message,
+                    }
+                    for error in errors
+                ],
+            },
+            "timestamp": datetime.now().isoformat(),
+        }
+
+        await self.manager.send_message(self.session_id, partial_data)
+        logger.debug(f"중간 오류 보고: {sheet_name} - {len(errors)}개")
+
     async def start_task(self, task_name: str, total_steps: int = 0):
         """새 작업 시작"""
+        progress_throttle.discard(self._throttle_key)
         self.current_task = task_name
         self.start_time = datetime.now()
 
@@ -128,7 +171,9 @@ class WebSocketProgressReporter(IProgressReporter):
     async def complete_task(
         self, task_name: str, result: Optional[Dict[str, Any]] = None
     ):
-        """작업 완료"""
+        """작업 완료 (보류된 마지막 진행률을 먼저 전송)"""
+        await progress_throttle.flush(self._throttle_key)
+        progress_throttle.discard(self._throttle_key)
         complete_data = {
             "type": "task_complete",
             "session_id": self.session_id,
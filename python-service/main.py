@@ -109,6 +109,16 @@ async def lifespan(app: FastAPI):
         logger.warning(f"Database initialization failed: {e}")
         logger.info("Running in OCR-only mode without database features")
 
+    # pgvector ANN 인덱스 (테이블 생성과 별도 트랜잭션 - 실패해도 테이블은 유지)
+    if settings.VECTOR_SEARCH_BACKEND == "pgvector":
+        try:
+            from app.services.vector_search import vector_search_service
+
+            async with engine.begin() as conn:
+                await vector_search_service.pg_index.ensure_index(conn)
+        except Exception as e:
+            logger.warning(f"Vector index initialization failed: {e}")
+
     # Check AI API connections
     await check_ai_connections()
 
@@ -169,6 +179,24 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to cleanup WOPI services: {e}")
 
+    # 오류 감지 프로세스 풀 정리
+    try:
+        from app.core.parallel_processor import parallel_processor
+
+        parallel_processor.shutdown()
+        logger.info("감지 프로세스 풀 정리 완료")
+    except Exception as e:
+        logger.warning(f"감지 프로세스 풀 정리 실패: {e}")
+
+    # Redis L2 캐시 커넥션 풀 정리
+    try:
+        from app.core.redis_l2 import redis_l2_cache
+
+        await redis_l2_cache.close()
+        logger.info("Redis L2 캐시 연결 정리 완료")
+    except Exception as e:
+        logger.warning(f"Redis L2 캐시 연결 정리 실패: {e}")
+
     # 종료 성능 메트릭 로깅
     shutdown_time = __import__("time").time() - shutdown_start
     log_performance_metrics(
@@ -297,11 +325,17 @@ import asyncio
 
 
 async def cleanup_inactive_sessions():
-    """Cleanup inactive WebSocket sessions periodically"""
+    """Cleanup inactive WebSocket sessions and expired file mappings periodically"""
+    from app.core.file_path_resolver import FilePathResolver
+
     while True:
         try:
             await asyncio.sleep(300)  # Every 5 minutes
             await websocket_handler.cleanup_inactive_sessions(30)  # 30 minutes timeout
+            # Only touches mappings past their age (time-indexed)
+            await FilePathResolver.cleanup_old_mappings(
+                settings.FILE_MAPPING_MAX_AGE_HOURS
+            )
         except Exception as e:
             logger.error(f"Session cleanup error: {str(e)}")
 
@@ -312,10 +346,16 @@ async def startup_event():
     """Start background tasks on startup"""
     asyncio.create_task(cleanup_inactive_sessions())
 
+    # 검색 결과 캐시 만료 정리 (읽기 경로에서는 삭제하지 않음)
+    from app.services.vector_search import vector_search_service
+
+    vector_search_service.start_cache_expiry()
+
     # Start monitoring background task
-    from app.core.monitoring import background_monitoring
+    from app.core.monitoring import background_monitoring, process_sampler
 
     asyncio.create_task(background_monitoring())
+    process_sampler.start()
     logger.info("Background monitoring started")
 
 
@@ -0,0 +1,84 @@
+"""
+Performance benchmark for the embedding pipeline
+
+Runs an offline workload of chat queries and template descriptions,
+where many texts repeat, against the local deterministic embedding model.
+A simulated per-call latency stands in for the remote API. The uncached
+model is compared with CachedEmbeddingService (content-hash cache plus
+in-flight dedup), and both must return identical vectors.
+
+Usage: python tests/benchmark_embedding_cache.py [--requests N] [--latency S]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.core.redis_l2 import RedisL2Cache
+from app.services.embedding.embedding_cache import (
+    CachedEmbeddingService,
+    EmbeddingCache,
+)
+from app.services.embedding.local_embedding import LocalEmbeddingService
+
+
+def build_workload(requests: int, distinct: int, seed: int = 11):
+    """Skewed stream of single texts and small batches"""
+    random.seed(seed)
+    texts = [f"how do I fix error {i} in my sheet formula" for i in range(distinct)]
+    weights = [1 / (rank + 1) for rank in range(distinct)]
+    workload = []
+    for _ in range(requests):
+        size = random.choice([1, 1, 1, 5])
+        workload.append(random.choices(texts, weights, k=size))
+    return workload
+
+
+async def run(service, workload, concurrency: int):
+    """Issue requests with bounded concurrency, return (seconds, vectors)"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(batch):
+        async with semaphore:
+            if len(batch) == 1:
+                return [await service.create_embedding(batch[0])]
+            return await service.create_embeddings(batch)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one(batch) for batch in workload))
+    return time.perf_counter() - start, results
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--distinct", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    workload = build_workload(args.requests, args.distinct)
+    plain = LocalEmbeddingService(latency=args.latency)
+    cached_model = LocalEmbeddingService(latency=args.latency)
+    cache = EmbeddingCache("benchmark", 10000, redis_cache=RedisL2Cache(enabled=False))
+    cached = CachedEmbeddingService(cached_model, cache)
+
+    texts = sum(len(batch) for batch in workload)
+    print(f"Embedding pipeline benchmark ({args.requests} requests, {texts} texts)")
+    plain_time, plain_results = await run(plain, workload, args.concurrency)
+    cached_time, cached_results = await run(cached, workload, args.concurrency)
+
+    print(f"{'pipeline':<12}{'seconds':>10}{'model calls':>14}")
+    print(f"{'uncached':<12}{plain_time:>10.3f}{plain._calls:>14}")
+    print(f"{'cached':<12}{cached_time:>10.3f}{cached_model._calls:>14}")
+    print(f"speedup: {plain_time / cached_time:.1f}x")
+    print(f"cache stats: {cached.get_cache_stats()}")
+    print(f"identical results: {plain_results == cached_results}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+"""
+Performance benchmark for the sliding-window rate limiter
+
+Measures per-check latency for each tier. Uses Redis (GCRA script, one
+round-trip per check) when REDIS_URL is reachable, otherwise the in-process
+ring buffer fallback.
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.services.rate_limiter import RateLimiter, RateLimitTier
+
+CHECKS_PER_TIER = 5000
+IDENTIFIERS = 50
+
+
+async def benchmark_tier(limiter: RateLimiter, tier: RateLimitTier) -> dict:
+    """Run CHECKS_PER_TIER checks spread over IDENTIFIERS callers"""
+    latencies = []
+    allowed_count = 0
+
+    for i in range(CHECKS_PER_TIER):
+        identifier = f"bench:{tier.value}:{i % IDENTIFIERS}"
+        start = time.perf_counter()
+        allowed, _ = await limiter.check_rate_limit(identifier, tier=tier)
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+        allowed_count += allowed
+
+    for i in range(IDENTIFIERS):
+        await limiter.reset_rate_limit(f"bench:{tier.value}:{i}")
+
+    latencies.sort()
+    return {
+        "tier": tier.value,
+        "mean_us": statistics.mean(latencies),
+        "p50_us": latencies[len(latencies) // 2],
+        "p99_us": latencies[int(len(latencies) * 0.99)],
+        "allowed": allowed_count,
+    }
+
+
+async def main():
+    """Run the benchmark for every tier"""
+    limiter = RateLimiter()
+    backend = "redis" if limiter.redis_cache.get_client() else "in-process ring"
+
+    # Warm up (also registers the Lua script / detects an unreachable Redis)
+    await limiter.check_rate_limit("bench:warmup")
+    await limiter.reset_rate_limit("bench:warmup")
+    if limiter.redis_cache.get_client() is None:
+        backend = "in-process ring"
+
+    print(f"Rate limiter benchmark ({backend}, {CHECKS_PER_TIER} checks per tier)")
+    print(f"{'tier':<12}{'mean us':>10}{'p50 us':>10}{'p99 us':>10}{'allowed':>10}")
+    for tier in RateLimitTier:
+        result = await benchmark_tier(limiter, tier)
+        print(
+            f"{result['tier']:<12}{result['mean_us']:>10.1f}"
+            f"{result['p50_us']:>10.1f}{result['p99_us']:>10.1f}"
+            f"{result['allowed']:>10}"
+        )
+
+    await limiter.redis_cache.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
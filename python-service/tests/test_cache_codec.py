@@ -0,0 +1,119 @@
+"""
+Cache Codec / Redis L2 Tests
+msgpack 코덱 왕복, 압축 임계값, 파이프라인 다중 조회 테스트
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.cache_codec import (
+    COMPRESSION_NONE,
+    CacheCodec,
+    EXCEL_ERROR_FIELDS,
+)
+from app.core.cache_engine import CacheEngine
+from app.core.integrated_cache import IntegratedCache
+from app.core.interfaces import ExcelError
+from app.core.redis_l2 import RedisL2Cache
+
+
+def make_error(index: int) -> ExcelError:
+    return ExcelError(
+        id=f"err-{index}",
+        type="#DIV/0!",
+        sheet="Sheet1",
+        cell=f"A{index}",
+        formula=f"=B{index}/0",
+        value="#DIV/0!",
+        message="0으로 나누기 오류",
+        severity="high",
+        is_auto_fixable=True,
+        suggested_fix=f"=IFERROR(B{index}/0, 0)",
+        confidence=0.9,
+    )
+
+
+class TestCacheCodec:
+    """CacheCodec 테스트"""
+
+    def test_excel_error_list_round_trip(self):
+        codec = CacheCodec(compression_threshold=1 << 30)
+        value = {
+            "errors": [make_error(i) for i in range(3)],
+            "created_at": datetime(2024, 1, 2, 3, 4, 5),
+            "cells": ("A1", "B2"),
+        }
+
+        decoded = codec.decode(codec.encode(value))
+
+        assert decoded == value
+        assert isinstance(decoded["errors"][0], ExcelError)
+
+    def test_rows_are_smaller_than_field_maps(self):
+        codec = CacheCodec(compression_threshold=1 << 30)
+        errors = [make_error(i) for i in range(50)]
+        as_dicts = [
+            {name: getattr(e, name) for name in EXCEL_ERROR_FIELDS} for e in errors
+        ]
+
+        assert len(codec.encode(errors)) < len(codec.encode(as_dicts)) * 0.7
+
+    def test_compression_above_threshold(self):
+        codec = CacheCodec(compression_threshold=1024)
+        small = codec.encode("x" * 10)
+        large_value = [make_error(i) for i in range(200)]
+        large = codec.encode(large_value)
+
+        assert small[1:2] == COMPRESSION_NONE
+        assert large[1:2] != COMPRESSION_NONE
+        assert codec.decode(large) == large_value
+
+
+class TestRedisL2Cache:
+    """RedisL2Cache 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_get_many_uses_single_mget(self):
+        l2 = RedisL2Cache(enabled=True)
+        client = MagicMock()
+        client.mget = AsyncMock(return_value=[l2.codec.encode({"v": 1}), None])
+        l2._client = client
+
+        assert await l2.get_many(["a", "b"]) == {"a": {"v": 1}}
+        client.mget.assert_awaited_once_with(
+            ["excel_unified:l2:a", "excel_unified:l2:b"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_failure_backs_off(self):
+        l2 = RedisL2Cache(enabled=True)
+        client = MagicMock()
+        client.mget = AsyncMock(side_effect=ConnectionError("down"))
+        l2._client = client
+
+        assert await l2.get("a") is None
+        assert await l2.get("a") is None
+        assert client.mget.await_count == 1
+
+
+class TestIntegratedCacheBatch:
+    """IntegratedCache 다중 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_get_many_checks_memory_first(self):
+        cache = IntegratedCache(engine=CacheEngine(max_bytes=1 << 20))
+        cache.redis_cache = MagicMock(
+            get_many=AsyncMock(return_value={"b": 2}),
+            set_many=AsyncMock(return_value=True),
+        )
+        await cache.set("a", 1, cache_level="memory")
+
+        assert await cache.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+        cache.redis_cache.get_many.assert_awaited_once_with(["b", "c"])
+        # Redis에서 찾은 값은 L1에도 채워짐
+        assert cache.memory.get("b") == 2
+
+        await cache.set_many({"x": 1, "y": 2}, ttl=60)
+        cache.redis_cache.set_many.assert_awaited_once_with({"x": 1, "y": 2}, 60)
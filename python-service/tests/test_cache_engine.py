@@ -0,0 +1,92 @@
+"""
+Cache Engine Tests
+바이트 기준 LRU, 타이머 휠 TTL, 통합 캐시 공유 테스트
+"""
+
+import pytest
+
+from app.core.cache_engine import CacheEngine, estimate_size, memory_cache_engine
+from app.core.integrated_cache import IntegratedCache
+from app.core.unified_cache import unified_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCacheEngine:
+    """CacheEngine 테스트"""
+
+    def test_lru_eviction_by_bytes(self):
+        engine = CacheEngine(max_bytes=300)
+        engine.set("a", "x", size=100)
+        engine.set("b", "y", size=100)
+        engine.set("c", "z", size=100)
+        assert engine.get("a") == "x"  # a를 최근 사용으로 갱신
+
+        engine.set("d", "w", size=150)
+
+        # 가장 오래 사용하지 않은 b, c 순서로 제거
+        assert engine.keys() == ["a", "d"]
+        assert engine.size_bytes == 250
+        assert engine.stats["evictions"] == 2
+
+    def test_oversized_value_is_not_stored(self):
+        engine = CacheEngine(max_bytes=100)
+        assert not engine.set("big", "x" * 1000)
+        assert "big" not in engine
+
+    def test_ttl_expiry_with_timer_wheel(self):
+        clock = FakeClock()
+        engine = CacheEngine(
+            max_bytes=10_000, tick_seconds=1.0, wheel_slots=8, clock=clock
+        )
+        engine.set("short", 1, ttl=2)
+        engine.set("long", 2, ttl=20)  # 휠 한 바퀴보다 먼 만료
+        engine.set("forever", 3)
+
+        clock.now += 3
+        assert engine.expire() == 1
+        assert engine.keys() == ["long", "forever"]
+
+        clock.now += 10
+        assert engine.expire() == 0
+        assert engine.get("long") == 2
+
+        clock.now += 10
+        assert engine.get("long") is None
+        assert engine.keys() == ["forever"]
+        assert engine.size_bytes == estimate_size(3)
+
+    def test_delete_prefix(self):
+        engine = CacheEngine(max_bytes=10_000)
+        engine.set("unified:a", 1)
+        engine.set("unified:b", 2)
+        engine.set("other", 3)
+
+        assert engine.delete_prefix("unified:") == 2
+        assert engine.keys() == ["other"]
+
+
+class TestSharedEngine:
+    """integrated_cache / unified_cache 엔진 공유 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_both_caches_route_through_engine(self):
+        cache = IntegratedCache()
+        await cache.set("engine-test:key", {"value": 1}, cache_level="memory")
+        await unified_cache.set_analysis("engine-test-file", {"sheets": 1})
+
+        assert cache.memory is memory_cache_engine
+        assert memory_cache_engine.get("engine-test:key") == {"value": 1}
+        assert await unified_cache.get_analysis("engine-test-file") == {"sheets": 1}
+        assert await cache.get("engine-test:key", cache_level="memory") == {"value": 1}
+
+        await unified_cache.clear_file_cache("engine-test-file")
+        await cache.clear_pattern("engine-test:")
+        assert await unified_cache.get_analysis("engine-test-file") is None
+        assert "engine-test:key" not in memory_cache_engine
@@ -0,0 +1,91 @@
+"""
+Cache Key Tests
+@cache_result 키 생성 (self 제외, 정규화, 파일 내용 기준, vary_on) 테스트
+"""
+
+import os
+
+import pytest
+
+from app.core.cache_keys import CacheKeyBuilder
+from app.core.content_hash import content_hash_registry
+from app.core.integrated_cache import cache_result, integrated_cache
+
+
+class Detector:
+    def __init__(self, version: int = 1):
+        self.version = version
+        self.calls = 0
+
+    async def analyze(self, file_path: str, options: dict = None):
+        self.calls += 1
+        return {"file": file_path, "calls": self.calls}
+
+
+class TestCacheKeyBuilder:
+    """CacheKeyBuilder 테스트"""
+
+    def test_ignores_self_and_argument_style(self):
+        builder = CacheKeyBuilder(Detector.analyze, prefix="detect")
+
+        first = builder.build((Detector(), "a.xlsx"), {"options": {"x": 1, "y": 2}})
+        second = builder.build(
+            (Detector(),), {"options": {"y": 2, "x": 1}, "file_path": "a.xlsx"}
+        )
+
+        assert first == second
+        assert first.startswith("detect:")
+        assert first != builder.build((Detector(), "b.xlsx"), {})
+
+    def test_file_arguments_keyed_by_content(self, tmp_path):
+        builder = CacheKeyBuilder(Detector.analyze)
+        first, second = tmp_path / "one.xlsx", tmp_path / "two.xlsx"
+        first.write_bytes(b"same")
+        second.write_bytes(b"same")
+        content_hash_registry.register(str(first), "digest-1")
+        content_hash_registry.register(str(second), "digest-1")
+
+        assert builder.build((None, str(first)), {}) == builder.build(
+            (None, str(second)), {}
+        )
+
+        # 등록되지 않은 파일은 크기/수정 시각으로 구분
+        third = tmp_path / "three.xlsx"
+        third.write_bytes(b"v1")
+        before = builder.build((None, str(third)), {})
+        third.write_bytes(b"v2-longer")
+        os.utime(third, ns=(1, 1))
+        assert builder.build((None, str(third)), {}) != before
+
+    def test_vary_on_self_attribute(self):
+        builder = CacheKeyBuilder(
+            Detector.analyze, vary_on=["file_path", "self.version"]
+        )
+
+        base = builder.build((Detector(1), "a.xlsx"), {"options": {"x": 1}})
+        assert base == builder.build((Detector(1), "a.xlsx"), {"options": {"x": 2}})
+        assert base != builder.build((Detector(2), "a.xlsx"), {})
+
+
+class TestCacheResultDecorator:
+    """@cache_result 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_hits_across_instances_and_prefix_stats(self):
+        calls = []
+
+        class Service:
+            @cache_result(prefix="cache-keys-test", ttl=60)
+            async def run(self, value: int):
+                calls.append(value)
+                return {"value": value}
+
+        assert await Service().run(1) == {"value": 1}
+        assert await Service().run(value=1) == {"value": 1}
+        assert calls == [1]
+
+        stats = integrated_cache.get_prefix_stats()["cache-keys-test"]
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["bytes"] > 0
+
+        await integrated_cache.clear_pattern("cache-keys-test:")
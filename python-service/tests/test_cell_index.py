@@ -0,0 +1,116 @@
+"""
+Workbook Cell Index Tests
+공유 셀 인덱스 테스트
+"""
+
+import pytest
+from types import SimpleNamespace
+from app.services.detection.cell_index import WorkbookCellIndex
+from app.services.detection.strategies.data_quality_detector import DataQualityDetector
+from app.services.detection.strategies.structure_detector import StructureDetector
+
+
+def make_worksheet(values, max_row=None, max_column=None):
+    """{(row, col): value} 에서 모의 워크시트 생성"""
+    cells = {}
+    for (row, col), value in values.items():
+        data_type = "f" if isinstance(value, str) and value.startswith("=") else "n"
+        if isinstance(value, str) and data_type != "f":
+            data_type = "s"
+        cells[(row, col)] = SimpleNamespace(
+            row=row,
+            column=col,
+            value=value,
+            data_type=data_type,
+            number_format="General",
+            is_date=False,
+        )
+    return SimpleNamespace(
+        _cells=cells,
+        max_row=max_row or max(row for row, _ in values),
+        max_column=max_column or max(col for _, col in values),
+        merged_cells=SimpleNamespace(ranges=[]),
+        row_dimensions={},
+        column_dimensions={},
+    )
+
+
+class FakeWorkbook:
+    def __init__(self, sheets):
+        self._sheets = sheets
+        self.sheetnames = list(sheets)
+
+    def __getitem__(self, name):
+        return self._sheets[name]
+
+
+class TestWorkbookCellIndex:
+    """WorkbookCellIndex 테스트"""
+
+    @pytest.fixture
+    def workbook(self):
+        return FakeWorkbook(
+            {
+                "Data": make_worksheet(
+                    {
+                        (1, 1): "Name",
+                        (1, 2): "Amount",
+                        (2, 1): "Alice",
+                        (2, 2): 10,
+                        (3, 1): "Bob",
+                        (3, 2): "=B2*2",
+                    },
+                    max_row=5,
+                    max_column=3,
+                )
+            }
+        )
+
+    def test_build_indexes_only_populated_cells(self, workbook):
+        index = WorkbookCellIndex.build(workbook)
+        sheet = index["Data"]
+
+        assert len(sheet) == 6
+        assert sheet.value(2, 2) == 10
+        assert sheet.value(5, 3) is None
+        assert sheet["B3"].data_type == "f"
+        assert [cell.coordinate for cell in sheet.iter_formula_cells()] == ["B3"]
+
+    def test_iter_cells_is_row_major(self, workbook):
+        sheet = WorkbookCellIndex.build(workbook)["Data"]
+        coords = [cell.coordinate for cell in sheet.iter_cells()]
+        assert coords == ["A1", "B1", "A2", "B2", "A3", "B3"]
+
+    def test_type_histograms(self, workbook):
+        sheet = WorkbookCellIndex.build(workbook)["Data"]
+
+        assert sheet.column_type_histograms[1]["text"] == 3
+        assert sheet.column_type_histograms[2]["formulas"] == 1
+        assert sheet.type_counts() == {
+            "numbers": 1,
+            "text": 4,
+            "formulas": 1,
+            "dates": 0,
+        }
+
+    def test_column_null_runs(self, workbook):
+        sheet = WorkbookCellIndex.build(workbook)["Data"]
+
+        starts, lengths = sheet.column_null_runs(1, first_row=2)
+        assert (starts.tolist(), lengths.tolist()) == ([4], [2])
+        starts, lengths = sheet.column_null_runs(3)
+        assert (starts.tolist(), lengths.tolist()) == ([1], [5])
+
+    def test_ensure_reuses_existing_index(self, workbook):
+        index = WorkbookCellIndex.build(workbook)
+        assert WorkbookCellIndex.ensure(index) is index
+
+    @pytest.mark.asyncio
+    async def test_detectors_share_index(self, workbook):
+        index = WorkbookCellIndex.build(workbook)
+
+        # 인덱스와 원본 워크북에서 같은 결과
+        for detector in (DataQualityDetector(), StructureDetector()):
+            from_index = await detector.detect(index)
+            from_workbook = await detector.detect(workbook)
+            assert [e.id for e in from_index] == [e.id for e in from_workbook]
@@ -0,0 +1,110 @@
+"""
+Data Quality Detector Tests
+열 지향 프레임 기반 중복/누락/타입 불일치/이상치 감지 테스트
+"""
+
+from datetime import datetime
+
+import pytest
+from openpyxl import Workbook
+
+from app.services.detection.cell_index import WorkbookCellIndex
+from app.services.detection.strategies.data_quality_detector import (
+    DataQualityDetector,
+)
+
+
+@pytest.fixture
+def workbook():
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Data"
+    sheet.append(["Code", "Amount", "Email", "Flag"])
+    rows = [
+        ("ABC-1", 10, "a@example.com", "yes"),
+        ("ABC-2", 11, "b@example.com", "yes"),
+        ("ABC-1", 12, "c@example.com", "no"),
+        ("ABC-3", 11, "not-an-email", "no"),
+        ("ABC-4", 10, "d@example.com", "yes"),
+        ("ABC-1", 1000, "e@example.com", "no"),
+        ("ABC-5", 12, "f@example.com", "yes"),
+        ("ABC-6", 11, datetime(2024, 1, 1), "no"),
+        ("ABC-7", 10, "g@example.com", "yes"),
+        ("ABC-8", None, "h@example.com", "no"),
+        ("ABC-9", 12, "i@example.com", "yes"),
+    ]
+    for row in rows:
+        sheet.append(row)
+    return workbook
+
+
+class TestDataQualityDetector:
+    """DataQualityDetector 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_detects_each_issue_type(self, workbook):
+        errors = await DataQualityDetector().detect(workbook)
+        by_type = {}
+        for error in errors:
+            by_type.setdefault(error.type, []).append(error.cell)
+
+        # 같은 열의 두 번째 이후 값만, 단순 값(yes/no)은 제외
+        assert by_type["Duplicate Data"] == ["A4", "A7"]
+        assert by_type["Missing Data"] == ["B11"]
+        assert by_type["Type Mismatch"] == ["C5", "C9"]
+        assert by_type["Outlier"] == ["B7"]
+
+        duplicate = next(e for e in errors if e.cell == "A4")
+        assert duplicate.value == "ABC-1" and "A2" in duplicate.message
+        mismatch = next(e for e in errors if e.cell == "C5")
+        assert mismatch.message == "타입 불일치: email 예상, text 발견"
+
+    @pytest.mark.asyncio
+    async def test_runs_of_empty_cells_are_not_reported(self):
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["Value"])
+        for row in range(2, 42):
+            if row not in (20, 21, 22):
+                sheet.cell(row, 1, row)
+
+        errors = await DataQualityDetector().detect(workbook)
+
+        # 연속된 빈 셀 3개는 의도적으로 비운 것으로 보고 건너뜀
+        assert [e for e in errors if e.type == "Missing Data"] == []
+
+    @pytest.mark.asyncio
+    async def test_tall_sparse_sheet_scales_with_populated_cells(self):
+        # 빈 셀 구간(런 렝스)만 다루므로 max_row 크기의 배열을 만들지 않음
+        index = WorkbookCellIndex.with_sheets(["Tall"])
+        sheet = index["Tall"]
+        sheet.add_cell(1, 1, "Value", "s")
+        for row in range(2, 1001):
+            if row != 500:
+                sheet.add_cell(row, 1, row, "n")
+        sheet.max_row = 1000
+        sheet.finalize()
+
+        errors = await DataQualityDetector().detect(index)
+        assert [e.cell for e in errors if e.type == "Missing Data"] == ["A500"]
+
+        # 5천만 행 범위도 구간 두 개로 표현되고, 긴 구간은 바로 제외됨
+        starts, lengths = sheet.column_null_runs(1, first_row=2, last_row=50_000_000)
+        assert starts.tolist() == [500, 1001]
+        assert lengths.tolist() == [1, 49_999_000]
+        isolated = DataQualityDetector._isolated_null_rows(starts, lengths)
+        assert isolated.tolist() == [500]
+
+    @pytest.mark.asyncio
+    async def test_numeric_strings_are_not_outlier_candidates(self):
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "Sheet"
+        sheet.append(["Amount"])
+        for value in (100, 101, 102, 103, 104, "12.5", 105):
+            sheet.append([value])
+
+        errors = await DataQualityDetector().detect(workbook)
+
+        # "12.5"는 문자열 셀이므로 IQR 계산과 이상치 보고 대상이 아님
+        assert [e for e in errors if e.type == "Outlier"] == []
@@ -0,0 +1,257 @@
+"""
+Dependency Graph Tests
+수식 의존성 그래프 및 순환 참조 감지 테스트
+"""
+
+import random
+
+import openpyxl
+import pytest
+from openpyxl.workbook.defined_name import DefinedName
+
+from app.core.interfaces import ExcelErrorType
+from app.services.circular_reference_detector import CircularReferenceDetector
+from app.services.detection.cell_index import WorkbookCellIndex
+from app.services.detection.dependency_graph import (
+    MAX_COLUMN,
+    MAX_ROW,
+    DependencyGraph,
+    IntervalIndex,
+    parse_references,
+)
+from app.services.detection.strategies.enhanced_formula_detector import (
+    EnhancedFormulaDetector,
+)
+
+
+@pytest.fixture
+def workbook():
+    """직접/간접/시트 간/범위 순환과 순환 없는 체인을 포함한 워크북"""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Calc"
+    sheet["A1"] = "=B1+1"
+    sheet["B1"] = "=A1*2"  # 직접 순환
+    sheet["C1"] = "=D1"
+    sheet["D1"] = "=E1"
+    sheet["E1"] = "=C1"  # 간접 순환
+    sheet["F1"] = "=F1+1"  # 자기 참조
+    sheet["G5"] = "=SUM(G1:G4)"
+    sheet["G2"] = "=G5/2"  # 범위를 통한 순환
+    sheet["H1"] = 10
+    sheet["H2"] = "=H1*2"
+    sheet["H3"] = '=H2+"A1"'  # 문자열 안 참조는 무시
+    sheet["H4"] = "=H3+'My Data'!A1"
+
+    other = workbook.create_sheet("My Data")
+    other["A1"] = "=Calc!H2+1"
+    other["B1"] = "=Calc!J1"
+    sheet["J1"] = "='My Data'!B1"  # 시트 간 순환
+    return workbook
+
+
+class TestDependencyGraph:
+    """DependencyGraph 테스트"""
+
+    def test_parse_references(self):
+        references = parse_references(
+            "=SUM($A$1:B3)+'My Data'!C2*Other!D4+\"E5\"+LOG10(2)", "Calc"
+        )
+        assert references == [
+            ("Calc", 1, 1, 3, 2),
+            ("My Data", 2, 3, 2, 3),
+            ("Other", 4, 4, 4, 4),
+        ]
+
+    def test_parse_unquoted_unicode_sheet_references(self):
+        references = parse_references("=시트1!A1+1+매출_2024!B2:C3*_tmp!D1", "Calc")
+        assert references == [
+            ("시트1", 1, 1, 1, 1),
+            ("매출_2024", 2, 2, 3, 3),
+            ("_tmp", 1, 4, 1, 4),
+        ]
+
+    def test_cycles_from_scc(self, workbook):
+        graph = DependencyGraph.for_workbook(workbook)
+        cycles = {frozenset(cycle) for cycle in graph.cycles()}
+
+        assert cycles == {
+            frozenset({"Calc!A1", "Calc!B1"}),
+            frozenset({"Calc!C1", "Calc!D1", "Calc!E1"}),
+            frozenset({"Calc!F1"}),
+            frozenset({"Calc!G5", "Calc!G2"}),
+            frozenset({"Calc!J1", "My Data!B1"}),
+        }
+        assert graph.is_in_cycle("Calc", 1, 1)
+        assert not graph.is_in_cycle("Calc", 2, 8)
+
+    def test_depth_and_longest_path(self, workbook):
+        graph = DependencyGraph.for_workbook(workbook)
+
+        assert graph.depth("Calc", 2, 8) == 0
+        assert graph.depth("Calc", 4, 8) == 2
+        longest_path = graph.longest_path()
+        assert len(longest_path) == 3
+        assert (longest_path[0], longest_path[-1]) == ("Calc!H2", "Calc!H4")
+        assert graph.dependents("Calc", 2, 8) == ["Calc!H3", "My Data!A1"]
+
+    def test_long_chain_without_recursion_limit(self):
+        entries = [("S", "A1", "=1")] + [
+            ("S", f"A{row}", f"=A{row - 1}+1") for row in range(2, 20001)
+        ]
+        graph = DependencyGraph.from_formulas(entries)
+
+        assert not graph.has_cycles()
+        assert graph.depth("S", 20000, 1) == 19999
+
+    def test_cell_index_shares_graph(self, workbook):
+        cell_index = WorkbookCellIndex.build(workbook)
+        graph = cell_index.dependency_graph
+
+        assert DependencyGraph.for_workbook(cell_index) is graph
+        assert cell_index.sheet_slice("Calc", graph).dependency_graph is graph
+        assert not cell_index.sheet_slice("Calc").has_dependency_graph
+
+
+class TestRangeCompressedEdges:
+    """범위 압축 엣지 및 구간 인덱스 테스트"""
+
+    def test_parse_whole_column_and_row(self):
+        references = parse_references("=SUM(B:B)+SUM(Data!$2:$3)", "Calc")
+        assert references == [
+            ("Calc", 1, 2, MAX_ROW, 2),
+            ("Data", 2, 1, 3, MAX_COLUMN),
+        ]
+
+    def test_large_and_whole_column_ranges_form_cycles(self):
+        graph = DependencyGraph.from_formulas(
+            [
+                ("S", "C1", "=SUM(B2:B5000)"),
+                ("S", "B4999", "=C1*2"),
+                ("S", "E1", "=SUM(D:D)"),
+                ("S", "D70000", "=E1"),
+                ("S", "F3", "=SUM(2:2)"),
+                ("S", "XFD2", "=F3"),
+            ]
+        )
+        cycles = {frozenset(cycle) for cycle in graph.cycles()}
+
+        assert cycles == {
+            frozenset({"S!C1", "S!B4999"}),
+            frozenset({"S!E1", "S!D70000"}),
+            frozenset({"S!F3", "S!XFD2"}),
+        }
+
+    def test_dependents_of_value_cells(self):
+        graph = DependencyGraph.from_formulas(
+            [
+                ("S", "C1", "=SUM(B2:B5000)"),
+                ("S", "C2", "=SUM(B:B)"),
+                ("S", "C3", "=SUM(3:3)"),
+                ("S", "C4", "=C1+C3"),
+            ]
+        )
+
+        assert graph.dependents("S", 2500, 2) == ["S!C1", "S!C2"]
+        assert graph.dependents("S", 3, 2) == ["S!C1", "S!C2", "S!C3"]
+        assert graph.dependents("S", 6000, 2) == ["S!C2"]
+        assert graph.transitive_dependents("S", 3, 200) == {"S!C3", "S!C4"}
+
+    def test_named_ranges(self):
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "Calc"
+        workbook.defined_names["Rates"] = DefinedName(
+            "Rates", attr_text="Calc!$C$1:$C$10"
+        )
+        sheet["D1"] = "=SUM(Rates)*2"
+        sheet["C5"] = "=D1/10"
+
+        graph = DependencyGraph.for_workbook(workbook)
+
+        assert graph.precedents("Calc", 1, 4) == ["Calc!C1:C10"]
+        assert graph.cycles() and set(graph.cycles()[0]) == {"Calc!D1", "Calc!C5"}
+
+    def test_unicode_sheet_and_defined_names(self):
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "계산"
+        workbook.defined_names["세율"] = DefinedName("세율", attr_text="계산!$C$1")
+        sheet["A1"] = "=계산!B1+1"
+        sheet["B1"] = "=세율*A1"
+        sheet["C1"] = "=B1"
+
+        graph = DependencyGraph.for_workbook(workbook)
+
+        assert graph.precedents("계산", 1, 1) == ["계산!B1"]
+        assert graph.precedents("계산", 1, 2) == ["계산!A1", "계산!C1"]
+        assert all(graph.is_in_cycle("계산", 1, column) for column in (1, 2, 3))
+
+    def test_interval_index_matches_brute_force(self):
+        rng = random.Random(7)
+        intervals = []
+        index = IntervalIndex()
+        for value in range(500):
+            start = rng.randint(1, 1000)
+            end = start + rng.randint(0, 200)
+            intervals.append((start, end))
+            index.add(start, end, value)
+
+        for point in range(0, 1300, 7):
+            expected = {
+                value
+                for value, (start, end) in enumerate(intervals)
+                if start <= point <= end
+            }
+            assert set(index.query(point)) == expected
+
+
+class TestGraphConsumers:
+    """의존성 그래프를 사용하는 감지기 테스트"""
+
+    def test_circular_reference_detector(self, workbook):
+        chains = CircularReferenceDetector().analyze_workbook(workbook)
+        chain_types = sorted(chain.chain_type for chain in chains)
+
+        assert chain_types == [
+            "direct",
+            "direct",
+            "indirect",
+            "indirect",
+            "multi-sheet",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_formula_detector_flags_cycle_members(self, workbook):
+        errors = await EnhancedFormulaDetector().detect(workbook)
+        circular = {
+            f"{error.sheet}!{error.cell}"
+            for error in errors
+            if error.type == ExcelErrorType.CIRCULAR_REF.value
+        }
+
+        assert {"Calc!A1", "Calc!B1", "Calc!G2", "Calc!G5", "My Data!B1"} <= circular
+        assert "Calc!H4" not in circular
+
+    @pytest.mark.asyncio
+    async def test_openpyxl_cells_build_graph_once_per_workbook(
+        self, workbook, monkeypatch
+    ):
+        builds = []
+        for_workbook = DependencyGraph.for_workbook.__func__
+        monkeypatch.setattr(
+            DependencyGraph,
+            "for_workbook",
+            classmethod(lambda cls, wb: builds.append(wb) or for_workbook(cls, wb)),
+        )
+        detector = EnhancedFormulaDetector()
+        sheet = workbook["Calc"]
+
+        flagged = []
+        for coordinate in ("A1", "B1", "C1", "H4"):
+            errors = await detector.check_cell_formula(sheet[coordinate], "Calc")
+            if any(e.type == ExcelErrorType.CIRCULAR_REF.value for e in errors):
+                flagged.append(coordinate)
+
+        assert flagged == ["A1", "B1", "C1"]
+        assert builds == [workbook]
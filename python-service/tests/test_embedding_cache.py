@@ -0,0 +1,196 @@
+"""
+Embedding Cache Tests
+텍스트 해시 임베딩 캐시, 동시 요청 병합, Vertex AI 배치 동시 전송, 로컬 모델 테스트
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.core.redis_l2 import RedisL2Cache
+from app.services.embedding.embedding_cache import (
+    CachedEmbeddingService,
+    EmbeddingCache,
+)
+from app.services.embedding.local_embedding import LocalEmbeddingService
+from app.services.embedding.vertex_ai_embedding import VertexAIEmbeddingService
+
+
+class CountingService(LocalEmbeddingService):
+    """내부 서비스로 전달된 텍스트를 기록"""
+
+    def __init__(self, latency=0.0):
+        super().__init__(dimension=16, latency=latency)
+        self.received = []
+
+    async def create_embeddings(self, texts):
+        self.received.append(list(texts))
+        return await super().create_embeddings(texts)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class Pipeline:
+            def set(self, key, value, ex=None):
+                redis.data[key] = value
+
+            async def execute(self):
+                return []
+
+        return Pipeline()
+
+
+def local_cache(namespace="test", max_entries=100):
+    return EmbeddingCache(
+        namespace, max_entries, redis_cache=RedisL2Cache(enabled=False)
+    )
+
+
+class TestCachedEmbeddingService:
+    """CachedEmbeddingService 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_only_misses_reach_model(self):
+        inner = CountingService()
+        service = CachedEmbeddingService(inner, local_cache())
+
+        first = await service.create_embeddings(["a b", "c d", "a b"])
+        second = await service.create_embeddings(["c d", "e f", ""])
+
+        # 배치 안 중복은 한 번, 캐시된 텍스트는 다시 보내지 않음 (빈 텍스트는 캐시 안 함)
+        assert inner.received == [["a b", "c d"], ["e f", ""]]
+        assert first[0] == first[2] and first[1] == second[0]
+        assert await service.create_embedding("e f") == second[1]
+        assert service.get_cache_stats()["memory_hits"] == 2
+        assert service.get_usage_stats()["calls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_texts_share_one_call(self):
+        inner = CountingService(latency=0.05)
+        service = CachedEmbeddingService(inner, local_cache())
+
+        results = await asyncio.gather(
+            service.create_embedding("sum formula"),
+            service.create_embedding("sum formula"),
+            service.create_embeddings(["sum formula", "vlookup"]),
+        )
+
+        assert inner.received == [["sum formula"], ["vlookup"]]
+        assert results[0] == results[1] == results[2][0]
+        assert service.stats["inflight_joins"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_to_waiters_and_is_not_cached(self):
+        class Failing(CountingService):
+            async def create_embeddings(self, texts):
+                await asyncio.sleep(0.01)
+                raise RuntimeError("quota")
+
+        service = CachedEmbeddingService(Failing(), local_cache())
+        results = await asyncio.gather(
+            service.create_embedding("x"),
+            service.create_embedding("x"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert service._inflight == {}
+        assert service.cache.get_stats()["memory_entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_waiter_retries_when_owner_is_cancelled(self):
+        inner = CountingService(latency=0.05)
+        service = CachedEmbeddingService(inner, local_cache())
+
+        owner = asyncio.create_task(service.create_embedding("sum formula"))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(service.create_embeddings(["sum formula"]))
+        await asyncio.sleep(0.01)
+        owner.cancel()
+
+        # 취소되지 않은 요청은 CancelledError 대신 직접 다시 계산한 결과를 받음
+        (embedding,) = await waiter
+        assert owner.cancelled()
+        assert embedding == await inner.create_embedding("sum formula")
+        assert inner.received[:2] == [["sum formula"], ["sum formula"]]
+        assert service._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_shared_between_workers(self):
+        redis = FakeRedis()
+        shared = RedisL2Cache(enabled=True)
+        shared._client = redis
+
+        worker_a = CachedEmbeddingService(
+            CountingService(), EmbeddingCache("m", 1, redis_cache=shared)
+        )
+        inner_b = CountingService()
+        worker_b = CachedEmbeddingService(
+            inner_b, EmbeddingCache("m", 1, redis_cache=shared)
+        )
+
+        embedding = await worker_a.create_embedding("pivot table")
+        assert await worker_b.create_embedding("pivot table") == embedding
+        assert inner_b.received == []
+        assert worker_b.cache.get_stats()["redis_hits"] == 1
+
+        # 메모리 LRU는 max_entries만 유지
+        await worker_a.create_embedding("chart")
+        assert worker_a.cache.get_stats()["memory_entries"] == 1
+
+
+class TestEmbeddingModels:
+    """Vertex AI 배치 전송과 로컬 모델 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_vertex_batches_run_concurrently_on_shared_executor(self):
+        service = VertexAIEmbeddingService()
+        active, peak, threads = [0], [0], set()
+        lock = threading.Lock()
+
+        def get_embeddings(texts):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+                threads.add(threading.current_thread().name)
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return [SimpleNamespace(values=[float(len(t))]) for t in texts]
+
+        service.model = SimpleNamespace(get_embeddings=get_embeddings)
+        texts = [f"text {i:02d}" for i in range(20)]
+        try:
+            embeddings = await service.create_embeddings(texts)
+            await service.create_embedding("again")
+        finally:
+            service.close()
+
+        assert embeddings == [[7.0]] * 20
+        # 5개씩 4배치가 동시에, 호출마다 새 풀이 아니라 같은 풀의 스레드로
+        assert peak[0] > 1
+        assert all(name.startswith("vertex-embedding") for name in threads)
+
+    @pytest.mark.asyncio
+    async def test_local_model_is_deterministic_and_lexical(self):
+        model = LocalEmbeddingService(dimension=256)
+        a, b, c = await model.create_embeddings(
+            ["VLOOKUP returns #N/A", "vlookup returns #n/a error", "pivot chart"]
+        )
+
+        other = LocalEmbeddingService(dimension=256)
+        assert await other.create_embedding("VLOOKUP returns #N/A") == a
+        assert len(a) == 256 and np.linalg.norm(a) == pytest.approx(1.0)
+        assert np.dot(a, b) > 0.7 > np.dot(a, c)
@@ -0,0 +1,58 @@
+"""
+Excel to HTML Converter Tests
+병합 셀 조회 맵, 누적 크기 배열, 스타일 메모이제이션 테스트
+"""
+
+import openpyxl
+from openpyxl.styles import Font
+
+from app.services.excel_to_html_converter import ExcelToHtmlConverter
+
+
+def _cell_map(result):
+    cells = {}
+    for row_index, row in enumerate(result["html_rows"], start=1):
+        for cell in row:
+            cells.setdefault(row_index, []).append(cell)
+    return cells
+
+
+class TestExcelToHtmlConverter:
+    """ExcelToHtmlConverter 테스트"""
+
+    def test_merged_cells_use_spans_and_summed_sizes(self):
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.column_dimensions["B"].width = 10  # 75px (A, C는 기본 13 → 96px)
+        sheet.row_dimensions[2].height = 30  # 39px
+        sheet["A1"] = "title"
+        sheet["D3"] = "end"
+        sheet.merge_cells("A1:C2")
+
+        result = ExcelToHtmlConverter().convert_sheet_to_html(sheet)
+        rows = _cell_map(result)
+
+        master = rows[1][0]["attrs"]
+        assert (master["rowspan"], master["colspan"]) == (2, 3)
+        assert "merged-cell" in master["class"]
+        assert master["style"].endswith(" width: 267px; height: 64px;")
+        # 병합에 가려진 셀은 렌더링하지 않음
+        assert [len(rows[row]) for row in (1, 2, 3)] == [2, 1, 4]
+
+    def test_style_memoised_per_style_id(self):
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        for row in range(1, 4):
+            sheet.cell(row=row, column=1, value=row).font = Font(bold=True)
+
+        converter = ExcelToHtmlConverter()
+        cache = {}
+        styles = [
+            converter._get_cell_style(sheet.cell(row=row, column=1), 64, 25, cache)
+            for row in range(1, 4)
+        ]
+
+        assert len(cache) == 1
+        assert len(set(styles)) == 1
+        assert styles[0] == converter._get_cell_style(sheet["A1"], 64, 25)
+        assert "font-weight: bold" in styles[0]
@@ -0,0 +1,105 @@
+"""
+Excel Viewport Tests
+뷰포트 타일 렌더링, ETag, 인접 타일 프리페치 테스트
+"""
+
+from io import BytesIO
+
+import openpyxl
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1 import excel_viewport
+from app.services.excel_viewport_service import ExcelViewportService
+
+
+@pytest.fixture
+def workbook_bytes():
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Data"
+    for row in range(1, 201):
+        for col in range(1, 31):
+            sheet.cell(row=row, column=col, value=row * 100 + col)
+    sheet.merge_cells("B9:D12")
+    buffer = BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def service(tmp_path, workbook_bytes):
+    path = tmp_path / "viewport.xlsx"
+    path.write_bytes(workbook_bytes)
+    service = ExcelViewportService(max_workbooks=2, max_tiles=16)
+    service.open_workbook(str(path), "file-1")
+    return service
+
+
+class TestExcelViewportService:
+    """ExcelViewportService 테스트"""
+
+    def test_renders_only_window(self, service):
+        _, tile = service.get_tile("file-1", "Data", 11, 3, 5, 4)
+
+        assert (tile["row_start"], tile["row_end"]) == (11, 15)
+        assert (tile["col_start"], tile["col_end"]) == (3, 6)
+        assert len(tile["html_rows"]) == 5
+        # 11~12행의 C, D열은 B9 병합에 가려짐
+        assert [cell["value"] for cell in tile["html_rows"][0]] == ["1105", "1106"]
+        assert len(tile["merged_cells"]) == 1
+        assert tile["top"] == 10 * 25 and tile["left"] == 2 * 96
+
+    def test_tile_cache_and_etag(self, service):
+        etag, first = service.get_tile("file-1", "Data", 1, 1, 50, 26)
+        again, second = service.get_tile("file-1", "Data", 1, 1, 50, 26)
+
+        assert etag == again == service.tile_etag("file-1", "Data", 1, 1, 50, 26)
+        assert second is first
+        assert service.get_stats()["tile_hits"] == 1
+        assert etag != service.tile_etag("file-1", "Data", 51, 1, 50, 26)
+
+    def test_prefetch_adjacent_tiles(self, service):
+        service.get_tile("file-1", "Data", 1, 1, 50, 26)
+
+        # 위/왼쪽은 시트 밖이라 아래/오른쪽만 렌더링
+        assert service.prefetch_adjacent("file-1", "Data", 1, 1, 50, 26) == 2
+        service.get_tile("file-1", "Data", 51, 1, 50, 26)
+        assert service.get_stats()["tile_hits"] == 1
+
+    def test_window_validation(self, service):
+        with pytest.raises(ValueError):
+            service.get_tile("file-1", "Data", 1, 1, 1000, 1000)
+        with pytest.raises(KeyError):
+            service.get_tile("file-1", "Missing", 1, 1, 10, 10)
+
+
+class TestExcelViewportApi:
+    """뷰포트 API 테스트"""
+
+    def test_open_and_conditional_get(self, workbook_bytes):
+        app = FastAPI()
+        app.include_router(excel_viewport.router, prefix="/excel-viewport")
+        client = TestClient(app)
+
+        opened = client.post(
+            "/excel-viewport/open",
+            files={"file": ("big.xlsx", workbook_bytes)},
+        ).json()
+        url = f"/excel-viewport/{opened['file_id']}/sheets/Data/tile"
+        assert opened["sheets"][0]["max_row"] == 200
+
+        response = client.get(url, params={"row": 1, "rows": 20, "cols": 10})
+        assert response.status_code == 200
+        assert len(response.json()["html_rows"]) == 20
+
+        cached = client.get(
+            url,
+            params={"row": 1, "rows": 20, "cols": 10},
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+        assert cached.status_code == 304
+
+        client.delete(f"/excel-viewport/{opened['file_id']}")
+        assert client.get(url).status_code == 404
@@ -0,0 +1,109 @@
+"""
+File Path Resolver Tests
+워커 간 공유 파일 매핑 (Redis 해시 + 생성 시각 인덱스) 테스트
+"""
+
+from collections import OrderedDict
+import json
+
+import pytest
+
+from app.core.file_path_resolver import FilePathResolver
+from app.core.redis_l2 import RedisL2Cache
+
+
+class FakeRedis:
+    """해시/정렬 집합 명령만 구현한 메모리 Redis"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.zsets = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    async def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    async def hmget(self, key, fields):
+        return [self.hashes.get(key, {}).get(field) for field in fields]
+
+    async def hdel(self, key, *fields):
+        return sum(self.hashes.get(key, {}).pop(f, None) is not None for f in fields)
+
+    async def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zrem(self, key, member):
+        return int(self.zsets.get(key, {}).pop(member, None) is not None)
+
+    async def zrangebyscore(self, key, low, high):
+        items = sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1])
+        return [member.encode() for member, score in items if score <= high]
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queued = []
+
+    def __getattr__(self, name):
+        method = getattr(self.redis, name)
+        return lambda *args: self.queued.append(method(*args))
+
+    async def execute(self):
+        return [await call for call in self.queued]
+
+
+@pytest.fixture
+def shared_redis(monkeypatch):
+    redis = FakeRedis()
+    cache = RedisL2Cache(enabled=True)
+    cache._client = redis
+    monkeypatch.setattr(FilePathResolver, "redis_cache", cache)
+    monkeypatch.setattr(FilePathResolver, "_mappings", OrderedDict())
+    return redis
+
+
+class TestFilePathResolver:
+    """FilePathResolver 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_mapping_visible_to_other_worker(self, shared_redis, tmp_path):
+        file_path = tmp_path / "a.xlsx"
+        file_path.write_bytes(b"x")
+        await FilePathResolver.save_file_mapping("excel_a", str(file_path))
+
+        # 다른 워커: 프로세스 내 매핑은 비어 있고 공유 저장소만 있음
+        FilePathResolver._mappings.clear()
+        assert await FilePathResolver.get_file_path("excel_a") == str(file_path)
+
+        file_path.unlink()
+        assert await FilePathResolver.get_file_path("excel_a") is None
+        assert shared_redis.hashes[FilePathResolver.key_prefix] == {}
+
+    @pytest.mark.asyncio
+    async def test_cleanup_only_removes_expired(self, shared_redis, tmp_path):
+        old, new = tmp_path / "old.xlsx", tmp_path / "new.xlsx"
+        for path in (old, new):
+            path.write_bytes(b"x")
+        await FilePathResolver.save_file_mapping("excel_old", str(old))
+        await FilePathResolver.save_file_mapping("excel_new", str(new))
+
+        # 이전 워커가 오래전에 저장한 매핑
+        FilePathResolver._mappings.clear()
+        created_key = f"{FilePathResolver.key_prefix}:created"
+        shared_redis.zsets[created_key]["excel_old"] = 0
+
+        assert await FilePathResolver.cleanup_old_mappings(max_age_hours=1) == 1
+        assert not old.exists() and new.exists()
+        assert list(shared_redis.zsets[created_key]) == ["excel_new"]
+        stored = shared_redis.hashes[FilePathResolver.key_prefix]
+        assert json.loads(stored["excel_new"])["file_path"] == str(new)
+        assert "excel_old" not in stored
+
+        # 다른 워커가 이미 정리한 항목은 다시 세지 않음
+        assert await FilePathResolver.cleanup_old_mappings(max_age_hours=1) == 0
@@ -0,0 +1,151 @@
+"""
+Incremental Formula Model Tests
+세션별 증분 재계산 수식 모델 테스트
+"""
+
+import pytest
+
+pytest.importorskip("formulas")
+
+from app.services.incremental_formula_model import (  # noqa: E402
+    IncrementalFormulaModel,
+    SessionModelCache,
+)
+from app.services.realtime_formula_validator import (  # noqa: E402
+    RealtimeFormulaValidator,
+)
+
+
+@pytest.fixture
+def model():
+    return IncrementalFormulaModel.from_context(
+        {
+            "Calc": {
+                "A1": 1,
+                "A2": 2,
+                "B1": "=SUM(A1:A2)",
+                "C1": "=B1*10",
+                "D1": "=A2/0",
+                "E1": "=SUM(A:A)",
+                "F1": 100,
+                "G1": "=F1+1",
+            },
+            "Report": {"A1": "=Calc!C1+1"},
+        }
+    )
+
+
+class TestIncrementalFormulaModel:
+    """IncrementalFormulaModel 테스트"""
+
+    def test_initial_values(self, model):
+        assert model.value("Calc", "B1") == 3
+        assert model.value("Calc", "C1") == 30
+        assert model.value("Calc", "D1") == "#DIV/0!"
+        assert model.value("Calc", "E1") == 3
+        assert model.value("Report", "A1") == 31
+
+    def test_recalculates_only_dependents(self, model):
+        model.value("Report", "A1")
+        model.value("Calc", "G1")
+        evaluations = model.evaluations
+
+        dirty = model.set_cell("Calc", "A1", 5)
+
+        assert {("Calc", 1, 2), ("Calc", 1, 3), ("Report", 1, 1)} <= dirty
+        assert ("Calc", 1, 7) not in dirty
+        # B1, C1, E1(전체 열), Report!A1만 다시 계산
+        assert model.evaluations - evaluations == 4
+        assert model.value("Report", "A1") == 71
+        assert model.value("Calc", "G1") == 101
+        assert model.evaluations - evaluations == 4
+
+    def test_preview_does_not_commit(self, model):
+        assert model.value("Report", "A1") == 31
+
+        preview = model.preview("Calc", "B1", "=A1*100")
+
+        assert preview == {"value": 100, "error": None, "circular": False}
+        assert model.value("Calc", "B1") == 3
+        assert model.value("Report", "A1") == 31
+
+    def test_circular_reference(self, model):
+        preview = model.preview("Calc", "A2", "=C1")
+        assert preview["circular"]
+
+        model.set_cell("Calc", "A2", "=C1")
+        assert model.is_circular("Calc", "B1")
+        assert not model.is_circular("Calc", "G1")
+
+        model.set_cell("Calc", "A2", 4)
+        assert not model.is_circular("Calc", "B1")
+        assert model.value("Calc", "C1") == 50
+
+    def test_parse_error(self, model):
+        preview = model.preview("Calc", "H1", "=SUM(")
+        assert preview["error"]
+        assert model.error("Calc", "H1") is None
+
+    def test_unquoted_unicode_sheet_reference(self):
+        model = IncrementalFormulaModel.from_context(
+            {"시트1": {"A1": 5}, "Sheet2": {"A1": "=시트1!A1*2"}}
+        )
+
+        assert model.value("Sheet2", "A1") == 10
+        assert model.dependents("시트1", "A1") == ["Sheet2!A1"]
+
+    def test_invalid_address_is_rejected(self, model):
+        for address in ("A1:B2", "Calc!A1", "A0", "XFE1"):
+            with pytest.raises(ValueError, match="Invalid cell address"):
+                model.preview("Calc", address, "=1")
+
+        # 거부된 변경은 아무것도 바꾸지 않음
+        with pytest.raises(ValueError):
+            model.apply_changes([("Calc", "A1", 9), ("Calc", "A1:B2", 1)])
+        assert model.value("Calc", "B1") == 3
+
+        validator = RealtimeFormulaValidator()
+        result = validator.validate_formula_realtime("=1+1", "A1:B2")
+        assert not result.valid and "Invalid cell address" in result.error
+        results = validator.batch_validate_changes(
+            [{"cell": "A1:B2", "value": 1}, {"cell": "B1", "formula": "=2*3"}]
+        )
+        assert not results["Sheet1!A1:B2"].valid
+        assert results["Sheet1!B1"].calculated_value == 6
+
+
+class TestSessionModelCache:
+    """SessionModelCache 테스트"""
+
+    def test_lru_eviction(self):
+        cache = SessionModelCache(max_sessions=2)
+        first = cache.get_or_create("a")
+        cache.get_or_create("b")
+        assert cache.get("a") is first
+
+        cache.get_or_create("c")
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.stats()["evictions"] == 1
+
+    def test_validator_sessions_are_isolated(self):
+        validator = RealtimeFormulaValidator()
+        validator.set_context("Sheet1", {"A1": 2}, session_id="s1")
+        validator.set_context("Sheet1", {"A1": 7}, session_id="s2")
+
+        first = validator.validate_formula_realtime("A1*3", "B1", session_id="s1")
+        second = validator.validate_formula_realtime("A1*3", "B1", session_id="s2")
+
+        assert (first.calculated_value, second.calculated_value) == (6, 21)
+        assert "B1" not in validator.get_model("s1").inputs["Sheet1"]
+
+        results = validator.batch_validate_changes(
+            [
+                {"sheet": "Sheet1", "cell": "A1", "value": 10},
+                {"sheet": "Sheet1", "cell": "B1", "formula": "=A1+1"},
+            ],
+            session_id="s1",
+        )
+        assert results["Sheet1!B1"].calculated_value == 11
+        assert validator.get_model("s1").inputs["Sheet1"] == {"A1": 2}
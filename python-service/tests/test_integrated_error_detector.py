@@ -3,11 +3,12 @@ Integrated Error Detector Tests
 통합 오류 감지기 테스트
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from app.services.detection.integrated_error_detector import IntegratedErrorDetector
 from app.core.interfaces import ExcelError
-from datetime import datetime
 
 
 class TestIntegratedErrorDetector:
@@ -17,10 +18,38 @@ class TestIntegratedErrorDetector:
     def mock_progress_reporter(self):
         """모의 진행 상황 보고기"""
         reporter = MagicMock()
+        reporter.start_task = AsyncMock()
         reporter.report_progress = AsyncMock()
+        reporter.complete_task = AsyncMock()
         reporter.report_error = AsyncMock()
         return reporter
 
+    @pytest.fixture
+    def fake_cache(self):
+        """통합 캐시 대신 쓰는 딕셔너리 저장소"""
+        store = {}
+
+        async def set_value(key, value, ttl=None):
+            store[key] = value
+
+        async def clear_pattern(pattern):
+            keys = [key for key in store if key.startswith(pattern)]
+            for key in keys:
+                del store[key]
+            return len(keys)
+
+        cache = MagicMock()
+        cache.store = store
+        cache.get_analysis = AsyncMock(side_effect=store.get)
+        cache.set_analysis = AsyncMock(side_effect=set_value)
+        cache.set_errors = AsyncMock()
+        cache.set = AsyncMock(side_effect=set_value)
+        cache.clear_pattern = AsyncMock(side_effect=clear_pattern)
+        with patch(
+            "app.services.detection.integrated_error_detector.integrated_cache", cache
+        ):
+            yield cache
+
     @pytest.fixture
     def detector(self, mock_progress_reporter):
         """감지기 인스턴스"""
@@ -48,34 +77,42 @@ class TestIntegratedErrorDetector:
         )
 
     @pytest.mark.asyncio
-    async def test_detect_all_errors_with_cache(self, detector):
-        """캐시를 사용한 오류 감지 테스트"""
-        file_path = "/test/file.xlsx"
-
-        # 첫 번째 호출 - 캐시 미스
-        with patch.object(detector, "_load_workbook") as mock_load:
-            mock_workbook = MagicMock()
-            mock_load.return_value = mock_workbook
-
-            with patch.object(detector, "_run_detectors_parallel") as mock_run:
-                mock_run.return_value = []
-
-                result1 = await detector.detect_all_errors(file_path)
+    async def test_detect_all_errors_with_cache(self, detector, fake_cache):
+        """캐시를 사용한 오류 감지 테스트 (파일 내용 해시 기준)"""
+        module = "app.services.detection.integrated_error_detector"
+        with patch(
+            f"{module}.content_hash_registry.resolve",
+            AsyncMock(return_value="ab" * 32),
+        ), patch(f"{module}.StreamingErrorDetector.should_stream", return_value=False):
+            # 첫 번째 호출 - 캐시 미스
+            with patch.object(detector, "_load_workbook") as mock_load, patch.object(
+                detector, "_build_cell_index"
+            ), patch.object(
+                detector,
+                "_run_detectors_parallel_optimized",
+                AsyncMock(return_value=[]),
+            ) as mock_run, patch.object(
+                detector, "_get_sheet_summaries", AsyncMock(return_value={})
+            ):
+                mock_load.return_value = MagicMock()
+                result1 = await detector.detect_all_errors("/test/file.xlsx")
 
                 # 워크북 로드 확인
-                mock_load.assert_called_once_with(file_path)
+                mock_load.assert_called_once_with("/test/file.xlsx")
                 mock_run.assert_called_once()
 
-        # 두 번째 호출 - 캐시 히트
-        with patch.object(detector, "_load_workbook") as mock_load2:
-            result2 = await detector.detect_all_errors(file_path)
+            # 두 번째 호출 - 내용이 같은 다른 업로드도 캐시 히트
+            with patch.object(detector, "_load_workbook") as mock_load2:
+                result2 = await detector.detect_all_errors("/uploads/copy.xlsx")
 
-            # 워크북을 다시 로드하지 않음
-            mock_load2.assert_not_called()
+                # 워크북을 다시 로드하지 않음
+                mock_load2.assert_not_called()
 
-            # 같은 결과 반환
-            assert result1["file_path"] == result2["file_path"]
-            assert result1["status"] == result2["status"]
+        assert result1["status"] == result2["status"] == "success"
+        assert result1["file_id"] == result2["file_id"] == "ab" * 8
+        # 경로 정보는 현재 요청 기준
+        assert result2["file_path"] == "/uploads/copy.xlsx"
+        assert result2["filename"] == "copy.xlsx"
 
     @pytest.mark.asyncio
     async def test_detect_cell_error(self, detector, sample_error):
@@ -315,15 +352,11 @@ class TestIntegratedErrorDetector:
 
         # 검증
         assert summary["total_errors"] == 3
-        assert summary["by_type"]["#DIV/0!"] == 2
-        assert summary["by_type"]["#N/A"] == 1
-        assert summary["by_severity"]["high"] == 2
-        assert summary["by_severity"]["low"] == 1
-        assert summary["by_sheet"]["Sheet1"] == 2
-        assert summary["by_sheet"]["Sheet2"] == 1
-        assert summary["auto_fixable"] == 2
+        assert summary["has_errors"] is True
+        assert summary["error_types"] == {"#DIV/0!": 2, "#N/A": 1}
+        assert summary["auto_fixable_count"] == 2
         assert summary["auto_fixable_percentage"] == 66.67
-        assert summary["most_common_type"] == "#DIV/0!"
+        assert summary["most_common_error_type"] == "#DIV/0!"
 
     def test_add_remove_detector(self, detector):
         """감지기 추가/제거 테스트"""
@@ -347,18 +380,98 @@ class TestIntegratedErrorDetector:
         # FormulaErrorDetector가 제거되었는지 확인
         assert not any(isinstance(d, FormulaErrorDetector) for d in detector.detectors)
 
-    def test_cache_operations(self, detector):
+    @pytest.mark.asyncio
+    async def test_cache_operations(self, detector, fake_cache):
         """캐시 작업 테스트"""
-        file_path = "/test/file.xlsx"
-        cache_key = detector._get_cache_key(file_path)
+        cache_key = detector._build_cache_key("ab" * 32)
 
-        # 캐시 데이터 추가
-        test_data = {"test": "data"}
-        detector._cache[cache_key] = {"data": test_data, "timestamp": datetime.now()}
+        # 내용 해시 + 감지기 구성 버전 기준 키, 내용 ID가 없으면 캐시하지 않음
+        assert cache_key.startswith(f"error_detection:{'ab' * 32}:")
+        assert detector._build_cache_key(None) is None
 
-        # 캐시 유효성 확인
-        assert detector._is_cache_valid(detector._cache[cache_key]) == True
+        # 감지기 구성이 바뀌면 다른 키
+        detector.add_detector(MagicMock())
+        assert detector._build_cache_key("ab" * 32) != cache_key
+
+        # 캐시 초기화는 오류 감지 키만 삭제
+        fake_cache.store[cache_key] = {"status": "success"}
+        fake_cache.store["other:key"] = {}
+        await detector.clear_cache()
+        assert list(fake_cache.store) == ["other:key"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_detection(self, detector, fake_cache):
+        """진행 중인 감지 취소 - 취소 결과를 반환하고 호출자 태스크는 계속 진행"""
+        module = "app.services.detection.integrated_error_detector"
+        started = asyncio.Event()
 
-        # 캐시 초기화
-        detector.clear_cache()
-        assert len(detector._cache) == 0
+        async def slow_detection(cell_index):
+            started.set()
+            await asyncio.sleep(60)
+            return []
+
+        with patch(
+            f"{module}.content_hash_registry.resolve",
+            AsyncMock(return_value="cd" * 32),
+        ), patch(
+            f"{module}.StreamingErrorDetector.should_stream", return_value=False
+        ), patch.object(
+            detector, "_load_workbook"
+        ), patch.object(
+            detector, "_build_cell_index"
+        ), patch.object(
+            detector, "_run_detectors_parallel_optimized", slow_detection
+        ):
+            task = asyncio.create_task(detector.detect_all_errors("/test/file.xlsx"))
+            await started.wait()
+            detector.cancel()
+            result = await task
+
+        assert result["status"] == "cancelled"
+        assert not task.cancelled()
+        # 취소된 결과는 캐시하지 않음
+        assert fake_cache.store == {}
+        # 감지가 끝난 뒤의 취소 요청은 아무 태스크도 취소하지 않음
+        assert detector.cancel() == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_request_waiting_on_shared_detection(
+        self, mock_progress_reporter, fake_cache
+    ):
+        """다른 요청의 진행 중인 분석을 기다리는 요청도 취소 가능 (리더는 계속 진행)"""
+        module = "app.services.detection.integrated_error_detector"
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_detection(cell_index):
+            started.set()
+            await release.wait()
+            return []
+
+        leader = IntegratedErrorDetector(mock_progress_reporter)
+        follower = IntegratedErrorDetector(mock_progress_reporter)
+        with patch(
+            f"{module}.content_hash_registry.resolve",
+            AsyncMock(return_value="ef" * 32),
+        ), patch(
+            f"{module}.StreamingErrorDetector.should_stream", return_value=False
+        ), patch.object(
+            leader, "_load_workbook"
+        ), patch.object(
+            leader, "_build_cell_index"
+        ), patch.object(
+            leader, "_run_detectors_parallel_optimized", slow_detection
+        ):
+            leader_task = asyncio.create_task(leader.detect_all_errors("/a.xlsx"))
+            await started.wait()
+            follower_task = asyncio.create_task(follower.detect_all_errors("/b.xlsx"))
+            await asyncio.sleep(0.01)
+
+            follower.cancel()
+            result = await follower_task
+            assert result["status"] == "cancelled"
+            assert not follower_task.cancelled()
+            assert not leader_task.done()
+
+            release.set()
+            assert (await leader_task)["status"] == "success"
@@ -8,7 +8,9 @@ from unittest.mock import MagicMock, AsyncMock, patch
 from app.services.detection.integrated_error_detector import IntegratedErrorDetector
 from app.core.interfaces import ExcelError
 from app.core.types import CellInfo
+from app.core.integrated_cache import IntegratedCache
 import asyncio
+import openpyxl
 
 
 class TestIntegratedErrorDetectorEnhanced:
@@ -260,6 +262,39 @@ class TestIntegratedErrorDetectorEnhanced:
             # (실제로는 동시에 4개만 실행되어야 함)
             assert len(detector.detectors) > detector.MAX_CONCURRENT_DETECTORS
 
+    @pytest.mark.asyncio
+    async def test_content_hash_cache_for_repeat_uploads(self, detector, tmp_path):
+        """같은 내용의 파일은 경로가 달라도 캐시에서 반환"""
+        workbook = openpyxl.Workbook()
+        workbook.active["A1"] = "=1/0"
+        first_path = tmp_path / "upload_a.xlsx"
+        workbook.save(first_path)
+        second_path = tmp_path / "upload_b.xlsx"
+        second_path.write_bytes(first_path.read_bytes())
+
+        with patch(
+            "app.services.detection.integrated_error_detector.integrated_cache",
+            IntegratedCache(),
+        ) as cache:
+            cache.redis_cache = MagicMock(
+                get=AsyncMock(return_value=None), set=AsyncMock()
+            )
+            first = await detector.detect_all_errors(str(first_path))
+
+            with patch.object(detector, "_load_workbook") as mock_load:
+                second = await detector.detect_all_errors(str(second_path))
+                mock_load.assert_not_called()
+
+            assert second["errors"] == first["errors"]
+            assert second["file_id"] == first["file_id"]
+            assert second["file_path"] == str(second_path)
+            assert cache.get_stats()["analysis_hits"] == 1
+
+            # 감지기 구성이 바뀌면 다른 캐시 키 사용
+            detector.detectors.pop()
+            await detector.detect_all_errors(str(second_path))
+            assert cache.get_stats()["analysis_misses"] == 2
+
     @pytest.mark.asyncio
     async def test_multi_cell_analysis_type(self, detector, sample_cells):
         """MultiCellAnalysis 타입 테스트"""
@@ -0,0 +1,100 @@
+"""
+Metrics Tests
+로그 버킷 히스토그램 백분위수, Prometheus 내보내기, 미들웨어 기록 테스트
+"""
+
+import random
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.metrics import (
+    LatencyHistogram,
+    ProcessSampler,
+    build_prometheus_registry,
+    render_prometheus,
+)
+from app.core.monitoring import MetricsCollector
+from app.middleware import monitoring_middleware
+from app.middleware.monitoring_middleware import MonitoringMiddleware
+
+
+class TestLatencyHistogram:
+    """LatencyHistogram 테스트"""
+
+    def test_percentiles_within_relative_error(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(-3, 1.2) for _ in range(20000)]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        values.sort()
+        for quantile, estimate in zip(
+            (0.5, 0.9, 0.99), histogram.percentiles((0.5, 0.9, 0.99))
+        ):
+            exact = values[int(len(values) * quantile)]
+            assert abs(estimate - exact) / exact < 0.05
+
+        assert histogram.count == 20000
+        assert histogram.percentile(1.0) == histogram.max
+
+    def test_cumulative_buckets(self):
+        histogram = LatencyHistogram()
+        for value in (0.001, 0.002, 0.02, 0.3, 4.0):
+            histogram.record(value)
+
+        assert histogram.cumulative_buckets((0.01, 0.1, 1.0, 10.0)) == [
+            (0.01, 2),
+            (0.1, 3),
+            (1.0, 4),
+            (10.0, 5),
+        ]
+
+
+class TestMetricsExport:
+    """Prometheus 내보내기 / 미들웨어 테스트"""
+
+    def test_prometheus_text_format(self):
+        collector = MetricsCollector()
+        collector.record_request("GET /api/v1/health", 0.02, 200)
+        collector.record_request("GET /api/v1/health", 0.4, 500)
+        sampler = ProcessSampler(interval=60)
+        sampler.sample()
+
+        registry = build_prometheus_registry(collector, sampler)
+        text = render_prometheus(registry).decode()
+
+        assert 'excel_service_requests_total{endpoint="GET /api/v1/health"} 2.0' in text
+        assert (
+            "excel_service_request_duration_seconds_bucket"
+            '{endpoint="GET /api/v1/health",le="0.025"} 1.0'
+        ) in text
+        assert "excel_service_process_memory_mb" in text
+
+    def test_middleware_records_route_template(self, monkeypatch):
+        middleware_metrics = MetricsCollector()
+        monkeypatch.setattr(
+            monitoring_middleware, "metrics_collector", middleware_metrics
+        )
+        app = FastAPI()
+        app.add_middleware(MonitoringMiddleware)
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: str):
+            return {"id": item_id}
+
+        client = TestClient(app)
+        client.get("/items/1")
+        client.get("/items/3f9a2b7c1d0e")
+        client.get("/items/task_ab12")
+        # 매칭되지 않은 임의 경로는 엔드포인트를 늘리지 않음
+        for index in range(5):
+            client.get(f"/scan/{index}/x{index}")
+
+        stats = middleware_metrics.get_stats("GET /items/{item_id}")
+        assert stats["count"] == 3 and stats["p99"] > 0
+        assert set(middleware_metrics.metrics) == {
+            "GET /items/{item_id}",
+            "GET {unmatched}",
+        }
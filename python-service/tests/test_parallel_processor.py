@@ -0,0 +1,146 @@
+"""
+Parallel Processor Tests
+프로세스 풀 대기열 및 감지기 오프로딩 테스트
+"""
+
+import asyncio
+import time
+
+import openpyxl
+import pytest
+from unittest.mock import patch
+
+from app.core.parallel_processor import ParallelProcessor
+from app.services.detection import integrated_error_detector
+from app.services.detection.cell_index import WorkbookCellIndex
+from app.services.detection.dependency_graph import DependencyGraph
+from app.services.detection.integrated_error_detector import IntegratedErrorDetector
+
+
+def _square(value):
+    return value * value
+
+
+def _sleep_and_return(value):
+    time.sleep(0.3)
+    return value
+
+
+@pytest.fixture
+def processor():
+    processor = ParallelProcessor(max_workers=1, max_pending=1)
+    yield processor
+    processor.shutdown()
+
+
+class TestParallelProcessor:
+    """ParallelProcessor 프로세스 대기열 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_run_in_process(self, processor):
+        results = await asyncio.gather(
+            *(processor.run_in_process(_square, i) for i in range(4))
+        )
+
+        assert results == [0, 1, 4, 9]
+        stats = processor.get_queue_stats()
+        assert stats["completed"] == 4
+        assert stats["queue_depth"] == 0
+        assert stats["active_requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_request_cancels_queued_work(self, processor):
+        running = asyncio.ensure_future(
+            processor.run_in_process(_sleep_and_return, 1, request_id="keep")
+        )
+        queued = [
+            asyncio.ensure_future(
+                processor.run_in_process(_sleep_and_return, i, request_id="drop")
+            )
+            for i in range(3)
+        ]
+        await asyncio.sleep(0.05)
+
+        # 슬롯 1개: 첫 작업만 실행 중, 나머지는 대기
+        assert processor.get_queue_stats()["waiting_for_slot"] == 3
+
+        assert processor.cancel_request("drop") == 3
+        results = await asyncio.gather(*queued, return_exceptions=True)
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+
+        assert await running == 1
+        assert processor.get_queue_stats()["cancelled"] == 3
+
+
+class TestDetectorOffloading:
+    """CPU 집약 감지기의 프로세스 풀 실행 테스트"""
+
+    @pytest.fixture
+    def cell_index(self):
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "Data"
+        for row in range(1, 31):
+            sheet.cell(row, 1, row)
+            sheet.cell(row, 2, f"=A{row}*2")
+        sheet["C3"] = "=A3/0"
+        sheet["A10"] = "  padded  "
+        other = workbook.create_sheet("Other")
+        other["A1"] = "=B1/0"
+        other["B2"] = "=SUM(A1:A2"
+        return WorkbookCellIndex.build(workbook)
+
+    @pytest.mark.asyncio
+    async def test_process_results_match_inline(self, cell_index):
+        settings_path = "app.services.detection.integrated_error_detector.settings"
+
+        with patch(settings_path) as settings:
+            settings.DETECTION_PROCESS_POOL_ENABLED = False
+            inline_detector = IntegratedErrorDetector()
+            inline = await inline_detector._run_detectors_parallel_optimized(cell_index)
+
+            settings.DETECTION_PROCESS_POOL_ENABLED = True
+            settings.DETECTION_PROCESS_MIN_CELLS = 1
+            process_detector = IntegratedErrorDetector()
+            selected = process_detector._select_process_detectors(cell_index)
+            assert {d.__class__.__name__ for d in selected} == {
+                "EnhancedFormulaDetector",
+                "DataQualityDetector",
+                "StructureDetector",
+            }
+            offloaded = await process_detector._run_detectors_parallel_optimized(
+                cell_index
+            )
+
+        assert inline
+        assert sorted(e.id for e in offloaded) == sorted(e.id for e in inline)
+
+    @pytest.mark.asyncio
+    async def test_graph_built_in_worker_and_sent_only_where_used(self, cell_index):
+        processor = integrated_error_detector.parallel_processor
+        submitted = []
+        run_in_process = processor.run_in_process
+
+        async def record(func, *args, request_id=None):
+            submitted.append((func, args))
+            return await run_in_process(func, *args, request_id=request_id)
+
+        detector = IntegratedErrorDetector()
+        detectors = [d for d in detector.detectors if getattr(d, "CPU_BOUND", False)]
+        with patch.object(processor, "run_in_process", record):
+            errors = await detector._run_detectors_in_processes(cell_index, detectors)
+
+        # 그래프는 수식 셀만 넘겨 워커에서 한 번 생성
+        detect_sheet = integrated_error_detector._detect_sheet_in_process
+        builds = [func for func, _ in submitted if func is not detect_sheet]
+        assert builds == [DependencyGraph.from_formula_cells]
+        assert cell_index.has_dependency_graph
+
+        sheet_tasks = [args for func, args in submitted if func is detect_sheet]
+        assert len(sheet_tasks) == 4  # 시트 2개 x (그래프 사용 / 미사용 묶음)
+        for task_detectors, sheet_slice in sheet_tasks:
+            uses_graph = {d.__class__.__name__ for d in task_detectors} == {
+                "EnhancedFormulaDetector"
+            }
+            assert sheet_slice.has_dependency_graph == uses_graph
+        assert any(e.sheet == "Other" for e in errors)
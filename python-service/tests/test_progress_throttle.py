@@ -0,0 +1,112 @@
+"""
+Progress Throttle Tests
+작업별 진행률 알림 속도 제한, 최신 값 병합, 시작/완료/오류 전달 테스트
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core.progress_throttle import ProgressThrottle
+from app.services.progress_tracker import ProcessingStage, ProgressTracker
+from app.websocket.progress_reporter import WebSocketProgressReporter
+
+
+class Recorder:
+    def __init__(self):
+        self.sent = []
+
+    def emit(self, value):
+        async def send():
+            self.sent.append(value)
+
+        return send
+
+
+@pytest.fixture
+def throttle():
+    throttle = ProgressThrottle(rate=20, burst=2, min_delta=5, min_interval=0.05)
+    yield throttle
+    for key in list(throttle._buckets):
+        throttle.discard(key)
+
+
+class TestProgressThrottle:
+    """ProgressThrottle 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_latest_value_wins(self, throttle):
+        recorder = Recorder()
+
+        results = [
+            await throttle.submit("t", value, recorder.emit(value))
+            for value in range(0, 100, 10)
+        ]
+
+        # 버스트(2개)만 즉시 전송, 나머지는 하나로 병합되어 토큰이 차면 전송
+        assert results == [True, True] + [False] * 8
+        assert recorder.sent == [0, 10]
+        await asyncio.sleep(0.1)
+        assert recorder.sent == [0, 10, 90]
+        assert throttle.get_stats()["coalesced"] == 7
+
+    @pytest.mark.asyncio
+    async def test_small_delta_held_until_interval(self, throttle):
+        recorder = Recorder()
+
+        assert await throttle.submit("t", 10, recorder.emit(10))
+        assert not await throttle.submit("t", 11, recorder.emit(11))
+        assert not await throttle.submit("t", 12, recorder.emit(12))
+        assert recorder.sent == [10]
+
+        await asyncio.sleep(0.08)
+        assert recorder.sent == [10, 12]
+
+    @pytest.mark.asyncio
+    async def test_final_tick_and_flush_always_delivered(self, throttle):
+        recorder = Recorder()
+        for value in (0, 10, 20):
+            await throttle.submit("t", value, recorder.emit(value))
+
+        assert await throttle.flush("t")
+        assert await throttle.submit("t", 100, recorder.emit(100), final=True)
+        throttle.discard("t")
+
+        assert recorder.sent == [0, 10, 20, 100]
+        assert throttle.get_stats()["tracked_tasks"] == 0
+
+
+class TestProgressIntegration:
+    """리포터/추적기 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_reporter_coalesces_ticks_but_delivers_lifecycle(self):
+        reporter = WebSocketProgressReporter("throttle-session")
+        reporter.manager = AsyncMock()
+
+        await reporter.start_task("batch", 1000)
+        for current in range(1000):
+            await reporter.report_progress(current, 1000, "")
+        await reporter.complete_task("batch", {"ok": True})
+
+        calls = reporter.manager.send_message.call_args_list
+        types = [c.args[1]["type"] for c in calls]
+        assert types[0] == "task_start" and types[-1] == "task_complete"
+        assert 1 < types.count("progress") < 20
+
+    @pytest.mark.asyncio
+    async def test_tracker_notifies_through_throttle(self):
+        tracker = ProgressTracker()
+        tracker.create_task("job-1", "a.xlsx")
+
+        with patch("app.services.progress_tracker.websocket_manager") as manager:
+            manager.send_progress_update = AsyncMock()
+            manager.send_task_completion = AsyncMock()
+            for _ in range(50):
+                tracker.update_progress("job-1", ProcessingStage.DETECTING_ERRORS)
+            tracker.complete_task("job-1")
+            await asyncio.gather(*tracker._notify_tasks)
+
+        assert manager.send_progress_update.await_count == 1
+        manager.send_task_completion.assert_awaited_once()
@@ -0,0 +1,104 @@
+"""
+Rate Limiter Tests
+슬라이딩 윈도우 속도 제한 (Redis GCRA / 링 버퍼 대체) 테스트
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.redis_l2 import RedisL2Cache
+from app.services.rate_limiter import (
+    GCRA_KEY_PREFIX,
+    RateLimiter,
+    RateLimitTier,
+    SlidingWindowRing,
+)
+
+
+@pytest.fixture
+def limiter():
+    limiter = RateLimiter()
+    limiter.redis_cache = RedisL2Cache(enabled=False)
+    return limiter
+
+
+class TestSlidingWindowRing:
+    """SlidingWindowRing 테스트"""
+
+    def test_window_slides(self):
+        ring = SlidingWindowRing(period=60, limit=3)
+        for now in (0, 10, 20):
+            assert ring.retry_after(now, 1) == 0
+            ring.record(now, 1)
+
+        assert ring.remaining(30) == 0
+        assert ring.retry_after(30, 1) == 30  # 0초 요청이 60초에 빠짐
+        assert ring.retry_after(61, 1) == 0
+        assert ring.retry_after(61, 2) == 9
+        assert ring.remaining(75) == 2
+
+
+class TestRateLimiter:
+    """RateLimiter 슬라이딩 윈도우 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_local_fallback_enforces_minute_limit(self, limiter):
+        limits = {"requests_per_minute": 5, "requests_per_hour": 100}
+
+        results = [
+            await limiter.check_rate_limit("user-a", custom_limits=limits)
+            for _ in range(6)
+        ]
+
+        assert [allowed for allowed, _ in results] == [True] * 5 + [False]
+        assert results[0][1]["remaining"] == 4
+        denied = results[-1][1]
+        assert denied["limit"] == 5 and denied["retry_after"] >= 59
+
+        # 다른 식별자는 영향 없음, 초기화 후 다시 허용
+        assert (await limiter.check_rate_limit("user-b", custom_limits=limits))[0]
+        await limiter.reset_rate_limit("user-a")
+        assert (await limiter.check_rate_limit("user-a", custom_limits=limits))[0]
+
+    @pytest.mark.asyncio
+    async def test_endpoint_weight_and_admin(self, limiter):
+        limits = {"requests_per_minute": 5, "requests_per_hour": 100}
+        endpoint = "/api/v1/excel/analyze"  # 가중치 3
+
+        assert (await limiter.check_rate_limit("u", endpoint, custom_limits=limits))[0]
+        allowed, info = await limiter.check_rate_limit(
+            "u", endpoint, custom_limits=limits
+        )
+        assert not allowed and info["remaining"] == 0
+
+        for _ in range(100):
+            allowed, _ = await limiter.check_rate_limit(
+                "admin", tier=RateLimitTier.ADMIN
+            )
+            assert allowed
+
+    @pytest.mark.asyncio
+    async def test_redis_gcra_single_round_trip(self, limiter):
+        script = AsyncMock(side_effect=[[1, 0, 29, 0], [0, 1, 0, 1500]])
+        client = MagicMock()
+        client.register_script = MagicMock(return_value=script)
+        limiter.redis_cache = RedisL2Cache(enabled=True)
+        limiter.redis_cache._client = client
+
+        allowed, info = await limiter.check_rate_limit("ip-1", tier=RateLimitTier.FREE)
+        assert allowed and info == {
+            "limit": 30,
+            "remaining": 29,
+            "reset_time": info["reset_time"],
+        }
+        script.assert_awaited_once_with(
+            keys=[f"{GCRA_KEY_PREFIX}ip-1:60", f"{GCRA_KEY_PREFIX}ip-1:3600"],
+            args=[1, 60000, 30, 3600000, 500],
+            client=client,
+        )
+
+        allowed, info = await limiter.check_rate_limit("ip-1", tier=RateLimitTier.FREE)
+        assert not allowed
+        assert info["limit"] == 500 and info["retry_after"] == 2
+        client.register_script.assert_called_once()
@@ -0,0 +1,189 @@
+"""
+Semantic Search Cache Tests
+질의 임베딩 거리 기반 검색 결과 재사용, 백그라운드 만료, 적중 통계 테스트
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.semantic_search_cache import SemanticSearchCache
+from app.services.vector_search import VectorSearchService
+
+VECTORS = {
+    "how do i fix a vlookup error": [1.0, 0.0, 0.0],
+    "vlookup error, how to fix it?": [0.99, 0.05, 0.0],
+    "create a pivot chart": [0.0, 1.0, 0.0],
+}
+
+
+class TableEmbedding:
+    """질의별 고정 벡터 (표현만 다른 질의는 가까운 벡터)"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def create_embedding(self, text):
+        self.calls.append(text)
+        return VECTORS.get(text.lower().strip(), [0.0, 0.0, 1.0])
+
+    async def create_embeddings(self, texts):
+        return [await self.create_embedding(text) for text in texts]
+
+
+class CacheTableSession:
+    """search_cache 조회/저장 SQL을 기록하는 세션"""
+
+    def __init__(self, rows, rowcount=0):
+        self.rows = rows
+        self.rowcount = rowcount
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append((" ".join(str(statement).split()), params or {}))
+        return SimpleNamespace(fetchall=lambda: self.rows, rowcount=self.rowcount)
+
+    async def commit(self):
+        pass
+
+
+@pytest.fixture
+def service():
+    service = VectorSearchService()
+    service._embedding_service = TableEmbedding()
+    service._cache_enabled = True
+    service.search_cache = SemanticSearchCache(max_distance=0.05, ttl=60)
+    service.local_index.add("d1", "qa_pair", "VLOOKUP", [1.0, 0.0, 0.0])
+    service.local_index.add("d2", "qa_pair", "Pivot", [0.0, 1.0, 0.0])
+    return service
+
+
+class TestSemanticSearchCache:
+    """VectorSearchService 의미 기반 결과 캐시"""
+
+    @pytest.mark.asyncio
+    async def test_exact_and_paraphrased_queries_skip_work(self, service):
+        scans = []
+        search = service.local_index.search
+        service.local_index.search = lambda *a, **k: scans.append(a) or search(*a, **k)
+
+        first = await service.search_similar_documents("How do I fix a VLOOKUP error")
+        # 공백/대소문자만 다른 질의: 임베딩/벡터 검색 모두 생략
+        again = await service.search_similar_documents(" how do i  fix a vlookup error")
+        # 표현이 다른 질의: 임베딩은 필요하지만 벡터 검색은 생략
+        paraphrase = await service.search_similar_documents(
+            "VLOOKUP error, how to fix it?"
+        )
+        other = await service.search_similar_documents("create a pivot chart")
+
+        assert [r["document_id"] for r in first] == ["d1"]
+        assert again is first and paraphrase is first
+        assert [r["document_id"] for r in other] == ["d2"]
+        assert len(service._embedding_service.calls) == 3
+        assert len(scans) == 2
+
+        stats = service.get_cache_stats()
+        assert (stats["exact_hits"], stats["semantic_hits"], stats["misses"]) == (
+            1,
+            1,
+            2,
+        )
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_scope_and_index_changes_are_respected(self, service):
+        query = "how do i fix a vlookup error"
+        await service.search_similar_documents(query, threshold=0.7)
+
+        # 조건이 다르면 재사용하지 않음
+        await service.search_similar_documents(query, threshold=0.9)
+        assert service.search_cache.stats["misses"] == 2
+
+        # 문서가 바뀌면 캐시 무효화
+        await service.index_document("d3", "qa_pair", query)
+        results = await service.search_similar_documents(query, threshold=0.7)
+        assert {r["document_id"] for r in results} == {"d1", "d3"}
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_ignored_then_purged(self, service, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr(
+            "app.services.semantic_search_cache.time.monotonic", lambda: clock[0]
+        )
+        monkeypatch.setattr(
+            "app.services.vector_search.settings.VECTOR_SEARCH_BACKEND", "local"
+        )
+        await service.search_similar_documents("create a pivot chart")
+
+        clock[0] += 61
+        # 읽기 경로는 만료 항목을 지우지 않고 새로 검색
+        await service.search_similar_documents("create a pivot chart")
+        assert service.search_cache.stats["exact_hits"] == 0
+
+        clock[0] += 61
+        assert await service.expire_cache() == 1
+        assert service.get_cache_stats()["entries"] == 0
+
+
+class TestSharedSearchCache:
+    """search_cache 테이블 계층 (다른 워커가 저장한 결과)"""
+
+    @pytest.mark.asyncio
+    async def test_nearest_cached_query_with_same_scope_is_reused(
+        self, service, monkeypatch
+    ):
+        monkeypatch.setattr(
+            "app.services.vector_search.settings.VECTOR_SEARCH_BACKEND", "pgvector"
+        )
+        scope = service.search_cache.scope(None, 10, 0.7)
+        cached = [{"document_id": "from-other-worker"}]
+        db = CacheTableSession(
+            [
+                SimpleNamespace(
+                    query="vlookup?",
+                    distance=0.01,
+                    results=json.dumps({"scope": [None, 3, 0.7], "results": []}),
+                ),
+                SimpleNamespace(query="legacy", distance=0.02, results="[]"),
+                SimpleNamespace(
+                    query="vlookup error",
+                    distance=0.03,
+                    results=json.dumps({"scope": list(scope), "results": cached}),
+                ),
+            ]
+        )
+
+        results = await service.search_similar_documents(
+            "how do i fix a vlookup error", db=db
+        )
+
+        assert results == cached
+        ((sql, params),) = db.statements
+        assert "ORDER BY query_embedding <=> CAST(:embedding AS vector)" in sql
+        assert "DELETE" not in sql and params["embedding"] == "[1.0,0.0,0.0]"
+        assert service.get_cache_stats()["shared_hits"] == 1
+
+        # 프로세스 캐시에 올라가 다음 번에는 DB도 조회하지 않음
+        await service.search_similar_documents("how do i fix a vlookup error", db=db)
+        assert len(db.statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_document_changes_clear_shared_rows(self, service, monkeypatch):
+        monkeypatch.setattr(
+            "app.services.vector_search.settings.VECTOR_SEARCH_BACKEND", "pgvector"
+        )
+        scope = service.search_cache.scope(None, 10, 0.7)
+        stale = SimpleNamespace(
+            query="vlookup error",
+            distance=0.0,
+            results=json.dumps({"scope": list(scope), "results": []}),
+        )
+        db = CacheTableSession([stale], rowcount=1)
+        await service.search_similar_documents("how do i fix a vlookup error", db=db)
+
+        assert await service.delete_document_embedding("d1", db=db)
+
+        # 프로세스 캐시뿐 아니라 테이블 행도 지워 이전 결과가 다시 올라오지 않음
+        assert db.statements[-1][0] == "DELETE FROM search_cache"
+        assert service.get_cache_stats()["entries"] == 0
@@ -0,0 +1,142 @@
+"""
+Session Context Store Tests
+세션 컨텍스트 조각 단위 저장 (해시 필드 / 길이 제한 리스트) 테스트
+"""
+
+import json
+
+import pytest
+
+from app.services.context.session_context_store import SessionContextStore
+
+
+class FakeRedis:
+    """테스트에 필요한 명령만 구현한 메모리 Redis"""
+
+    def __init__(self):
+        self.data = {}
+        self.commands = []
+        self.expired = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def type(self, key):
+        value = self.data.get(key)
+        return "string" if isinstance(value, str) else "none"
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    def run(self, name, *args, **kwargs):
+        self.commands.append(name)
+        if name == "hset":
+            self.data.setdefault(args[0], {}).update(kwargs["mapping"])
+        elif name == "hgetall":
+            return dict(self.data.get(args[0], {}))
+        elif name == "rpush":
+            self.data.setdefault(args[0], []).extend(args[1:])
+        elif name == "ltrim":
+            self.data[args[0]] = self.data[args[0]][args[1] :]
+        elif name == "lrange":
+            return list(self.data.get(args[0], []))
+        elif name == "delete":
+            for key in args:
+                self.data.pop(key, None)
+        elif name == "expire":
+            self.expired.append(args[0])
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queued = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.queued.append((name, args, kwargs))
+
+    async def execute(self):
+        return [self.redis.run(name, *a, **kw) for name, a, kw in self.queued]
+
+
+@pytest.fixture
+def store():
+    store = SessionContextStore()
+    store._redis = FakeRedis()
+    return store
+
+
+class TestSessionContextStore:
+    """SessionContextStore 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_chat_message_is_appended_not_rewritten(self, store):
+        store.max_history_per_session = 3
+        await store.update_selected_cells("s1", [{"address": "A1"}])
+
+        for i in range(5):
+            store._redis.commands.clear()
+            assert await store.add_chat_message("s1", "user", f"msg {i}")
+            # 기존 컨텍스트를 읽지 않고 메시지 하나만 덧붙임
+            assert "hgetall" not in store._redis.commands
+            assert "rpush" in store._redis.commands
+
+        fields = store._redis.data["excel_unified:session:s1:fields"]
+        assert set(fields) == {"selected_cells", "selection_timestamp", "last_updated"}
+
+        context = await store.get_session_context("s1")
+        assert [m["content"] for m in context["chat_history"]] == [
+            "msg 2",
+            "msg 3",
+            "msg 4",
+        ]
+        assert context["selected_cells"] == [{"address": "A1"}]
+        assert len(context["selection_history"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_save_replaces_and_legacy_blob_is_migrated(self, store):
+        legacy = {"chat_history": [{"role": "user", "content": "hi"}], "foo": 1}
+        store._redis.data["excel_unified:session:old"] = json.dumps(legacy)
+
+        assert await store.get_session_context("old") == legacy
+        assert "excel_unified:session:old" not in store._redis.data
+        assert store._redis.data["excel_unified:session:old:chat"] == [
+            json.dumps({"role": "user", "content": "hi"})
+        ]
+
+        await store.save_session_context("old", {"bar": 2})
+        context = await store.get_session_context("old")
+        assert "chat_history" not in context and context["bar"] == 2
+
+    @pytest.mark.asyncio
+    async def test_every_write_refreshes_all_fragment_ttls(self, store):
+        await store.add_chat_message("s1", "user", "hi")
+        store._redis.expired.clear()
+
+        await store.update_selected_cells("s1", [{"address": "B2"}])
+
+        # 선택만 바꿔도 채팅 리스트가 먼저 만료되지 않음
+        assert set(store._redis.expired) == {
+            "excel_unified:session:s1:fields",
+            "excel_unified:session:s1:chat",
+            "excel_unified:session:s1:selections",
+        }
+
+    @pytest.mark.asyncio
+    async def test_legacy_blob_is_migrated_on_first_write(self, store):
+        legacy = {"chat_history": [{"role": "user", "content": "hi"}], "foo": 1}
+        store._redis.data["excel_unified:session:old"] = json.dumps(legacy)
+
+        assert await store.add_chat_message("old", "assistant", "hello")
+
+        assert "excel_unified:session:old" not in store._redis.data
+        context = await store.get_session_context("old")
+        assert [m["content"] for m in context["chat_history"]] == ["hi", "hello"]
+        assert context["foo"] == 1
@@ -0,0 +1,88 @@
+"""
+Single Flight Tests
+동일 키 동시 요청 병합 (프로세스 내 / Redis 락) 테스트
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.redis_l2 import RedisL2Cache
+from app.core.single_flight import SingleFlight
+
+
+def local_only() -> SingleFlight:
+    return SingleFlight(redis_cache=RedisL2Cache(enabled=False))
+
+
+class TestSingleFlight:
+    """SingleFlight 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_run(self):
+        flight = local_only()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"value": 42}
+
+        results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+
+        assert calls == [1]
+        assert [shared for _, shared in results].count(False) == 1
+        assert all(result == {"value": 42} for result, _ in results)
+        assert not flight.in_flight("k")
+        assert flight.get_stats()["followers"] == 4
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_followers(self):
+        flight = local_only()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_follower_takes_over_when_leader_cancelled(self):
+        flight = local_only()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == ("done", False)
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_remote_lock_waits_then_rechecks(self):
+        client = MagicMock()
+        client.set = AsyncMock(return_value=None)  # 다른 워커가 락 보유
+        client.exists = AsyncMock(side_effect=[1, 0])
+        redis_cache = RedisL2Cache(enabled=True)
+        redis_cache._client = client
+        flight = SingleFlight(redis_cache=redis_cache, poll_interval=0.001)
+        work = AsyncMock(return_value="local")
+
+        result = await flight.do(
+            "k", work, recheck=AsyncMock(return_value="from-other-worker")
+        )
+
+        assert result == ("from-other-worker", True)
+        work.assert_not_awaited()
+        assert flight.get_stats()["remote_followers"] == 1
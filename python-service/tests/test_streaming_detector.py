@@ -0,0 +1,90 @@
+"""
+Streaming Error Detector Tests
+대용량 파일 스트리밍 감지 테스트
+"""
+
+import pytest
+import openpyxl
+from unittest.mock import patch
+from app.services.detection.streaming_detector import StreamingErrorDetector
+from app.services.detection.strategies.enhanced_formula_detector import (
+    EnhancedFormulaDetector,
+)
+from app.services.detection.strategies.data_quality_detector import DataQualityDetector
+
+
+@pytest.fixture
+def workbook_file(tmp_path):
+    """수식 오류가 여러 청크에 흩어진 파일"""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Data"
+    for row in range(1, 26):
+        sheet.cell(row, 1, row)
+        sheet.cell(row, 2, f"=A{row}*2")
+    sheet["C3"] = "=A3/0"
+    sheet["C20"] = "=SUM(A1:A2"
+    workbook.create_sheet("Empty")
+
+    path = tmp_path / "large.xlsx"
+    workbook.save(path)
+    return path
+
+
+class TestStreamingErrorDetector:
+    """StreamingErrorDetector 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_emits_errors_per_chunk(self, workbook_file):
+        callbacks = []
+
+        async def callback(result):
+            callbacks.append(result)
+
+        detector = StreamingErrorDetector(
+            [EnhancedFormulaDetector(), DataQualityDetector()], chunk_rows=10
+        )
+        result = await detector.detect(str(workbook_file), callback)
+
+        # Data 시트 3개 청크 + 빈 시트 1회
+        assert [r["sheet"] for r in callbacks] == ["Data", "Data", "Data", "Empty"]
+        assert [r["rows_processed"] for r in callbacks] == [10, 20, 25, 1]
+        assert callbacks[-1]["progress"] == 100
+
+        cells = {error.cell for error in result["errors"]}
+        assert {"C3", "C20"} <= cells
+        assert result["skipped_detectors"] == ["DataQualityDetector"]
+
+        summary = result["sheets"]["Data"]
+        assert summary["rows"] == 25
+        assert summary["non_empty_cells"] == 52
+        assert summary["formulas_count"] == 27
+
+    @pytest.mark.asyncio
+    async def test_matches_in_memory_detection(self, workbook_file):
+        formula_detector = EnhancedFormulaDetector()
+        in_memory = await formula_detector.detect(openpyxl.load_workbook(workbook_file))
+
+        result = await StreamingErrorDetector([formula_detector], chunk_rows=7).detect(
+            str(workbook_file)
+        )
+
+        assert sorted(e.id for e in result["errors"]) == sorted(e.id for e in in_memory)
+
+    def test_should_stream_thresholds(self, workbook_file, tmp_path):
+        settings_path = "app.services.detection.streaming_detector.settings"
+
+        with patch(settings_path) as settings:
+            settings.STREAMING_DETECTION_FILE_SIZE_THRESHOLD = 10**9
+            settings.STREAMING_DETECTION_CELL_THRESHOLD = 50
+            assert StreamingErrorDetector.should_stream(str(workbook_file))
+
+            settings.STREAMING_DETECTION_CELL_THRESHOLD = 10**9
+            assert not StreamingErrorDetector.should_stream(str(workbook_file))
+
+            settings.STREAMING_DETECTION_FILE_SIZE_THRESHOLD = 1
+            assert StreamingErrorDetector.should_stream(str(workbook_file))
+
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("a,b\n1,2\n")
+        assert not StreamingErrorDetector.should_stream(str(csv_file))
@@ -0,0 +1,178 @@
+"""
+Vector Index Tests
+pgvector 인덱스 검색 쿼리(거리 순 LIMIT + 임계값 후처리)와 프로세스 내 인덱스 테스트
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from app.services.vector_index import InMemoryVectorIndex, PgVectorIndex
+from app.services.vector_search import VectorSearchService
+
+
+class KeywordEmbedding:
+    """단어 해시 기반 결정적 임베딩"""
+
+    dimension = 32
+
+    def _embed(self, text):
+        vector = [0.0] * self.dimension
+        for word in text.lower().split():
+            vector[sum(map(ord, word)) % self.dimension] += 1.0
+        return vector
+
+    async def create_embedding(self, text):
+        return self._embed(text)
+
+    async def create_embeddings(self, texts):
+        return [self._embed(text) for text in texts]
+
+
+class FakeSession:
+    """실행된 SQL을 기록하고 거리 순 행을 돌려주는 세션"""
+
+    def __init__(self, distances):
+        self.rows = [
+            SimpleNamespace(
+                id=f"id-{i}",
+                document_id=f"doc-{i}",
+                document_type="qa_pair",
+                content=f"content {i}",
+                document_metadata=None,
+                distance=distance,
+            )
+            for i, distance in enumerate(distances)
+        ]
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append((str(statement), params or {}))
+        limit = (params or {}).get("limit", len(self.rows))
+        return SimpleNamespace(fetchall=lambda: self.rows[:limit])
+
+
+class TestInMemoryVectorIndex:
+    """InMemoryVectorIndex 테스트"""
+
+    def test_top_k_matches_brute_force(self):
+        rng = np.random.default_rng(3)
+        vectors = rng.normal(size=(500, 16))
+        index = InMemoryVectorIndex(initial_capacity=8)
+        for i, vector in enumerate(vectors):
+            index.add(f"doc-{i}", "even" if i % 2 == 0 else "odd", "", vector)
+
+        query = rng.normal(size=16)
+        hits = index.search(query, limit=5, document_type="odd")
+
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        scores = normalized @ (query / np.linalg.norm(query))
+        odd = [i for i in np.argsort(-scores) if i % 2 == 1][:5]
+        assert [record["document_id"] for record, _ in hits] == [
+            f"doc-{i}" for i in odd
+        ]
+        assert [round(s, 5) for _, s in hits] == [round(scores[i], 5) for i in odd]
+
+        # 임계값은 상위 후보에만 적용
+        threshold = float(scores[odd[1]] + scores[odd[2]]) / 2
+        assert len(index.search(query, 5, threshold, "odd")) == 2
+
+    def test_remove_keeps_remaining_rows_searchable(self):
+        index = InMemoryVectorIndex(initial_capacity=2)
+        index.add("a", "t", "A", [1, 0, 0])
+        index.add("b", "t", "B", [0, 1, 0])
+        index.add("a", "t", "A2", [0.9, 0.1, 0])
+        index.add("c", "u", "C", [0, 0, 1])
+
+        assert index.remove("a") == 2
+        assert len(index) == 2 and "a" not in index
+        hits = index.search([0, 0, 1], limit=10)
+        assert [record["document_id"] for record, _ in hits] == ["c", "b"]
+        assert index.update("b", "B2", [0, 0, 1])
+        assert index.search([0, 0, 1], 1, document_type="t")[0][0]["content"] == "B2"
+
+
+class TestPgVectorIndex:
+    """pgvector 검색 쿼리 테스트"""
+
+    def test_index_ddl(self):
+        hnsw = PgVectorIndex(kind="hnsw", m=24, ef_construction=100)
+        assert hnsw.create_index_sql() == (
+            "CREATE INDEX IF NOT EXISTS document_embeddings_embedding_hnsw_idx "
+            "ON document_embeddings USING hnsw (embedding vector_cosine_ops) "
+            "WITH (m = 24, ef_construction = 100)"
+        )
+        ivfflat = PgVectorIndex(kind="ivfflat", lists=50)
+        assert "USING ivfflat" in ivfflat.create_index_sql()
+        assert ivfflat.create_index_sql().endswith("WITH (lists = 50)")
+        with pytest.raises(ValueError):
+            PgVectorIndex(kind="flat")
+
+    @pytest.mark.asyncio
+    async def test_search_orders_by_distance_and_post_filters(self, monkeypatch):
+        monkeypatch.setattr(
+            "app.services.vector_search.settings.VECTOR_SEARCH_BACKEND", "pgvector"
+        )
+        service = VectorSearchService()
+        service.pg_index = PgVectorIndex(kind="hnsw", ef_search=10, overfetch=4)
+        service._embedding_service = KeywordEmbedding()
+        service._get_cached_results = AsyncMock(return_value=None)
+        service._cache_results = AsyncMock()
+        db = FakeSession([0.05, 0.2, 0.25, 0.4, 0.6])
+
+        results = await service.search_similar_documents(
+            "sum formula", document_type="qa_pair", limit=3, threshold=0.7, db=db
+        )
+
+        (config_sql, config_params), (search_sql, params) = db.statements
+        assert "set_config" in config_sql
+        # 유형 필터가 있으면 4배 후보, ef_search는 LIMIT 이상
+        assert config_params == {"name": "hnsw.ef_search", "value": "12"}
+        assert params["limit"] == 12 and params["document_type"] == "qa_pair"
+        where = search_sql.split("WHERE")[1].split("ORDER BY")[0]
+        assert ":threshold" not in search_sql and "<=>" not in where
+        assert "ORDER BY embedding <=> CAST(:embedding AS vector)" in search_sql
+
+        assert [r["document_id"] for r in results] == ["doc-0", "doc-1", "doc-2"]
+        assert results[0]["similarity"] == pytest.approx(0.95)
+
+
+class TestLocalVectorSearch:
+    """DB 없이 VectorSearchService 사용"""
+
+    @pytest.mark.asyncio
+    async def test_index_search_update_delete_without_db(self):
+        service = VectorSearchService()
+        service._embedding_service = KeywordEmbedding()
+
+        documents = [
+            ("q1", "qa_pair", "vlookup returns n/a error"),
+            ("q2", "qa_pair", "circular reference in sum formula"),
+            ("f1", "excel_analysis", "vlookup returns n/a error"),
+        ]
+        await service.index_documents_batch(
+            [
+                {"document_id": doc_id, "document_type": kind, "content": content}
+                for doc_id, kind, content in documents
+            ]
+        )
+        await service.update_document_embedding(
+            "f1", "vlookup returns n/a error", metadata={"a": 1}
+        )
+
+        results = await service.search_similar_documents(
+            "vlookup returns n/a error", document_type="qa_pair", threshold=0.5
+        )
+        assert [r["document_id"] for r in results] == ["q1"]
+        assert results[0]["similarity"] == pytest.approx(1.0)
+
+        assert await service.update_document_embedding("q2", "vlookup returns n/a")
+        assert not await service.update_document_embedding("missing", "x")
+        assert await service.delete_document_embedding("q1")
+        results = await service.search_similar_documents(
+            "vlookup returns n/a error", threshold=0.5
+        )
+        assert [r["document_id"] for r in results] == ["f1", "q2"]
+        assert results[0]["metadata"] == {"a": 1}
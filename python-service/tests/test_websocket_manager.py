@@ -0,0 +1,142 @@
+"""
+WebSocket Manager Tests
+연결별 전송 큐 팬아웃, 진행률 프레임 병합, 느린 소비자 처리 테스트
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.services import websocket_manager as websocket_module
+from app.services.websocket_manager import ProgressWebSocketHandler, WebSocketManager
+
+
+class FakeWebSocket:
+    def __init__(self, blocked: bool = False):
+        self.sent = []
+        self.received = asyncio.Queue()
+        self.close_code = None
+        self.gate = asyncio.Event()
+        if not blocked:
+            self.gate.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        await self.gate.wait()
+        self.sent.append(json.loads(text))
+
+    async def receive_text(self) -> str:
+        return await self.received.get()
+
+    async def close(self, code: int = 1000):
+        self.close_code = code
+
+
+@pytest.fixture
+async def manager():
+    manager = WebSocketManager()
+    yield manager
+    # 막힌 전송 태스크 정리
+    for connection_id in list(manager.active_connections):
+        manager.disconnect(connection_id)
+
+
+async def connect(manager, websocket, connection_id, task_id="task-1"):
+    await manager.connect(websocket, connection_id=connection_id, task_id=task_id)
+
+
+async def drain():
+    """전송 태스크가 큐를 처리할 시간을 줌"""
+    await asyncio.sleep(0.01)
+
+
+class TestWebSocketFanOut:
+    """WebSocketManager 팬아웃 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_others(self, manager):
+        fast, slow = FakeWebSocket(), FakeWebSocket(blocked=True)
+        await connect(manager, fast, "fast")
+        await connect(manager, slow, "slow")
+
+        with patch(
+            "app.services.websocket_manager.json.dumps", wraps=json.dumps
+        ) as dumps:
+            sent = await manager.send_task_completion("task-1", {"ok": True})
+        await drain()
+
+        assert sent == 2
+        assert dumps.call_count == 1  # 수신자 수와 무관하게 한 번만 직렬화
+        assert [m["type"] for m in fast.sent] == [
+            "connection_established",
+            "task_completed",
+        ]
+        assert slow.sent == []
+        assert manager.get_connection_stats()["send_queues"]["total_depth"] == 1
+
+        slow.gate.set()
+        await drain()
+        assert len(slow.sent) == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_progress_frames_are_coalesced(self, manager):
+        slow = FakeWebSocket(blocked=True)
+        await connect(manager, slow, "slow")
+
+        for percent in range(10):
+            await manager.send_progress_update("task-1", {"percent": percent})
+        await manager.send_task_completion("task-1", {"ok": True})
+
+        slow.gate.set()
+        await drain()
+
+        progress = [m for m in slow.sent if m["type"] == "progress_update"]
+        assert [m["data"]["percent"] for m in progress] == [9]
+        assert slow.sent[-1]["type"] == "task_completed"
+        assert manager.get_connection_stats()["send_queues"]["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_full_queue_disconnects_slow_consumer(self, manager):
+        slow = FakeWebSocket(blocked=True)
+        with patch("app.services.websocket_manager.settings.WS_SEND_QUEUE_SIZE", 3):
+            await connect(manager, slow, "slow")
+        await drain()  # 연결 확인 프레임은 전송 중 (큐에서 빠짐)
+
+        await manager.send_progress_update("task-1", {"percent": 1})
+        for _ in range(2):
+            assert await manager.send_to_connection("slow", {"type": "notice"})
+        # 진행률 프레임을 버리고 자리를 만든 뒤, 더는 버릴 프레임이 없으면 연결 해제
+        assert await manager.send_to_connection("slow", {"type": "notice"})
+        assert not await manager.send_to_connection("slow", {"type": "notice"})
+
+        stats = manager.get_connection_stats()
+        assert stats["total_connections"] == 0
+        assert stats["send_queues"]["slow_disconnects"] == 1
+
+    @pytest.mark.asyncio
+    async def test_evicted_connection_is_closed_and_not_resubscribed(
+        self, manager, monkeypatch
+    ):
+        monkeypatch.setattr(websocket_module, "websocket_manager", manager)
+        slow = FakeWebSocket(blocked=True)
+        with patch("app.services.websocket_manager.settings.WS_SEND_QUEUE_SIZE", 1):
+            await connect(manager, slow, "slow")
+        await drain()
+        handler = ProgressWebSocketHandler(slow, "slow")
+        receiving = asyncio.create_task(handler.handle_connection())
+
+        assert await manager.send_to_connection("slow", {"type": "notice"})
+        assert not await manager.send_to_connection("slow", {"type": "notice"})
+        await drain()
+        assert slow.close_code == 1013
+
+        # 닫히기 전에 도착한 구독 요청이 정리된 연결을 다시 등록하지 않음
+        slow.received.put_nowait(
+            json.dumps({"type": "subscribe_task", "task_id": "task-2"})
+        )
+        await asyncio.wait_for(receiving, timeout=1)
+        assert manager.task_connections == {}
@@ -0,0 +1,96 @@
+"""
+Streaming XLSX Reader Tests
+스트리밍 xlsx 리더 테스트
+"""
+
+import zipfile
+
+import pytest
+import openpyxl
+from datetime import datetime
+from app.services.xlsx_stream_reader import StreamingXlsxReader
+from app.services.excel_analyzer import ExcelAnalyzer
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    """수식, 날짜, 병합 셀이 있는 샘플 파일"""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Data"
+    sheet["A1"] = "Name"
+    sheet["B1"] = "Amount"
+    sheet["A2"] = "Alice"
+    sheet["B2"] = 10
+    sheet["B3"] = "=B2/0"
+    sheet["C4"] = datetime(2024, 1, 2)
+    sheet.merge_cells("E5:F6")
+    workbook.create_sheet("Empty")
+
+    path = tmp_path / "sample.xlsx"
+    workbook.save(path)
+    return path
+
+
+class TestStreamingXlsxReader:
+    """StreamingXlsxReader 테스트"""
+
+    def test_reads_formula_and_value_in_one_pass(self, sample_file):
+        with StreamingXlsxReader(sample_file) as reader:
+            assert reader.sheetnames == ["Data", "Empty"]
+
+            stream = reader.open_sheet("Data")
+            cells = {cell.coordinate: cell for cell in stream}
+
+        assert cells["A2"].value == "Alice"
+        assert cells["B2"].value == 10
+        assert cells["B3"].formula == "=B2/0"
+        assert cells["B3"].data_type == "f"
+        assert cells["C4"].value == datetime(2024, 1, 2)
+        assert "A3" not in cells
+
+    def test_dimensions_match_openpyxl(self, sample_file):
+        workbook = openpyxl.load_workbook(sample_file)
+
+        with StreamingXlsxReader(sample_file) as reader:
+            for sheet_name in reader.sheetnames:
+                stream = reader.open_sheet(sheet_name)
+                list(stream)
+                assert stream.max_row == workbook[sheet_name].max_row
+                assert stream.max_column == workbook[sheet_name].max_column
+
+            assert reader.open_sheet("Data").merged_cells == []
+            stream = reader.open_sheet("Data")
+            list(stream)
+            assert stream.merged_cells == ["E5:F6"]
+
+    @pytest.mark.asyncio
+    async def test_analyzer_uses_single_pass(self, sample_file):
+        result = await ExcelAnalyzer().analyze_file(str(sample_file))
+
+        sheet = result["sheets"]["Data"]
+        assert sheet["formula_count"] == 1
+        assert sheet["columns"][:2] == ["Name", "Amount"]
+        assert sheet["used_range"] == "A1:F6"
+        assert sheet["merged_cells"] == ["E5:F6"]
+        assert sheet["data_types"]["B"]["primary"] == "number"
+
+    def test_unparseable_cell_reference_falls_back_to_position(
+        self, sample_file, tmp_path
+    ):
+        # 일부 생성 도구가 쓰는 R1C1 형식 참조도 스트림을 중단시키지 않음
+        patched = tmp_path / "patched.xlsx"
+        with zipfile.ZipFile(sample_file) as source, zipfile.ZipFile(
+            patched, "w"
+        ) as target:
+            for item in source.infolist():
+                data = source.read(item.filename)
+                if item.filename == "xl/worksheets/sheet1.xml":
+                    data = data.replace(b'r="B2"', b'r="R2C2"')
+                target.writestr(item, data)
+
+        with StreamingXlsxReader(patched) as reader:
+            cells = {cell.coordinate: cell for cell in reader.open_sheet("Data")}
+
+        assert cells["B2"].value == 10
+        assert cells["B3"].formula == "=B2/0"